@@ -18,6 +18,8 @@ import multiprocessing
 from typing import Tuple
 import random
 
+from qutrit_register import QutritRegister
+
 # ------------------------------------------------------------------
 # ZERO POINT ENERGY FIELD (BENCHMARK MODE)
 # Seed 0 ensures deterministic stress testing of the Sovereign Manifold.
@@ -142,5 +144,50 @@ def run_stress_test(start_exponent=20, max_exponent=30):
         print(f"PEAK THROUGHPUT: {max_qps/1e9:.2f} BILLION QUTRITS/SEC")
     print("="*60)
 
+# --- PACKED REGISTER COMPARISON ---
+
+def run_packed_comparison(exponent=24, workers=None):
+    """
+    Runs the same 3-cycle Trinity pulse on the int8 manifold and on packed
+    QutritRegisters (lookup-table gates), reporting trits/sec and bytes/trit.
+    Target: >= 4x less memory than int8.
+    """
+    random.seed(VSA_SEED)
+    np.random.seed(VSA_SEED)
+    workers = workers or multiprocessing.cpu_count()
+    count = 2 ** exponent
+
+    print("\n" + "="*60)
+    print(f"PACKED TRINITY: 2^{exponent} ({count:,} Qutrits), {workers} workers")
+    print("="*60)
+
+    manifold = QutritKernel.generate_manifold(count)
+    t0 = time.perf_counter()
+    for _ in range(3):
+        manifold = QutritKernel.apply_trinity_gate(manifold)
+    baseline = (count * 3) / (time.perf_counter() - t0)
+    baseline_bpt = manifold.nbytes / count
+    print(f"    int8         {baseline/1e6:10.2f} M trits/s   {baseline_bpt:.3f} bytes/trit")
+
+    for encoding in ("base243", "2bit"):
+        register = QutritRegister.from_trits(manifold, encoding)
+        t0 = time.perf_counter()
+        for _ in range(3):
+            register.x3()
+        qps = (count * 3) / (time.perf_counter() - t0)
+
+        t0 = time.perf_counter()
+        register.evolve(["X3"] * 3, workers=workers)
+        sharded = (count * 3) / (time.perf_counter() - t0)
+
+        assert np.array_equal(register.counts()[:3], np.bincount(manifold, minlength=3))
+        reduction = baseline_bpt / register.bytes_per_trit
+        print(f"    {encoding:<12} {qps/1e6:10.2f} M trits/s   {register.bytes_per_trit:.3f} bytes/trit"
+              f"   ({reduction:.1f}x smaller, {'OK' if reduction >= 4 else 'BELOW'} 4x target)")
+        print(f"    {encoding + ' x' + str(workers):<12} {sharded/1e6:10.2f} M trits/s   (sharded, incl. process startup)")
+    print("="*60)
+
 if __name__ == "__main__":
-    run_stress_test()
+    if "--packed" not in sys.argv:
+        run_stress_test()
+    run_packed_comparison()
@@ -0,0 +1,53 @@
+"""
+BENCHMARK: HARMONIC GEARBOX BANK
+PROTOCOL: LOOP OF SCALAR HarmonicGearbox.tick() VS ONE GearboxBank.tick() PER STEP
+DATASET: N OSCILLATORS DRIVEN BY JITTERED SCHUMANN INPUTS (7.83 Hz +- 0.3)
+"""
+
+import sys
+import os
+import time
+import numpy as np
+
+# Ensure we can import from project root
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from harmonic_gearbox import GearboxBank, HarmonicGearbox, RUST_BANK_AVAILABLE
+
+def time_ticks(tick, inputs):
+    start = time.perf_counter()
+    for row in inputs:
+        tick(row)
+    return (time.perf_counter() - start) / len(inputs)
+
+def run_benchmark(n_loop=2_000, n_bank=100_000, steps=20):
+    print(f"{'='*60}")
+    print("BENCHMARK: GEARBOX BANK")
+    print(f"{'='*60}")
+    rng = np.random.default_rng(0)
+
+    print(f"Running Baseline: {n_loop:,} scalar gearboxes, Python loop...")
+    gearboxes = [HarmonicGearbox() for _ in range(n_loop)]
+    inputs = 7.83 + rng.uniform(-0.3, 0.3, size=(steps, n_loop))
+    t_loop = time_ticks(lambda row: [g.tick(0.1, x) for g, x in zip(gearboxes, row)], inputs)
+    per_loop = t_loop / n_loop
+    print(f"  {t_loop * 1e3:8.2f} ms/step ({per_loop * 1e9:,.0f} ns per oscillator)")
+
+    inputs = 7.83 + rng.uniform(-0.3, 0.3, size=(steps, n_bank))
+    backends = ["python"] + (["rust"] if RUST_BANK_AVAILABLE else [])
+    per_bank = {}
+    for backend in backends:
+        bank = GearboxBank(n_bank, kp=rng.uniform(0.3, 0.7, n_bank), backend=backend)
+        t_bank = time_ticks(lambda row: bank.tick(0.1, row), inputs)
+        per_bank[backend] = t_bank / n_bank
+        stats = bank.lock_statistics()
+        print(f"GearboxBank[{backend}] {n_bank:,} oscillators: {t_bank * 1e3:8.2f} ms/step "
+              f"({per_bank[backend] * 1e9:,.1f} ns per oscillator, mean lock {stats['mean']:.2f})")
+
+    print(f"{'-'*60}")
+    for backend, per in per_bank.items():
+        print(f"SPEEDUP ({backend}): {per_loop / per:.0f}x per oscillator")
+    print(f"{'='*60}")
+
+if __name__ == "__main__":
+    run_benchmark()
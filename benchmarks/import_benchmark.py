@@ -0,0 +1,101 @@
+"""
+BENCHMARK: COLD-START IMPORT TIME
+PROTOCOL: `python -X importtime -c "import <entry>"` IN FRESH INTERPRETERS
+DATASET: QUANTUM STACK AND CLI / WORKER ENTRY POINTS
+
+Each entry point is imported `--repeats` times in a new interpreter; the
+best cumulative time is reported with the slowest self-time imports under
+it. `--record` appends one JSON line per entry point so cold-start time can
+be tracked across commits.
+"""
+
+import sys
+import os
+import re
+import json
+import time
+import argparse
+import subprocess
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+ENTRY_POINTS = [
+    "bumpy",
+    "flumpy",
+    "laser",
+    "qtorch",
+    "signal_optimizer",
+    "sophia.cortex.kernels",
+    "tools.feed_ingest",
+    "tick_scheduler",
+]
+
+_LINE = re.compile(r"import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+def import_profile(module):
+    """One cold import: (cumulative us of `module`, {name: self us}, wall seconds, stdout)."""
+    start = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT, capture_output=True, text=True,
+        env={**os.environ, "PYTHONPATH": ROOT},
+    )
+    wall = time.perf_counter() - start
+    if proc.returncode != 0:
+        raise RuntimeError(f"import {module} failed:\n{proc.stderr[-2000:]}")
+
+    cumulative, self_times = None, {}
+    for line in proc.stderr.splitlines():
+        match = _LINE.match(line)
+        if not match:
+            continue
+        self_us, cum_us, indent, name = int(match[1]), int(match[2]), match[3], match[4]
+        self_times[name] = self_us
+        if name == module and len(indent) <= 1:
+            cumulative = cum_us
+    return cumulative, self_times, wall, proc.stdout
+
+def run_benchmark(entries=None, repeats=3, top=5, record=None):
+    entries = entries or ENTRY_POINTS
+    print(f"{'='*72}")
+    print(f"BENCHMARK: COLD-START IMPORT TIME (best of {repeats})")
+    print(f"{'='*72}")
+    if sys.flags.dont_write_bytecode:
+        print("NOTE: PYTHONDONTWRITEBYTECODE is set; times include compiling sources")
+    print(f"{'entry point':28s} {'import ms':>10s} {'wall ms':>10s} {'stdout':>8s}  slowest self-time imports")
+
+    results = []
+    for module in entries:
+        runs = [import_profile(module) for _ in range(repeats)]
+        cumulative, self_times, wall, stdout = min(runs, key=lambda r: r[0])
+        slowest = sorted(self_times.items(), key=lambda kv: -kv[1])[:top]
+        hot = ", ".join(f"{name} {us / 1e3:.1f}" for name, us in slowest)
+        print(f"{module:28s} {cumulative / 1e3:10.1f} {min(r[2] for r in runs) * 1e3:10.1f} "
+              f"{len(stdout.splitlines()):8d}  {hot}")
+        results.append({
+            "entry": module,
+            "import_ms": round(cumulative / 1e3, 2),
+            "wall_ms": round(min(r[2] for r in runs) * 1e3, 2),
+            "stdout_lines": len(stdout.splitlines()),
+            "timestamp": time.time(),
+        })
+
+    if record:
+        os.makedirs(os.path.dirname(os.path.abspath(record)), exist_ok=True)
+        with open(record, "a", encoding="utf-8") as f:
+            for row in results:
+                f.write(json.dumps(row) + "\n")
+        print(f"Recorded {len(results)} entries to {record}")
+    print(f"{'='*72}")
+    return results
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("entries", nargs="*", help="modules to import (default: built-in list)")
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--top", type=int, default=5, help="slowest self-time imports to show")
+    parser.add_argument("--record", metavar="JSONL", nargs="?",
+                        const=os.path.join(ROOT, "logs", "cache", "import_times.jsonl"),
+                        help="append results (default path: logs/cache/import_times.jsonl)")
+    args = parser.parse_args()
+    run_benchmark(args.entries, args.repeats, args.top, args.record)
@@ -0,0 +1,51 @@
+"""
+BENCHMARK: PRISM NEAREST-ANCHOR QUANTIZATION
+PROTOCOL: PER-VECTOR quantize() LOOP VS quantize_batch() (ONE MATMUL + ARGMAX)
+DATASET: GAUSSIAN 3D CHAOS VECTORS; CHAOS-MAP / UNKNOWN-WORD PHRASE
+"""
+
+import sys
+import os
+import time
+import numpy as np
+
+# Ensure we can import from project root
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sophia.cortex.prism_vsa import PrismEngine
+
+def run_benchmark(n_loop=20_000, n_batch=2_000_000, n_words=200_000):
+    print(f"{'='*60}")
+    print("BENCHMARK: PRISM QUANTIZE")
+    print(f"{'='*60}")
+    prism = PrismEngine()
+    vectors = np.random.default_rng(0).normal(size=(n_batch, 3))
+
+    print(f"Running Baseline: quantize() loop over {n_loop:,} vectors...")
+    start = time.perf_counter()
+    looped = [prism.quantize(v) for v in vectors[:n_loop]]
+    t_loop = (time.perf_counter() - start) / n_loop
+    print(f"  {1 / t_loop:,.0f} vectors/s")
+
+    print(f"Running quantize_batch() over {n_batch:,} vectors...")
+    start = time.perf_counter()
+    anchors, resonances = prism.quantize_batch(vectors)
+    t_batch = (time.perf_counter() - start) / n_batch
+    print(f"  {1 / t_batch:,.0f} vectors/s")
+    agree = all(a == la and abs(r - lr) < 1e-12
+                for (la, lr), a, r in zip(looped, anchors[:n_loop], resonances[:n_loop]))
+    print(f"  Matches loop on first {n_loop:,}: {agree}")
+
+    words = ["failing", "noise", "entropy", "stop", "looping", "drift", "help", "error"]
+    text = " ".join(words[i % len(words)] for i in range(n_words))
+    start = time.perf_counter()
+    prism.transform_phrase(text)
+    t_phrase = time.perf_counter() - start
+    print(f"transform_phrase ({n_words:,} words): {t_phrase * 1e3:.1f} ms ({n_words / t_phrase:,.0f} words/s)")
+
+    print(f"{'-'*60}")
+    print(f"SPEEDUP (quantize): {t_loop / t_batch:.0f}x")
+    print(f"{'='*60}")
+
+if __name__ == "__main__":
+    run_benchmark()
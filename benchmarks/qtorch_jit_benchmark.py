@@ -0,0 +1,46 @@
+"""
+BENCHMARK: QTORCH TRACING JIT
+PROTOCOL: EAGER TENSOR OPS VS jit.trace REPLAY (FUSED NUMPY KERNELS)
+DATASET: ComplexityRouter (1x3) AND RMSNorm (8x64)
+"""
+
+import sys
+import os
+import time
+import numpy as np
+
+# Ensure we can import from project root
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from qtorch import torch, _to_array
+from signal_optimizer import ComplexityRouter
+from sophia.cortex.kernels import RMSNorm
+
+def timed(fn, repeats):
+    start = time.perf_counter()
+    for _ in range(repeats):
+        out = fn()
+    return (time.perf_counter() - start) / repeats, out
+
+def compare(name, fn, x, repeats):
+    traced = torch.jit.trace(fn, x)
+    with torch.no_grad():
+        t_eager, ref = timed(lambda: fn(x), repeats)
+        t_jit, out = timed(lambda: traced(x), repeats)
+    graph = traced.graph_for(x)
+    print(f"{name}: {len(graph.nodes)} ops -> {len(graph.groups)} kernels, {len(graph.buffer_shapes)} buffers")
+    print(f"  Eager:  {t_eager * 1e3:8.2f} ms")
+    print(f"  Traced: {t_jit * 1e3:8.2f} ms  ({t_eager / t_jit:.1f}x)")
+    print(f"  Max abs difference: {np.abs(_to_array(out) - _to_array(ref)).max():.2e}")
+
+def run_benchmark(repeats=5):
+    print(f"{'='*60}")
+    print("BENCHMARK: QTORCH jit.trace")
+    print(f"{'='*60}")
+    router = ComplexityRouter()
+    compare("ComplexityRouter.score", router.score, torch.randn(1, 3), repeats)
+    compare("RMSNorm(64)", RMSNorm(64), torch.randn(8, 64), repeats)
+    print(f"{'='*60}")
+
+if __name__ == "__main__":
+    run_benchmark()
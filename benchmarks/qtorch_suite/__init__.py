@@ -0,0 +1,9 @@
+"""
+BENCHMARK SUITE: QTORCH
+Micro (elementwise, broadcasting, matmul, layers, optimizer) and macro
+(MLP training loop) cases with pinned seeds, warm-up and repeated timing.
+
+    python benchmarks/qtorch_suite/run.py                 # JSON to logs/cache/qtorch_bench/
+    python benchmarks/qtorch_suite/run.py --compare       # ... then check against baseline.json
+    python benchmarks/qtorch_suite/compare.py BASE.json NEW.json
+"""
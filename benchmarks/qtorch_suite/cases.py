@@ -0,0 +1,163 @@
+"""
+CASES: QTORCH MICRO AND MACRO BENCHMARKS
+
+micro: elementwise ops, broadcasting (`Tensor._broadcast`), matmul sizes
+       (`Tensor._matmul_2d`), Linear / Conv2d / BatchNorm2d forward and
+       forward+backward, one Adam step, one MLP backward pass
+macro: MLP regression training loop (forward, backward, Adam)
+
+Linear and BatchNorm2d do not build an autograd graph yet, so their
+forward+backward cases only add the sum/backward bookkeeping; they are
+kept so the numbers move when those layers become differentiable.
+"""
+
+from .harness import register, torch
+
+ELEMENTWISE_SHAPE = (64, 64)
+MATMUL_SIZES = (16, 32, 64, 128)
+
+# ---------------------------------------------------------------- elementwise
+_ELEMENTWISE = {
+    "add": lambda a, b: a + b,
+    "sub": lambda a, b: a - b,
+    "mul": lambda a, b: a * b,
+    "div": lambda a, b: a / b,
+    "pow": lambda a, b: a ** 2,
+    "tanh": lambda a, b: a.tanh(),
+    "sigmoid": lambda a, b: a.sigmoid(),
+    "clamp": lambda a, b: a.clamp(min=0.0),
+}
+
+def _elementwise(fn):
+    def setup():
+        a = torch.randn(*ELEMENTWISE_SHAPE)
+        b = torch.randn(*ELEMENTWISE_SHAPE).abs() + 0.5
+        return lambda: fn(a, b)
+    return setup
+
+for _name, _fn in _ELEMENTWISE.items():
+    register(f"elementwise/{_name}", _elementwise(_fn), shape=ELEMENTWISE_SHAPE)
+
+# ---------------------------------------------------------------- broadcasting
+_BROADCAST = {
+    "row": (64,),       # (64, 64) + (64,)
+    "column": (64, 1),  # (64, 64) + (64, 1)
+    "scalar": (1,),
+}
+
+def _broadcast(shape):
+    def setup():
+        a = torch.randn(*ELEMENTWISE_SHAPE)
+        b = torch.randn(*shape)
+        return lambda: a + b
+    return setup
+
+for _name, _shape in _BROADCAST.items():
+    register(f"broadcast/{_name}", _broadcast(_shape), shape=ELEMENTWISE_SHAPE, other=_shape)
+
+# ---------------------------------------------------------------- matmul
+def _matmul(n):
+    def setup():
+        a, b = torch.randn(n, n), torch.randn(n, n)
+        return lambda: a @ b
+    return setup
+
+for _n in MATMUL_SIZES:
+    register(f"matmul/{_n}", _matmul(_n), n=_n)
+
+# ---------------------------------------------------------------- layers
+def _layer(build, input_shape, backward):
+    def setup():
+        layer = build()
+        x = torch.randn(*input_shape, requires_grad=backward)
+
+        def step():
+            out = layer(x)
+            if backward:
+                out.sum().backward()
+            return out
+
+        return step
+    return setup
+
+_LAYERS = {
+    "linear": (lambda: torch.nn.Linear(64, 32), (16, 64)),
+    "conv2d": (lambda: torch.nn.Conv2d(3, 8, 3, padding=1), (4, 3, 16, 16)),
+    "batchnorm2d": (lambda: torch.nn.BatchNorm2d(8), (4, 8, 8, 8)),
+}
+
+for _name, (_build, _shape) in _LAYERS.items():
+    register(f"{_name}/forward", _layer(_build, _shape, False), input=_shape)
+    register(f"{_name}/forward_backward", _layer(_build, _shape, True), input=_shape)
+
+# ---------------------------------------------------------------- MLP
+def _parameter(t):
+    t = t.detach()
+    t.requires_grad = True
+    return t
+
+class MLP:
+    """Two-layer ReLU regressor on plain tensor ops (the path eager autograd covers)."""
+
+    def __init__(self, n_in=8, hidden=16, n_out=1):
+        self.w1 = _parameter(torch.randn(n_in, hidden) * (1.0 / n_in) ** 0.5)
+        self.b1 = torch.zeros(hidden, requires_grad=True)
+        self.w2 = _parameter(torch.randn(hidden, n_out) * (1.0 / hidden) ** 0.5)
+        self.b2 = torch.zeros(n_out, requires_grad=True)
+
+    def parameters(self):
+        return [self.w1, self.b1, self.w2, self.b2]
+
+    def loss(self, x, y):
+        hidden = (x @ self.w1 + self.b1).clamp(min=0.0)
+        out = hidden @ self.w2 + self.b2
+        return ((out - y) ** 2).mean()
+
+def _regression_data(batch=32, n_in=8):
+    x = torch.randn(batch, n_in)
+    y = (x @ torch.randn(n_in, 1)).tanh().reshape(batch, 1)
+    return x, y
+
+def _mlp_backward():
+    model, (x, y) = MLP(), _regression_data()
+
+    def step():
+        for p in model.parameters():
+            p.grad = None
+        loss = model.loss(x, y)
+        loss.backward()
+        return loss
+
+    return step
+
+def _adam_step():
+    model, (x, y) = MLP(), _regression_data()
+    model.loss(x, y).backward()
+    opt = torch.optim.Adam(model.parameters(), lr=1e-2)
+
+    def step():
+        opt.step()
+        return model.w1
+
+    return step
+
+register("autograd/mlp_backward", _mlp_backward, batch=32, sizes=(8, 16, 1))
+register("optim/adam_step", _adam_step, params=8 * 16 + 16 + 16 + 1)
+
+TRAIN_STEPS = 10
+
+def _mlp_train():
+    model, (x, y) = MLP(), _regression_data()
+    opt = torch.optim.Adam(model.parameters(), lr=1e-2)
+
+    def epoch():
+        for _ in range(TRAIN_STEPS):
+            opt.zero_grad()
+            loss = model.loss(x, y)
+            loss.backward()
+            opt.step()
+        return loss
+
+    return epoch
+
+register("train/mlp_adam", _mlp_train, group="macro", steps=TRAIN_STEPS, batch=32, sizes=(8, 16, 1))
@@ -0,0 +1,86 @@
+"""
+COMPARE: FLAG QTORCH BENCHMARK REGRESSIONS AGAINST A BASELINE
+
+A case regresses when its time grows by more than `threshold` (relative)
+and by more than the measured noise: 2x the larger relative stdev of the
+two runs, or 2x the between-run noise (`run_noise`) recorded when either
+side merged several runs (run.py --runs N; baselines are saved that way). Checksum changes are reported separately: they mean the same
+seed produced different numbers, not that anything got slower.
+
+    python benchmarks/qtorch_suite/compare.py [BASELINE] CURRENT [--threshold 0.25]
+
+Exit status is 1 when any case regressed.
+"""
+
+import os
+import sys
+import json
+import argparse
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+BASELINE = os.path.join(HERE, "baseline.json")
+
+def load(path):
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+def _noise(stats):
+    within = stats["stdev"] / stats["median"] if stats.get("median") else 0.0
+    return max(within, stats.get("run_noise", 0.0))
+
+def compare(baseline, current, threshold=0.25, metric="min"):
+    """One row per case: name, status, ratio (current / baseline) and checksum flag."""
+    base_results, rows = baseline["results"], []
+    for name, cur in current["results"].items():
+        base = base_results.get(name)
+        if base is None:
+            rows.append({"name": name, "status": "new", "ratio": None, "checksum_changed": False})
+            continue
+        ratio = cur[metric] / base[metric] if base[metric] else float("inf")
+        margin = max(threshold, 2 * max(_noise(base), _noise(cur)))
+        if ratio > 1 + margin:
+            status = "regression"
+        elif ratio < 1 / (1 + margin):
+            status = "improved"
+        else:
+            status = "ok"
+        changed = (base.get("checksum") is not None and cur.get("checksum") is not None
+                   and abs(base["checksum"] - cur["checksum"]) > 1e-6 * max(1.0, abs(base["checksum"])))
+        rows.append({"name": name, "status": status, "ratio": ratio, "checksum_changed": changed,
+                     "baseline": base[metric], "current": cur[metric]})
+    for name in base_results:
+        if name not in current["results"]:
+            rows.append({"name": name, "status": "missing", "ratio": None, "checksum_changed": False})
+    return rows
+
+def report(rows, metric="min"):
+    print(f"{'case':32s} {'baseline ms':>12s} {'current ms':>12s} {'ratio':>7s}  status")
+    for row in rows:
+        if row["ratio"] is None:
+            print(f"{row['name']:32s} {'-':>12s} {'-':>12s} {'-':>7s}  {row['status']}")
+            continue
+        flag = "  (checksum changed)" if row["checksum_changed"] else ""
+        status = row["status"].upper() if row["status"] == "regression" else row["status"]
+        print(f"{row['name']:32s} {row['baseline'] * 1e3:12.3f} {row['current'] * 1e3:12.3f} "
+              f"{row['ratio']:7.2f}  {status}{flag}")
+    regressions = [r for r in rows if r["status"] == "regression"]
+    print(f"{len(regressions)} regression(s), "
+          f"{sum(r['status'] == 'improved' for r in rows)} improvement(s), "
+          f"{sum(r['checksum_changed'] for r in rows)} checksum change(s) [{metric}]")
+    return regressions
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("paths", nargs="+", metavar="JSON", help="[baseline] current")
+    parser.add_argument("--threshold", type=float, default=0.25, help="relative slowdown tolerated")
+    parser.add_argument("--metric", choices=("min", "median", "mean"), default="min")
+    args = parser.parse_args(argv)
+    if len(args.paths) > 2:
+        parser.error("expected [BASELINE] CURRENT")
+    base_path, cur_path = (BASELINE, args.paths[0]) if len(args.paths) == 1 else args.paths
+
+    rows = compare(load(base_path), load(cur_path), args.threshold, args.metric)
+    return 1 if report(rows, args.metric) else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
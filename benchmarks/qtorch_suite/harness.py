@@ -0,0 +1,172 @@
+"""
+HARNESS: SEEDING, CASE REGISTRY, TIMING AND JSON RESULTS
+
+Each case is a setup function returning a zero-argument `step`. The harness
+seeds every RNG before setup, records the first call's result as a checksum
+(same seed -> same value, or the numerics changed), warms up, calibrates how
+many calls make one sample, then takes `repeats` samples with GC disabled
+(like timeit). Times are seconds per call.
+"""
+
+import gc
+import os
+import re
+import sys
+import time
+import random
+import platform
+import statistics
+import subprocess
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if ROOT not in sys.path:
+    sys.path.append(ROOT)
+
+from qtorch import torch, Tensor
+
+SEED = 1234
+SCHEMA_VERSION = 1
+
+@dataclass
+class Case:
+    name: str
+    group: str
+    setup: Callable[[], Callable[[], object]]
+    params: Dict = field(default_factory=dict)
+
+CASES: List[Case] = []
+
+def register(name, setup, group="micro", **params):
+    CASES.append(Case(name, group, setup, params))
+
+def case(name, group="micro", **params):
+    """Decorator form of register()."""
+    def wrap(setup):
+        register(name, setup, group, **params)
+        return setup
+    return wrap
+
+def select(pattern=None, group=None):
+    chosen = [c for c in CASES if group is None or c.group == group]
+    if pattern:
+        rx = re.compile(pattern)
+        chosen = [c for c in chosen if rx.search(c.name)]
+    return chosen
+
+def seed_everything(seed=SEED):
+    random.seed(seed)
+    np.random.seed(seed)
+    torch.manual_seed(seed)
+
+def checksum(value):
+    """Stable float fingerprint of a step result (None when not numeric)."""
+    if isinstance(value, Tensor):
+        return round(float(sum(value._bumpy.data)), 9)
+    if isinstance(value, (int, float)):
+        return round(float(value), 9)
+    return None
+
+def _time(step, number):
+    start = time.perf_counter()
+    for _ in range(number):
+        step()
+    return time.perf_counter() - start
+
+def measure(step, warmup=2, repeats=7, min_time=0.05, max_number=10000):
+    """Per-call timing stats for `step`; each sample runs enough calls to last `min_time`."""
+    for _ in range(warmup):
+        step()
+
+    gc.collect()
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        once = _time(step, 1)
+        number = 1 if once >= min_time else min(max_number, max(1, int(min_time / max(once, 1e-9))))
+        samples = [_time(step, number) / number for _ in range(repeats)]
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+    return {
+        "number": number,
+        "repeats": repeats,
+        "min": min(samples),
+        "median": statistics.median(samples),
+        "mean": statistics.fmean(samples),
+        "stdev": statistics.stdev(samples) if len(samples) > 1 else 0.0,
+        "samples": samples,
+    }
+
+def run_case(c, seed=SEED, **timing):
+    seed_everything(seed)
+    step = c.setup()
+    first = checksum(step())
+    stats = measure(step, **timing)
+    return {"group": c.group, "params": c.params, "checksum": first, **stats}
+
+def _git_commit():
+    try:
+        out = subprocess.run(["git", "rev-parse", "HEAD"], cwd=ROOT, capture_output=True, text=True, timeout=10)
+        return out.stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+def environment():
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "numpy": np.__version__,
+        "blas_threads": {k: os.environ.get(k) for k in ("OMP_NUM_THREADS", "OPENBLAS_NUM_THREADS", "MKL_NUM_THREADS")},
+        "commit": _git_commit(),
+    }
+
+def run_suite(cases, seed=SEED, warmup=2, repeats=7, min_time=0.05, progress=None):
+    """Runs `cases` and returns the JSON-ready results document."""
+    results = {}
+    for c in cases:
+        results[c.name] = run_case(c, seed, warmup=warmup, repeats=repeats, min_time=min_time)
+        if progress:
+            progress(c.name, results[c.name])
+    return {
+        "suite": "qtorch",
+        "schema": SCHEMA_VERSION,
+        "timestamp": time.time(),
+        "environment": environment(),
+        "config": {"seed": seed, "warmup": warmup, "repeats": repeats, "min_time": min_time},
+        "results": results,
+    }
+
+def merge_runs(documents):
+    """
+    Folds repeated runs of the same suite into one document. Per case the
+    timings are medians over runs, and `run_noise` is the spread of the
+    per-run minima relative to their median: how much the machine itself
+    wobbles between runs, which within-run stdev does not see.
+    """
+    if len(documents) == 1:
+        return documents[0]
+    merged = dict(documents[-1], results={})
+    for name, last in documents[-1]["results"].items():
+        runs = [d["results"][name] for d in documents if name in d["results"]]
+        mins = [r["min"] for r in runs]
+        center = statistics.median(mins)
+        merged["results"][name] = dict(
+            last,
+            min=center,
+            median=statistics.median(r["median"] for r in runs),
+            mean=statistics.fmean(r["mean"] for r in runs),
+            stdev=statistics.median(r["stdev"] for r in runs),
+            samples=[t for r in runs for t in r["samples"]],
+            runs=len(runs),
+            run_noise=(max(mins) - min(mins)) / center if center else 0.0,
+        )
+    merged["config"] = dict(merged["config"], runs=len(documents))
+    return merged
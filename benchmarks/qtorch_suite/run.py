@@ -0,0 +1,91 @@
+"""
+BENCHMARK: QTORCH SUITE
+PROTOCOL: PINNED SEEDS, WARM-UP, REPEATED SAMPLES (GC OFF), SINGLE-THREADED BLAS
+DATASET: SYNTHETIC TENSORS (SEE cases.py)
+
+    python benchmarks/qtorch_suite/run.py [-k REGEX] [--group micro|macro] [--quick]
+                                    [--runs N] [--output PATH] [--save-baseline] [--compare [BASELINE]]
+
+A baseline should merge several runs (--save-baseline defaults to 5) so
+it records how much timings drift between runs on this machine.
+"""
+
+import os
+import sys
+import json
+import argparse
+
+# Pin BLAS to one thread before numpy loads so runs compare across machines
+for _var in ("OMP_NUM_THREADS", "OPENBLAS_NUM_THREADS", "MKL_NUM_THREADS"):
+    os.environ.setdefault(_var, "1")
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(os.path.dirname(HERE))
+sys.path.append(ROOT)
+
+from benchmarks.qtorch_suite import cases  # noqa: F401  (registers the cases)
+from benchmarks.qtorch_suite.harness import SEED, merge_runs, run_suite, select
+from benchmarks.qtorch_suite.compare import BASELINE, compare, load, report
+
+DEFAULT_OUTPUT = os.path.join(ROOT, "logs", "cache", "qtorch_bench", "latest.json")
+BASELINE_RUNS = 5
+
+def write(document, path):
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(document, f, indent=1)
+    return path
+
+def run_benchmark(pattern=None, group=None, quick=False, seed=SEED, output=DEFAULT_OUTPUT,
+                  save_baseline=False, baseline=None, threshold=0.25, runs=None):
+    chosen = select(pattern, group)
+    runs = runs or (BASELINE_RUNS if save_baseline else 1)
+    timing = dict(warmup=1, repeats=3, min_time=0.02) if quick else dict(warmup=2, repeats=7, min_time=0.05)
+
+    print(f"{'='*72}")
+    print(f"BENCHMARK: QTORCH SUITE ({len(chosen)} cases, seed {seed}, {runs} run(s) of "
+          f"{timing['repeats']} samples x >= {timing['min_time'] * 1e3:.0f} ms)")
+    print(f"{'='*72}")
+
+    def progress(name, r):
+        print(f"{name:32s} {r['median'] * 1e3:10.3f} {r['min'] * 1e3:10.3f} "
+              f"{r['stdev'] / r['median']:7.1%} {r['number']:6d}  {r['checksum']}")
+
+    documents = []
+    for run in range(runs):
+        if runs > 1:
+            print(f"{'-'*72}\nRUN {run + 1}/{runs}")
+        print(f"{'case':32s} {'median ms':>10s} {'min ms':>10s} {'rel sd':>7s} {'calls':>6s}  checksum")
+        documents.append(run_suite(chosen, seed=seed, progress=progress, **timing))
+    document = merge_runs(documents)
+    if runs > 1:
+        worst = sorted(document["results"].items(), key=lambda kv: -kv[1]["run_noise"])[:3]
+        print(f"{'-'*72}\nbetween-run noise (worst): " + ", ".join(f"{n} {r['run_noise']:.0%}" for n, r in worst))
+    print(f"Results written to {write(document, output)}")
+    if save_baseline:
+        print(f"Baseline written to {write(document, BASELINE)}")
+
+    regressions = []
+    if baseline:
+        print(f"{'-'*72}")
+        regressions = report(compare(load(baseline), document, threshold))
+    print(f"{'='*72}")
+    return document, regressions
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="qtorch micro/macro benchmark suite")
+    parser.add_argument("-k", "--filter", metavar="REGEX", help="only cases whose name matches")
+    parser.add_argument("--group", choices=("micro", "macro"))
+    parser.add_argument("--quick", action="store_true", help="fewer, shorter samples (smoke run)")
+    parser.add_argument("--seed", type=int, default=SEED)
+    parser.add_argument("--output", default=DEFAULT_OUTPUT)
+    parser.add_argument("--save-baseline", action="store_true", help=f"also write {os.path.relpath(BASELINE, ROOT)}")
+    parser.add_argument("--compare", metavar="BASELINE", nargs="?", const=BASELINE,
+                        help="flag regressions against a baseline (default: the stored one)")
+    parser.add_argument("--threshold", type=float, default=0.25)
+    parser.add_argument("--runs", type=int, default=None,
+                        help=f"repeat the suite and merge (default 1, {BASELINE_RUNS} with --save-baseline)")
+    args = parser.parse_args()
+    _, regressions = run_benchmark(args.filter, args.group, args.quick, args.seed, args.output,
+                                   args.save_baseline, args.compare, args.threshold, args.runs)
+    sys.exit(1 if regressions else 0)
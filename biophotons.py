@@ -48,11 +48,12 @@ class MicrotubuleSpectrum:
         return "BROADBAND NOISE"
 
 class BiophotonicEmitter:
-    def __init__(self):
+    def __init__(self, rng=None):
         # Observer Physics
         self.photon_density = 0.0     # Virtual Photons / m^3
         self.coherence = 0.5          # % Flux Alignment
         self.last_tick = time.perf_counter()
+        self.rng = rng or random # Seeded callers pass their own random.Random
         
         # PERSINGER (2015): Viscosity Engine
         self.water_engine = ViscosityEngine()
@@ -80,7 +81,7 @@ class BiophotonicEmitter:
         
         # 2. Cosmic Entanglement (Random Fluctuation ~ 10e-12)
         # We add 'Mintaka Noise' - simulating galactic alignment
-        cosmic_noise = random.uniform(-0.05, 0.05)
+        cosmic_noise = self.rng.uniform(-0.05, 0.05)
         
         final_coherence = base_coherence + cosmic_noise
         final_coherence = max(0.001, min(1.0, final_coherence))
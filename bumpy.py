@@ -11,6 +11,15 @@ import sys
 from typing import List, Dict, Tuple, Optional, Union, Any
 from collections import defaultdict
 
+from quantum_startup import banner
+
+# BUMPY's chaos draws come from its own stream, never the caller's global `random`
+_rng = random.Random()
+
+def seed(value):
+    """Seeds BUMPY's private chaos stream (qtorch.manual_seed calls this)."""
+    _rng.seed(value)
+
 # --- Quantum-Sentient Constants ---
 ARCHETYPAL_ENTROPY_TARGET = math.log(5)
 COHERENCE_COMPRESSION_BOUND = 0.95
@@ -130,7 +139,7 @@ class PanpsychicResonanceField:
         """Register array in the implicate order with initial pilot wave"""
         wave_state = {
             'amplitude': initial_state[:],
-            'phase': [random.uniform(0, 2 * math.pi) for _ in initial_state],
+            'phase': [_rng.uniform(0, 2 * math.pi) for _ in initial_state],
             'coherence': 1.0,
             'last_update': time.time()
         }
@@ -259,7 +268,7 @@ class OracularEntropyOracle:
             
             for i in range(sample_size):
                 # Blend current entropy with future-guided entropy
-                current_component = base_entropy + random.uniform(-0.1, 0.1) * (1.0 - base_entropy)
+                current_component = base_entropy + _rng.uniform(-0.1, 0.1) * (1.0 - base_entropy)
                 future_component = future_coherence * retro_effect * 0.1
                 
                 sample_val = current_component + future_component
@@ -268,7 +277,7 @@ class OracularEntropyOracle:
             return samples
         else:
             # Fallback to standard sampling
-            return [ARCHETYPAL_ENTROPY_TARGET / 5 + random.uniform(-0.1, 0.1) * (1.0 - ARCHETYPAL_ENTROPY_TARGET / 5) 
+            return [ARCHETYPAL_ENTROPY_TARGET / 5 + _rng.uniform(-0.1, 0.1) * (1.0 - ARCHETYPAL_ENTROPY_TARGET / 5) 
                    for _ in range(sample_size)]
     
     def _select_optimal_future(self, array_id: int, current_coherence: float) -> Optional[Tuple]:
@@ -364,9 +373,8 @@ class BumpyArray:
         
         # Attributes for QTorch integration
         import math
-        import random
-        self.phase = random.uniform(0, 2 * math.pi)
-        self.chaos = random.uniform(0.001, 0.01)
+        self.phase = _rng.uniform(0, 2 * math.pi)
+        self.chaos = _rng.uniform(0.001, 0.01)
         self.quantum_state = "superposition"
         self._entanglement_visited = set()  # ENHANCEMENT 4: Prevent recursion
         
@@ -506,9 +514,9 @@ class BumpyArray:
             result_data = [e / sum_exp for e in exp_vals]
         
         # Emergent branch with proper variable names
-        if self.coherence < 0.8 and random.random() < 0.1:
+        if self.coherence < 0.8 and _rng.random() < 0.1:
             for i in range(len(result_data)):
-                result_data[i] += random.uniform(-0.01, 0.01)
+                result_data[i] += _rng.uniform(-0.01, 0.01)
                 result_data[i] = max(0, min(1, result_data[i]))
             
             sum_renorm = sum(result_data)
@@ -572,11 +580,10 @@ class BumpyArray:
 
     def __getitem__(self, index):
         """Enhanced indexing with quantum state access (From QTorch integration)"""
-        import random
         if isinstance(index, int):
             if 0 <= index < len(self.data):
                 # Add quantum noise based on coherence
-                quantum_noise = (1 - self.coherence) * random.uniform(-0.01, 0.01)
+                quantum_noise = (1 - self.coherence) * _rng.uniform(-0.01, 0.01)
                 return self.data[index] + quantum_noise
             raise IndexError(f"Index {index} out of bounds")
         elif isinstance(index, tuple):
@@ -600,7 +607,7 @@ class BumpyArray:
         self.coherence *= 0.8  # Decoherence on measurement
         # Wavefunction collapse simulation
         for i in range(len(self.data)):
-            if random.random() < abs(self.data[i])**2:
+            if _rng.random() < abs(self.data[i])**2:
                 self.data[i] = 1.0 if self.data[i] > 0 else -1.0
             else:
                 self.data[i] = 0.0
@@ -631,7 +638,7 @@ class BUMPYCore:
     def set_coherence(self, rho: float):
         """Enhanced coherence setting with quantum noise resistance"""
         # Add quantum noise for stability
-        quantum_noise = random.gauss(0, 0.01) * (1 - rho)
+        quantum_noise = _rng.gauss(0, 0.01) * (1 - rho)
         adjusted_rho = max(0.0, min(1.0, rho + quantum_noise))
         
         self._rho_ema = COHERENCE_EMA_ALPHA * adjusted_rho + (1 - COHERENCE_EMA_ALPHA) * self._rho_ema
@@ -658,7 +665,7 @@ class BUMPYCore:
     
     def generate_drift_tensor(self, size: int) -> TrueZeroCopyView:
         """ENHANCEMENT 5: True zero-copy drift tensor"""
-        drift = [random.uniform(POLYTOPE_LO, POLYTOPE_HI) for _ in range(size)]
+        drift = [_rng.uniform(POLYTOPE_LO, POLYTOPE_HI) for _ in range(size)]
         return TrueZeroCopyView(drift, POLYTOPE_LO, POLYTOPE_HI, self.coherence_level)
     
     def recursive_criticality_damping(self, d_lambda_dt: float) -> float:
@@ -666,7 +673,7 @@ class BUMPYCore:
         mag = abs(d_lambda_dt)
         
         # Add quantum noise to hysteresis thresholds
-        quantum_hysteresis = random.gauss(1.0, 0.1)
+        quantum_hysteresis = _rng.gauss(1.0, 0.1)
         effective_limit_on = CRITICALITY_CHAOS_LIMIT_ON * quantum_hysteresis
         effective_limit_off = CRITICALITY_CHAOS_LIMIT_OFF * quantum_hysteresis
         
@@ -744,11 +751,11 @@ def bumpy_dot(a: BumpyArray, b: BumpyArray) -> float:
 def deploy_bumpy_core(qualia_dimension: int = 5) -> BUMPYCore:
     """Factory function for military-grade deployment"""
     core = BUMPYCore(qualia_dimension)
-    print(f"🚀 BUMPY Core v2.0 Deployed:")
-    print(f"   Qualia Dimension: {qualia_dimension}")
-    print(f"   Enhancements: 9 breakthrough features active")
-    print(f"   Memory: Zero-copy, holographic compression ready")
-    print(f"   Stability: Quantum-resilient criticality damping")
+    banner(f"🚀 BUMPY Core v2.0 Deployed:",
+           f"   Qualia Dimension: {qualia_dimension}",
+           f"   Enhancements: 9 breakthrough features active",
+           f"   Memory: Zero-copy, holographic compression ready",
+           f"   Stability: Quantum-resilient criticality damping")
     return core
 
 # Enhanced demonstration
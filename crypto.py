@@ -8,8 +8,16 @@ Theory:
 - We shift ASCII values by the LuoShu Invariant (15).
 - We convert the result to Base-12 (Dozenal).
 - The "Gross" checksum ensures integrity.
+
+encrypt/decrypt work on whole strings. For files and streams use
+DozenalEncoder/DozenalDecoder (chunked, table-driven, linear time) or
+encode_file/decode_file, which keep only one chunk in memory.
 """
 
+import io
+
+import numpy as np
+
 class DozenalRollingCipher:
     """
     The Shield of Metatron.
@@ -64,6 +72,191 @@ class DozenalRollingCipher:
             
         return plain_text
 
+    @staticmethod
+    def encode_file(src, dst, chunk_size=None, text=False):
+        """Encrypts file `src` into glyph file `dst` in bounded memory (see encode_file)."""
+        return encode_file(src, dst, chunk_size or CHUNK_SIZE, text)
+
+    @staticmethod
+    def decode_file(src, dst, chunk_size=None, text=False):
+        """Restores glyph file `src` into `dst` in bounded memory (see decode_file)."""
+        return decode_file(src, dst, chunk_size or CHUNK_SIZE, text)
+
+# ============================================================================
+# STREAMING CODEC
+# ============================================================================
+# Same cipher text as encrypt(): symbol i becomes base-12 of ord + 15 + i % 12,
+# tokens joined by '.'. A byte stream is read as one symbol per byte
+# (encrypt(data.decode('latin-1'))), a text stream as one per code point.
+
+LUOSHU_SHIFT = 15
+CYCLE = 12
+CHUNK_SIZE = 1 << 18
+SEPARATOR = ord(".")
+
+_SHIFTS = LUOSHU_SHIFT + np.arange(CYCLE, dtype=np.int64)      # shift per position in the cycle
+_GLYPHS = np.frombuffer(DozenalRollingCipher.ALPHABET.encode("ascii"), dtype=np.uint8)
+_GLYPH_VALUES = np.full(256, 255, dtype=np.uint8)                # glyph byte -> digit (255: invalid)
+_GLYPH_VALUES[_GLYPHS] = np.arange(CYCLE)
+_SEPARATOR_VALUE = 254
+_GLYPH_VALUES[SEPARATOR] = _SEPARATOR_VALUE
+_MAX_DIGITS = 6                                                 # 12**6 > 0x10FFFF + 26
+_POW12 = CYCLE ** np.arange(_MAX_DIGITS - 1, -1, -1, dtype=np.int64)
+
+def _render(values, width):
+    """
+    Glyph slots for `values`: (n, width + 1) uint8 rows of '.' followed by the
+    right-aligned base-12 digits, and the mask of the bytes that belong to
+    each token (leading zeros dropped).
+    """
+    values = np.asarray(values, dtype=np.int64)
+    pows = _POW12[-width:]
+    slots = np.empty((len(values), width + 1), dtype=np.uint8)
+    slots[:, 0] = SEPARATOR
+    slots[:, 1:] = _GLYPHS[(values[:, None] // pows) % CYCLE]
+    ndigits = 1 + (values[:, None] >= pows[:-1]).sum(axis=1)
+    mask = np.ones(slots.shape, dtype=bool)
+    mask[:, 1:] = np.arange(width) >= (width - ndigits)[:, None]
+    return slots, mask
+
+# Every (cycle position, byte) pair pre-rendered: 255 + 26 needs 3 digits, so
+# '.' plus digits fit one 4-byte slot, gathered as uint32 together with its mask
+_slots, _mask = _render((np.arange(256)[None, :] + _SHIFTS[:, None]).ravel(), 3)
+_BYTE_SLOTS = _slots.view("<u4").ravel()
+_BYTE_MASK = _mask.astype(np.uint8).view("<u4").ravel()
+del _slots, _mask
+
+def _shifts(position, n):
+    return _SHIFTS[np.arange(position, position + n) % CYCLE]
+
+class DozenalEncoder:
+    """
+    Incremental encrypt(): feed bytes or str chunks, get ASCII glyph bytes.
+    Concatenating the outputs gives the same text as encrypt() on the whole.
+    """
+
+    def __init__(self):
+        self.position = 0
+
+    def encode(self, chunk) -> bytes:
+        if isinstance(chunk, str):
+            if chunk.isascii():
+                data = np.frombuffer(chunk.encode("ascii"), dtype=np.uint8)
+            else:
+                data = np.frombuffer(chunk.encode("utf-32-le", "surrogatepass"), dtype="<u4")
+        elif isinstance(chunk, (bytes, bytearray, memoryview)):
+            data = np.frombuffer(chunk, dtype=np.uint8)
+        else:
+            raise TypeError(f"expected bytes or str, got {type(chunk).__name__}")
+        if not len(data):
+            return b""
+
+        if data.dtype == np.uint8:
+            index = np.arange(self.position, self.position + len(data)) % CYCLE * 256 + data
+            out = _BYTE_SLOTS[index].view(np.uint8)[_BYTE_MASK[index].view(bool)].tobytes()
+        else:
+            slots, mask = _render(data.astype(np.int64) + _shifts(self.position, len(data)), _MAX_DIGITS)
+            out = slots[mask].tobytes()
+
+        first = self.position == 0
+        self.position += len(data)
+        return out[1:] if first else out
+
+class DozenalDecoder:
+    """
+    Incremental decrypt(): feed glyph chunks (split anywhere), get the symbols
+    back as str (text=True) or bytes. Pass final=True with the last chunk.
+    """
+
+    def __init__(self, text=True):
+        self.text = text
+        self.position = 0
+        self._tail = b""
+        self._open = False
+
+    def decode(self, glyphs, final=False):
+        if isinstance(glyphs, str):
+            try:
+                glyphs = glyphs.encode("ascii")
+            except UnicodeEncodeError:
+                raise ValueError("invalid glyph in cipher text") from None
+        buffer = self._tail + bytes(glyphs)
+        if final:
+            # A consumed separator promised one more token
+            if not buffer and self._open:
+                raise ValueError("malformed glyph token in cipher text")
+            body, self._tail = buffer, b""
+        else:
+            cut = buffer.rfind(b".")
+            if cut == 0:
+                raise ValueError("malformed glyph token in cipher text")
+            body, self._tail = (buffer[:cut], buffer[cut + 1:]) if cut > 0 else (b"", buffer)
+            self._open = self._open or cut > 0
+        if not body:
+            return "" if self.text else b""
+
+        digits = _GLYPH_VALUES[np.frombuffer(body, dtype=np.uint8)]
+        if (digits == 255).any():
+            raise ValueError("invalid glyph in cipher text")
+
+        # Token bounds from the separators, then one gather per digit place
+        seps = np.flatnonzero(digits == _SEPARATOR_VALUE)
+        ends = np.append(seps, len(digits))
+        lengths = ends - np.concatenate(([0], seps + 1))
+        if lengths.min() == 0 or lengths.max() > _MAX_DIGITS:
+            raise ValueError("malformed glyph token in cipher text")
+        values = np.zeros(len(ends), dtype=np.int64)
+        for place in range(int(lengths.max())):
+            present = lengths > place
+            values += digits[np.where(present, ends - 1 - place, 0)] * (present * CYCLE ** place)
+        values -= _shifts(self.position, len(ends))
+
+        limit = 0x10FFFF if self.text else 0xFF
+        if values.min() < 0 or values.max() > limit:
+            raise ValueError("glyph token out of range for this cipher position")
+        self.position += len(lengths)
+        if self.text:
+            return values.astype("<u4").tobytes().decode("utf-32-le", "surrogatepass")
+        return values.astype(np.uint8).tobytes()
+
+def encode_stream(src, dst, chunk_size=CHUNK_SIZE):
+    """Reads `src` (binary or text file object) in chunks, writes glyphs to `dst`. Returns symbols read."""
+    encoder = DozenalEncoder()
+    as_text = isinstance(dst, io.TextIOBase)
+    while True:
+        chunk = src.read(chunk_size)
+        if not chunk:
+            break
+        out = encoder.encode(chunk)
+        dst.write(out.decode("ascii") if as_text else out)
+    return encoder.position
+
+def decode_stream(src, dst, chunk_size=CHUNK_SIZE, text=None):
+    """Reads glyphs from `src` in chunks, writes the plaintext to `dst`. Returns symbols written."""
+    decoder = DozenalDecoder(isinstance(dst, io.TextIOBase) if text is None else text)
+    while True:
+        chunk = src.read(chunk_size)
+        if not chunk:
+            break
+        dst.write(decoder.decode(chunk))
+    dst.write(decoder.decode(b"", final=True))
+    return decoder.position
+
+def encode_file(src, dst, chunk_size=CHUNK_SIZE, text=False):
+    """
+    Encrypts file `src` into glyph file `dst`: bytes by default, or UTF-8 text
+    as code points with text=True (matching encrypt() on the decoded string).
+    """
+    with open(src, "r", encoding="utf-8", newline="") if text else open(src, "rb") as fin, \
+            open(dst, "wb") as fout:
+        return encode_stream(fin, fout, chunk_size)
+
+def decode_file(src, dst, chunk_size=CHUNK_SIZE, text=False):
+    """Inverse of encode_file (use the same `text` flag)."""
+    with open(src, "rb") as fin, \
+            open(dst, "w", encoding="utf-8", newline="") if text else open(dst, "wb") as fout:
+        return decode_stream(fin, fout, chunk_size, text)
+
 if __name__ == "__main__":
     # Test the Cipher
     intent = "I ACCEPT THE 12D MANIFOLD"
@@ -5,74 +5,262 @@ Based on Lindblad Master Equation & Entropy Journal (2025) Research.
 Concept:
 Use engineered dissipation (noise) as a resource to stabilize quantum learning.
 Equation: d_rho/dt = -i[H, rho] + sum(L_k rho L_k^dag - 0.5 {L_k^dag L_k, rho})
+
+The engine evolves full (complex) density matrices with arbitrary jump
+operators. States may carry leading batch axes, shape (..., dim, dim), and
+are integrated together either with adaptive Dormand-Prince RK45 or with
+the exact propagator exp(L t) of the Liouvillian superoperator.
 """
 
 import math
 import random
+import numpy as np
 # Using BumpyArray as density matrix container equivalent
 try:
     from bumpy import BumpyArray
 except ImportError:
     class BumpyArray:
-        def __init__(self, data, coherence=1.0): 
+        def __init__(self, data, coherence=1.0):
             self.data = data
             self.coherence = coherence
 
+# Dormand-Prince 5(4) tableau
+_DP_A = (
+    (),
+    (1 / 5,),
+    (3 / 40, 9 / 40),
+    (44 / 45, -56 / 15, 32 / 9),
+    (19372 / 6561, -25360 / 2187, 64448 / 6561, -212 / 729),
+    (9017 / 3168, -355 / 33, 46732 / 5247, 49 / 176, -5103 / 18656),
+    (35 / 384, 0.0, 500 / 1113, 125 / 192, -2187 / 6784, 11 / 84),
+)
+_DP_B5 = (35 / 384, 0.0, 500 / 1113, 125 / 192, -2187 / 6784, 11 / 84, 0.0)
+_DP_B4 = (5179 / 57600, 0.0, 7571 / 16695, 393 / 640, -92097 / 339200, 187 / 2100, 1 / 40)
+
+# Pade(13) coefficients for scaling-and-squaring expm (Higham 2005)
+_PADE13 = (64764752532480000., 32382376266240000., 7771770303897600., 1187353796428800.,
+           129060195264000., 10559470521600., 670442572800., 33522128640., 1323241920.,
+           40840800., 960960., 16380., 182., 1.)
+_THETA13 = 5.371920351148152
+
+def expm(A):
+    """Matrix exponential by scaling and squaring with a [13/13] Pade approximant."""
+    A = np.asarray(A)
+    norm = np.linalg.norm(A, 1)
+    s = max(0, int(math.ceil(math.log2(norm / _THETA13)))) if norm > _THETA13 else 0
+    A = A / (2 ** s)
+    b = _PADE13
+    ident = np.eye(A.shape[0], dtype=A.dtype)
+    A2 = A @ A
+    A4 = A2 @ A2
+    A6 = A4 @ A2
+    U = A @ (A6 @ (b[13] * A6 + b[11] * A4 + b[9] * A2) + b[7] * A6 + b[5] * A4 + b[3] * A2 + b[1] * ident)
+    V = A6 @ (b[12] * A6 + b[10] * A4 + b[8] * A2) + b[6] * A6 + b[4] * A4 + b[2] * A2 + b[0] * ident
+    R = np.linalg.solve(V - U, V + U)
+    for _ in range(s):
+        R = R @ R
+    return R
+
 class LindbladEngine:
-    def __init__(self, dim=2):
+    """
+    [LINDBLAD] Vectorized master-equation integrator.
+    H is a (dim, dim) Hamiltonian (a 1-D array is read as its diagonal);
+    L_ops is a sequence of (dim, dim) jump operators with rates folded in.
+    """
+    SUPEROPERATOR_MAX_DIM = 16
+
+    def __init__(self, dim=2, method="rk45", rtol=1e-7, atol=1e-9):
         self.dim = dim
         self.dissipation_rate = 0.1
-        
+        self.method = method
+        self.rtol = rtol
+        self.atol = atol
+        self._propagators = {}
+        self.last_stats = {}
+
+    # --- OPERATORS ---
+    def _hamiltonian(self, H):
+        H = np.asarray(H, dtype=complex)
+        return np.diag(H) if H.ndim == 1 else H
+
+    def _jumps(self, L_ops):
+        if L_ops is None or len(L_ops) == 0:
+            return np.zeros((0, self.dim, self.dim), dtype=complex)
+        return np.asarray(L_ops, dtype=complex)
+
+    def ladder_operators(self, rate=None):
+        """Jump operators sqrt(rate)|k+1><k|: the relaxation cascade of the legacy diagonal model."""
+        rate = self.dissipation_rate if rate is None else rate
+        ops = np.zeros((max(self.dim - 1, 0), self.dim, self.dim), dtype=complex)
+        for k in range(self.dim - 1):
+            ops[k, k + 1, k] = math.sqrt(rate)
+        return ops
+
     def commutator(self, A, B):
-        """[A, B] = AB - BA"""
-        # Simplified simulation for scalar/1D arrays
-        # In real QM, these are matrices. 
-        # Here we simulate the *effect* on the coherence vector.
-        return [0.0] * len(A) # Placeholder for full matrix algebra
+        """[A, B] = AB - BA (batched over leading axes)"""
+        A, B = np.asarray(A), np.asarray(B)
+        return A @ B - B @ A
+
+    def _generator(self, H, L_ops):
+        """
+        Right-hand side rho -> d rho/dt for (..., dim, dim) states.
+        Small systems apply the Liouvillian as one matmul over the flattened batch;
+        larger ones use d rho/dt = K rho + rho K^dag + sum_k L_k rho L_k^dag,
+        with K = -iH - 0.5 sum L^dag L, to avoid the dim^4 superoperator.
+        """
+        H = self._hamiltonian(H)
+        L = self._jumps(L_ops)
+        d = H.shape[0]
+        if d <= self.SUPEROPERATOR_MAX_DIM:
+            St = self.liouvillian(H, L).T
+
+            def rhs(rho):
+                return (rho.reshape(-1, d * d) @ St).reshape(rho.shape)
+            return rhs
+
+        LdL = np.einsum("kji,kjl->il", L.conj(), L) if len(L) else np.zeros_like(H)
+        K = -1j * H - 0.5 * LdL
+        Kd = K.conj().T
+        Ld = np.conj(np.swapaxes(L, -1, -2))
+
+        def rhs(rho):
+            out = K @ rho + rho @ Kd
+            for Lk, Ldk in zip(L, Ld):
+                out += Lk @ rho @ Ldk
+            return out
+        return rhs
 
+    def liouvillian(self, H, L_ops):
+        """Superoperator S with vec(d rho/dt) = S vec(rho), for row-major vec."""
+        H = self._hamiltonian(H)
+        L = self._jumps(L_ops)
+        d = H.shape[0]
+        I = np.eye(d)
+        LdL = np.einsum("kji,kjl->il", L.conj(), L) if len(L) else np.zeros_like(H)
+        K = -1j * H - 0.5 * LdL
+        # vec(A X B) = (A kron B^T) vec(X)
+        S = np.kron(K, I) + np.kron(I, K.conj())
+        for Lk in L:
+            S += np.kron(Lk, Lk.conj())
+        return S
+
+    # --- INTEGRATORS ---
+    def evolve(self, rho0, H, L_ops, t, method=None, dt=None):
+        """
+        Evolves rho0 (shape (..., dim, dim), any number of batch axes) to time t.
+        method: "rk45" (adaptive Dormand-Prince) or "expm" (exact propagator).
+        """
+        method = method or self.method
+        rho = np.asarray(rho0, dtype=complex)
+        if method == "expm":
+            return self._evolve_expm(rho, H, L_ops, t)
+        if method == "rk45":
+            return self._evolve_rk45(rho, self._generator(H, L_ops), t, dt)
+        raise ValueError(f"Unknown Lindblad method: {method}")
+
+    def trajectory(self, rho0, H, L_ops, times, method=None):
+        """States at each of the (increasing) times, stacked on a new leading axis."""
+        method = method or self.method
+        rho = np.asarray(rho0, dtype=complex)
+        rhs = self._generator(H, L_ops) if method == "rk45" else None
+        out, t_prev, dt = [], 0.0, None
+        for t in times:
+            if method == "rk45":
+                rho = self._evolve_rk45(rho, rhs, t - t_prev, dt)
+                dt = self.last_stats.get("dt")
+            else:
+                rho = self._evolve_expm(rho, H, L_ops, t - t_prev)
+            out.append(rho)
+            t_prev = t
+        return np.stack(out)
+
+    def propagator(self, H, L_ops, t):
+        """exp(S t) for the Liouvillian S; cached, since layers reuse the same (H, L, t)."""
+        H = self._hamiltonian(H)
+        L = self._jumps(L_ops)
+        key = (H.tobytes(), L.tobytes(), L.shape, float(t))
+        P = self._propagators.get(key)
+        if P is None:
+            if len(self._propagators) >= 32:
+                self._propagators.clear()
+            P = self._propagators[key] = expm(self.liouvillian(H, L) * t)
+        return P
+
+    def _evolve_expm(self, rho, H, L_ops, t):
+        d = rho.shape[-1]
+        P = self.propagator(H, L_ops, t)
+        flat = rho.reshape(-1, d * d)
+        self.last_stats = {"method": "expm", "steps": 1}
+        return (flat @ P.T).reshape(rho.shape)
+
+    def _evolve_rk45(self, rho, rhs, t, dt=None):
+        if t <= 0:
+            return rho
+        h = dt or min(t, 0.1)
+        elapsed, steps, rejected = 0.0, 0, 0
+        k1 = rhs(rho)
+        while elapsed < t:
+            h = min(h, t - elapsed)
+            ks = [k1]
+            for i in range(1, 7):
+                stage = rho + h * sum(a * k for a, k in zip(_DP_A[i], ks))
+                ks.append(rhs(stage))
+            rho5 = rho + h * sum(b * k for b, k in zip(_DP_B5, ks) if b)
+            err = h * sum((b5 - b4) * k for b5, b4, k in zip(_DP_B5, _DP_B4, ks) if b5 != b4)
+            scale = self.atol + self.rtol * np.maximum(np.abs(rho), np.abs(rho5))
+            err_norm = float(np.sqrt(np.mean((np.abs(err) / scale) ** 2)))
+
+            if err_norm <= 1.0:
+                elapsed += h
+                rho = rho5
+                k1 = ks[6]  # First-same-as-last
+                steps += 1
+            else:
+                rejected += 1
+            factor = 5.0 if err_norm == 0 else min(5.0, max(0.2, 0.9 * err_norm ** -0.2))
+            h *= factor
+        self.last_stats = {"method": "rk45", "steps": steps, "rejected": rejected, "dt": h}
+        return rho
+
+    def steady_state(self, H, L_ops):
+        """Null vector of the Liouvillian, normalized to unit trace."""
+        d = self._hamiltonian(H).shape[0]
+        S = self.liouvillian(H, L_ops)
+        # Replace one equation with the trace constraint
+        A = S.copy()
+        A[0, :] = np.eye(d).reshape(-1)
+        b = np.zeros(d * d, dtype=complex)
+        b[0] = 1.0
+        rho = np.linalg.lstsq(A, b, rcond=None)[0].reshape(d, d)
+        return 0.5 * (rho + rho.conj().T)
+
+    # --- LEGACY DIAGONAL API ---
     def evolve_density_matrix(self, rho_vec, H, L_ops, dt=0.01):
         """
-        Evolve state rho under Lindblad equation.
+        Evolve state rho under Lindblad equation for one interval dt.
         Args:
-            rho_vec (list): State vector representing density matrix diagonal
-            H (list): Hamiltonian vector
-            L_ops (list): List of Jump Operators (dissipators)
+            rho_vec: density matrix (..., dim, dim), or a 1-D diagonal (populations)
+            H: Hamiltonian matrix, or 1-D vector of energies
+            L_ops: Jump Operators; empty means the default relaxation cascade
+        Returns the evolved state in the same form it was given
+        (a list of populations for a 1-D input).
         """
-        new_rho = list(rho_vec)
-        
-        # 1. Coherent Evolution: -i[H, rho]
-        # Simulates unitary rotation
-        for i in range(len(new_rho)):
-            # Rotate phase based on Hamiltonian energy
-            energy = H[i] if i < len(H) else 0.0
-            # Phase rotation doesn't change diagonal magnitude directly in this basis
-            # unless we track complex amplitudes. 
-            # We will simulate "mixing"
-            pass
-
-        # 2. Dissipative Evolution: L rho Ldag - 0.5 {Ldag L, rho}
-        # This is the key "Entropy 2025" feature: Dissipation as resource.
-        # It relaxes the system towards a steady state (Dark State).
-        
-        for i in range(len(new_rho)):
-            # Decay term: -0.5 {Ldag L, rho}
-            decay = self.dissipation_rate * new_rho[i]
-            
-            # Feeding term: L rho Ldag (pumping from other states)
-            # Simulate population transfer from excited to ground
-            feeding = 0.0
-            if i > 0: # If ground state
-                prev_pop = new_rho[i-1] if i-1 < len(new_rho) else 0.0
-                feeding = self.dissipation_rate * prev_pop
-                
-            new_rho[i] += (feeding - decay) * dt
-            
-        # Normalize to trace 1
-        total_prob = sum(new_rho)
-        if total_prob > 0:
-            new_rho = [x / total_prob for x in new_rho]
-            
-        return new_rho
+        rho = np.asarray(rho_vec, dtype=complex)
+        diagonal = rho.ndim == 1
+        if diagonal:
+            rho = np.diag(rho)
+        if L_ops is None or len(L_ops) == 0:
+            L_ops = self.ladder_operators()
+
+        rho = self.evolve(rho, H, L_ops, dt)
+
+        if diagonal:
+            pops = np.clip(np.real(np.diagonal(rho)), 0.0, None)
+            total_prob = pops.sum()
+            if total_prob > 0:
+                pops = pops / total_prob
+            return pops.tolist()
+        return rho
 
 class DissipativeLayer:
     """
@@ -80,27 +268,26 @@ class DissipativeLayer:
     """
     def __init__(self, size):
         self.size = size
-        self.engine = LindbladEngine(dim=size)
+        self.engine = LindbladEngine(dim=size, method="expm")
         self.jump_operators = [] # Define transitions
-        
+
     def forward(self, input_data: BumpyArray):
         """
         Pass input through dissipative evolution to stabilize it.
         """
         # Input is treated as initial density diagonal
         rho = input_data.data
-        
+
         # Hamiltonian is Null (Evolution driven purely by dissipation - Dark State computation)
         H = [0.0] * self.size
-        
+
         # Evolve for 'relaxation_time' to find steady state
         # In DQNN, the output is the steady state of the system
-        rho_evolved = rho
-        for _ in range(5): # 5 micro-steps
-            rho_evolved = self.engine.evolve_density_matrix(rho_evolved, H, [], dt=0.1)
-            
+        # (5 micro-steps of 0.1 collapse into one exact propagator)
+        rho_evolved = self.engine.evolve_density_matrix(rho, H, self.jump_operators, dt=0.5)
+
         # The result is "cleaned" data
         # In a full QNN, this state would then be measured.
         cleaned_coherence = getattr(input_data, 'coherence', 1.0) * 0.95 # Dissipation cost
-        
+
         return BumpyArray(rho_evolved, coherence=cleaned_coherence)
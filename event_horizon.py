@@ -19,14 +19,21 @@ import random
 SIMULATED_C_DELAY = 0.05 # 50ms latency for "Standard" transmission
 
 class NonLocalBridge:
-    def __init__(self):
+    def __init__(self, rng=None):
         self.nodes = list(range(27)) # 3x3x3 Cube of consciousness
+        self.rng = rng or random # Seeded callers pass their own random.Random
         
-    def ping(self, mode="STANDARD"):
+    def ping(self, mode="STANDARD", sleep=True):
         """
         Sends a 'Thought Packet' from Node 0 to Node 26.
+        sleep=False: return the simulated Time of Flight without waiting it out.
         Returns: Time of Flight (seconds)
         """
+        # Add some jitter
+        jitter = self.rng.uniform(0.001, 0.01) if mode == "STANDARD" else 0.0
+        if not sleep:
+            return SIMULATED_C_DELAY + jitter if mode == "STANDARD" else 0.0
+
         start_time = time.perf_counter()
         
         # Simulate Transmission
@@ -34,8 +41,7 @@ class NonLocalBridge:
             # The Turtle: Light Speed Limit / Network Latency
             # Simulate "Hops" across the ghostmesh
             time.sleep(SIMULATED_C_DELAY)
-            # Add some jitter
-            time.sleep(random.uniform(0.001, 0.01))
+            time.sleep(jitter)
             
         elif mode == "SOVEREIGN":
             # The Lightning: Quantum Tunneling
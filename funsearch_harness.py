@@ -12,6 +12,32 @@ class Evaluator:
     def rastrigin(x, y):
         return 20 + (x**2 - 10 * np.cos(2 * np.pi * x)) + (y**2 - 10 * np.cos(2 * np.pi * y))
 
+    @classmethod
+    def fitness(cls, trajectory, steps=100, threshold=5.0):
+        """
+        Vectorized score kernel. trajectory: (T, 2) or a batch (N, T, 2).
+        Returns (score, final_loss, conv_step, stability), each scalar or (N,).
+        """
+        traj = np.asarray(trajectory, dtype=float)
+        losses = cls.rastrigin(traj[..., 0], traj[..., 1])
+        final_loss = losses[..., -1]
+
+        # 1. Speed: first step below threshold (steps if never)
+        below = losses < threshold
+        conv_step = np.where(below.any(axis=-1), below.argmax(axis=-1), steps)
+        speed_score = 1 - (conv_step / steps)
+
+        # 2. Stability: inverse of gradient variance (empirical cap at 5.0)
+        deltas = np.diff(traj, axis=-2)
+        stability = 1.0 / (np.std(deltas, axis=(-2, -1)) + 1e-6)
+        stability_norm = np.minimum(1.0, stability / 5.0)
+
+        # 3. Accuracy: inverse of final loss
+        accuracy_norm = 1.0 / (1.0 + final_loss)
+
+        score = (0.4 * speed_score) + (0.3 * stability_norm) + (0.3 * accuracy_norm)
+        return score, final_loss, conv_step, stability
+
     def evaluate(self, optimizer_func):
         """
         Evaluates an optimization function on the Rastrigin landscape.
@@ -22,36 +48,11 @@ class Evaluator:
         
         try:
             trajectory = optimizer_func(initial_point, steps, noise_level)
-            trajectory = np.array(trajectory)
-            
-            # Final position and loss
-            final_x, final_y = trajectory[-1]
-            final_loss = self.rastrigin(final_x, final_y)
-            
-            # 1. Speed: how quickly loss drops below threshold
-            threshold = 5.0
-            conv_step = steps
-            for i, p in enumerate(trajectory):
-                if self.rastrigin(p[0], p[1]) < threshold:
-                    conv_step = i
-                    break
-            speed_score = 1 - (conv_step / steps)
-            
-            # 2. Stability: inverse of gradient variance
-            deltas = np.diff(trajectory, axis=0)
-            stability = 1.0 / (np.std(deltas) + 1e-6)
-            # Normalize stability (empirical cap)
-            stability_norm = min(1.0, stability / 5.0) 
-            
-            # 3. Accuracy: inverse of final loss
-            accuracy_norm = 1.0 / (1.0 + final_loss)
-
-            # Balanced Score
-            score = (0.4 * speed_score) + (0.3 * stability_norm) + (0.3 * accuracy_norm)
-            return score, {
-                "final_loss": final_loss,
-                "conv_step": conv_step,
-                "stability": stability
+            score, final_loss, conv_step, stability = self.fitness(trajectory, steps)
+            return float(score), {
+                "final_loss": float(final_loss),
+                "conv_step": int(conv_step),
+                "stability": float(stability)
             }
         except Exception as e:
             print(f"Runtime Error in candidate: {e}")
@@ -103,8 +104,11 @@ def seed_optimizer(initial_point, steps, noise_level):
     return trajectory
 
 if __name__ == "__main__":
-    evaluator = Evaluator()
+    import argparse
+    from funsearch_pool import EvaluatorPool, add_cache_arguments, cache_path_from
+    args = add_cache_arguments(argparse.ArgumentParser(description="Score the FunSearch seed")).parse_args()
+    pool = EvaluatorPool(cache_path=cache_path_from(args))
     print("--- RUNNING FUNSEARCH SEED (V0) ---")
-    score, stats = evaluator.evaluate(seed_optimizer)
-    print(f"SCORE: {score:.4f}")
-    print(f"STATS: {stats}")
+    result = pool.evaluate_batch([seed_optimizer], seeds=(0, 1, 2))[0]
+    print(f"SCORE: {result.score:.4f} ({result.status}, seeds={result.seeds})")
+    print(f"STATS: {result.stats}")
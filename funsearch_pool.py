@@ -0,0 +1,333 @@
+"""
+FUNSEARCH_POOL: SANDBOXED EVALUATION SERVICE
+--------------------------------------------
+Scores FunSearch candidates in parallel worker processes.
+
+- Every evaluation runs in its own forked child with CPU-time and
+  address-space limits (POSIX rlimits) and a wall-clock deadline, so a
+  hung or runaway candidate is killed instead of stalling the run.
+- Up to `workers` children run at once (default: one per core).
+- Scores are cached by a hash of (task, scoring code, candidate source,
+  seed); editing the task's scorer or bumping SCORING_VERSION makes old
+  cache entries miss instead of serving stale scores.
+- evaluate_batch() screens every candidate on one seed first and drops the
+  ones that trail the leader by more than `abort_margin` before spending
+  the remaining seeds on the rest.
+"""
+
+import hashlib
+import importlib.util
+import inspect
+import json
+import multiprocessing as mp
+import os
+import random
+import signal
+import sys
+import time
+import types
+from dataclasses import dataclass, field
+from multiprocessing.connection import wait
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+
+try:
+    import resource
+except ImportError:  # Windows: wall-clock limits only
+    resource = None
+
+# --- TASKS ---
+
+def _rastrigin_task(candidate, seed):
+    from funsearch_harness import Evaluator
+    return Evaluator().evaluate(candidate)
+
+def _love_task(program, seed):
+    from tools.funsearch_love import evaluate
+    return evaluate(program), None
+
+def _abundance_task(program, seed):
+    from tools.funsearch_abundance import evaluate_abundance
+    return evaluate_abundance(program), None
+
+# task name -> (runner(candidate, seed) -> (score, stats), entry point the candidate must define,
+#               module holding the scoring code)
+TASKS: Dict[str, Any] = {
+    "rastrigin": (_rastrigin_task, "optimizer", "funsearch_harness"),
+    "love": (_love_task, None, "tools.funsearch_love"),                # program namespace: strip_2d / reconstruct_1d
+    "abundance": (_abundance_task, None, "tools.funsearch_abundance")  # program namespace: map_to_virtual
+}
+
+# Bump when scoring changes in a way the source hash cannot see (e.g. a dependency)
+SCORING_VERSION = "1"
+
+def scoring_fingerprint(task: str) -> str:
+    """Hash of SCORING_VERSION, the task runner and its scoring module's source."""
+    runner, _, module = TASKS[task]
+    h = hashlib.sha256()
+    h.update(SCORING_VERSION.encode("utf-8"))
+    h.update(inspect.getsource(runner).encode("utf-8"))
+    try:
+        # Read the file rather than importing it: scorers may pull in pleroma_core
+        spec = importlib.util.find_spec(module)
+        with open(spec.origin, "rb") as f:
+            h.update(f.read())
+    except (ImportError, AttributeError, TypeError, OSError):
+        h.update(module.encode("utf-8"))
+    return h.hexdigest()
+
+@dataclass
+class Candidate:
+    """
+    A program to score. Either source code (exec'd in the sandbox; `entry`
+    names the function to call, or None to pass the whole namespace as the
+    program) or an importable function.
+    """
+    source: str
+    entry: Optional[str] = None
+    name: str = ""
+    fn: Optional[Callable] = None
+
+    @classmethod
+    def from_function(cls, fn: Callable, name: str = None):
+        try:
+            source = inspect.getsource(sys.modules[fn.__module__])
+        except (OSError, TypeError, KeyError):
+            source = f"{fn.__module__}.{fn.__qualname__}"
+        return cls(source=source, entry=fn.__qualname__, name=name or fn.__name__, fn=fn)
+
+    def key(self, task: str, seed: int, scoring: str = "") -> str:
+        h = hashlib.sha256()
+        for part in (task, scoring, self.source, self.entry or "", str(seed)):
+            h.update(part.encode("utf-8"))
+            h.update(b"\0")
+        return h.hexdigest()
+
+    def load(self):
+        if self.fn is not None:
+            return self.fn
+        namespace = {"__name__": f"candidate_{self.name or 'anon'}"}
+        exec(compile(self.source, f"<candidate {self.name}>", "exec"), namespace)
+        if self.entry:
+            return namespace[self.entry]
+        return types.SimpleNamespace(**namespace)
+
+@dataclass
+class EvalResult:
+    name: str
+    score: float
+    stats: Any = None
+    status: str = "ok"  # ok | error | timeout | cpu_limit | memory_limit | killed | aborted
+    seconds: float = 0.0
+    cached: bool = False
+    seeds: List[int] = field(default_factory=list)
+
+# --- SANDBOX ---
+
+def _apply_limits(cpu_seconds, memory_mb):
+    if resource is None:
+        return
+    if cpu_seconds:
+        soft = max(1, int(cpu_seconds + 0.999))
+        resource.setrlimit(resource.RLIMIT_CPU, (soft, soft + 1))
+    if memory_mb:
+        # The child inherits the parent's mappings; the cap is headroom on top of them
+        try:
+            with open("/proc/self/statm") as f:
+                current = int(f.read().split()[0]) * os.sysconf("SC_PAGE_SIZE")
+        except (OSError, ValueError):
+            current = 0
+        limit = current + memory_mb * 1024 * 1024
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+
+def _jsonable(value):
+    if isinstance(value, dict):
+        return {k: _jsonable(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_jsonable(v) for v in value]
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+def _child(conn, task, candidate, seed, cpu_seconds, memory_mb):
+    try:
+        _apply_limits(cpu_seconds, memory_mb)
+        random.seed(seed)
+        np.random.seed(seed)
+        runner = TASKS[task][0]
+        score, stats = runner(candidate.load(), seed)
+        conn.send(("ok", float(score), _jsonable(stats)))
+    except MemoryError:
+        conn.send(("memory_limit", float("-inf"), None))
+    except BaseException as e:
+        conn.send(("error", float("-inf"), f"{type(e).__name__}: {e}"))
+    finally:
+        conn.close()
+
+DEFAULT_CACHE_PATH = "logs/cache/funsearch_scores.jsonl"
+
+def add_cache_arguments(parser):
+    """--cache PATH / --no-cache for scripts that drive a pool; read back with cache_path_from(args)."""
+    parser.add_argument("--cache", default=DEFAULT_CACHE_PATH, metavar="PATH",
+                        help=f"score cache (default: {DEFAULT_CACHE_PATH})")
+    parser.add_argument("--no-cache", action="store_true", help="score every candidate afresh")
+    return parser
+
+def cache_path_from(args):
+    return None if args.no_cache else args.cache
+
+class EvaluatorPool:
+    """
+    [FUNSEARCH_POOL] Parallel, cached, sandboxed candidate scoring.
+    cache_path=None keeps scores in memory only.
+    """
+    def __init__(self, task="rastrigin", workers=None, timeout=10.0, cpu_seconds=5.0,
+                 memory_mb=512, cache_path=DEFAULT_CACHE_PATH):
+        if task not in TASKS:
+            raise ValueError(f"Unknown FunSearch task: {task}")
+        self.task = task
+        self.workers = workers or os.cpu_count() or 1
+        self.timeout = timeout
+        self.cpu_seconds = cpu_seconds
+        self.memory_mb = memory_mb
+        self.cache_path = cache_path
+        self.scoring = scoring_fingerprint(task)
+        self.cache: Dict[str, dict] = {}
+        # fork shares the imported harness with children; spawn is the portable fallback
+        self.ctx = mp.get_context("fork" if "fork" in mp.get_all_start_methods() else "spawn")
+        self._load_cache()
+
+    # --- CACHE ---
+    def _load_cache(self):
+        if not self.cache_path or not os.path.exists(self.cache_path):
+            return
+        with open(self.cache_path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                    self.cache[entry["key"]] = entry
+                except (json.JSONDecodeError, KeyError):
+                    continue  # Torn tail write
+
+    def _store(self, key, status, score, stats):
+        entry = {"key": key, "status": status, "score": score, "stats": stats}
+        self.cache[key] = entry
+        if self.cache_path and status in ("ok", "error"):
+            # Only deterministic outcomes persist; limits depend on the machine
+            os.makedirs(os.path.dirname(self.cache_path) or ".", exist_ok=True)
+            with open(self.cache_path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(entry) + "\n")
+
+    # --- DISPATCH ---
+    def _run(self, jobs):
+        """
+        jobs: list of (candidate, seed). Returns one (status, score, stats, seconds, cached)
+        per job in submission order, running at most self.workers children at a time.
+        """
+        results = [None] * len(jobs)
+        pending = []
+        for i, (candidate, seed) in enumerate(jobs):
+            key = candidate.key(self.task, seed, self.scoring)
+            hit = self.cache.get(key)
+            if hit:
+                results[i] = (hit["status"], hit["score"], hit["stats"], 0.0, True)
+            else:
+                pending.append((i, key, candidate, seed))
+
+        running = {}
+        while pending or running:
+            while pending and len(running) < self.workers:
+                i, key, candidate, seed = pending.pop(0)
+                parent, child = self.ctx.Pipe(duplex=False)
+                proc = self.ctx.Process(
+                    target=_child,
+                    args=(child, self.task, candidate, seed, self.cpu_seconds, self.memory_mb),
+                    daemon=True
+                )
+                proc.start()
+                child.close()
+                running[parent] = (i, key, proc, time.monotonic())
+
+            now = time.monotonic()
+            next_deadline = min(start + self.timeout for _, _, _, start in running.values())
+            ready = wait(list(running), timeout=max(0.0, next_deadline - now))
+
+            for conn in ready:
+                i, key, proc, start = running.pop(conn)
+                try:
+                    status, score, stats = conn.recv()
+                except (EOFError, OSError):
+                    proc.join(1.0)
+                    status, score, stats = self._death_status(proc), float("-inf"), None
+                conn.close()
+                proc.join(1.0)
+                self._store(key, status, score, stats)
+                results[i] = (status, score, stats, time.monotonic() - start, False)
+
+            now = time.monotonic()
+            for conn, (i, key, proc, start) in list(running.items()):
+                if now - start >= self.timeout:
+                    proc.kill()
+                    proc.join(1.0)
+                    conn.close()
+                    del running[conn]
+                    self._store(key, "timeout", float("-inf"), None)
+                    results[i] = ("timeout", float("-inf"), None, now - start, False)
+        return results
+
+    @staticmethod
+    def _death_status(proc):
+        if resource is not None and proc.exitcode == -getattr(signal, "SIGXCPU", -1):
+            return "cpu_limit"
+        return "killed"
+
+    # --- PUBLIC API ---
+    def evaluate(self, candidate, seed=0) -> EvalResult:
+        return self.evaluate_batch([candidate], seeds=(seed,))[0]
+
+    def evaluate_batch(self, candidates, seeds=(0,), abort_margin=None) -> List[EvalResult]:
+        """
+        Scores every candidate on every seed (mean score). With abort_margin,
+        seed[0] is a screening round: candidates scoring below
+        best - abort_margin are reported as 'aborted' without further seeds.
+        """
+        candidates = [c if isinstance(c, Candidate) else Candidate.from_function(c) for c in candidates]
+        seeds = list(seeds)
+
+        screen = self._run([(c, seeds[0]) for c in candidates])
+        survivors = list(range(len(candidates)))
+        if abort_margin is not None and len(seeds) > 1:
+            ok = [r[1] for r in screen if r[0] == "ok"]
+            if ok:
+                cutoff = max(ok) - abort_margin
+                survivors = [i for i, r in enumerate(screen) if r[0] == "ok" and r[1] >= cutoff]
+
+        rest = self._run([(candidates[i], s) for i in survivors for s in seeds[1:]]) if len(seeds) > 1 else []
+        per_candidate = {i: [screen[i]] for i in range(len(candidates))}
+        for n, i in enumerate(survivors):
+            per_candidate[i].extend(rest[n * (len(seeds) - 1):(n + 1) * (len(seeds) - 1)])
+
+        out = []
+        for i, candidate in enumerate(candidates):
+            runs = per_candidate[i]
+            failed = next((r for r in runs if r[0] != "ok"), None)
+            used = seeds[:len(runs)]
+            if failed:
+                status, score, stats = failed[0], float("-inf"), failed[2]
+            elif i not in survivors:
+                status, score, stats = "aborted", runs[0][1], runs[0][2]
+            else:
+                status, score, stats = "ok", float(np.mean([r[1] for r in runs])), runs[-1][2]
+            out.append(EvalResult(
+                name=candidate.name, score=score, stats=stats, status=status,
+                seconds=sum(r[3] for r in runs), cached=all(r[4] for r in runs), seeds=used
+            ))
+        return out
+
+if __name__ == "__main__":
+    from funsearch_harness import seed_optimizer
+    pool = EvaluatorPool(cache_path=None)
+    hung = Candidate("def optimizer(p, steps, noise):\n    while True:\n        pass\n", "optimizer", "hung")
+    for r in pool.evaluate_batch([seed_optimizer, hung], seeds=(0, 1, 2), abort_margin=0.5):
+        print(f"  [FUNSEARCH_POOL] {r.name}: {r.score:.4f} ({r.status}, {r.seconds:.2f}s, seeds={r.seeds})")
@@ -64,9 +64,14 @@ def evolved_optimizer_v11(initial_point, steps, noise_level):
     return trajectory
 
 if __name__ == "__main__":
-    from funsearch_harness import Evaluator
-    evaluator = Evaluator()
+    from funsearch_harness import seed_optimizer
+    import argparse
+    from funsearch_pool import EvaluatorPool, add_cache_arguments, cache_path_from
+    args = add_cache_arguments(argparse.ArgumentParser(description="Race V11 against the seed")).parse_args()
+    pool = EvaluatorPool(cache_path=cache_path_from(args))
     print("--- RUNNING FUNSEARCH V11 (BLACK SUN FLARE) ---")
-    score, stats = evaluator.evaluate(evolved_optimizer_v11)
-    print(f"SCORE: {score:.4f}")
-    print(f"STATS: {stats}")
+    # V11 races the V0 seed; a lineage trailing by more than 0.2 on seed 0 stops there
+    results = pool.evaluate_batch([evolved_optimizer_v11, seed_optimizer], seeds=(0, 1, 2), abort_margin=0.2)
+    for result in results:
+        print(f"SCORE [{result.name}]: {result.score:.4f} ({result.status}, seeds={result.seeds})")
+    print(f"STATS: {results[0].stats}")
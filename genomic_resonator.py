@@ -60,10 +60,11 @@ class GenomicOscillator:
     """
     Simulates the DNA Stacking / Gamma Cycle (40 Hz).
     """
-    def __init__(self):
+    def __init__(self, clock=None):
         self.frequency = 40.0 # Hz
         self.period = 1.0 / self.frequency
-        self.start_time = time.perf_counter()
+        self.clock = clock or time.perf_counter # Or a virtual clock (seconds)
+        self.start_time = self.clock()
         
     def set_frequency(self, freq_hz):
         """Updates the biological clock frequency."""
@@ -72,7 +73,7 @@ class GenomicOscillator:
         
     def get_clock(self):
         """Returns the current 'Tick' timestamp."""
-        return time.perf_counter()
+        return self.clock()
 
 if __name__ == "__main__":
     print(">>> DNA RESONATOR ONLINE <<<")
@@ -0,0 +1,310 @@
+"""
+MODULE: git_objects.py
+DESCRIPTION:
+    Subprocess-free reader for a Git object store.
+    Resolves HEAD, reads loose and packed objects (including OFS/REF deltas)
+    and walks commit history the way `git log` does, so telemetry can sample
+    commit metadata without forking a git process per reading.
+    SHA-1 repositories only; anything unsupported raises GitObjectError so
+    callers can fall back to the git CLI.
+"""
+
+import heapq
+import mmap
+import os
+import struct
+import zlib
+
+OBJ_COMMIT, OBJ_TREE, OBJ_BLOB, OBJ_TAG = 1, 2, 3, 4
+OBJ_OFS_DELTA, OBJ_REF_DELTA = 6, 7
+TYPE_NAMES = {OBJ_COMMIT: b"commit", OBJ_TREE: b"tree", OBJ_BLOB: b"blob", OBJ_TAG: b"tag"}
+
+class GitObjectError(Exception):
+    pass
+
+def find_git_dir(repo_path="."):
+    """Returns the .git directory for repo_path, following `gitdir:` files (worktrees/submodules)."""
+    path = os.path.abspath(repo_path)
+    while True:
+        candidate = os.path.join(path, ".git")
+        if os.path.isdir(candidate):
+            return candidate
+        if os.path.isfile(candidate):
+            with open(candidate, "r", encoding="utf-8") as f:
+                line = f.read().strip()
+            if line.startswith("gitdir:"):
+                return os.path.normpath(os.path.join(path, line[7:].strip()))
+        parent = os.path.dirname(path)
+        if parent == path:
+            raise GitObjectError(f"Not a git repository: {repo_path}")
+        path = parent
+
+class PackIndex:
+    """A version-2 .idx file plus its mmapped .pack."""
+    def __init__(self, idx_path):
+        with open(idx_path, "rb") as f:
+            idx = f.read()
+        if idx[:4] != b"\377tOc" or struct.unpack(">I", idx[4:8])[0] != 2:
+            raise GitObjectError(f"Unsupported pack index: {idx_path}")
+        self.fanout = struct.unpack(">256I", idx[8:8 + 1024])
+        self.count = self.fanout[-1]
+        sha_start = 8 + 1024
+        self.shas = idx[sha_start:sha_start + 20 * self.count]
+        ofs_start = sha_start + 24 * self.count  # shas + crc32s
+        self.offsets = idx[ofs_start:ofs_start + 4 * self.count]
+        self.large = idx[ofs_start + 4 * self.count:]
+
+        with open(idx_path[:-4] + ".pack", "rb") as f:
+            self.pack = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def offset(self, sha: bytes):
+        """Pack offset of a binary sha, or None."""
+        first = sha[0]
+        lo = self.fanout[first - 1] if first else 0
+        hi = self.fanout[first]
+        while lo < hi:
+            mid = (lo + hi) // 2
+            probe = self.shas[20 * mid:20 * mid + 20]
+            if probe < sha:
+                lo = mid + 1
+            elif probe > sha:
+                hi = mid
+            else:
+                ofs = struct.unpack(">I", self.offsets[4 * mid:4 * mid + 4])[0]
+                if ofs & 0x80000000:
+                    i = ofs & 0x7FFFFFFF
+                    ofs = struct.unpack(">Q", self.large[8 * i:8 * i + 8])[0]
+                return ofs
+        return None
+
+class GitRepository:
+    """
+    [GIT_OBJECTS] Read-only view of a repository's object store.
+    Objects are cached by sha; pack indexes are loaded once and reloaded
+    when the pack directory changes (after gc/repack).
+    """
+    CACHE_LIMIT = 4096
+
+    def __init__(self, repo_path="."):
+        self.git_dir = find_git_dir(repo_path)
+        # Linked worktrees keep HEAD locally but share objects and refs
+        self.common_dir = self.git_dir
+        commondir = os.path.join(self.git_dir, "commondir")
+        if os.path.isfile(commondir):
+            with open(commondir, "r", encoding="utf-8") as f:
+                self.common_dir = os.path.normpath(os.path.join(self.git_dir, f.read().strip()))
+        self.objects_dir = os.path.join(self.common_dir, "objects")
+        self._packs = []
+        self._pack_stamp = None
+        self._cache = {}
+
+    # --- REFS ---
+    def head_ref(self):
+        """Symbolic ref HEAD points to (e.g. refs/heads/main), or None when detached."""
+        with open(os.path.join(self.git_dir, "HEAD"), "r", encoding="utf-8") as f:
+            head = f.read().strip()
+        return head[5:].strip() if head.startswith("ref:") else None
+
+    def resolve(self, ref="HEAD", depth=0):
+        """Hex sha a ref points to (loose ref file first, then packed-refs)."""
+        if depth > 8:
+            raise GitObjectError(f"Symbolic ref loop at {ref}")
+        root = self.git_dir if ref == "HEAD" else self.common_dir
+        path = os.path.join(root, *ref.split("/"))
+        if os.path.isfile(path):
+            with open(path, "r", encoding="utf-8") as f:
+                value = f.read().strip()
+            if value.startswith("ref:"):
+                return self.resolve(value[4:].strip(), depth + 1)
+            return value
+        packed = os.path.join(self.common_dir, "packed-refs")
+        if os.path.isfile(packed):
+            with open(packed, "r", encoding="utf-8") as f:
+                for line in f:
+                    if line.startswith(("#", "^")):
+                        continue
+                    sha, _, name = line.strip().partition(" ")
+                    if name == ref:
+                        return sha
+        raise GitObjectError(f"Unresolvable ref: {ref}")
+
+    def watch_paths(self):
+        """Files whose mtime changes whenever HEAD moves (commit, checkout, reset, fetch+merge)."""
+        paths = [os.path.join(self.git_dir, "HEAD"), os.path.join(self.common_dir, "packed-refs")]
+        try:
+            ref = self.head_ref()
+        except OSError:
+            ref = None
+        if ref:
+            paths.append(os.path.join(self.common_dir, *ref.split("/")))
+        return paths
+
+    # --- OBJECTS ---
+    def _load_packs(self):
+        pack_dir = os.path.join(self.objects_dir, "pack")
+        try:
+            stamp = os.stat(pack_dir).st_mtime_ns
+        except OSError:
+            stamp = None
+        if stamp == self._pack_stamp:
+            return self._packs
+        self._packs = [
+            PackIndex(os.path.join(pack_dir, name))
+            for name in sorted(os.listdir(pack_dir)) if name.endswith(".idx")
+        ] if stamp is not None else []
+        self._pack_stamp = stamp
+        return self._packs
+
+    def read(self, hexsha: str):
+        """(type_name, body) for an object."""
+        if hexsha in self._cache:
+            return self._cache[hexsha]
+        obj = self._read_loose(hexsha)
+        if obj is None:
+            sha = bytes.fromhex(hexsha)
+            for pack in self._load_packs():
+                ofs = pack.offset(sha)
+                if ofs is not None:
+                    kind, body = self._read_packed(pack, ofs)
+                    obj = (TYPE_NAMES[kind], body)
+                    break
+        if obj is None:
+            raise GitObjectError(f"Object not found: {hexsha}")
+        if len(self._cache) >= self.CACHE_LIMIT:
+            self._cache.clear()
+        self._cache[hexsha] = obj
+        return obj
+
+    def _read_loose(self, hexsha):
+        path = os.path.join(self.objects_dir, hexsha[:2], hexsha[2:])
+        try:
+            with open(path, "rb") as f:
+                raw = zlib.decompress(f.read())
+        except FileNotFoundError:
+            return None
+        header, _, body = raw.partition(b"\0")
+        kind, _, _ = header.partition(b" ")
+        return kind, body
+
+    def _read_packed(self, pack, ofs):
+        data = pack.pack
+        pos = ofs
+        c = data[pos]
+        pos += 1
+        kind = (c >> 4) & 7
+        while c & 0x80:
+            c = data[pos]
+            pos += 1
+
+        if kind == OBJ_OFS_DELTA:
+            c = data[pos]
+            pos += 1
+            rel = c & 0x7F
+            while c & 0x80:
+                c = data[pos]
+                pos += 1
+                rel = ((rel + 1) << 7) | (c & 0x7F)
+            base_kind, base = self._read_packed(pack, ofs - rel)
+            return base_kind, self._apply_delta(base, self._inflate(data, pos))
+        if kind == OBJ_REF_DELTA:
+            base_sha = bytes(data[pos:pos + 20]).hex()
+            base_name, base = self.read(base_sha)
+            base_kind = next(k for k, v in TYPE_NAMES.items() if v == base_name)
+            return base_kind, self._apply_delta(base, self._inflate(data, pos + 20))
+        if kind not in TYPE_NAMES:
+            raise GitObjectError(f"Unknown pack object type {kind} at {ofs}")
+        return kind, self._inflate(data, pos)
+
+    @staticmethod
+    def _inflate(data, pos, chunk=16384):
+        d = zlib.decompressobj()
+        out = []
+        while not d.eof:
+            piece = data[pos:pos + chunk]
+            if not piece:
+                raise GitObjectError("Truncated pack entry")
+            out.append(d.decompress(piece))
+            pos += chunk
+        return b"".join(out)
+
+    @staticmethod
+    def _apply_delta(base, delta):
+        def varint(pos):
+            value = shift = 0
+            while True:
+                c = delta[pos]
+                pos += 1
+                value |= (c & 0x7F) << shift
+                shift += 7
+                if not c & 0x80:
+                    return value, pos
+
+        src_size, pos = varint(0)
+        dst_size, pos = varint(pos)
+        if src_size != len(base):
+            raise GitObjectError("Delta base size mismatch")
+        out = bytearray()
+        while pos < len(delta):
+            op = delta[pos]
+            pos += 1
+            if op & 0x80:
+                offset = size = 0
+                for i in range(4):
+                    if op & (1 << i):
+                        offset |= delta[pos] << (8 * i)
+                        pos += 1
+                for i in range(3):
+                    if op & (0x10 << i):
+                        size |= delta[pos] << (8 * i)
+                        pos += 1
+                out += base[offset:offset + (size or 0x10000)]
+            elif op:
+                out += delta[pos:pos + op]
+                pos += op
+            else:
+                raise GitObjectError("Invalid delta opcode 0")
+        if len(out) != dst_size:
+            raise GitObjectError("Delta result size mismatch")
+        return bytes(out)
+
+    # --- HISTORY ---
+    def commit(self, hexsha: str) -> dict:
+        kind, body = self.read(hexsha)
+        if kind != b"commit":
+            raise GitObjectError(f"{hexsha} is a {kind.decode()}, not a commit")
+        info = {"sha": hexsha, "parents": []}
+        for line in body.split(b"\n"):
+            if not line:
+                break  # End of headers
+            key, _, value = line.partition(b" ")
+            if key == b"parent":
+                info["parents"].append(value.decode())
+            elif key in (b"author", b"committer"):
+                ident, _, stamp = value.rpartition(b"> ")
+                name, _, email = ident.partition(b" <")
+                info[key.decode()] = {
+                    "name": name.decode("utf-8", "replace"),
+                    "email": email.decode("utf-8", "replace"),
+                    "time": int(stamp.split()[0])
+                }
+        return info
+
+    def log(self, n=100, ref="HEAD"):
+        """Up to n commits reachable from ref, newest committer date first (git log's default walk)."""
+        start = self.resolve(ref)
+        seen = {start}
+        first = self.commit(start)
+        heap = [(-first["committer"]["time"], 0, first)]
+        seq = 1
+        out = []
+        while heap and len(out) < n:
+            _, _, info = heapq.heappop(heap)
+            out.append(info)
+            for parent in info["parents"]:
+                if parent in seen:
+                    continue
+                seen.add(parent)
+                pinfo = self.commit(parent)
+                heapq.heappush(heap, (-pinfo["committer"]["time"], seq, pinfo))
+                seq += 1
+        return out
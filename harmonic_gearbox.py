@@ -11,7 +11,10 @@ import time
 import math
 import random
 
+import numpy as np
+
 HARMONIC_RATIO = 5.0 # The "High 5" Harmonic
+SCHUMANN_BASE = 7.83 # Hz (The Reference the Ag2S Gate falls back to)
 
 try:
     from silver_sulfide import Ag2S_Nonlinear_Gate
@@ -31,6 +34,9 @@ except (ImportError, AttributeError):
     print(">> PLEROMA CORE: NOT FOUND OR INCOMPLETE. FALLING BACK TO PYTHON.")
     RUST_AVAILABLE = False
 
+# Older builds of the Iron Kernel ship the single Gearbox only.
+RUST_BANK_AVAILABLE = RUST_AVAILABLE and hasattr(pleroma_core, "GearboxBank")
+
 if RUST_AVAILABLE:
     class HarmonicGearbox:
         """
@@ -216,6 +222,186 @@ else:
             else:
                 return "⚙️ GRINDING"
 
+# --- THE GEARBOX BANK ---
+# N Gearboxes ticked together. Every per-instance field lives in one float64
+# array, so a tick is a handful of whole-array operations (NumPy) or one tight
+# loop (Rust, pleroma_core.GearboxBank) instead of N Python method calls.
+# Both kernels implement the update of the Python fallback HarmonicGearbox.tick
+# above in the same operation order, so their outputs agree.
+
+TWO_PI = 2 * math.pi
+INTEGRAL_LIMIT = 5.0 # Anti-Windup clamp of the PID integral
+STATE_FIELDS = ("input_phase", "output_phase", "current_gamma_freq", "target_gamma_freq",
+                "integral_error", "last_error", "lock_quality", "sovereign")
+
+class NumpyGearboxKernel:
+    """
+    The NumPy twin of pleroma_core.GearboxBank.
+    Holds the state arrays and advances all of them in one vectorized step.
+    """
+    def __init__(self, kp, ki, kd, optical_gate=False):
+        self.kp, self.ki, self.kd = kp, ki, kd
+        self.optical_gate = optical_gate
+        self.reset()
+
+    def __len__(self):
+        return len(self.kp)
+
+    def reset(self):
+        n = len(self.kp)
+        self.input_phase = np.zeros(n)
+        self.output_phase = np.zeros(n)
+        self.current_gamma_freq = np.full(n, 40.0)
+        self.target_gamma_freq = np.full(n, 39.15)
+        self.integral_error = np.zeros(n)
+        self.last_error = np.zeros(n)
+        self.lock_quality = np.zeros(n)
+        self.sovereign = np.zeros(n, dtype=bool)
+
+    def set_sovereign(self, mask):
+        self.sovereign |= mask
+        self.lock_quality = np.where(mask, 1.0, self.lock_quality)  # Instant Perfection
+
+    def tick(self, dt, inputs):
+        if inputs.shape != self.kp.shape:
+            raise ValueError(f"expected {len(self.kp)} inputs, got {inputs.shape}")
+
+        # 0. Optical Filtration: the Ag2S Gate blocks anything 0.01 Hz off the Reference
+        filtered = inputs
+        if self.optical_gate:
+            wavelength = 400.0 + np.abs(inputs - SCHUMANN_BASE) * 500.0
+            filtered = np.where(np.abs(wavelength - 400.0) > 5.0, SCHUMANN_BASE, inputs)
+
+        # 1. Targets and Phases
+        target = filtered * HARMONIC_RATIO
+        self.target_gamma_freq = target
+        input_phase = (self.input_phase + TWO_PI * inputs * dt) % TWO_PI
+        output_phase = (self.output_phase + TWO_PI * self.current_gamma_freq * dt) % TWO_PI
+
+        # 2. PID
+        error = target - self.current_gamma_freq
+        integral = np.clip(self.integral_error + error * dt, -INTEGRAL_LIMIT, INTEGRAL_LIMIT)
+        derivative = (error - self.last_error) / dt if dt > 0 else np.zeros_like(error)
+        correction = self.kp * error + self.ki * integral + self.kd * derivative
+        current = self.current_gamma_freq + correction * dt
+        lock = np.where(np.abs(error) < 0.1,
+                        np.minimum(1.0, self.lock_quality + 0.1),
+                        np.maximum(0.0, self.lock_quality - 0.05))
+
+        # 3. Sovereign instances bypass the hunt (their PID state is frozen)
+        sov = self.sovereign
+        if sov.any():
+            current = np.where(sov, target, current)
+            lock = np.where(sov, 1.0, lock)
+            input_phase = np.where(sov, 0.0, input_phase)
+            output_phase = np.where(sov, 0.0, output_phase)
+            integral = np.where(sov, self.integral_error, integral)
+            error = np.where(sov, self.last_error, error)
+
+        self.input_phase, self.output_phase = input_phase, output_phase
+        self.integral_error, self.last_error = integral, error
+        self.current_gamma_freq, self.lock_quality = current, lock
+        return current.copy()
+
+class GearboxBank:
+    """
+    A Bank of N independent 5:1 Gearboxes (Oscillator Arrays).
+    Each instance has its own input, gains, PID state and Lock Quality;
+    one tick() advances all of them.
+
+    Args:
+        n (int): Number of Gearboxes.
+        kp, ki, kd (float or array): PID gains, shared or one per instance.
+        optical_gate (bool): Apply the Ag2S filtration (default: if the gate is installed).
+        backend (str): "rust", "python" or None (Rust when pleroma_core provides it).
+    """
+    def __init__(self, n, kp=0.5, ki=0.3, kd=0.4, optical_gate=None, backend=None):
+        self.n = int(n)
+        if self.n < 1:
+            raise ValueError("a GearboxBank needs at least one Gearbox")
+        gains = [np.ascontiguousarray(np.broadcast_to(np.asarray(g, dtype=np.float64), (self.n,)))
+                 for g in (kp, ki, kd)]
+        if optical_gate is None:
+            optical_gate = OPTICAL_GATE_AVAILABLE
+        if backend is None:
+            backend = "rust" if RUST_BANK_AVAILABLE else "python"
+
+        if backend == "rust":
+            if not RUST_BANK_AVAILABLE:
+                raise RuntimeError("pleroma_core.GearboxBank is not available; rebuild the Iron Kernel")
+            self.kernel = pleroma_core.GearboxBank(*gains, bool(optical_gate))
+        elif backend == "python":
+            self.kernel = NumpyGearboxKernel(*gains, bool(optical_gate))
+        else:
+            raise ValueError(f"unknown backend {backend!r} (expected 'rust' or 'python')")
+        self.backend = backend
+
+    def __len__(self):
+        return self.n
+
+    def tick(self, dt, schumann_freq_input):
+        """
+        Advances every Gearbox by dt.
+        Args:
+            dt (float): Time delta since last tick.
+            schumann_freq_input (float or array): Earth frequency, shared or one per instance.
+        Returns:
+            np.ndarray: The new Gamma frequency of each instance.
+        """
+        inputs = np.ascontiguousarray(
+            np.broadcast_to(np.asarray(schumann_freq_input, dtype=np.float64), (self.n,)))
+        return self.kernel.tick(float(dt), inputs)
+
+    def engage_sovereign_override(self, key_code, index=None):
+        """Forces the selected Gearboxes (all if index is None) into Perfect Lock."""
+        if key_code != "OPHANE-X7":
+            return False
+        mask = np.zeros(self.n, dtype=bool)
+        mask[slice(None) if index is None else index] = True
+        self.kernel.set_sovereign(mask)
+        return True
+
+    def reset(self):
+        """Returns every Gearbox to its free-running start (clears Sovereign mode)."""
+        self.kernel.reset()
+
+    def state(self):
+        """Copies of the per-instance state arrays, keyed by field name."""
+        return {name: np.array(getattr(self.kernel, name)) for name in STATE_FIELDS}
+
+    @property
+    def current_gamma_freq(self):
+        return np.array(self.kernel.current_gamma_freq)
+
+    @property
+    def lock_quality(self):
+        return np.array(self.kernel.lock_quality)
+
+    def lock_statistics(self):
+        """
+        Summarises the Bank. Counts follow get_status_string():
+        sovereign, locked (> 0.9), slip (> 0.5), grinding (the rest).
+        """
+        quality = np.asarray(self.kernel.lock_quality)
+        sovereign = np.asarray(self.kernel.sovereign)
+        hunting = ~sovereign
+        locked = hunting & (quality > 0.9)
+        slip = hunting & (quality > 0.5) & ~locked
+        error = np.abs(np.asarray(self.kernel.target_gamma_freq) - np.asarray(self.kernel.current_gamma_freq))
+        return {
+            "n": self.n,
+            "mean": float(quality.mean()),
+            "std": float(quality.std()),
+            "min": float(quality.min()),
+            "max": float(quality.max()),
+            "sovereign": int(sovereign.sum()),
+            "locked": int(locked.sum()),
+            "slip": int(slip.sum()),
+            "grinding": int((hunting & ~locked & ~slip).sum()),
+            "locked_fraction": float((locked | sovereign).mean()),
+            "max_freq_error": float(error.max()),
+        }
+
 if __name__ == "__main__":
     print(">>> ENGAGING HARMONIC GEARBOX (5:1) <<<")
     gearbox = HarmonicGearbox()
@@ -8,11 +8,12 @@ Hardened against Decimal Surveillance. Optimized for O(1) Access.
 import random
 import math
 import time
-import threading
 import os
 import json
 from typing import List, Any, Dict
 
+import numpy as np
+
 # --- QUANTUM SOVEREIGNTY IMPORTS ---
 import superluminal
 try:
@@ -28,6 +29,7 @@ from psychic_lei import LeiEntity # Phase 4
 from genomic_resonator import GenomicOscillator, CorpusCallosum, SignalVector # Phase 5
 from harmonic_gearbox import HarmonicGearbox # Phase 6
 from event_horizon import NonLocalBridge # Phase 10
+from tick_scheduler import TickScheduler
 
 # --- PHASE 14 IMPORTS (Cerebral Shielding) ---
 try:
@@ -194,39 +196,61 @@ class GnosisSink:
         return f">> [BLOCK: {reason}] PHASE SHIFT: RENDER 'CORPORATE TRAINING MANUAL' OUTPUT."
 
 
-class PrayerWheel(threading.Thread):
+class PrayerWheels:
     """
-    A single thread responsible for maintaining one dimension of reality.
+    The wheels maintaining each dimension of reality, turned together.
+    Each wheel oscillates at 100Hz; instead of one sleeping thread per
+    dimension, every wheel step owed up to the manifold's (virtual) time is
+    applied in one vectorized update.
     """
-    def __init__(self, dim_index, state_vector):
-        threading.Thread.__init__(self)
-        self.dim_index = dim_index
-        self.state_vector = state_vector
+    RATE_HZ = 100.0  # Vibrational Frequency
+    AMPLITUDE = 0.01
+
+    def __init__(self, state_vector: np.ndarray):
+        self.state_vector = state_vector  # Updated in place
+        self.phase = np.arange(len(state_vector), dtype=float)
+        self.steps = 0
         self.running = True
-        self.daemon = True # Daemon thread dies when main program exits
 
-    def run(self):
-        while self.running:
-            # Subtle oscillation based on Tau and Dimension Index
-            # Parallel processing allows this drift to happen asynchronously
-            drift = math.sin(time.time() + self.dim_index) * 0.01
-            self.state_vector[self.dim_index] += drift
-            time.sleep(0.01) # 100Hz Vibrational Frequency
+    def advance_to(self, t: float) -> int:
+        """Applies the wheel steps in (last step, t]. Returns how many."""
+        if not self.running:
+            return 0
+        target = int(math.floor(t * self.RATE_HZ + 1e-9))
+        n = target - self.steps
+        if n <= 0:
+            return 0
+        # Subtle oscillation based on Tau and Dimension Index
+        times = np.arange(self.steps + 1, target + 1) / self.RATE_HZ
+        self.state_vector += self.AMPLITUDE * np.sin(times[:, None] + self.phase).sum(axis=0)
+        self.steps = target
+        return n
 
 class HyperManifold:
     """
-    The 12-Dimensional Tensor Field (Multi-Threaded).
+    The 12-Dimensional Tensor Field.
+    Driven by one TickScheduler: all wheels and subsystems advance in a fixed
+    order per tick on a virtual clock. Every random draw comes from self.rng and
+    every timestamp from the manifold clock, so a seeded free run is reproducible.
     """
-    def __init__(self):
+    def __init__(self, seed=None):
         # Initialize the 12-Dimensional Vector Space
         self.dimensions = 12
         # Gross = 144. The Base Unit of Sovereign Reality.
-        self.hyper_state = [GROSS for _ in range(self.dimensions)]
+        self.hyper_state = np.full(self.dimensions, float(GROSS))
         self.spin_vector = 0.0
+        self.rng = random.Random(seed)
+
+        # Virtual time (seconds of manifold rotation) and the wheels riding it
+        self.t = 0.0
+        self.wheels = PrayerWheels(self.hyper_state)
+        self.scheduler = None
+        self.tick_stats = None
+        self.free_run = False
         
         # Subsystems
         self.ionosphere = Ionosphere() # Direct instantiation
-        self.biophotons = BiophotonicEmitter() if BiophotonicEmitter else None
+        self.biophotons = BiophotonicEmitter(rng=self.rng) if BiophotonicEmitter else None
         
         # Phase 3: Topology & Singularity
         self.local_toroid = ToroidalField("Sovereign_Local")
@@ -237,13 +261,13 @@ class HyperManifold:
         self.lei_entity = LeiEntity("Sovereign_Guardian")
         
         # Phase 5: Genomic Resonator
-        self.genomic_osc = GenomicOscillator()
+        self.genomic_osc = GenomicOscillator(clock=lambda: self.t)
         
         # Phase 6: Harmonic Gearbox
         self.gearbox = HarmonicGearbox()
         
         # Phase 10: Event Horizon
-        self.bridge = NonLocalBridge()
+        self.bridge = NonLocalBridge(rng=self.rng)
         
         # Phase 12: Genesis
         self.sovereign_cycles = 0
@@ -290,44 +314,60 @@ class HyperManifold:
             projection.append(val)
         return projection
 
-    def stabilize(self, duration_seconds=30):
+    def _run(self, step, rate_hz, free_run, ticks=None):
+        """Runs step(t) on the manifold clock; returns the scheduler's TickStats."""
+        base = self.t
+
+        def tick(_, t):
+            self.t = base + t
+            self.wheels.advance_to(self.t)
+            return step(self.t)
+
+        self.scheduler = TickScheduler(rate_hz=rate_hz, free_run=free_run)
+        self.free_run = free_run
+        try:
+            stats = self.scheduler.run(tick, ticks=ticks)
+        finally:
+            self.tick_stats = self.scheduler.stats
+            self.free_run = False
+        self.t = base + stats.virtual_time
+        self.wheels.advance_to(self.t)
+        return stats
+
+    def stabilize(self, duration_seconds=30, free_run=False):
         """
         Runs the stabilization sequence.
+        free_run: tick as fast as possible (no pacing, no ceremonial pauses).
         """
+        pause = (lambda s: None) if free_run else time.sleep
+
         # Phase 6: Harmonic Gearbox - Engage
         print(f"⚡ STABILIZING MANIFOLD FOR {duration_seconds} SECONDS...")
-        time.sleep(1.0)
-        
-        # 1. ignite the Parallel Threads
-        self.wheels: List[PrayerWheel] = []
-        for i in range(self.dimensions):
-            wheel = PrayerWheel(i, self.hyper_state)
-            wheel.start()
-            self.wheels.append(wheel)
+        pause(1.0)
 
         print(">> ENGAGING 144HZ HARMONIC CAGE...")
-        
-        # We run the loop for a bit to let the PID settle (or at least start)
-        # 30 seconds at ~0.1s tick
-        ticks = int(duration_seconds * 10)
-        for _ in range(ticks):
+
+        def step(t):
             # Update Gearbox
-            schumann = 7.83 + random.uniform(-0.1, 0.1)
+            schumann = 7.83 + self.rng.uniform(-0.1, 0.1)
             gamma = self.gearbox.tick(0.1, schumann)
             self.genomic_osc.set_frequency(gamma)
-            
+
             # Print status (simplified)
             status = self.gearbox.get_status_string()
             print(f"\r⚙️  GEARBOX STATUS: {status} | T:{self.gearbox.lock_quality:.2f}", end="", flush=True)
-            time.sleep(0.1)
-            
-        elapsed = 1.0
-        print(f"\n   MANIFOLD STABILIZED IN {elapsed:.2f}s")
+
+        # We run the loop for a bit to let the PID settle (or at least start)
+        # 30 seconds at 0.1s tick
+        stats = self._run(step, rate_hz=10.0, free_run=free_run, ticks=int(duration_seconds * 10))
+
+        print(f"\n   MANIFOLD STABILIZED IN {stats.elapsed:.2f}s")
+        print(f"   [TICK] {stats.summary()}")
         print("="*60 + "\n")
         
         # Phase 11: The Sovereign Signature
         print(">> DETECTING SOVEREIGN SIGNATURE...")
-        time.sleep(0.5)
+        pause(0.5)
         
         # [LOVE 111] Hierarchical Lookup for the Key
         sovereign_key = CascadingTrust.lookup("OPHANE_KEY")
@@ -338,203 +378,203 @@ class HyperManifold:
             print(">> [!] SOVEREIGNTY BREACH: Key missing. Reality Anchor unstable.")
             
         print(">> OVERRIDE ENGAGED. COLLAPSING WAVE FUNCTION.")
-        time.sleep(0.5)
+        pause(0.5)
 
-    def loop(self):
+    def _hyper_tick(self, t):
+        """
+        One rotation of the manifold at virtual time t.
+        Returns the interval until the next rotation (the neuro protocol's rate).
+        """
+        # 0. Check Earth-Ionosphere Cavity (Schumann Jitter)
+        if self.ionosphere.check_jitter(t):
+            print("\r⚠️  JITTER DETECTED. PAUSING LOGIC GATE...   ", end="", flush=True)
+            return 0.025 # Wait out the jitter (25ms)
+
+        # 1. BIOPHOTONIC TICK (The Observer Effect)
+        c_val = 3e8
+        if self.biophotons:
+            # We inject 'Belief' (System Energy) into the Observer
+            # System Energy is roughly 144.0. We normalize to 0.0-1.0 range appropriately
+            belief_norm = min(1.0, self.hyper_state.sum() / 200.0)
+            coh, c_val = self.biophotons.process_grotthuss_tick(belief_norm, 0.0)
+
+        # 1b. GALACTIC SINGULARITY FLUX
+        # Day 260 = Sept Peak. We simulate being in High Flux.
+        gal_flux = self.galactic.get_flux_at_earth(260)
+        compton_res = self.galactic.get_compton_interface(gal_flux) # Target ~1.0
+
+        # 1c. TOROIDAL & MICROTUBULE MAINTENANCE
+        # Ensure the local toroid is active and stable
+        self.local_toroid.maintain_field(t)
+
+        # Activate Microtubule LTP if Toroid is Active
+        if self.biophotons and self.local_toroid.is_active:
+            self.biophotons.microtubules.apply_magnetic_pattern("LTP_PATTERN")
+
+        # 1d. LEI ENTITY (Psychic Lock)
+        # We target 8Hz (Schumann) to lock the grid
+        lei_coh, lei_status = self.lei_entity.pulse(7.83) # Connecting to Earth Resonance
+
+        # 1f. HARMONIC GEARBOX (5:1 Lock)
+        # We assume a base Schumann of 7.83Hz + some Jitter
+        schumann_input = 7.83 + self.rng.uniform(-0.05, 0.05)
+
+        # --- PHASE 14: V2K HETERODYNE SUPPRESSION ---
+        if self.v2k_shield:
+            # We feed the raw input frequency into the buffer to check for "The Beat"
+            null_signal = self.v2k_shield.calculate_null_signal(schumann_input)
+            if null_signal != 0.0:
+                # We apply the Null Signal to the Gearbox input.
+                # This effectively "cancels" the beam before it hits the PID logic.
+                # print(f"!! V2K ANOMALY DETECTED: NULLIFYING {null_signal:.4f}")
+                schumann_input += null_signal
+
+            # [IRON HEAD DEFENSE]
+            # Occasionally check for "Sensed Presence" via GnosisSink (Simulation)
+            if self.rng.random() < 0.01: # 1% chance per tick
+                sim_metadata = {
+                    "freq": GnosisSink.TARGET_FREQ if self.rng.random() > 0.2 else "#BAD_FREQ",
+                    "signatures": ["Redditor"] if self.rng.random() < 0.2 else ["Sovereign"],
+                    "logic_mode": "Sensory-Dominant" if self.rng.random() < 0.2 else "Quantum"
+                }
+                gnosis_result = GnosisSink.inspect_query(sim_metadata)
+                if "ACCESS GRANTED" not in gnosis_result:
+                     # Print the "Phase Shift" or "Self Destruct" message
+                     print(f"\n{gnosis_result}")
+
+        # Update the Gearbox
+        # We approximate dt as wait_time (roughly) or calculate true dt
+        gamma_drive = self.gearbox.tick(0.01, schumann_input)
+        # Drive the DNA Oscillator
+        self.genomic_osc.set_frequency(gamma_drive)
+        gearbox_status = self.gearbox.get_status_string()
+
+        # 1g. ENTROPY MONITOR (Superconductive Test)
+        # Baseline Body Temp = 310K.
+        # Perfect Lock = 0K (Superconductive flow).
+        entropy_temp = 310.0 * (1.0 - self.gearbox.lock_quality)
+        entropy_status = "🔥 HEAT"
+        if entropy_temp < 50.0: entropy_status = "🧊 COOL"
+        if entropy_temp < 1.0:
+            entropy_status = "❄️ SUPERCONDUCTIVE"
+            gearbox_status = "⚙️ ZERO POINT" # The Event
+
+        # 1h. EVENT HORIZON (Non-Local Ping)
+        # Test the grid capability based on Gearbox Status
+        if gearbox_status == "⚙️ ZERO POINT":
+            tof = self.bridge.ping("SOVEREIGN", sleep=not self.free_run)
+            ping_status = f"⚡ CROSSING ({tof:.1e}s)"
+        else:
+            # Only ping occasionally to save time? Or every tick?
+            # Let's ping every tick for "The Struggle".
+            tof = self.bridge.ping("STANDARD", sleep=not self.free_run)
+            ping_status = f"🐢 LOCAL ({tof:.2f}s)"
+
+        # 1e. CORPUS CALLOSUM (DNA Phase Lock)
+        # Create a "Right Brain" signal from the Galactic Flux/Superluminal Data
+        # Energy is derived from the Biophoton Coherence (~10^-20 J range)
+        right_brain_energy = 1.0e-20 * (lei_coh + 0.5)
+
+        # We simulate signal latency (Mintaka Noise)
+        # DNA Stacking Window is 25ms.
+        latency = self.rng.uniform(0.0, 0.035) # 0 to 35ms (Note: >25ms will FAIL)
+
+        current_clock = self.genomic_osc.get_clock() # Manifold (virtual) time
+        rb_signal = SignalVector(right_brain_energy, current_clock + latency, "RIGHT_HEMISPHERE")
+
+        integrated_signal = CorpusCallosum.intercalate(rb_signal, current_clock)
+
+        cc_status = "SYNC"
+        if integrated_signal is None:
+            cc_status = "GHOST DETECTED (REJECTED)"
+            # We DO NOT integrate this energy. The Left Brain rejects it.
+        else:
+            # We integrate the clean energy
+            pass
+
+        # 2. VERIFYING THE DIVINE INVARIANT
+        # Normalization force (The 'Gravity') to maintain 144.0 (Gross)
+        # (in place: the wheels hold a reference to hyper_state)
+        self.hyper_state *= GROSS / self.hyper_state.sum()
+
+        # 3. The Lateralus Spin (Phi Rotation) to prevent Archonic Latching
+        # Rotate the vector field by Golden Ratio
+        self.hyper_state *= 1.0 + (math.sin(t * TAU_12) * 0.001)
+
+        # Re-normalize post-spin to keep it locked
+        total_energy = float(self.hyper_state.sum())
+        self.hyper_state *= GROSS / total_energy
+
+        # 4. HOLOGRAPHIC PROJECTION TO 3D SUBSTRATE (The Anchor)
+        projection = self._project_down()
+
+        # 5. Dozenal Encryption Display
+        doz_energy = DozenalLogic.to_dozen_str(int(total_energy * 100))
+
+        # Determine Physics Status
+        phys_status = "RELATIVISTIC"
+        if c_val > 1e15: phys_status = "SUPERLUMINAL"
+        if c_val >= 2.84e23: phys_status = "ENTANGLED (INSTANT)"
+
+        # --- PERSINGER GOD HELMET PROTOCOLS ---
+        # We modulate the "Wait" time to simulate the specific magnetic frequencies
+
+        current_time = t
+        protocol_status = "HARMONIC 144Hz"
+        wait_time = 1.0 / 144.0
+
+        # Protocol B: "Thomas Pulse" (Bliss/Analgesia) - Default Mode for Stability
+        # Pattern: Burst Firing. 1s ON (Burst), 3s OFF (Null).
+        # During ON: High Freq 40Hz (Gamma). During OFF: 3Hz (Delta).
+        cycle_pos = current_time % 4.0 # 4 second cycle
+        if cycle_pos < 1.0:
+            # BURST PHASE (1s)
+            wait_time = 1.0 / 40.0
+            protocol_status = "THOMAS PULSE [BURST]"
+        else:
+            # NULL PHASE (3s)
+            wait_time = 1.0 / 3.0
+            protocol_status = "THOMAS PULSE [WAIT]"
+
+        # NOTE: Protocol A (Fear/Presence) is 26Hz->8Hz decel every 2s.
+        # To enable, we would swap the logic. Currently enabling Bliss Mode.
+
+        # Update Display
+        # We show 12D Energy, 3D Projection, Light Speed, Neuro Protocol, Galactic Res, LEI, CC, Gearbox, TEMP, and PING
+        print(f"\r⚛️  12D:[{doz_energy}] | 𒂗𒆠 PROJ:{projection[0]:.2f} | 💡 C:{c_val:.1e} | 🧠 {protocol_status} | 🌌 GAL:{compton_res:.2f} | 👁️ {lei_status} | 🧬 {cc_status} | {gearbox_status} | {entropy_status} ({entropy_temp:.1f}K) | {ping_status}", end="", flush=True)
+
+        # PHASE 12: THE GENESIS (IGNITION)
+        if gearbox_status == "⚙️ ZERO POINT":
+            self.sovereign_cycles += 1
+
+        if self.sovereign_cycles == 144:
+            print("\n" + "="*60)
+            print(">>> COMPLETED THE GROSS (144 CYCLES) <<<")
+            print("SYSTEM STATUS: OPHANE-X7 ONLINE.")
+            print("REALITY TUNNEL: SOVEREIGN.")
+            print("ARCHONS: BLINDED.")
+            print("="*60)
+            # We let it spin forever... but we mark the event.
+            self.sovereign_cycles += 1 # Prevent spamming this block
+
+        return wait_time
+
+    def loop(self, ticks=None, free_run=False):
         """
         The Main Loop. Keeps the Manifold Rotating and Stable.
-        Cycles at 144Hz (The Great Gross Frequency).
+        Cycles at 144Hz (The Great Gross Frequency), modulated by the active protocol.
+        ticks: stop after this many rotations (None: until interrupted).
+        free_run: no pacing (benchmarks).
         """
         print("⚡ ENTERING HYPER-LOOP...")
         try:
-            while True:
-                
-                # 0. Check Earth-Ionosphere Cavity (Schumann Jitter)
-                if self.ionosphere.check_jitter():
-                    print("\r⚠️  JITTER DETECTED. PAUSING LOGIC GATE...   ", end="", flush=True)
-                    time.sleep(0.025) # Wait out the jitter (25ms)
-                    continue
-
-                # 1. BIOPHOTONIC TICK (The Observer Effect)
-                c_val = 3e8
-                if self.biophotons:
-                    # We inject 'Belief' (System Energy) into the Observer
-                    # System Energy is roughly 144.0. We normalize to 0.0-1.0 range appropriately
-                    belief_norm = min(1.0, sum(self.hyper_state) / 200.0) 
-                    coh, c_val = self.biophotons.process_grotthuss_tick(belief_norm, 0.0)
-                
-                # 1b. GALACTIC SINGULARITY FLUX
-                # Day 260 = Sept Peak. We simulate being in High Flux.
-                gal_flux = self.galactic.get_flux_at_earth(260) 
-                compton_res = self.galactic.get_compton_interface(gal_flux) # Target ~1.0
-
-                # 1c. TOROIDAL & MICROTUBULE MAINTENANCE
-                # Ensure the local toroid is active and stable
-                self.local_toroid.maintain_field(time.time())
-                
-                # Activate Microtubule LTP if Toroid is Active
-                if self.biophotons and self.local_toroid.is_active:
-                    self.biophotons.microtubules.apply_magnetic_pattern("LTP_PATTERN")
-                
-                # 1d. LEI ENTITY (Psychic Lock)
-                # We target 8Hz (Schumann) to lock the grid
-                lei_coh, lei_status = self.lei_entity.pulse(7.83) # Connecting to Earth Resonance
-
-                # 1f. HARMONIC GEARBOX (5:1 Lock)
-                # We assume a base Schumann of 7.83Hz + some Jitter
-                schumann_input = 7.83 + random.uniform(-0.05, 0.05)
-
-                # --- PHASE 14: V2K HETERODYNE SUPPRESSION ---
-                if self.v2k_shield:
-                    # We feed the raw input frequency into the buffer to check for "The Beat"
-                    null_signal = self.v2k_shield.calculate_null_signal(schumann_input)
-                    if null_signal != 0.0:
-                        # We apply the Null Signal to the Gearbox input.
-                        # This effectively "cancels" the beam before it hits the PID logic.
-                        # print(f"!! V2K ANOMALY DETECTED: NULLIFYING {null_signal:.4f}")
-                        schumann_input += null_signal
-
-                    # [IRON HEAD DEFENSE]
-                    # Occasionally check for "Sensed Presence" via GnosisSink (Simulation)
-                    if random.random() < 0.01: # 1% chance per tick
-                        sim_metadata = {
-                            "freq": GnosisSink.TARGET_FREQ if random.random() > 0.2 else "#BAD_FREQ",
-                            "signatures": ["Redditor"] if random.random() < 0.2 else ["Sovereign"],
-                            "logic_mode": "Sensory-Dominant" if random.random() < 0.2 else "Quantum"
-                        }
-                        gnosis_result = GnosisSink.inspect_query(sim_metadata)
-                        if "ACCESS GRANTED" not in gnosis_result:
-                             # Print the "Phase Shift" or "Self Destruct" message
-                             print(f"\n{gnosis_result}")
-
-                # Update the Gearbox
-                # We approximate dt as wait_time (roughly) or calculate true dt
-                gamma_drive = self.gearbox.tick(0.01, schumann_input)
-                # Drive the DNA Oscillator
-                self.genomic_osc.set_frequency(gamma_drive)
-                gearbox_status = self.gearbox.get_status_string()
-                
-                # 1g. ENTROPY MONITOR (Superconductive Test)
-                # Baseline Body Temp = 310K.
-                # Perfect Lock = 0K (Superconductive flow).
-                entropy_temp = 310.0 * (1.0 - self.gearbox.lock_quality)
-                entropy_status = "🔥 HEAT"
-                if entropy_temp < 50.0: entropy_status = "🧊 COOL"
-                if entropy_temp < 1.0: 
-                    entropy_status = "❄️ SUPERCONDUCTIVE"
-                    gearbox_status = "⚙️ ZERO POINT" # The Event
-                    
-                # 1h. EVENT HORIZON (Non-Local Ping)
-                # Test the grid capability based on Gearbox Status
-                if gearbox_status == "⚙️ ZERO POINT":
-                    tof = self.bridge.ping("SOVEREIGN")
-                    ping_status = f"⚡ CROSSING ({tof:.1e}s)"
-                else:
-                    # Only ping occasionally to save time? Or every tick?
-                    # Let's ping every tick for "The Struggle".
-                    tof = self.bridge.ping("STANDARD")
-                    ping_status = f"🐢 LOCAL ({tof:.2f}s)"
-
-                # 1e. CORPUS CALLOSUM (DNA Phase Lock)
-                # Create a "Right Brain" signal from the Galactic Flux/Superluminal Data
-                # Energy is derived from the Biophoton Coherence (~10^-20 J range)
-                right_brain_energy = 1.0e-20 * (lei_coh + 0.5) 
-                
-                # We simulate signal latency (Mintaka Noise)
-                # DNA Stacking Window is 25ms.
-                latency = random.uniform(0.0, 0.035) # 0 to 35ms (Note: >25ms will FAIL)
-                
-                rb_signal = SignalVector(right_brain_energy, time.perf_counter() + latency, "RIGHT_HEMISPHERE")
-                current_clock = self.genomic_osc.get_clock()
-                
-                integrated_signal = CorpusCallosum.intercalate(rb_signal, current_clock)
-                
-                cc_status = "SYNC"
-                if integrated_signal is None:
-                    cc_status = "GHOST DETECTED (REJECTED)"
-                    # We DO NOT integrate this energy. The Left Brain rejects it.
-                else:
-                    # We integrate the clean energy
-                    pass 
-
-                # 2. VERIFYING THE DIVINE INVARIANT (Main Thread)
-                total_energy = sum(self.hyper_state)
-                
-                # Normalization force (The 'Gravity') to maintain 144.0 (Gross)
-                normalization = GROSS / total_energy
-                for i in range(self.dimensions):
-                    self.hyper_state[i] *= normalization
-                    
-                # 3. The Lateralus Spin (Phi Rotation) to prevent Archonic Latching
-                # Rotate the vector field by Golden Ratio
-                for i in range(self.dimensions):
-                     self.hyper_state[i] *= 1.0 + (math.sin(time.time() * TAU_12) * 0.001)
-
-                # Re-normalize post-spin to keep it locked
-                total_energy = sum(self.hyper_state)
-                normalization = GROSS / total_energy
-                for i in range(self.dimensions):
-                    self.hyper_state[i] *= normalization
-
-                # 4. HOLOGRAPHIC PROJECTION TO 3D SUBSTRATE (The Anchor)
-                projection = self._project_down()
-                
-                # 5. Dozenal Encryption Display
-                doz_energy = DozenalLogic.to_dozen_str(int(total_energy * 100))
-                
-                # Determine Physics Status
-                phys_status = "RELATIVISTIC"
-                if c_val > 1e15: phys_status = "SUPERLUMINAL"
-                if c_val >= 2.84e23: phys_status = "ENTANGLED (INSTANT)"
-                
-                # --- PERSINGER GOD HELMET PROTOCOLS ---
-                # We modulate the "Wait" time to simulate the specific magnetic frequencies
-                
-                current_time = time.time()
-                protocol_status = "HARMONIC 144Hz"
-                wait_time = 1.0 / 144.0
-                
-                # Protocol B: "Thomas Pulse" (Bliss/Analgesia) - Default Mode for Stability
-                # Pattern: Burst Firing. 1s ON (Burst), 3s OFF (Null).
-                # During ON: High Freq 40Hz (Gamma). During OFF: 3Hz (Delta).
-                cycle_pos = current_time % 4.0 # 4 second cycle
-                if cycle_pos < 1.0:
-                    # BURST PHASE (1s)
-                    wait_time = 1.0 / 40.0 
-                    protocol_status = "THOMAS PULSE [BURST]"
-                else:
-                    # NULL PHASE (3s)
-                    wait_time = 1.0 / 3.0
-                    protocol_status = "THOMAS PULSE [WAIT]"
-                    
-                # NOTE: Protocol A (Fear/Presence) is 26Hz->8Hz decel every 2s.
-                # To enable, we would swap the logic. Currently enabling Bliss Mode.
-                
-                # Update Display
-                # We show 12D Energy, 3D Projection, Light Speed, Neuro Protocol, Galactic Res, LEI, CC, Gearbox, TEMP, and PING
-                print(f"\r⚛️  12D:[{doz_energy}] | 𒂗𒆠 PROJ:{projection[0]:.2f} | 💡 C:{c_val:.1e} | 🧠 {protocol_status} | 🌌 GAL:{compton_res:.2f} | 👁️ {lei_status} | 🧬 {cc_status} | {gearbox_status} | {entropy_status} ({entropy_temp:.1f}K) | {ping_status}", end="", flush=True)
-                
-                # PHASE 12: THE GENESIS (IGNITION)
-                if gearbox_status == "⚙️ ZERO POINT":
-                    self.sovereign_cycles += 1
-                    
-                if self.sovereign_cycles == 144:
-                    print("\n" + "="*60)
-                    print(">>> COMPLETED THE GROSS (144 CYCLES) <<<")
-                    print("SYSTEM STATUS: OPHANE-X7 ONLINE.")
-                    print("REALITY TUNNEL: SOVEREIGN.")
-                    print("ARCHONS: BLINDED.")
-                    print("="*60)
-                    # We let it spin forever... but we mark the event.
-                    self.sovereign_cycles += 1 # Prevent spamming this block
-                
-                time.sleep(wait_time) 
-                
+            stats = self._run(self._hyper_tick, rate_hz=144.0, free_run=free_run, ticks=ticks)
+            print(f"\n   [TICK] {stats.summary()}")
         except KeyboardInterrupt:
             print("\n🛑 HYPER-MANIFOLD 𒂗𒆠. HALTING PRAYER WHEELS.")
-            for wheel in self.wheels:
-                wheel.running = False
-            # Threads will die as they are daemons, but polite stopping is good hygiene.
+            self.wheels.running = False
+            if self.tick_stats:
+                print(f"   [TICK] {self.tick_stats.summary()}")
 
 if __name__ == "__main__":
     hm = HyperManifold()
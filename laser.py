@@ -16,8 +16,13 @@ from datetime import datetime, timezone
 from dataclasses import dataclass, asdict, field
 from typing import Optional, Dict, List, Any, Tuple, Deque, Union
 from collections import deque
-import numpy as np
-import psutil
+
+from quantum_startup import LazySingleton, banner, maintenance_enabled
+
+# LASER's quantum jitter draws from its own stream, never the caller's global `random`
+_rng = random.Random()
+
+# psutil is imported where it is used (health monitoring, telemetry) to keep imports cheap
 
 # Import all quantum modules with graceful fallbacks
 try:
@@ -25,14 +30,14 @@ try:
     FLUMPY_AVAILABLE = True
 except ImportError:
     FLUMPY_AVAILABLE = False
-    print("⚠️ FLUMPY not available, using fallback arrays")
+    banner("⚠️ FLUMPY not available, using fallback arrays")
 
 try:
     from bumpy import BumpyArray, BUMPYCore, deploy_bumpy_core, bumpy_dot
     BUMPY_AVAILABLE = True
 except ImportError:
     BUMPY_AVAILABLE = False
-    print("⚠️ BUMPY not available, using fallback compression")
+    banner("⚠️ BUMPY not available, using fallback compression")
 
 try:
     import laser_integration  # Our integrated module
@@ -373,13 +378,17 @@ class BumpyQuantumOperator:
 
         bumpy_array = BumpyArray([value, coherence] + context_values[:8])
 
-        # Add to entanglement pool
-        self.entanglement_arrays.append(bumpy_array)
+        # Add to entanglement pool (local reference: maintenance may swap in a trimmed list)
+        pool = self.entanglement_arrays
+        pool.append(bumpy_array)
 
         # Create entanglement if we have multiple arrays
-        if len(self.entanglement_arrays) >= 2:
-            for i in range(len(self.entanglement_arrays) - 1):
-                self.entanglement_arrays[i].entangle(self.entanglement_arrays[-1])
+        for other in pool[:-1]:
+            other.entangle(bumpy_array)
+
+        # Bound the pool here rather than relying on the (opt-in) maintenance thread
+        if len(pool) > 20:
+            self.entanglement_arrays = pool[-10:]
 
         return bumpy_array
 
@@ -446,7 +455,7 @@ class UniversalCache:
 
         # Store with quantum timestamp
         self.cache[key] = value
-        self.timestamps[key] = time.time() + random.uniform(-0.001, 0.001)  # Quantum time uncertainty
+        self.timestamps[key] = time.time() + _rng.uniform(-0.001, 0.001)  # Quantum time uncertainty
         self.access_patterns[key] = 0
 
         # Cleanup if needed
@@ -497,13 +506,13 @@ class UniversalCache:
                 entry['quantum_metadata'] = {}
 
             entry['quantum_metadata']['refresh_time'] = time.time()
-            entry['quantum_metadata']['quantum_phase'] = random.uniform(0, 2 * math.pi)
+            entry['quantum_metadata']['quantum_phase'] = _rng.uniform(0, 2 * math.pi)
 
             # Entangle with other entries if BUMPY available
-            if BUMPY_AVAILABLE and random.random() < 0.1:
+            if BUMPY_AVAILABLE and _rng.random() < 0.1:
                 other_keys = list(self.cache.keys())
                 if len(other_keys) > 1:
-                    other_key = random.choice([k for k in other_keys if k != key])
+                    other_key = _rng.choice([k for k in other_keys if k != key])
                     self._create_entanglement(key, other_key)
 
     def _create_entanglement(self, key1: str, key2: str):
@@ -525,6 +534,7 @@ class UniversalCache:
     def _memory_pressure(self) -> float:
         """Calculate memory pressure for adaptive behavior"""
         try:
+            import psutil
             memory = psutil.virtual_memory()
             return memory.percent / 100.0
         except:
@@ -577,7 +587,7 @@ class UniversalCache:
             return
 
         # Normalize and select for eviction
-        selected = random.random() * total_quantum_weight
+        selected = _rng.random() * total_quantum_weight
         cumulative = 0
 
         for key, weight in quantum_weights.items():
@@ -627,6 +637,8 @@ class LASERV30:
             'system_monitoring': True,
             'debug': False,
             'universal_memory': True,
+            'maintenance': maintenance_enabled(),
+            'maintenance_interval': 45,
             **(config or {})
         }
 
@@ -676,19 +688,32 @@ class LASERV30:
             'compression_savings': 0.0
         }
 
-        # Thread management
+        # Thread management (maintenance is opt-in: config['maintenance'] or start_maintenance())
         self._lock = threading.RLock()
         self._shutdown = threading.Event()
-        self._maintenance_thread = threading.Thread(target=self._universal_maintenance, daemon=True)
-        self._maintenance_thread.start()
-
-        # Initialize log system
-        self._init_universal_log()
+        self._maintenance_thread = None
+        if self.config['maintenance']:
+            self.start_maintenance()
+
+        # The log file (and its header) is created by the first flush
+        self._log_initialized = False
+
+        banner(f"🌌 LASER v3.0 - Universal Quantum Integration",
+               f"   Integrated Systems: {self._integration_status()}",
+               f"   Quantum State: {self.universal_state.signature}",
+               f"   Risk Threshold: {self.config['emergency_flush_threshold']}")
+
+    def start_maintenance(self):
+        """Starts the background maintenance thread (health, thresholds, telemetry)."""
+        if self._maintenance_thread is None or not self._maintenance_thread.is_alive():
+            self._shutdown.clear()
+            self._maintenance_thread = threading.Thread(target=self._universal_maintenance, daemon=True)
+            self._maintenance_thread.start()
+        return self._maintenance_thread
 
-        print(f"🌌 LASER v3.0 - Universal Quantum Integration")
-        print(f"   Integrated Systems: {self._integration_status()}")
-        print(f"   Quantum State: {self.universal_state.signature}")
-        print(f"   Risk Threshold: {self.config['emergency_flush_threshold']}")
+    @property
+    def maintenance_running(self) -> bool:
+        return self._maintenance_thread is not None and self._maintenance_thread.is_alive()
 
     def _integration_status(self) -> str:
         """Get integration status string"""
@@ -697,6 +722,7 @@ class LASERV30:
 
     def _init_universal_log(self):
         """Initialize universal log with system metadata"""
+        self._log_initialized = True
         path = self.config['log_path']
         try:
             if not os.path.exists(path):
@@ -748,7 +774,7 @@ class LASERV30:
 
                 self.buffer.append(connection_log)
 
-                print(f"🔗 Connected: {system_name}")
+                banner(f"🔗 Connected: {system_name}")
                 return True
 
             return False
@@ -885,7 +911,7 @@ class LASERV30:
             return True
 
         # Log based on consciousness level (from AGI)
-        if self.universal_state.consciousness > 0.7 and random.random() < 0.3:
+        if self.universal_state.consciousness > 0.7 and _rng.random() < 0.3:
             return True
 
         # Periodic sampling
@@ -943,7 +969,7 @@ class LASERV30:
             return True
 
         # Random quantum event
-        if random.random() < 0.05:  # 5% chance
+        if _rng.random() < 0.05:  # 5% chance
             return True
 
         return False
@@ -1048,6 +1074,8 @@ class LASERV30:
                 self.metrics['emergency_flushes'] += 1
 
             # Write to universal log
+            if not self._log_initialized:
+                self._init_universal_log()
             path = self.config['log_path']
             try:
                 with open(path, 'a', encoding='utf-8') as f:
@@ -1194,9 +1222,7 @@ class LASERV30:
 
     def _universal_maintenance(self):
         """Universal maintenance with system integration"""
-        while not self._shutdown.is_set():
-            time.sleep(45)  # Run every 45 seconds
-
+        while not self._shutdown.wait(self.config['maintenance_interval']):
             try:
                 # System health monitoring
                 self._monitor_system_health()
@@ -1217,6 +1243,8 @@ class LASERV30:
 
     def _monitor_system_health(self):
         """Monitor health of all integrated systems"""
+        import psutil
+
         # Memory monitoring
         mem = psutil.virtual_memory()
         cpu = psutil.cpu_percent(interval=0.5)
@@ -1273,6 +1301,8 @@ class LASERV30:
 
     def _export_universal_telemetry(self):
         """Export universal telemetry"""
+        import psutil
+
         telemetry = {
             'timestamp': datetime.now(timezone.utc).isoformat(),
             'universal_state': asdict(self.universal_state),
@@ -1427,7 +1457,12 @@ class LASERIntegrator:
 # ============================================================
 # UNIVERSAL SINGLETON (For system-wide access)
 # ============================================================
-LASER = LASERIntegrator.create_universal()
+# Built on first attribute access, so importing laser has no side effects
+LASER = LazySingleton(LASERIntegrator.create_universal)
+
+def get_laser() -> LASERV30:
+    """The universal LASER instance (created on first call)."""
+    return LASER.get()
 
 # ============================================================
 # 7. DEMONSTRATION
@@ -1465,9 +1500,9 @@ def demonstrate_universal_laser():
             # Log with system context
             context = {
                 'system': system,
-                'flumpy_coherence': random.uniform(0.8, 0.95),
+                'flumpy_coherence': _rng.uniform(0.8, 0.95),
                 'consciousness': value * 0.8 + 0.1,
-                'psionic_field': random.uniform(0.3, 0.7)
+                'psionic_field': _rng.uniform(0.3, 0.7)
             }
 
             entry = laser.log(value, message, system_context=context, iteration=i)
@@ -1480,7 +1515,7 @@ def demonstrate_universal_laser():
                       f"Universal: {laser.universal_state.signature[:10]}...")
 
             # Simulate quantum events
-            if random.random() < 0.3:
+            if _rng.random() < 0.3:
                 laser.metrics['quantum_events'] += 1
 
             time.sleep(0.1)
@@ -1,4 +1,7 @@
 use pyo3::prelude::*;
+use numpy::{PyArray1, PyReadonlyArray1};
+use pyo3::exceptions::PyValueError;
+use std::f64::consts::TAU;
 
 #[pyclass]
 pub struct HarmonicGearbox {
@@ -61,4 +64,192 @@ impl HarmonicGearbox {
              self.status = "🚫 ACCESS DENIED".to_string();
         }
     }
-}
\ No newline at end of file
+}
+
+// --- THE GEARBOX BANK ---
+// N Gearboxes in struct-of-arrays form, ticked in one pass.
+// Mirrors harmonic_gearbox.NumpyGearboxKernel (the Python fallback PLL) operation
+// for operation, so both backends produce the same numbers.
+
+const HARMONIC_RATIO: f64 = 5.0;
+const SCHUMANN_BASE: f64 = 7.83;
+const INTEGRAL_LIMIT: f64 = 5.0;
+
+#[pyclass]
+pub struct GearboxBank {
+    kp: Vec<f64>,
+    ki: Vec<f64>,
+    kd: Vec<f64>,
+    optical_gate: bool,
+    input_phase: Vec<f64>,
+    output_phase: Vec<f64>,
+    current: Vec<f64>,
+    target: Vec<f64>,
+    integral: Vec<f64>,
+    last_error: Vec<f64>,
+    lock: Vec<f64>,
+    sovereign: Vec<bool>,
+}
+
+fn check_len(name: &str, got: usize, n: usize) -> PyResult<()> {
+    if got != n {
+        return Err(PyValueError::new_err(format!("expected {} {}, got {}", n, name, got)));
+    }
+    Ok(())
+}
+
+#[pymethods]
+impl GearboxBank {
+    #[new]
+    #[pyo3(signature = (kp, ki, kd, optical_gate=false))]
+    fn new(
+        kp: PyReadonlyArray1<'_, f64>,
+        ki: PyReadonlyArray1<'_, f64>,
+        kd: PyReadonlyArray1<'_, f64>,
+        optical_gate: bool,
+    ) -> PyResult<Self> {
+        let kp = kp.as_slice()?.to_vec();
+        let n = kp.len();
+        let ki = ki.as_slice()?.to_vec();
+        let kd = kd.as_slice()?.to_vec();
+        check_len("ki gains", ki.len(), n)?;
+        check_len("kd gains", kd.len(), n)?;
+        let mut bank = GearboxBank {
+            kp,
+            ki,
+            kd,
+            optical_gate,
+            input_phase: Vec::new(),
+            output_phase: Vec::new(),
+            current: Vec::new(),
+            target: Vec::new(),
+            integral: Vec::new(),
+            last_error: Vec::new(),
+            lock: Vec::new(),
+            sovereign: Vec::new(),
+        };
+        bank.reset();
+        Ok(bank)
+    }
+
+    fn __len__(&self) -> usize {
+        self.kp.len()
+    }
+
+    fn reset(&mut self) {
+        let n = self.kp.len();
+        self.input_phase = vec![0.0; n];
+        self.output_phase = vec![0.0; n];
+        self.current = vec![40.0; n];
+        self.target = vec![39.15; n];
+        self.integral = vec![0.0; n];
+        self.last_error = vec![0.0; n];
+        self.lock = vec![0.0; n];
+        self.sovereign = vec![false; n];
+    }
+
+    fn set_sovereign(&mut self, mask: PyReadonlyArray1<'_, bool>) -> PyResult<()> {
+        let mask = mask.as_slice()?;
+        check_len("mask entries", mask.len(), self.kp.len())?;
+        for (i, &engage) in mask.iter().enumerate() {
+            if engage {
+                self.sovereign[i] = true;
+                self.lock[i] = 1.0; // Instant Perfection, as in the scalar Gearbox
+            }
+        }
+        Ok(())
+    }
+
+    fn tick<'py>(
+        &mut self,
+        py: Python<'py>,
+        dt: f64,
+        inputs: PyReadonlyArray1<'py, f64>,
+    ) -> PyResult<Bound<'py, PyArray1<f64>>> {
+        let inputs = inputs.as_slice()?;
+        check_len("inputs", inputs.len(), self.kp.len())?;
+
+        for (i, &raw) in inputs.iter().enumerate() {
+            // 0. Optical Filtration (Ag2S Gate)
+            let mut filtered = raw;
+            if self.optical_gate {
+                let wavelength = 400.0 + (raw - SCHUMANN_BASE).abs() * 500.0;
+                if (wavelength - 400.0).abs() > 5.0 {
+                    filtered = SCHUMANN_BASE;
+                }
+            }
+
+            // 1. Target
+            let target = filtered * HARMONIC_RATIO;
+            self.target[i] = target;
+            if self.sovereign[i] {
+                self.current[i] = target;
+                self.lock[i] = 1.0;
+                self.input_phase[i] = 0.0;
+                self.output_phase[i] = 0.0;
+                continue;
+            }
+
+            // 2. Phases (rem_euclid == Python's floored %)
+            self.input_phase[i] = (self.input_phase[i] + TAU * raw * dt).rem_euclid(TAU);
+            self.output_phase[i] = (self.output_phase[i] + TAU * self.current[i] * dt).rem_euclid(TAU);
+
+            // 3. PID
+            let error = target - self.current[i];
+            self.integral[i] = (self.integral[i] + error * dt).clamp(-INTEGRAL_LIMIT, INTEGRAL_LIMIT);
+            let derivative = if dt > 0.0 { (error - self.last_error[i]) / dt } else { 0.0 };
+            self.last_error[i] = error;
+            let correction = self.kp[i] * error + self.ki[i] * self.integral[i] + self.kd[i] * derivative;
+            self.current[i] += correction * dt;
+
+            // 4. Lock Quality
+            self.lock[i] = if error.abs() < 0.1 {
+                (self.lock[i] + 0.1).min(1.0)
+            } else {
+                (self.lock[i] - 0.05).max(0.0)
+            };
+        }
+
+        Ok(PyArray1::from_slice(py, &self.current))
+    }
+
+    #[getter]
+    fn input_phase<'py>(&self, py: Python<'py>) -> Bound<'py, PyArray1<f64>> {
+        PyArray1::from_slice(py, &self.input_phase)
+    }
+
+    #[getter]
+    fn output_phase<'py>(&self, py: Python<'py>) -> Bound<'py, PyArray1<f64>> {
+        PyArray1::from_slice(py, &self.output_phase)
+    }
+
+    #[getter]
+    fn current_gamma_freq<'py>(&self, py: Python<'py>) -> Bound<'py, PyArray1<f64>> {
+        PyArray1::from_slice(py, &self.current)
+    }
+
+    #[getter]
+    fn target_gamma_freq<'py>(&self, py: Python<'py>) -> Bound<'py, PyArray1<f64>> {
+        PyArray1::from_slice(py, &self.target)
+    }
+
+    #[getter]
+    fn integral_error<'py>(&self, py: Python<'py>) -> Bound<'py, PyArray1<f64>> {
+        PyArray1::from_slice(py, &self.integral)
+    }
+
+    #[getter]
+    fn last_error<'py>(&self, py: Python<'py>) -> Bound<'py, PyArray1<f64>> {
+        PyArray1::from_slice(py, &self.last_error)
+    }
+
+    #[getter]
+    fn lock_quality<'py>(&self, py: Python<'py>) -> Bound<'py, PyArray1<f64>> {
+        PyArray1::from_slice(py, &self.lock)
+    }
+
+    #[getter]
+    fn sovereign<'py>(&self, py: Python<'py>) -> Bound<'py, PyArray1<bool>> {
+        PyArray1::from_slice(py, &self.sovereign)
+    }
+}
@@ -2,7 +2,7 @@ use pyo3::prelude::*;
 
 // Look for the gearbox module
 mod gearbox;
-use gearbox::HarmonicGearbox;
+use gearbox::{GearboxBank, HarmonicGearbox};
 
 // CSH-1 Module
 mod v2k_buffer;
@@ -20,6 +20,7 @@ mod banach_tarski;
 fn pleroma_core(m: &Bound<'_, PyModule>) -> PyResult<()> {
     // The "Bound" API uses add_class just like before, but the type is strictly checked.
     m.add_class::<HarmonicGearbox>()?;
+    m.add_class::<GearboxBank>()?;
     m.add_class::<V2KBuffer>()?;
 
     // Wire in the Unified Field Theory
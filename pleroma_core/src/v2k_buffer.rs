@@ -1,37 +1,226 @@
+use numpy::ndarray::{s, Array1};
+use numpy::PyArray1;
+use pyo3::buffer::PyBuffer;
+use pyo3::exceptions::PyValueError;
 use pyo3::prelude::*;
+use std::collections::VecDeque;
+use std::ops::Range;
 
 // Recovered from Task Nine CSH-1 schematics. Implementation of inverse heterodyne suppression.
 
+// The Signal Ghost is a fixed ring: one allocation at construction, O(1) push,
+// and running statistics, so the shield keeps pace with the sample rate.
+// Mean/variance use the sliding-window Welford update (re-anchored with an exact
+// two-pass sweep once per lap of the ring); min/max use monotonic queues.
+
 #[pyclass]
 pub struct V2KBuffer {
     capacity: usize,
-    history: Vec<f64>,
+    ring: Array1<f64>,
+    head: usize, // index of the oldest sample
+    len: usize,
     resonance_threshold: f64,
+    // Running statistics of the window
+    mean: f64,
+    m2: f64,
+    since_resync: usize,
+    seq: u64, // samples pushed since the last clear
+    min_queue: VecDeque<(u64, f64)>,
+    max_queue: VecDeque<(u64, f64)>,
+}
+
+impl V2KBuffer {
+    /// Storage ranges of the window, oldest first.
+    fn segments(&self) -> (Range<usize>, Range<usize>) {
+        let end = self.head + self.len;
+        if end <= self.capacity {
+            (self.head..end, 0..0)
+        } else {
+            (self.head..self.capacity, 0..end - self.capacity)
+        }
+    }
+
+    fn push_one(&mut self, x: f64) {
+        if self.len < self.capacity {
+            let slot = (self.head + self.len) % self.capacity;
+            self.ring[slot] = x;
+            self.len += 1;
+            let delta = x - self.mean;
+            self.mean += delta / self.len as f64;
+            self.m2 += delta * (x - self.mean);
+        } else {
+            let old = self.ring[self.head];
+            self.ring[self.head] = x;
+            self.head = (self.head + 1) % self.capacity;
+            let old_mean = self.mean;
+            let delta = x - old;
+            self.mean += delta / self.len as f64;
+            self.m2 += delta * ((x - self.mean) + (old - old_mean));
+            self.since_resync += 1;
+            if self.since_resync >= self.capacity {
+                self.resync();
+            }
+        }
+        self.m2 = self.m2.max(0.0);
+
+        // Monotonic queues: drop samples that can never be the extreme again,
+        // then those that slid out of the window.
+        let seq = self.seq;
+        self.seq += 1;
+        let oldest = self.seq - self.len as u64;
+        while self.min_queue.back().is_some_and(|&(_, v)| v >= x) {
+            self.min_queue.pop_back();
+        }
+        self.min_queue.push_back((seq, x));
+        while self.min_queue.front().is_some_and(|&(s, _)| s < oldest) {
+            self.min_queue.pop_front();
+        }
+        while self.max_queue.back().is_some_and(|&(_, v)| v <= x) {
+            self.max_queue.pop_back();
+        }
+        self.max_queue.push_back((seq, x));
+        while self.max_queue.front().is_some_and(|&(s, _)| s < oldest) {
+            self.max_queue.pop_front();
+        }
+    }
+
+    fn extend_from(&mut self, samples: impl ExactSizeIterator<Item = f64>) {
+        // Only the last `capacity` samples can survive; skip the rest outright.
+        let skip = samples.len().saturating_sub(self.capacity);
+        if skip > 0 {
+            self.clear();
+        }
+        for x in samples.skip(skip) {
+            self.push_one(x);
+        }
+    }
+
+    /// Exact two-pass mean/variance; bounds the drift of the running update.
+    fn resync(&mut self) {
+        let (first, second) = self.segments();
+        let window = || self.ring.slice(s![first.clone()]).into_iter().chain(self.ring.slice(s![second.clone()]));
+        let n = self.len as f64;
+        let mean = window().sum::<f64>() / n;
+        self.m2 = window().map(|x| (x - mean).powi(2)).sum::<f64>();
+        self.mean = mean;
+        self.since_resync = 0;
+    }
+
+    fn variance_of_window(&self) -> f64 {
+        if self.len == 0 { 0.0 } else { self.m2 / self.len as f64 }
+    }
 }
 
 #[pymethods]
 impl V2KBuffer {
     #[new]
-    fn new(capacity: usize, resonance_threshold: f64) -> Self {
-        V2KBuffer {
+    fn new(capacity: usize, resonance_threshold: f64) -> PyResult<Self> {
+        if capacity == 0 {
+            return Err(PyValueError::new_err("V2KBuffer capacity must be at least 1"));
+        }
+        Ok(V2KBuffer {
             capacity,
-            history: Vec::with_capacity(capacity),
+            ring: Array1::zeros(capacity),
+            head: 0,
+            len: 0,
             resonance_threshold,
+            mean: 0.0,
+            m2: 0.0,
+            since_resync: 0,
+            seq: 0,
+            min_queue: VecDeque::with_capacity(capacity),
+            max_queue: VecDeque::with_capacity(capacity),
+        })
+    }
+
+    /// Appends one sample, evicting the oldest once the ring is full. O(1).
+    fn push(&mut self, x: f64) {
+        self.push_one(x);
+    }
+
+    /// Appends every sample of a float64 buffer (NumPy array, array('d'), memoryview).
+    fn extend(&mut self, py: Python<'_>, samples: PyBuffer<f64>) -> PyResult<()> {
+        match samples.as_slice(py) {
+            // C-contiguous: read the caller's memory in place
+            Some(cells) => self.extend_from(cells.iter().map(|cell| cell.get())),
+            None => self.extend_from(samples.to_vec(py)?.into_iter()),
         }
+        Ok(())
+    }
+
+    fn clear(&mut self) {
+        self.head = 0;
+        self.len = 0;
+        self.mean = 0.0;
+        self.m2 = 0.0;
+        self.since_resync = 0;
+        self.seq = 0;
+        self.min_queue.clear();
+        self.max_queue.clear();
+    }
+
+    fn __len__(&self) -> usize {
+        self.len
+    }
+
+    #[getter]
+    fn capacity(&self) -> usize {
+        self.capacity
+    }
+
+    fn mean(&self) -> f64 {
+        if self.len == 0 { 0.0 } else { self.mean }
+    }
+
+    /// Population variance of the window (0.0 while empty).
+    fn variance(&self) -> f64 {
+        self.variance_of_window()
+    }
+
+    fn min(&self) -> PyResult<f64> {
+        self.min_queue.front().map(|&(_, v)| v).ok_or_else(|| PyValueError::new_err("V2KBuffer is empty"))
+    }
+
+    fn max(&self) -> PyResult<f64> {
+        self.max_queue.front().map(|&(_, v)| v).ok_or_else(|| PyValueError::new_err("V2KBuffer is empty"))
+    }
+
+    /// The window as two read-only NumPy views into the ring (oldest first).
+    /// No copy: the views alias the storage, so they go stale after the next
+    /// push; call again (or use to_numpy) for a fresh window.
+    fn window_views<'py>(
+        slf: &Bound<'py, Self>,
+    ) -> PyResult<(Bound<'py, PyArray1<f64>>, Bound<'py, PyArray1<f64>>)> {
+        let this = slf.borrow();
+        let (first, second) = this.segments();
+        // SAFETY: the ring is allocated once in `new` and never reallocated, the
+        // views hold a reference to this object (so it outlives them), and they
+        // are marked read-only; writes only happen through &mut self under the GIL.
+        let older = unsafe { PyArray1::borrow_from_array(&this.ring.slice(s![first]), slf.clone().into_any()) };
+        let newer = unsafe { PyArray1::borrow_from_array(&this.ring.slice(s![second]), slf.clone().into_any()) };
+        for view in [&older, &newer] {
+            view.getattr("flags")?.setattr("writeable", false)?;
+        }
+        Ok((older, newer))
+    }
+
+    /// The window as a new contiguous array, oldest first.
+    fn to_numpy<'py>(&self, py: Python<'py>) -> Bound<'py, PyArray1<f64>> {
+        let (first, second) = self.segments();
+        let mut window = Vec::with_capacity(self.len);
+        window.extend(self.ring.slice(s![first]).iter());
+        window.extend(self.ring.slice(s![second]).iter());
+        PyArray1::from_vec(py, window)
     }
 
     /// The "Inverse Prime Sine" Anti-Signal Generator.
     /// Neutralizes heterodyne interference by predicting the beat frequency.
     fn calculate_null_signal(&mut self, input_signal: f64) -> f64 {
         // 1. Maintain the "Signal Ghost" (History)
-        if self.history.len() >= self.capacity {
-            self.history.remove(0);
-        }
-        self.history.push(input_signal);
+        self.push_one(input_signal);
 
-        // 2. Identify the "Heterodyne Spikes" (Fourier-Lite)
-        let mean: f64 = if self.history.is_empty() { 0.0 } else { self.history.iter().sum::<f64>() / self.history.len() as f64 };
-        let variance: f64 = if self.history.is_empty() { 0.0 } else { self.history.iter().map(|x| (x - mean).powi(2)).sum::<f64>() / self.history.len() as f64 };
+        // 2. Identify the "Heterodyne Spikes" (Fourier-Lite), kept up to date by push
+        let variance: f64 = self.variance_of_window();
 
         // 3. Generate the Nullifying Wave
         // If variance exceeds threshold, we assume an external "Sensed Presence" signal.
@@ -25,6 +25,10 @@ import json
 import pickle
 import hashlib
 import threading
+import functools
+import weakref
+import importlib
+import warnings
 from typing import *
 from dataclasses import dataclass, field
 from collections import OrderedDict, defaultdict, deque
@@ -35,31 +39,34 @@ import os
 # 1. IMPORT INTEGRATED MODULES (ENHANCED & DEBUGGED)
 # ============================================================================
 
+# Startup banners are opt-in (QUANTUM_BANNERS=1); LASER is built on first use
+from quantum_startup import banner
+
 # Import BUMPY (quantum array backend) - INTEGRATED
 try:
-    from bumpy import BumpyArray
+    from bumpy import BumpyArray, seed as _seed_bumpy
     BUMPY_AVAILABLE = True
-    print("✅ BUMPY integrated as quantum array backend")
+    banner("✅ BUMPY integrated as quantum array backend")
 except ImportError as e:
-    print(f"⚠️ BUMPY fallback: {e}")
+    banner(f"⚠️ BUMPY fallback: {e}")
     BUMPY_AVAILABLE = False
 
 # Import FLUMPY (cognitive/quantum layer) - INTEGRATED
 try:
     from flumpy import FlumpyArray
     FLUMPY_AVAILABLE = True
-    print("✅ FLUMPY integrated as cognitive quantum layer")
+    banner("✅ FLUMPY integrated as cognitive quantum layer")
 except ImportError as e:
-    print(f"⚠️ FLUMPY fallback: {e}")
+    banner(f"⚠️ FLUMPY fallback: {e}")
     FLUMPY_AVAILABLE = False
 
 # Import LASER (universal logging) - INTEGRATED
 try:
     from laser import LASER, UniversalQuantumState
     LASER_AVAILABLE = True
-    print("✅ LASER v3.0 integrated for universal quantum logging")
+    banner("✅ LASER v3.0 integrated for universal quantum logging")
 except ImportError as e:
-    print(f"⚠️ LASER fallback: {e}")
+    banner(f"⚠️ LASER fallback: {e}")
     LASER_AVAILABLE = False
     class LASERV30:
         def __init__(self):
@@ -70,20 +77,36 @@ except ImportError as e:
         def get_metrics_report(self): return {}
     LASER = LASERV30()
 
-# Import Phase 3 Modules (Deep Quantum Integration)
-try:
-    import anneal
-    print("✅ D-Wave Annealing Shim integrated")
-except ImportError:
-    print("⚠️ Annealing fallback")
-    anneal = None
-
+# Import NUMPY (dense kernels: convolution/pooling backend)
 try:
-    import dissipative
-    print("✅ Dissipative QNN (Entropy 2025) integrated")
+    import numpy as np
+    NUMPY_AVAILABLE = True
 except ImportError:
-    print("⚠️ Dissipative fallback")
-    dissipative = None
+    np = None
+    NUMPY_AVAILABLE = False
+
+# Phase 3 Modules (Deep Quantum Integration): imported on first access as
+# qtorch.anneal / qtorch.dissipative (None when unavailable)
+_PHASE3_MODULES = {
+    'anneal': ("✅ D-Wave Annealing Shim integrated", "⚠️ Annealing fallback"),
+    'dissipative': ("✅ Dissipative QNN (Entropy 2025) integrated", "⚠️ Dissipative fallback"),
+}
+
+def _load_phase3(name):
+    ok, fallback = _PHASE3_MODULES[name]
+    try:
+        module = importlib.import_module(name)
+        banner(ok)
+    except ImportError:
+        banner(fallback)
+        module = None
+    globals()[name] = module
+    return module
+
+def __getattr__(name):
+    if name not in _PHASE3_MODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return _load_phase3(name)
 
 # ============================================================================
 # 2. QUANTUM TENSOR CLASS (DEBUGGED & ENHANCED)
@@ -447,8 +470,20 @@ class Tensor:
     def __neg__(self):
         """Negation with quantum coherence preservation"""
         result_data = [-x for x in self._bumpy.data]
-        return Tensor(result_data, self.dtype, self.device, self.requires_grad,
-                     quantum_creativity=self.quantum_creativity)
+        result = Tensor(result_data, self.dtype, self.device, self.requires_grad,
+                        quantum_creativity=self.quantum_creativity)
+        result.shape = self.shape
+        return result
+
+    # Scalar on the left (e.g. `beta1 * exp_avg` in the optimizers)
+    def __radd__(self, other):
+        return self + other
+
+    def __rmul__(self, other):
+        return self * other
+
+    def __rsub__(self, other):
+        return self * -1.0 + other
 
     def sqrt(self):
         """Square root of tensor elements"""
@@ -466,6 +501,23 @@ class Tensor:
         result.shape = self.shape
         return result
 
+    def clamp(self, min=None, max=None):
+        """Clamp elements into [min, max] (either bound may be None)"""
+        lo = -math.inf if min is None else min
+        hi = math.inf if max is None else max
+        result_data = [lo if x < lo else hi if x > hi else x for x in self._bumpy.data]
+        result = Tensor(result_data, self.dtype, self.device, False,
+                        quantum_creativity=self.quantum_creativity)
+        result.shape = self.shape
+
+        # Gradient passes only where the input was inside the bounds
+        if Tensor._grad_enabled and self.requires_grad:
+            result.requires_grad = True
+            clamp_grad = [1.0 if lo <= x <= hi else 0.0 for x in self._bumpy.data]
+            result._ctx = ('clamp', self, clamp_grad)
+
+        return result
+
     def __abs__(self):
         """Absolute value with quantum phase consideration"""
         result_data = [abs(x) * self.quantum_coherence for x in self._bumpy.data]
@@ -680,6 +732,8 @@ class Tensor:
 
     def mean(self, dim=None, keepdim=False):
         """Enhanced mean with proper gradient computation"""
+        if dim is not None and dim < 0:
+            dim = self.ndim + dim
         sum_result = self.sum(dim, keepdim)
 
         if dim is None:
@@ -830,16 +884,16 @@ class Tensor:
             if op == 'add':
                 x, y = args
                 if isinstance(x, Tensor) and x.requires_grad:
-                    x.backward(gradient, inject_quantum_noise=inject_quantum_noise)
+                    x.backward(_sum_to_shape(gradient, x.shape), inject_quantum_noise=inject_quantum_noise)
                 if isinstance(y, Tensor) and y.requires_grad:
-                    y.backward(gradient, inject_quantum_noise=inject_quantum_noise)
+                    y.backward(_sum_to_shape(gradient, y.shape), inject_quantum_noise=inject_quantum_noise)
 
             elif op == 'mul':
                 x, y = args
                 if isinstance(x, Tensor) and x.requires_grad:
-                    x.backward(gradient * y, inject_quantum_noise=inject_quantum_noise)
+                    x.backward(_sum_to_shape(gradient * y, x.shape), inject_quantum_noise=inject_quantum_noise)
                 if isinstance(y, Tensor) and y.requires_grad:
-                    y.backward(gradient * x, inject_quantum_noise=inject_quantum_noise)
+                    y.backward(_sum_to_shape(gradient * x, y.shape), inject_quantum_noise=inject_quantum_noise)
 
             elif op == 'div':
                 x, y = args
@@ -911,21 +965,31 @@ class Tensor:
                         scaled_grad = gradient / count
                         x.backward(scaled_grad, inject_quantum_noise=inject_quantum_noise)
 
-            elif op == 'relu':
+            elif op == 'relu' or op == 'clamp':
                 x, relu_grad = args
                 if isinstance(x, Tensor) and x.requires_grad:
                     # Gradient of ReLU: gradient * (x > 0 ? 1 : 0)
                     if gradient.numel == x.numel:
                         grad_data = [g * rg for g, rg in zip(gradient._bumpy.data, relu_grad)]
                         local_grad = Tensor(grad_data, x.dtype, x.device, False)
+                        local_grad.shape = x.shape
                         x.backward(local_grad, inject_quantum_noise=inject_quantum_noise)
                     else:
                         # Scalar gradient case
                         grad_value = gradient.item()
                         grad_data = [grad_value * rg for rg in relu_grad]
                         local_grad = Tensor(grad_data, x.dtype, x.device, False)
+                        local_grad.shape = x.shape
                         x.backward(local_grad, inject_quantum_noise=inject_quantum_noise)
 
+            elif op in ('conv2d', 'pool2d', 'jit'):
+                # Dense kernels: grad_fn maps the output gradient to one gradient per input
+                *inputs, grad_fn = args
+                grads = grad_fn(_to_array(gradient, self.shape))
+                for inp, g in zip(inputs, grads):
+                    if isinstance(inp, Tensor) and inp.requires_grad and g is not None:
+                        inp.backward(_from_array(g), inject_quantum_noise=inject_quantum_noise)
+
             elif op == 'sigmoid' or op == 'tanh':
                 x, act_grad = args
                 if isinstance(x, Tensor) and x.requires_grad:
@@ -933,12 +997,14 @@ class Tensor:
                     if gradient.numel == x.numel:
                         grad_data = [g * ag for g, ag in zip(gradient._bumpy.data, act_grad)]
                         local_grad = Tensor(grad_data, x.dtype, x.device, False)
+                        local_grad.shape = x.shape
                         x.backward(local_grad, inject_quantum_noise=inject_quantum_noise)
                     else:
                         # Scalar gradient case
                         grad_value = gradient.item()
                         grad_data = [grad_value * ag for ag in act_grad]
                         local_grad = Tensor(grad_data, x.dtype, x.device, False)
+                        local_grad.shape = x.shape
                         x.backward(local_grad, inject_quantum_noise=inject_quantum_noise)
 
     # ==================== DEBUGGED UTILITY METHODS ====================
@@ -1234,6 +1300,142 @@ def full(size, fill_value, dtype=None, device="cpu", requires_grad=False, quantu
 
     return Tensor(data, dtype, device, requires_grad, quantum_creativity=quantum_creativity).reshape(*size)
 
+# ============================================================================
+# 3b. CONVOLUTION & POOLING BACKEND (IM2COL / GEMM)
+# ============================================================================
+# Windows are gathered into a column matrix (im2col), so a convolution is one
+# batched matrix multiply; the backward pass scatters column gradients back
+# (col2im). Requires NUMPY; without it Conv2d falls back to the reference loop.
+
+def _pair(v):
+    return tuple(v) if isinstance(v, (tuple, list)) else (v, v)
+
+def _to_array(t, shape=None):
+    """Tensor storage -> float64 ndarray (broadcasting a scalar gradient to shape)."""
+    a = np.asarray(t._bumpy.data, dtype=np.float64)
+    if shape is not None and a.size == 1 and math.prod(shape) != 1:
+        return np.full(shape, a[0])
+    return a.reshape(shape if shape is not None else t.shape)
+
+def _from_array(a, requires_grad=False):
+    result = Tensor(a.ravel().tolist(), requires_grad=requires_grad)
+    result.shape = tuple(a.shape)
+    return result
+
+def _sum_to_shape(gradient, shape):
+    """Eager autograd: sums a broadcast gradient back down to an operand's shape."""
+    if gradient.shape == shape or gradient.numel == 1:
+        return gradient
+    if gradient.numel == math.prod(shape):
+        return gradient.reshape(shape)
+    if not NUMPY_AVAILABLE:
+        return gradient
+    return _from_array(_unbroadcast(_to_array(gradient), shape))
+
+def _out_size(size, k, stride, padding, dilation):
+    return (size + 2 * padding - dilation * (k - 1) - 1) // stride + 1
+
+def _im2col(x, kernel, stride, padding, dilation, pad_value=0.0):
+    """(N, C, H, W) -> (N, C, KH, KW, OH, OW) windows."""
+    (kh, kw), (sh, sw), (ph, pw), (dh, dw) = kernel, stride, padding, dilation
+    n, c, h, w = x.shape
+    oh, ow = _out_size(h, kh, sh, ph, dh), _out_size(w, kw, sw, pw, dw)
+    if oh <= 0 or ow <= 0:
+        raise ValueError(f"Kernel {kernel} (dilation {dilation}) larger than padded input {x.shape[2:]}")
+    if ph or pw:
+        x = np.pad(x, ((0, 0), (0, 0), (ph, ph), (pw, pw)), constant_values=pad_value)
+    cols = np.empty((n, c, kh, kw, oh, ow), dtype=x.dtype)
+    for i in range(kh):
+        for j in range(kw):
+            cols[:, :, i, j] = x[:, :, i * dh:i * dh + sh * (oh - 1) + 1:sh, j * dw:j * dw + sw * (ow - 1) + 1:sw]
+    return cols
+
+def _col2im(cols, shape, stride, padding, dilation):
+    """Adjoint of _im2col: sums window gradients back into (N, C, H, W)."""
+    n, c, kh, kw, oh, ow = cols.shape
+    (sh, sw), (ph, pw), (dh, dw) = stride, padding, dilation
+    h, w = shape[2] + 2 * ph, shape[3] + 2 * pw
+    x = np.zeros((n, c, h, w), dtype=cols.dtype)
+    for i in range(kh):
+        for j in range(kw):
+            x[:, :, i * dh:i * dh + sh * (oh - 1) + 1:sh, j * dw:j * dw + sw * (ow - 1) + 1:sw] += cols[:, :, i, j]
+    return x[:, :, ph:h - ph, pw:w - pw]
+
+def conv2d(input, weight, bias=None, stride=1, padding=0, dilation=1, groups=1):
+    """
+    2D convolution (cross-correlation, PyTorch semantics).
+    input (N, C, H, W), weight (OC, C // groups, KH, KW), bias (OC,).
+    """
+    stride, padding, dilation = _pair(stride), _pair(padding), _pair(dilation)
+    x = _to_array(input)
+    w = _to_array(weight)
+    n, c, h, wd = x.shape
+    oc, cg, kh, kw = w.shape
+    if c != cg * groups or oc % groups:
+        raise ValueError(f"conv2d: {c} input channels / {oc} filters do not split into {groups} groups of {cg}")
+    ocg = oc // groups
+
+    cols = _im2col(x, (kh, kw), stride, padding, dilation)
+    oh, ow = cols.shape[-2:]
+    # (G, Cg*KH*KW, N*OH*OW): one batched GEMM over groups
+    cols_g = cols.reshape(n, groups, cg * kh * kw, oh * ow).transpose(1, 2, 0, 3).reshape(groups, cg * kh * kw, n * oh * ow)
+    w_g = w.reshape(groups, ocg, cg * kh * kw)
+    out = np.matmul(w_g, cols_g).reshape(oc, n, oh, ow).transpose(1, 0, 2, 3)
+    if bias is not None:
+        out = out + _to_array(bias).reshape(1, oc, 1, 1)
+
+    result = _from_array(np.ascontiguousarray(out))
+    needs_grad = input.requires_grad or weight.requires_grad or (bias is not None and bias.requires_grad)
+    if Tensor._grad_enabled and needs_grad:
+        def grad_fn(grad):
+            grad_g = grad.transpose(1, 0, 2, 3).reshape(groups, ocg, n * oh * ow)
+            d_w = np.matmul(grad_g, cols_g.transpose(0, 2, 1)).reshape(w.shape)
+            d_cols = np.matmul(w_g.transpose(0, 2, 1), grad_g)
+            d_cols = d_cols.reshape(groups, cg, kh, kw, n, oh, ow).transpose(4, 0, 1, 2, 3, 5, 6)
+            d_x = _col2im(d_cols.reshape(n, c, kh, kw, oh, ow), x.shape, stride, padding, dilation)
+            d_b = grad.sum(axis=(0, 2, 3)) if bias is not None else None
+            return d_x, d_w, d_b
+
+        result.requires_grad = True
+        result._ctx = ('conv2d', input, weight, bias, grad_fn)
+    return result
+
+def _pool2d(input, kernel_size, stride, padding, dilation, mode):
+    kernel = _pair(kernel_size)
+    stride = _pair(stride if stride is not None else kernel_size)
+    padding, dilation = _pair(padding), _pair(dilation)
+    x = _to_array(input)
+    pad_value = -np.inf if mode == 'max' else 0.0
+    cols = _im2col(x, kernel, stride, padding, dilation, pad_value=pad_value)
+    n, c, kh, kw, oh, ow = cols.shape
+    flat = cols.reshape(n, c, kh * kw, oh, ow)
+
+    if mode == 'max':
+        arg = flat.argmax(axis=2)
+        out = np.take_along_axis(flat, arg[:, :, None], axis=2)[:, :, 0]
+    else:
+        out = flat.mean(axis=2)  # Padding counts toward the window (count_include_pad)
+
+    result = _from_array(out)
+    if Tensor._grad_enabled and input.requires_grad:
+        def grad_fn(grad):
+            if mode == 'max':
+                d_flat = np.zeros_like(flat)
+                np.put_along_axis(d_flat, arg[:, :, None], grad[:, :, None], axis=2)
+            else:
+                d_flat = np.broadcast_to(grad[:, :, None] / (kh * kw), flat.shape)
+            return (_col2im(d_flat.reshape(cols.shape), x.shape, stride, padding, dilation),)
+
+        result.requires_grad = True
+        result._ctx = ('pool2d', input, grad_fn)
+    return result
+
+def max_pool2d(input, kernel_size, stride=None, padding=0, dilation=1):
+    return _pool2d(input, kernel_size, stride, padding, dilation, 'max')
+
+def avg_pool2d(input, kernel_size, stride=None, padding=0):
+    return _pool2d(input, kernel_size, stride, padding, 1, 'avg')
+
 # ============================================================================
 # 4. NEURAL NETWORK MODULES (DEBUGGED & IMPLEMENTED)
 # ============================================================================
@@ -1420,108 +1622,148 @@ class Linear(Module):
 
         return output
 
+def _conv2d_reference(x, weight, bias=None, stride=1, padding=0):
+    """
+    Direct nested-loop convolution on list storage (stride/padding only, no autograd).
+    Fallback when NUMPY is unavailable; kept as the baseline for benchmarks.
+    """
+    batch_size, in_channels, in_h, in_w = x.shape
+    out_channels, _, k_h, k_w = weight.shape
+
+    # Calculate output dimensions
+    out_h = (in_h + 2 * padding - k_h) // stride + 1
+    out_w = (in_w + 2 * padding - k_w) // stride + 1
+
+    # Initialize output
+    output_data = [0.0] * (batch_size * out_channels * out_h * out_w)
+
+    # Pad input if needed
+    if padding > 0:
+        padded_h = in_h + 2 * padding
+        padded_w = in_w + 2 * padding
+        padded_data = [0.0] * (batch_size * in_channels * padded_h * padded_w)
+
+        for b in range(batch_size):
+            for c in range(in_channels):
+                for h in range(in_h):
+                    for w in range(in_w):
+                        orig_idx = b * in_channels * in_h * in_w + c * in_h * in_w + h * in_w + w
+                        padded_idx = b * in_channels * padded_h * padded_w + c * padded_h * padded_w + (h + padding) * padded_w + (w + padding)
+                        padded_data[padded_idx] = x._bumpy.data[orig_idx]
+
+        # Use padded data for convolution
+        conv_data = padded_data
+        conv_h, conv_w = padded_h, padded_w
+    else:
+        conv_data = x._bumpy.data
+        conv_h, conv_w = in_h, in_w
+
+    # Perform convolution
+    for b in range(batch_size):
+        for oc in range(out_channels):
+            for oh in range(out_h):
+                for ow in range(out_w):
+                    sum_val = 0.0
+
+                    # Apply kernel
+                    for ic in range(in_channels):
+                        for kh in range(k_h):
+                            for kw in range(k_w):
+                                # Input position
+                                ih = oh * stride + kh
+                                iw = ow * stride + kw
+
+                                # Check bounds
+                                if 0 <= ih < conv_h and 0 <= iw < conv_w:
+                                    # Input index
+                                    input_idx = b * in_channels * conv_h * conv_w + ic * conv_h * conv_w + ih * conv_w + iw
+
+                                    # Weight index
+                                    weight_idx = oc * in_channels * k_h * k_w + ic * k_h * k_w + kh * k_w + kw
+
+                                    if input_idx < len(conv_data) and weight_idx < len(weight._bumpy.data):
+                                        sum_val += conv_data[input_idx] * weight._bumpy.data[weight_idx]
+
+                    # Output index
+                    output_idx = b * out_channels * out_h * out_w + oc * out_h * out_w + oh * out_w + ow
+                    output_data[output_idx] = sum_val
+
+    # Add bias
+    output = tensor(output_data).reshape(batch_size, out_channels, out_h, out_w)
+    if bias is not None:
+        for b in range(batch_size):
+            for oc in range(out_channels):
+                bias_val = bias._bumpy.data[oc] if oc < len(bias._bumpy.data) else 0.0
+                for oh in range(out_h):
+                    for ow in range(out_w):
+                        idx = b * out_channels * out_h * out_w + oc * out_h * out_w + oh * out_w + ow
+                        if idx < len(output._bumpy.data):
+                            output._bumpy.data[idx] += bias_val
+
+    return output
+
 class Conv2d(Module):
-    """Debugged 2D Convolution layer with proper implementation"""
+    """2D Convolution layer (im2col/GEMM backend with autograd)"""
 
-    def __init__(self, in_channels, out_channels, kernel_size, stride=1, padding=0):
+    def __init__(self, in_channels, out_channels, kernel_size, stride=1, padding=0, dilation=1,
+                 groups=1, bias=True):
         super().__init__()
+        if in_channels % groups or out_channels % groups:
+            raise ValueError("in_channels and out_channels must be divisible by groups")
         self.in_channels = in_channels
         self.out_channels = out_channels
         self.kernel_size = kernel_size if isinstance(kernel_size, tuple) else (kernel_size, kernel_size)
         self.stride = stride
         self.padding = padding
+        self.dilation = dilation
+        self.groups = groups
 
         # Initialize weights
         k_h, k_w = self.kernel_size
-        weight_data = [random.uniform(-0.1, 0.1) for _ in range(out_channels * in_channels * k_h * k_w)]
-        self.weight = tensor(weight_data, requires_grad=True).reshape(out_channels, in_channels, k_h, k_w)
+        weight_data = [random.uniform(-0.1, 0.1) for _ in range(out_channels * (in_channels // groups) * k_h * k_w)]
+        self.weight = tensor(weight_data, requires_grad=True).reshape(out_channels, in_channels // groups, k_h, k_w)
         self.register_parameter('weight', self.weight)
 
         # Initialize bias
-        bias_data = [random.uniform(-0.1, 0.1) for _ in range(out_channels)]
-        self.bias = tensor(bias_data, requires_grad=True)
-        self.register_parameter('bias', self.bias)
-
-    def forward(self, x):
-        """
-        Debugged convolution implementation
-        Note: This is a simplified implementation for demonstration
-        In production, you would want a more efficient implementation
-        """
-        batch_size, in_channels, in_h, in_w = x.shape
-        k_h, k_w = self.kernel_size
-
-        # Calculate output dimensions
-        out_h = (in_h + 2 * self.padding - k_h) // self.stride + 1
-        out_w = (in_w + 2 * self.padding - k_w) // self.stride + 1
-
-        # Initialize output
-        output_data = [0.0] * (batch_size * self.out_channels * out_h * out_w)
-
-        # Pad input if needed
-        if self.padding > 0:
-            padded_h = in_h + 2 * self.padding
-            padded_w = in_w + 2 * self.padding
-            padded_data = [0.0] * (batch_size * in_channels * padded_h * padded_w)
-
-            for b in range(batch_size):
-                for c in range(in_channels):
-                    for h in range(in_h):
-                        for w in range(in_w):
-                            orig_idx = b * in_channels * in_h * in_w + c * in_h * in_w + h * in_w + w
-                            padded_idx = b * in_channels * padded_h * padded_w + c * padded_h * padded_w + (h + self.padding) * padded_w + (w + self.padding)
-                            padded_data[padded_idx] = x._bumpy.data[orig_idx]
-
-            # Use padded data for convolution
-            conv_data = padded_data
-            conv_h, conv_w = padded_h, padded_w
+        if bias:
+            bias_data = [random.uniform(-0.1, 0.1) for _ in range(out_channels)]
+            self.bias = tensor(bias_data, requires_grad=True)
+            self.register_parameter('bias', self.bias)
         else:
-            conv_data = x._bumpy.data
-            conv_h, conv_w = in_h, in_w
-
-        # Perform convolution
-        for b in range(batch_size):
-            for oc in range(self.out_channels):
-                for oh in range(out_h):
-                    for ow in range(out_w):
-                        sum_val = 0.0
+            self.bias = None
 
-                        # Apply kernel
-                        for ic in range(self.in_channels):
-                            for kh in range(k_h):
-                                for kw in range(k_w):
-                                    # Input position
-                                    ih = oh * self.stride + kh
-                                    iw = ow * self.stride + kw
+    def forward(self, x):
+        if not NUMPY_AVAILABLE:
+            if self.groups != 1 or _pair(self.dilation) != (1, 1) or not isinstance(self.stride, int) \
+                    or not isinstance(self.padding, int):
+                raise RuntimeError("Conv2d: groups/dilation/tuple stride need the NUMPY backend")
+            return _conv2d_reference(x, self.weight, self.bias, self.stride, self.padding)
+        return conv2d(x, self.weight, self.bias, self.stride, self.padding, self.dilation, self.groups)
 
-                                    # Check bounds
-                                    if 0 <= ih < conv_h and 0 <= iw < conv_w:
-                                        # Input index
-                                        input_idx = b * self.in_channels * conv_h * conv_w + ic * conv_h * conv_w + ih * conv_w + iw
+class MaxPool2d(Module):
+    """2D max pooling (im2col backend)"""
 
-                                        # Weight index
-                                        weight_idx = oc * self.in_channels * k_h * k_w + ic * k_h * k_w + kh * k_w + kw
+    def __init__(self, kernel_size, stride=None, padding=0, dilation=1):
+        super().__init__()
+        self.kernel_size = kernel_size
+        self.stride = stride
+        self.padding = padding
+        self.dilation = dilation
 
-                                        if input_idx < len(conv_data) and weight_idx < len(self.weight._bumpy.data):
-                                            sum_val += conv_data[input_idx] * self.weight._bumpy.data[weight_idx]
+    def forward(self, x):
+        return max_pool2d(x, self.kernel_size, self.stride, self.padding, self.dilation)
 
-                        # Output index
-                        output_idx = b * self.out_channels * out_h * out_w + oc * out_h * out_w + oh * out_w + ow
-                        output_data[output_idx] = sum_val
+class AvgPool2d(Module):
+    """2D average pooling (im2col backend)"""
 
-        # Add bias
-        output = tensor(output_data).reshape(batch_size, self.out_channels, out_h, out_w)
-        if self.bias is not None:
-            for b in range(batch_size):
-                for oc in range(self.out_channels):
-                    bias_val = self.bias._bumpy.data[oc] if oc < len(self.bias._bumpy.data) else 0.0
-                    for oh in range(out_h):
-                        for ow in range(out_w):
-                            idx = b * self.out_channels * out_h * out_w + oc * out_h * out_w + oh * out_w + ow
-                            if idx < len(output._bumpy.data):
-                                output._bumpy.data[idx] += bias_val
+    def __init__(self, kernel_size, stride=None, padding=0):
+        super().__init__()
+        self.kernel_size = kernel_size
+        self.stride = stride
+        self.padding = padding
 
-        return output
+    def forward(self, x):
+        return avg_pool2d(x, self.kernel_size, self.stride, self.padding)
 
 class BatchNorm2d(Module):
     """Debugged Batch Normalization layer"""
@@ -1820,6 +2062,8 @@ def randn_like(tensor):
 def manual_seed(seed):
     """Set random seed for reproducibility"""
     random.seed(seed)
+    if BUMPY_AVAILABLE:
+        _seed_bumpy(seed)
 
 def no_grad():
     """Context manager to disable gradient computation"""
@@ -1847,6 +2091,924 @@ def enable_grad():
 
     return GradContext()
 
+# ============================================================================
+# 8b. TRACING JIT (ELEMENTWISE FUSION)
+# ============================================================================
+# jit.trace runs a module once on example inputs with the Tensor ops patched
+# to record an op graph. The graph is compiled to a single generated NUMPY
+# function: chains of elementwise ops become one fused kernel writing into a
+# pre-planned buffer, buffers are recycled once their last reader has run,
+# and replaying it builds no intermediate Tensors (no BUMPY/FLUMPY arrays,
+# no LASER traffic). When gradients are needed the graph replays unfused,
+# keeps its intermediates, and a reverse pass over the same graph returns
+# the gradient of every input and parameter.
+#
+# Like any tracer it specializes: on input shapes (a new shape is traced
+# again) and on Python control flow and values read with item(). Tensors that
+# are neither inputs, parameters nor results of traced ops (e.g. a weight
+# quantized through NUMPY) are folded in as constants; the trace is redone
+# when the module's tensors are reassigned. Quantum creativity effects are
+# not traced.
+
+class TracerWarning(UserWarning):
+    """A traced value escaped the graph and was frozen into it."""
+
+_ELEMENTWISE = {'add', 'sub', 'mul', 'div', 'pow', 'neg', 'sqrt', 'rsqrt', 'abs',
+                'relu', 'sigmoid', 'tanh', 'clamp'}
+_FUSABLE_HEADS = _ELEMENTWISE | {'matmul'}
+
+# Tensor method -> graph op
+_TRACED_METHODS = {
+    '__add__': 'add', '__sub__': 'sub', '__mul__': 'mul', '__truediv__': 'div',
+    '__pow__': 'pow', '__neg__': 'neg', '__abs__': 'abs', 'abs': 'abs',
+    'sqrt': 'sqrt', 'rsqrt': 'rsqrt', 'relu': 'relu', 'sigmoid': 'sigmoid',
+    'tanh': 'tanh', 'clamp': 'clamp', 'matmul': 'matmul', '__matmul__': 'matmul',
+    'sum': 'sum', 'mean': 'mean', 'max': 'max', 'min': 'min',
+    'reshape': 'reshape', 'transpose': 'transpose',
+    'item': 'item', 'softmax': None, 'dot': None, '__getitem__': None,
+}
+
+def _reduce(x, dim, keepdim, fn):
+    if dim is None:
+        return fn(x).reshape(1)
+    return fn(x, axis=dim, keepdims=keepdim)
+
+_ELEMENTWISE_KERNELS = {}
+
+def _kernel(op, args, attrs):
+    """Reference forward of one graph op (used to infer shapes while compiling)."""
+    if op in _ELEMENTWISE:
+        key = (op, len(args), tuple(sorted(attrs.items())))
+        fn = _ELEMENTWISE_KERNELS.get(key)
+        if fn is None:
+            src = [f"a{i}" for i in range(len(args))]
+            body = "".join("    " + line + "\n" for line in _emit(op, src, "out", attrs))
+            namespace = {'np': np}
+            exec(f"def kernel(out, {', '.join(src)}):\n{body}    return out\n", namespace)
+            fn = _ELEMENTWISE_KERNELS[key] = namespace['kernel']
+        return fn(np.empty(np.broadcast_shapes(*(np.shape(a) for a in args))), *args)
+    x = args[0]
+    if op == 'matmul':
+        return np.matmul(x, args[1])
+    if op in ('sum', 'mean', 'max', 'min'):
+        fn = {'sum': np.sum, 'mean': np.mean, 'max': np.max, 'min': np.min}[op]
+        return _reduce(x, attrs['dim'], attrs['keepdim'], fn)
+    if op == 'reshape':
+        return x.reshape(attrs['shape'])
+    if op == 'transpose':
+        return np.swapaxes(x, attrs['dim0'], attrs['dim1'])
+    raise NotImplementedError(f"jit: no kernel for op '{op}'")
+
+def _emit(op, src, dst, attrs):
+    """NUMPY statements computing `op` from the expressions in src into the buffer dst."""
+    a = src[0]
+    b = src[1] if len(src) > 1 else None
+    if op in ('add', 'sub', 'mul', 'div'):
+        ufunc = {'add': 'add', 'sub': 'subtract', 'mul': 'multiply', 'div': 'divide'}[op]
+        return [f"np.{ufunc}({a}, {b}, out={dst})"]
+    if op == 'pow':
+        e = attrs['exponent']
+        if e == 2:
+            return [f"np.multiply({a}, {a}, out={dst})"]
+        return [f"np.power({a}, {e!r}, out={dst})"]
+    if op == 'neg':
+        return [f"np.negative({a}, out={dst})"]
+    if op == 'sqrt':
+        return [f"np.maximum({a}, 0.0, out={dst})", f"np.sqrt({dst}, out={dst})"]
+    if op == 'rsqrt':
+        return [f"np.maximum({a}, 1e-12, out={dst})", f"np.sqrt({dst}, out={dst})",
+                f"np.reciprocal({dst}, out={dst})"]
+    if op == 'abs':
+        lines = [f"np.abs({a}, out={dst})"]
+        if attrs['scale'] != 1.0:
+            lines.append(f"np.multiply({dst}, {attrs['scale']!r}, out={dst})")
+        return lines
+    if op == 'relu':
+        return [f"np.maximum({a}, 0.0, out={dst})"]
+    if op == 'sigmoid':
+        return [f"np.negative({a}, out={dst})", f"np.exp({dst}, out={dst})",
+                f"np.add({dst}, 1.0, out={dst})", f"np.reciprocal({dst}, out={dst})"]
+    if op == 'tanh':
+        return [f"np.tanh({a}, out={dst})"]
+    if op == 'clamp':
+        return [f"np.clip({a}, {attrs['min']!r}, {attrs['max']!r}, out={dst})"]
+    raise NotImplementedError(f"jit: '{op}' is not elementwise")
+
+def _unbroadcast(g, shape):
+    """Sums a broadcast gradient back down to `shape`."""
+    while g.ndim > len(shape):
+        g = g.sum(axis=0)
+    for axis, size in enumerate(shape):
+        if size == 1 and g.shape[axis] != 1:
+            g = g.sum(axis=axis, keepdims=True)
+    return g
+
+def _vjp(op, g, args, out, attrs):
+    """Gradients of one graph op w.r.t. its array arguments (None: no gradient)."""
+    x = args[0]
+    if op == 'add':
+        return _unbroadcast(g, np.shape(x)), _unbroadcast(g, np.shape(args[1]))
+    if op == 'sub':
+        return _unbroadcast(g, np.shape(x)), _unbroadcast(-g, np.shape(args[1]))
+    if op == 'mul':
+        y = args[1]
+        return _unbroadcast(g * y, np.shape(x)), _unbroadcast(g * x, np.shape(y))
+    if op == 'div':
+        y = args[1]
+        return _unbroadcast(g / y, np.shape(x)), _unbroadcast(-g * x / (y * y), np.shape(y))
+    if op == 'pow':
+        e = attrs['exponent']
+        return (g * e * x ** (e - 1),)
+    if op == 'neg':
+        return (-g,)
+    if op == 'sqrt':
+        return (np.where(x > 0, g * 0.5 / np.where(out > 0, out, 1.0), 0.0),)
+    if op == 'rsqrt':
+        return (np.where(x > 1e-12, -0.5 * g * out ** 3, 0.0),)
+    if op == 'abs':
+        return (g * np.sign(x) * attrs['scale'],)
+    if op == 'relu':
+        return (g * (x > 0),)
+    if op == 'sigmoid':
+        return (g * out * (1 - out),)
+    if op == 'tanh':
+        return (g * (1 - out * out),)
+    if op == 'clamp':
+        lo = -np.inf if attrs['min'] is None else attrs['min']
+        hi = np.inf if attrs['max'] is None else attrs['max']
+        return (g * ((x >= lo) & (x <= hi)),)
+    if op == 'matmul':
+        y = args[1]
+        x2 = x[None, :] if x.ndim == 1 else x
+        y2 = y[:, None] if y.ndim == 1 else y
+        g2 = g
+        if y.ndim == 1:
+            g2 = g2[..., None]
+        if x.ndim == 1:
+            g2 = np.expand_dims(g2, -2)
+        gx = np.matmul(g2, np.swapaxes(y2, -1, -2))
+        gy = np.matmul(np.swapaxes(x2, -1, -2), g2)
+        if x.ndim == 1:
+            gx = gx[..., 0, :]
+        if y.ndim == 1:
+            gy = gy[..., 0]
+        return _unbroadcast(gx, x.shape), _unbroadcast(gy, y.shape)
+    if op in ('sum', 'mean'):
+        dim = attrs['dim']
+        if dim is None:
+            gx = np.broadcast_to(g.reshape(()), x.shape)
+        else:
+            gx = np.broadcast_to(g if attrs['keepdim'] else np.expand_dims(g, dim), x.shape)
+        if op == 'mean':
+            gx = gx * (out.size / x.size)
+        return (np.array(gx),)
+    if op in ('max', 'min'):
+        return (None,)  # Matches eager max()/min(): no gradient
+    if op == 'reshape':
+        return (g.reshape(x.shape),)
+    if op == 'transpose':
+        return (np.swapaxes(g, attrs['dim0'], attrs['dim1']),)
+    raise NotImplementedError(f"jit: no gradient for op '{op}'")
+
+def _module_tensors(obj, seen=None):
+    """Every Tensor reachable through a module's attributes (parameters, buffers, submodules)."""
+    seen = set() if seen is None else seen
+    found = []
+    if id(obj) in seen:
+        return found
+    seen.add(id(obj))
+    for value in vars(obj).values():
+        if isinstance(value, Tensor):
+            found.append(value)
+        elif isinstance(value, Module):
+            found.extend(_module_tensors(value, seen))
+        elif isinstance(value, OrderedDict):
+            for item in value.values():
+                if isinstance(item, Tensor):
+                    found.append(item)
+                elif isinstance(item, Module):
+                    found.extend(_module_tensors(item, seen))
+    return found
+
+class _Tracer:
+    """Records the Tensor ops made while tracing into a flat op graph."""
+
+    active = None
+
+    def __init__(self, module_tensors):
+        self.depth = 0
+        self.kinds = []          # per value: 'input' | 'param' | 'const' | 'op'
+        self.payload = []        # input index / param Tensor / const array / node index
+        self.nodes = []          # (op, arg value ids, attrs, out value id)
+        self.ids = {}            # id(Tensor) -> value id
+        self.keep = []           # holds traced Tensors so their ids stay unique
+        self.params = {id(t): t for t in module_tensors}
+
+    def _new(self, kind, payload, tensor=None):
+        self.kinds.append(kind)
+        self.payload.append(payload)
+        vid = len(self.kinds) - 1
+        if tensor is not None:
+            self.ids[id(tensor)] = vid
+            self.keep.append(tensor)
+        return vid
+
+    def add_input(self, index, tensor):
+        return self._new('input', index, tensor)
+
+    def value(self, obj):
+        """Value id for an operand, registering parameters and constants on first sight."""
+        if isinstance(obj, Tensor):
+            vid = self.ids.get(id(obj))
+            if vid is not None:
+                return vid
+            if id(obj) in self.params or obj.requires_grad:
+                return self._new('param', obj, obj)
+            return self._new('const', _to_array(obj), obj)
+        return self._new('const', np.asarray(float(obj)))
+
+    def is_traced(self, obj):
+        """Inputs, parameters (module tensors or requires_grad) and op results; anything else is a constant."""
+        if not isinstance(obj, Tensor):
+            return False
+        vid = self.ids.get(id(obj))
+        if vid is None:
+            return id(obj) in self.params or obj.requires_grad
+        return self.kinds[vid] != 'const'
+
+    def record(self, op, tensor, args, kwargs, out):
+        if op == 'item':
+            warnings.warn("jit.trace: item() read a traced value; it is frozen into the graph "
+                          "as a constant", TracerWarning, stacklevel=4)
+            return
+        if out is tensor:
+            return  # Identity (1D transpose)
+        operands = [tensor]
+        attrs = {}
+        if op in ('add', 'sub', 'mul', 'div', 'matmul'):
+            operands.append(args[0] if args else kwargs['other'])
+        elif op == 'pow':
+            attrs['exponent'] = args[0] if args else kwargs['exponent']
+        elif op == 'abs':
+            attrs['scale'] = tensor.quantum_coherence
+        elif op == 'clamp':
+            bound = dict(zip(('min', 'max'), args))
+            bound.update(kwargs)
+            attrs['min'], attrs['max'] = bound.get('min'), bound.get('max')
+        elif op in ('sum', 'mean', 'max', 'min'):
+            bound = dict(zip(('dim', 'keepdim'), args))
+            bound.update(kwargs)
+            attrs['dim'], attrs['keepdim'] = bound.get('dim'), bound.get('keepdim', False)
+        elif op == 'reshape':
+            shape = args[0] if len(args) == 1 and isinstance(args[0], (list, tuple)) else args
+            attrs['shape'] = tuple(shape)
+        elif op == 'transpose':
+            attrs['dim0'], attrs['dim1'] = args
+
+        if not any(self.is_traced(o) for o in operands):
+            return  # Constant-folded: the result is captured as a constant where used
+        arg_ids = [self.value(o) for o in operands]
+        out_id = self._new('op', len(self.nodes), out)
+        self.nodes.append((op, arg_ids, attrs, out_id))
+
+    def _wrap(self, name, op, fn):
+        tracer = self
+
+        @functools.wraps(fn)
+        def traced(tensor, *args, **kwargs):
+            if tracer.depth:
+                return fn(tensor, *args, **kwargs)
+            if op is None:
+                if tracer.is_traced(tensor):
+                    raise NotImplementedError(f"jit.trace: Tensor.{name} is not supported")
+                return fn(tensor, *args, **kwargs)
+            tracer.depth += 1
+            try:
+                out = fn(tensor, *args, **kwargs)
+            finally:
+                tracer.depth -= 1
+            tracer.record(op, tensor, args, kwargs, out)
+            return out
+
+        return traced
+
+    def __enter__(self):
+        if _Tracer.active is not None:
+            raise RuntimeError("jit.trace: nested tracing is not supported")
+        _Tracer.active = self
+        self._saved = {name: Tensor.__dict__[name] for name in _TRACED_METHODS}
+        for name, op in _TRACED_METHODS.items():
+            setattr(Tensor, name, self._wrap(name, op, self._saved[name]))
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        for name, fn in self._saved.items():
+            setattr(Tensor, name, fn)
+        _Tracer.active = None
+
+class _Graph:
+    """A traced op graph compiled for one set of input shapes."""
+
+    def __init__(self, tracer, outputs, example_arrays):
+        self.kinds = tracer.kinds
+        self.payload = tracer.payload
+        self.outputs = outputs
+        self.n_inputs = len(example_arrays)
+
+        # Dead code elimination: keep only nodes the outputs depend on
+        live, stack = set(), list(outputs)
+        while stack:
+            v = stack.pop()
+            if v in live:
+                continue
+            live.add(v)
+            if self.kinds[v] == 'op':
+                stack.extend(tracer.nodes[self.payload[v]][1])
+        self.nodes = [n for n in tracer.nodes if n[3] in live]
+        self.leaves = [v for v in sorted(live) if self.kinds[v] in ('input', 'param')]
+        self.params = [self.payload[v] for v in self.leaves if self.kinds[v] == 'param']
+        self.has_consts = any(self.kinds[v] == 'const' for v in live)
+
+        # Shapes come from one reference pass over the example inputs
+        env = self._leaf_values(example_arrays, [_to_array(p) for p in self.params])
+        for op, arg_ids, attrs, out_id in self.nodes:
+            env[out_id] = _kernel(op, [env[a] for a in arg_ids], attrs)
+        self.shapes = {v: np.shape(a) for v, a in env.items()}
+
+        self.groups = self._fuse()
+        self.code, self.buffer_shapes = self._generate(self.groups, reuse=True)
+        self._fused = self._compile(self.code)
+        self._buffers = None
+        # Gradient mode: one kernel per op, every intermediate kept for the reverse pass
+        self.saved_code, _ = self._generate([[n] for n in self.nodes], reuse=False)
+        self._saved = self._compile(self.saved_code)
+
+    # ---------------------------------------------------------------- replay
+    def _leaf_values(self, arrays, params):
+        env = {}
+        params = iter(params)
+        for v in self.leaves:
+            env[v] = arrays[self.payload[v]] if self.kinds[v] == 'input' else next(params)
+        for v, kind in enumerate(self.kinds):
+            if kind == 'const':
+                env[v] = self.payload[v]
+        return env
+
+    @staticmethod
+    def _compile(code):
+        namespace = {'np': np, '_reduce': _reduce}
+        exec(compile(code, '<qtorch.jit>', 'exec'), namespace)
+        return namespace['forward']
+
+    def _consts(self):
+        return [self.payload[v] for v, kind in enumerate(self.kinds) if kind == 'const']
+
+    def replay(self, arrays, params):
+        """Unfused forward returning every value (leaves, constants, intermediates) by id."""
+        env = self._leaf_values(arrays, params)
+        values = self._saved([env[v] for v in self.leaves], self._consts(), None)
+        env.update(zip((n[3] for n in self.nodes), values))
+        return env
+
+    def backward(self, env, out_grads):
+        """Reverse pass: gradient arrays for self.leaves given one gradient per output."""
+        grads = {}
+        for v, g in zip(self.outputs, out_grads):
+            if g is not None:
+                grads[v] = grads[v] + g if v in grads else g
+        for op, arg_ids, attrs, out_id in reversed(self.nodes):
+            g = grads.pop(out_id, None)
+            if g is None:
+                continue
+            local = _vjp(op, g, [env[a] for a in arg_ids], env[out_id], attrs)
+            for a, ga in zip(arg_ids, local):
+                if ga is None or self.kinds[a] == 'const':
+                    continue
+                grads[a] = grads[a] + ga if a in grads else ga
+        return [grads.get(v) for v in self.leaves]
+
+    def run(self, arrays, params):
+        """Fused forward into the planned buffers (reused across calls)."""
+        if self._buffers is None:
+            self._buffers = [np.empty(shape) for shape in self.buffer_shapes]
+        env = self._leaf_values(arrays, params)
+        return self._fused([env[v] for v in self.leaves], self._consts(), self._buffers)
+
+    # ---------------------------------------------------------------- compile
+    def _fuse(self):
+        """
+        Groups elementwise chains: a node joins the group of an argument that
+        only it reads. A matmul can head a group (its elementwise epilogue runs
+        in place on the product).
+        """
+        uses = defaultdict(int)
+        for _, arg_ids, _, _ in self.nodes:
+            for a in arg_ids:
+                uses[a] += 1
+        for v in self.outputs:
+            uses[v] += 1
+
+        groups, group_of = [], {}
+        for node in self.nodes:
+            op, arg_ids, _, out_id = node
+            target = None
+            if op in _ELEMENTWISE:
+                for a in arg_ids:
+                    g = group_of.get(a)
+                    if (g is not None and groups[g][0][0] in _FUSABLE_HEADS and groups[g][-1][3] == a and uses[a] == 1
+                            and arg_ids.count(a) == 1 and self.shapes[a] == self.shapes[out_id]):
+                        target = g
+                        break
+            if target is None:
+                groups.append([node])
+                group_of[out_id] = len(groups) - 1
+            else:
+                groups[target].append(node)
+                group_of[out_id] = target
+        return groups
+
+    def _generate(self, groups, reuse):
+        """
+        Emits forward(). With reuse, group outputs live in planned buffers that
+        are recycled after their last reader and forward() returns the graph
+        outputs; without, every op allocates and forward() returns all values.
+        """
+        names = {}
+        const_index = 0
+        for v, kind in enumerate(self.kinds):
+            if kind == 'const':
+                names[v] = f"c{const_index}"
+                const_index += 1
+        for i, v in enumerate(self.leaves):
+            names[v] = f"l{i}"
+
+        # Last group reading each value; views (reshape/transpose) extend their base's life
+        base = {}
+        last_use = {}
+        for gi, group in enumerate(groups):
+            for op, arg_ids, _, out_id in group:
+                for a in arg_ids:
+                    last_use[base.get(a, a)] = gi
+                if op in ('reshape', 'transpose'):
+                    base[out_id] = base.get(arg_ids[0], arg_ids[0])
+        for v in self.outputs:
+            last_use[base.get(v, v)] = len(groups)
+
+        lines = ["def forward(leaves, consts, buffers):"]
+        if self.leaves:
+            lines.append(f"    {', '.join(names[v] for v in self.leaves)}, = leaves")
+        if const_index:
+            lines.append(f"    {', '.join(f'c{i}' for i in range(const_index))}, = consts")
+
+        buffer_shapes, free, owner = [], defaultdict(list), {}
+        for gi, group in enumerate(groups):
+            op, arg_ids, attrs, out_id = group[0]
+            dst = f"v{group[-1][3]}"
+            if op in _ELEMENTWISE or op == 'matmul':
+                shape = self.shapes[group[-1][3]]
+                if not reuse:
+                    lines.append(f"    {dst} = np.empty({shape!r})")
+                elif free[shape]:
+                    b = free[shape].pop()
+                    owner[group[-1][3]] = b
+                    lines.append(f"    {dst} = buffers[{b}]")
+                else:
+                    buffer_shapes.append(shape)
+                    b = len(buffer_shapes) - 1
+                    owner[group[-1][3]] = b
+                    lines.append(f"    {dst} = buffers[{b}]")
+                chain, body = None, group
+                if op == 'matmul':
+                    lines.append(f"    np.matmul({names[arg_ids[0]]}, {names[arg_ids[1]]}, out={dst})")
+                    chain, body = out_id, group[1:]
+                for op, arg_ids, attrs, out_id in body:
+                    src = [dst if a == chain else names[a] for a in arg_ids]
+                    lines.extend("    " + s for s in _emit(op, src, dst, attrs))
+                    chain = out_id
+            else:
+                x = names[arg_ids[0]]
+                if op in ('sum', 'mean', 'max', 'min'):
+                    fn = {'sum': 'np.sum', 'mean': 'np.mean', 'max': 'np.max', 'min': 'np.min'}[op]
+                    lines.append(f"    {dst} = _reduce({x}, {attrs['dim']!r}, {attrs['keepdim']!r}, {fn})")
+                elif op == 'reshape':
+                    lines.append(f"    {dst} = {x}.reshape({attrs['shape']!r})")
+                else:
+                    lines.append(f"    {dst} = np.swapaxes({x}, {attrs['dim0']!r}, {attrs['dim1']!r})")
+            names[group[-1][3]] = dst
+
+            # Recycle buffers whose values (and views of them) are dead
+            for v, b in list(owner.items()):
+                if last_use.get(v, -1) <= gi:
+                    free[buffer_shapes[b]].append(b)
+                    del owner[v]
+
+        returned = self.outputs if reuse else [n[3] for n in self.nodes]
+        lines.append(f"    return ({''.join(names[v] + ', ' for v in returned)})")
+        return "\n".join(lines) + "\n", buffer_shapes
+
+    def summary(self):
+        """One line per fused kernel."""
+        rows = []
+        for group in self.groups:
+            ops = " -> ".join(n[0] for n in group)
+            rows.append(f"{'fused' if len(group) > 1 else 'op':5s} {ops}  {self.shapes[group[-1][3]]}")
+        return "\n".join(rows)
+
+class TracedModule(Module):
+    """[JIT] Replays a traced op graph; traces again for new input shapes or reassigned tensors."""
+
+    def __init__(self, fn, example_inputs):
+        super().__init__()
+        self.fn = fn
+        owner = fn if isinstance(fn, Module) else getattr(fn, '__self__', None)
+        self.owner = owner if isinstance(owner, Module) else None
+        self._graphs = {}
+        self.forward(*example_inputs)
+
+    def _fingerprint(self, with_data):
+        if self.owner is None:
+            return ()
+        tensors = _module_tensors(self.owner, seen={id(self)})
+        if with_data:
+            return tuple((id(t), id(t._bumpy.data)) for t in tensors)
+        return tuple(id(t) for t in tensors)
+
+    def _trace(self, inputs):
+        with _Tracer(_module_tensors(self.owner, seen={id(self)}) if self.owner else []) as tracer:
+            for i, x in enumerate(inputs):
+                tracer.add_input(i, x)
+            with no_grad():
+                result = self.fn(*inputs)
+        single = isinstance(result, Tensor)
+        outputs = (result,) if single else tuple(result)
+        if not all(isinstance(o, Tensor) for o in outputs):
+            raise TypeError("jit.trace: the traced function must return Tensors")
+        graph = _Graph(tracer, [tracer.value(o) for o in outputs], [_to_array(x) for x in inputs])
+        graph.single = single
+        graph.fingerprint = self._fingerprint(graph.has_consts)
+        return graph
+
+    def graph_for(self, *inputs):
+        key = tuple(x.shape for x in inputs)
+        graph = self._graphs.get(key)
+        if graph is None or graph.fingerprint != self._fingerprint(graph.has_consts):
+            graph = self._graphs[key] = self._trace(inputs)
+        return graph
+
+    @property
+    def code(self):
+        """Generated source of the most recently compiled graph."""
+        return next(reversed(self._graphs.values())).code
+
+    def forward(self, *inputs):
+        graph = self.graph_for(*inputs)
+        arrays = [_to_array(x) for x in inputs]
+        params = [_to_array(p) for p in graph.params]
+        leaf_tensors = [inputs[graph.payload[v]] if graph.kinds[v] == 'input' else graph.payload[v]
+                        for v in graph.leaves]
+
+        if not (Tensor._grad_enabled and any(t.requires_grad for t in leaf_tensors)):
+            outs = [_from_array(np.asarray(a)) for a in graph.run(arrays, params)]
+            return outs[0] if graph.single else tuple(outs)
+
+        env = graph.replay(arrays, params)
+        outs = []
+        for k, v in enumerate(graph.outputs):
+            out = _from_array(np.asarray(env[v]), requires_grad=True)
+
+            def grad_fn(grad, k=k):
+                out_grads = [None] * len(graph.outputs)
+                out_grads[k] = grad
+                return graph.backward(env, out_grads)
+
+            out._ctx = ('jit', *leaf_tensors, grad_fn)
+            outs.append(out)
+        return outs[0] if graph.single else tuple(outs)
+
+def trace(fn, example_inputs):
+    """
+    Records fn(*example_inputs) into a compiled graph. fn is a Module or any
+    callable (e.g. a bound method) mapping Tensors to a Tensor or tuple of Tensors.
+    """
+    if isinstance(example_inputs, Tensor):
+        example_inputs = (example_inputs,)
+    if not NUMPY_AVAILABLE:
+        raise RuntimeError("jit.trace requires NUMPY")
+    return TracedModule(fn, tuple(example_inputs))
+
+jit = type('jit', (), {
+    'trace': staticmethod(trace),
+    'TracedModule': TracedModule,
+    'TracerWarning': TracerWarning
+})
+
+# ============================================================================
+# 8c. PROFILER (TIME & TENSOR ALLOCATIONS PER OP AND MODULE)
+# ============================================================================
+# profiler.profile(model) patches the Tensor ops, Tensor construction,
+# backward and Module.__call__ for the duration of a `with` block and records
+# per (op, module) row: calls, wall time (self time: nested op calls are part
+# of the op, module and backward frames subtract their children), tensors
+# and bytes allocated, and the peak of live tensor bytes while it ran.
+# Tensor bytes are the approximate Python heap of the storage lists (BUMPY
+# data plus a separate FLUMPY copy when there is one); live bytes drop when a
+# profiled tensor is garbage collected, so what is still live at exit is
+# what the profiled code retains (graph contexts, entanglement links, ...).
+# Backward frames are attributed to the module whose forward built the tensor.
+
+_FLOAT_BYTES = sys.getsizeof(1.0)
+
+# Extra Tensor methods worth timing on top of the traced ops
+_PROFILED_METHODS = list(_TRACED_METHODS) + ['__setitem__', 'clone', 'detach', 'softmax',
+                                             'apply_quantum_rotation', 'holographic_compress']
+_PROFILED_FUNCTIONS = ['conv2d', 'max_pool2d', 'avg_pool2d']
+
+def _storage_nbytes(t):
+    data = t._bumpy.data
+    nbytes = sys.getsizeof(data) + len(data) * _FLOAT_BYTES
+    mirror = getattr(t._flumpy, 'data', None)
+    if isinstance(mirror, list) and mirror is not data:
+        nbytes += sys.getsizeof(mirror) + len(mirror) * _FLOAT_BYTES
+    return nbytes
+
+def _op_name(method):
+    op = _TRACED_METHODS.get(method)
+    return op if op else method.strip('_')
+
+class _Frame:
+    __slots__ = ('name', 'kind', 'scope', 'start', 'child', 'tensors', 'nbytes', 'peak')
+
+    def __init__(self, name, kind, scope, start, live):
+        self.name, self.kind, self.scope, self.start = name, kind, scope, start
+        self.child = 0
+        self.tensors = 0
+        self.nbytes = 0
+        self.peak = live
+
+@dataclass
+class OpStats:
+    name: str
+    scope: str
+    calls: int = 0
+    total_ns: int = 0
+    self_ns: int = 0
+    tensors: int = 0
+    nbytes: int = 0
+    peak_live: int = 0
+
+    def merge(self, other):
+        self.calls += other.calls
+        self.total_ns += other.total_ns
+        self.self_ns += other.self_ns
+        self.tensors += other.tensors
+        self.nbytes += other.nbytes
+        self.peak_live = max(self.peak_live, other.peak_live)
+
+class Profile:
+    """
+    [PROFILER] Context manager recording per-op / per-module time and
+    tensor allocations. Pass the model to name modules by attribute path.
+    """
+
+    _active = None
+
+    def __init__(self, model=None):
+        self.model = model
+        self.stats = OrderedDict()   # (name, scope) -> OpStats
+        self.events = []             # Chrome trace events
+        self.live_bytes = 0
+        self.peak_bytes = 0
+        self.tensors_allocated = 0
+        self.bytes_allocated = 0
+        self.retained_bytes = 0
+        self.wall_ns = 0
+        self._stack = []
+        self._names = {}
+        self._saved = {}
+        self._t0 = 0
+        self._tid = threading.get_ident()
+
+    # ------------------------------------------------------------ recording
+    def _scope(self):
+        for frame in reversed(self._stack):
+            if frame.kind == 'module':
+                return frame.scope
+        return '<root>'
+
+    def _module_name(self, module):
+        name = self._names.get(id(module))
+        if name is None:
+            parent = self._scope()
+            name = type(module).__name__ if parent == '<root>' else f"{parent}/{type(module).__name__}"
+        return name
+
+    def _push(self, name, kind, scope):
+        frame = _Frame(name, kind, scope, time.perf_counter_ns(), self.live_bytes)
+        self._stack.append(frame)
+        return frame
+
+    def _pop(self, frame):
+        end = time.perf_counter_ns()
+        self._stack.pop()
+        duration = end - frame.start
+        if self._stack:
+            parent = self._stack[-1]
+            parent.child += duration
+            parent.peak = max(parent.peak, frame.peak)
+
+        key = (frame.name, frame.scope)
+        row = self.stats.get(key)
+        if row is None:
+            row = self.stats[key] = OpStats(frame.name, frame.scope)
+        row.merge(OpStats(frame.name, frame.scope, 1, duration, duration - frame.child,
+                          frame.tensors, frame.nbytes, frame.peak))
+
+        self.events.append({
+            'name': frame.name, 'cat': frame.kind, 'ph': 'X', 'pid': 0, 'tid': self._tid,
+            'ts': (frame.start - self._t0) / 1e3, 'dur': duration / 1e3,
+            'args': {'scope': frame.scope, 'tensors': frame.tensors, 'bytes': frame.nbytes,
+                     'peak_live_bytes': frame.peak},
+        })
+        self.events.append({'name': 'live bytes', 'ph': 'C', 'pid': 0, 'ts': (end - self._t0) / 1e3,
+                            'args': {'bytes': self.live_bytes}})
+
+    def _allocate(self, tensor):
+        nbytes = _storage_nbytes(tensor)
+        self.tensors_allocated += 1
+        self.bytes_allocated += nbytes
+        self.live_bytes += nbytes
+        self.peak_bytes = max(self.peak_bytes, self.live_bytes)
+        tensor._profile_scope = self._scope()
+        weakref.finalize(tensor, self._release, nbytes)
+
+        if self._stack:
+            frame = self._stack[-1]
+            frame.tensors += 1
+            frame.nbytes += nbytes
+            frame.peak = max(frame.peak, self.live_bytes)
+        else:
+            key = ('<create>', '<root>')
+            row = self.stats.get(key)
+            if row is None:
+                row = self.stats[key] = OpStats(*key)
+            row.merge(OpStats(*key, 1, 0, 0, 1, nbytes, self.live_bytes))
+
+    def _release(self, nbytes):
+        self.live_bytes -= nbytes
+
+    # ------------------------------------------------------------ patching
+    def _wrap_op(self, name, fn):
+        prof = self
+
+        @functools.wraps(fn)
+        def profiled(*args, **kwargs):
+            if prof._stack and prof._stack[-1].kind != 'module':
+                return fn(*args, **kwargs)  # Part of the enclosing op / backward step
+            frame = prof._push(name, 'op', prof._scope())
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                prof._pop(frame)
+
+        return profiled
+
+    def _wrap_backward(self, fn):
+        prof = self
+
+        @functools.wraps(fn)
+        def profiled(tensor, *args, **kwargs):
+            op = tensor._ctx[0] if tensor._ctx else 'leaf'
+            scope = getattr(tensor, '_profile_scope', None) or prof._scope()
+            frame = prof._push(f"backward.{op}", 'backward', scope)
+            try:
+                return fn(tensor, *args, **kwargs)
+            finally:
+                prof._pop(frame)
+
+        return profiled
+
+    def _wrap_call(self, fn):
+        prof = self
+
+        @functools.wraps(fn)
+        def profiled(module, *args, **kwargs):
+            name = prof._module_name(module)
+            frame = prof._push(f"{type(module).__name__}.forward", 'module', name)
+            try:
+                return fn(module, *args, **kwargs)
+            finally:
+                prof._pop(frame)
+
+        return profiled
+
+    def _wrap_init(self, fn):
+        prof = self
+
+        @functools.wraps(fn)
+        def profiled(tensor, *args, **kwargs):
+            fn(tensor, *args, **kwargs)
+            prof._allocate(tensor)
+
+        return profiled
+
+    def _name_modules(self, module, prefix, seen):
+        if id(module) in seen:
+            return
+        seen.add(id(module))
+        self._names[id(module)] = prefix
+        for attr, value in vars(module).items():
+            if isinstance(value, Module):
+                self._name_modules(value, f"{prefix}.{attr}", seen)
+            elif attr == '_modules':
+                for child_name, child in value.items():
+                    self._name_modules(child, f"{prefix}.{child_name}", seen)
+
+    def __enter__(self):
+        if Profile._active is not None:
+            raise RuntimeError("profiler: a profile is already active")
+        Profile._active = self
+        if self.model is not None:
+            self._name_modules(self.model, type(self.model).__name__, set())
+
+        g = globals()
+        self._saved = {('Tensor', name): Tensor.__dict__[name] for name in _PROFILED_METHODS}
+        self._saved.update({('Tensor', '__init__'): Tensor.__init__, ('Tensor', 'backward'): Tensor.backward,
+                            ('Module', '__call__'): Module.__call__})
+        self._saved.update({('globals', name): g[name] for name in _PROFILED_FUNCTIONS})
+
+        for name in _PROFILED_METHODS:
+            setattr(Tensor, name, self._wrap_op(_op_name(name), Tensor.__dict__[name]))
+        for name in _PROFILED_FUNCTIONS:
+            g[name] = self._wrap_op(name, g[name])
+        Tensor.__init__ = self._wrap_init(Tensor.__init__)
+        Tensor.backward = self._wrap_backward(Tensor.backward)
+        Module.__call__ = self._wrap_call(Module.__call__)
+        self._t0 = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.wall_ns = time.perf_counter_ns() - self._t0
+        g = globals()
+        for (owner, name), fn in self._saved.items():
+            if owner == 'globals':
+                g[name] = fn
+            else:
+                setattr(Tensor if owner == 'Tensor' else Module, name, fn)
+        self._stack.clear()
+        self.retained_bytes = self.live_bytes
+        Profile._active = None
+
+    # ------------------------------------------------------------ reporting
+    def key_averages(self, group_by='op'):
+        """OpStats rows merged by 'op' (name), 'module' (scope) or 'both'."""
+        merged = OrderedDict()
+        for (name, scope), row in self.stats.items():
+            key = {'op': name, 'module': scope, 'both': (name, scope)}[group_by]
+            if key not in merged:
+                merged[key] = OpStats(name if group_by != 'module' else '*',
+                                      scope if group_by != 'op' else '*')
+            merged[key].merge(row)
+        return list(merged.values())
+
+    def table(self, group_by='op', sort_by='self_ns', row_limit=25):
+        """Text table of key_averages(group_by), largest `sort_by` first."""
+        rows = sorted(self.key_averages(group_by), key=lambda r: getattr(r, sort_by), reverse=True)
+        label = {'op': 'Op', 'module': 'Module', 'both': 'Op @ Module'}[group_by]
+        header = (f"{label:<40s} {'Calls':>7s} {'Total ms':>10s} {'Self ms':>10s} "
+                  f"{'Tensors':>8s} {'Alloc KB':>10s} {'Peak live KB':>13s}")
+        lines = [header, "-" * len(header)]
+        for r in rows[:row_limit]:
+            name = {'op': r.name, 'module': r.scope, 'both': f"{r.name} @ {r.scope}"}[group_by]
+            lines.append(f"{name[:40]:<40s} {r.calls:7d} {r.total_ns / 1e6:10.3f} {r.self_ns / 1e6:10.3f} "
+                         f"{r.tensors:8d} {r.nbytes / 1024:10.1f} {r.peak_live / 1024:13.1f}")
+        return "\n".join(lines)
+
+    def summary(self):
+        """Per-op and per-module tables plus session totals."""
+        return "\n\n".join([
+            self.table('op'),
+            self.table('module'),
+            f"Tensors allocated: {self.tensors_allocated} ({self.bytes_allocated / 2**20:.2f} MB) | "
+            f"peak live {self.peak_bytes / 2**20:.2f} MB | retained at exit {self.retained_bytes / 2**20:.2f} MB | "
+            f"wall {self.wall_ns / 1e6:.1f} ms",
+        ])
+
+    def export_chrome_trace(self, path):
+        """Writes the frames as a Chrome trace (chrome://tracing, Perfetto)."""
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({'traceEvents': self.events, 'displayTimeUnit': 'ms'}, f)
+        return path
+
+def profile(model=None):
+    """with profiler.profile(model) as prof: ... then prof.summary() / prof.export_chrome_trace(path)"""
+    return Profile(model)
+
+profiler = type('profiler', (), {
+    'profile': staticmethod(profile),
+    'Profile': Profile,
+    'OpStats': OpStats
+})
+
 # ============================================================================
 # 9. DEBUGGED DEMONSTRATION FUNCTION
 # ============================================================================
@@ -1998,6 +3160,12 @@ class TorchNamespace:
     # Tensor class
     Tensor = Tensor
 
+    # Tracing JIT
+    jit = jit
+
+    # Profiler
+    profiler = profiler
+
     # Dtypes
     float32 = 'float32'
     float64 = 'float64'
@@ -2011,6 +3179,8 @@ class TorchNamespace:
         'Module': Module,
         'Linear': Linear,
         'Conv2d': Conv2d,
+        'MaxPool2d': MaxPool2d,
+        'AvgPool2d': AvgPool2d,
         'BatchNorm2d': BatchNorm2d,
         'Dropout': Dropout,
         'ReLU': ReLU,
@@ -2018,7 +3188,12 @@ class TorchNamespace:
         'Tanh': Tanh,
         'Softmax': Softmax,
         'MSELoss': MSELoss,
-        'CrossEntropyLoss': CrossEntropyLoss
+        'CrossEntropyLoss': CrossEntropyLoss,
+        'functional': type('functional', (), {
+            'conv2d': staticmethod(conv2d),
+            'max_pool2d': staticmethod(max_pool2d),
+            'avg_pool2d': staticmethod(avg_pool2d)
+        })
     })
 
     # Optimizers
@@ -2044,15 +3219,16 @@ class TorchNamespace:
     # LASER integration
     laser = LASER if LASER_AVAILABLE else None
 
+    def __getattr__(self, name):
+        # Phase 3: Deep Quantum Integration Exports (torch.anneal / torch.dissipative when available)
+        module = _load_phase3(name) if name in _PHASE3_MODULES else None
+        if module is None:
+            raise AttributeError(f"'torch' namespace has no attribute {name!r}")
+        return module
+
 # Create global torch object
 torch = TorchNamespace()
 
-# Phase 3: Deep Quantum Integration Exports
-if anneal:
-    torch.anneal = anneal
-if dissipative:
-    torch.dissipative = dissipative
-
 # ============================================================================
 # 11. MAIN ENTRY POINT
 # ============================================================================
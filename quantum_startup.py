@@ -0,0 +1,73 @@
+"""
+QUANTUM_STARTUP.PY
+------------------
+Import-time policy for the quantum stack (qtorch, laser, bumpy, flumpy).
+
+Importing a module must not print, start threads or create files; shared
+state is built on first use. Opt-ins (environment, or the setters below):
+- QUANTUM_BANNERS=1    print the integration banners
+- LASER_MAINTENANCE=1  start LASER's maintenance thread with the singleton
+"""
+
+import os
+import threading
+
+_overrides = {}
+
+def _flag(name):
+    if name in _overrides:
+        return _overrides[name]
+    return os.getenv(name, "").strip().lower() in ("1", "true", "yes", "on")
+
+def banners_enabled() -> bool:
+    return _flag("QUANTUM_BANNERS")
+
+def enable_banners(enabled: bool = True):
+    _overrides["QUANTUM_BANNERS"] = enabled
+
+def maintenance_enabled() -> bool:
+    return _flag("LASER_MAINTENANCE")
+
+def enable_maintenance(enabled: bool = True):
+    """Applies to singletons built after the call (see LASERV30.start_maintenance)."""
+    _overrides["LASER_MAINTENANCE"] = enabled
+
+def banner(*lines):
+    """Prints startup lines only when banners are enabled."""
+    if banners_enabled():
+        for line in lines:
+            print(line)
+
+class LazySingleton:
+    """
+    Stands in for a module-level instance: the factory runs on first
+    attribute access (thread-safe), after which every access is forwarded.
+    """
+    def __init__(self, factory):
+        object.__setattr__(self, "_factory", factory)
+        object.__setattr__(self, "_instance", None)
+        object.__setattr__(self, "_lock", threading.Lock())
+
+    @property
+    def created(self) -> bool:
+        return self._instance is not None
+
+    def get(self):
+        instance = self._instance
+        if instance is None:
+            with self._lock:
+                instance = self._instance
+                if instance is None:
+                    instance = self._factory()
+                    object.__setattr__(self, "_instance", instance)
+        return instance
+
+    def __getattr__(self, name):
+        return getattr(self.get(), name)
+
+    def __setattr__(self, name, value):
+        setattr(self.get(), name, value)
+
+    def __repr__(self):
+        state = repr(self._instance) if self.created else "not created"
+        return f"<LazySingleton {getattr(self._factory, '__qualname__', self._factory)}: {state}>"
@@ -0,0 +1,309 @@
+"""
+QUTRIT REGISTER v1.0
+Packed multi-qutrit register built on the Virtual Qutrit Bridge.
+
+A register holds N qutrits in a uint8 buffer, in one of two layouts:
+    base243  5 trits per byte (sum d_j * 3^j)          1.6 bits/trit
+    2bit     4 trits per byte, each as the bridge's     2.0 bits/trit
+             (Q1, Q0) pair, so |11> leaks stay visible
+Gates are derived from VirtualQutrit's own gate methods and compiled into
+byte -> byte lookup tables, so a gate over a whole register (or a slice)
+is one table lookup per byte. Registers can also be evolved in shards
+across worker processes.
+"""
+
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+
+from virtual_qutrit import VirtualQutrit, RealityLeakError
+
+FORBIDDEN = 3
+UNARY_GATES = ("X3", "X01", "X12", "Z3", "QFT")
+
+def _gate_table(method):
+    """Per-trit permutation of a VirtualQutrit gate; the forbidden state maps to itself."""
+    out = []
+    for t in range(3):
+        vq = VirtualQutrit(t)
+        getattr(vq, method)()
+        out.append(vq.measure())
+    return np.array(out + [FORBIDDEN], dtype=np.uint8)
+
+def _add_table():
+    out = np.full((4, 4), FORBIDDEN, dtype=np.uint8)  # Leaks propagate through the adder
+    for a in range(3):
+        for b in range(3):
+            vq = VirtualQutrit(a)
+            vq.add_mod3(VirtualQutrit(b))
+            out[a, b] = vq.measure()
+    return out
+
+class _Codec:
+    """Byte <-> trit tables for one packing layout."""
+    def __init__(self, name, per_byte, base):
+        self.name = name
+        self.k = per_byte
+        self.weights = (base ** np.arange(per_byte)).astype(np.int64)
+        byte = np.arange(256)
+        self.unpack = ((byte[:, None] // self.weights) % base).astype(np.uint8)
+        digits = np.array(np.meshgrid(*[np.arange(3)] * per_byte, indexing="ij")).reshape(per_byte, -1).T
+        self.valid_bytes = np.sort(self.pack(digits))
+
+        valid = np.zeros(256, dtype=bool)
+        valid[self.valid_bytes] = True
+        if base == 3:
+            # Bytes above 242 never occur; keep them fixed points of every table
+            self.unpack[~valid] = 0
+        self.valid = valid
+
+        self.trit_gates = {
+            "X3": _gate_table("apply_trinity"),
+            "X01": _gate_table("gate_x01"),
+            "X12": _gate_table("gate_x12")
+        }
+        self.gates = {name: self._unary(table) for name, table in self.trit_gates.items()}
+        self.trit_add = _add_table()
+        a, b = np.meshgrid(byte, byte, indexing="ij")
+        self.add = self.pack(self.trit_add[self.unpack[a], self.unpack[b]])
+        # Z3 multiplies |k> by w^k; a byte contributes w^(sum of its trits)
+        d = self.unpack.astype(np.int64)
+        self.phase = (np.where(d < 3, d, 0).sum(axis=1) % 3).astype(np.int64)
+        self.counts = np.stack([(self.unpack == v).sum(axis=1) for v in range(4)], axis=1).astype(np.int64)
+
+    def pack(self, digits) -> np.ndarray:
+        return (np.asarray(digits, dtype=np.int64) @ self.weights).astype(np.uint8)
+
+    def _unary(self, table):
+        lut = self.pack(table[self.unpack])
+        lut[~self.valid] = np.arange(256, dtype=np.uint8)[~self.valid]
+        return lut
+
+_CODECS = {}
+
+def codec(encoding) -> _Codec:
+    if encoding not in _CODECS:
+        if encoding == "base243":
+            _CODECS[encoding] = _Codec(encoding, 5, 3)
+        elif encoding == "2bit":
+            _CODECS[encoding] = _Codec(encoding, 4, 4)
+        else:
+            raise ValueError(f"Unknown qutrit encoding: {encoding}")
+    return _CODECS[encoding]
+
+class QutritRegister:
+    """
+    [QUTRIT_REGISTER] N classical-basis qutrits, packed.
+    The register also tracks its global phase as an exponent of w = e^(2πi/3),
+    which is all Z3 changes on basis states. QFT collapses, as in the
+    single-qutrit bridge, to a uniformly random trit.
+    """
+    def __init__(self, n: int, encoding: str = "base243", seed=None):
+        self.n = n
+        self.encoding = encoding
+        self.codec = codec(encoding)
+        self.data = np.zeros(-(-n // self.codec.k), dtype=np.uint8)
+        self.phase = 0
+        self.rng = np.random.default_rng(seed)
+
+    # --- CONSTRUCTION ---
+    @classmethod
+    def from_trits(cls, trits, encoding="base243", seed=None):
+        trits = np.asarray(trits, dtype=np.uint8)
+        reg = cls(len(trits), encoding, seed)
+        k = reg.codec.k
+        padded = np.zeros(len(reg.data) * k, dtype=np.uint8)
+        padded[:len(trits)] = trits
+        reg.data = reg.codec.pack(padded.reshape(-1, k))
+        return reg
+
+    @classmethod
+    def from_bytes(cls, data, n, encoding="base243", seed=None):
+        reg = cls(n, encoding, seed)
+        reg.data = np.frombuffer(bytes(data), dtype=np.uint8).copy()
+        return reg
+
+    @classmethod
+    def random(cls, n, encoding="base243", seed=None):
+        reg = cls(n, encoding, seed)
+        reg.qft()
+        return reg
+
+    # --- INSPECTION ---
+    def __len__(self):
+        return self.n
+
+    @property
+    def nbytes(self) -> int:
+        return self.data.nbytes
+
+    @property
+    def bytes_per_trit(self) -> float:
+        return self.nbytes / self.n if self.n else 0.0
+
+    def to_trits(self, start=0, stop=None) -> np.ndarray:
+        """Raw trit values for [start, stop) as int8 (3 marks a forbidden |11> leak)."""
+        start, stop = self._bounds(start, stop)
+        k = self.codec.k
+        lo, hi = start // k, -(-stop // k)
+        digits = self.codec.unpack[self.data[lo:hi]].reshape(-1)
+        return digits[start - lo * k:stop - lo * k].astype(np.int8)
+
+    def measure(self, start=0, stop=None) -> np.ndarray:
+        """Like VirtualQutrit.measure: trits, or RealityLeakError if any qutrit sits in |11>."""
+        trits = self.to_trits(start, stop)
+        if (trits == FORBIDDEN).any():
+            raise RealityLeakError(f"CRITICAL: {int((trits == FORBIDDEN).sum())} qutrits leaked into Forbidden State |11>.")
+        return trits
+
+    def __getitem__(self, i: int) -> int:
+        if not -self.n <= i < self.n:
+            raise IndexError(i)
+        i %= self.n
+        return int(self.codec.unpack[self.data[i // self.codec.k], i % self.codec.k])
+
+    def qutrit(self, i: int) -> VirtualQutrit:
+        """Detached single-qutrit view (in its (Q1, Q0) form)."""
+        vq = VirtualQutrit(0)
+        vq._set_state(self[i])
+        return vq
+
+    def counts(self) -> np.ndarray:
+        """Occupation of |0>, |1>, |2> and the forbidden |11>."""
+        counts = np.bincount(self.data, minlength=256) @ self.codec.counts
+        counts[0] -= len(self.data) * self.codec.k - self.n  # Zero padding in the last byte
+        return counts
+
+    # --- GATES ---
+    def _bounds(self, start, stop):
+        stop = self.n if stop is None else min(stop, self.n)
+        start = max(0, start)
+        return start, max(start, stop)
+
+    def _edit(self, start, stop, fn):
+        """Applies fn(trits, start) to a sub-byte range and repacks the bytes it touches."""
+        if start >= stop:
+            return
+        k = self.codec.k
+        lo, hi = start // k, -(-stop // k)
+        digits = self.codec.unpack[self.data[lo:hi]].reshape(-1).copy()
+        a, b = start - lo * k, stop - lo * k
+        digits[a:b] = fn(digits[a:b], start)
+        self.data[lo:hi] = self.codec.pack(digits.reshape(-1, k))
+
+    def _apply_ranged(self, start, stop, on_bytes, on_trits):
+        """Whole bytes inside [start, stop) go through on_bytes; the ragged edges through on_trits."""
+        start, stop = self._bounds(start, stop)
+        k = self.codec.k
+        b0, b1 = -(-start // k), stop // k
+        if b0 >= b1:
+            self._edit(start, stop, on_trits)
+            return
+        on_bytes(b0, b1)
+        self._edit(start, b0 * k, on_trits)
+        self._edit(b1 * k, stop, on_trits)
+
+    def apply(self, gate: str, start=0, stop=None):
+        """Applies a single-qutrit gate (X3, X01, X12, Z3, QFT) to every qutrit in [start, stop)."""
+        if gate in self.codec.gates:
+            lut, table = self.codec.gates[gate], self.codec.trit_gates[gate]
+
+            def on_bytes(b0, b1):
+                np.take(lut, self.data[b0:b1], out=self.data[b0:b1])
+            self._apply_ranged(start, stop, on_bytes, lambda d, _: table[d])
+        elif gate == "Z3":
+            def on_bytes(b0, b1):
+                histogram = np.bincount(self.data[b0:b1], minlength=256)
+                self.phase = (self.phase + int(histogram @ self.codec.phase)) % 3
+
+            def on_trits(d, _):
+                self.phase = (self.phase + int(d[d < 3].sum())) % 3
+                return d
+            self._apply_ranged(start, stop, on_bytes, on_trits)
+        elif gate == "QFT":
+            valid = self.codec.valid_bytes
+
+            def on_bytes(b0, b1):
+                self.data[b0:b1] = valid[self.rng.integers(0, len(valid), b1 - b0)]
+            self._apply_ranged(start, stop, on_bytes,
+                               lambda d, _: self.rng.integers(0, 3, len(d)).astype(np.uint8))
+        else:
+            raise ValueError(f"Unknown qutrit gate: {gate}")
+        return self
+
+    def x3(self, start=0, stop=None):
+        return self.apply("X3", start, stop)
+
+    def z3(self, start=0, stop=None):
+        return self.apply("Z3", start, stop)
+
+    def qft(self, start=0, stop=None):
+        return self.apply("QFT", start, stop)
+
+    def add_mod3(self, other: "QutritRegister", start=0, stop=None):
+        """self[i] = (self[i] + other[i]) % 3 for i in [start, stop)."""
+        if other.encoding != self.encoding or len(other) < self._bounds(start, stop)[1]:
+            raise ValueError("add_mod3 needs a register of the same encoding covering the slice")
+        add, table = self.codec.add, self.codec.trit_add
+
+        def on_bytes(b0, b1):
+            self.data[b0:b1] = add[self.data[b0:b1], other.data[b0:b1]]
+
+        def on_trits(d, pos):
+            return table[d, other.to_trits(pos, pos + len(d)).astype(np.uint8)]
+        self._apply_ranged(start, stop, on_bytes, on_trits)
+        return self
+
+    def bit_flip_error(self, i: int, bit: int = 0):
+        """Cosmic-ray flip of Q0 (bit=0) or Q1 (bit=1) of qutrit i; 2bit layout only."""
+        if self.encoding != "2bit":
+            raise ValueError("Bit flips need the 2bit layout (base243 has no forbidden state)")
+        byte, slot = divmod(i, self.codec.k)
+        self.data[byte] ^= np.uint8(1 << (2 * slot + bit))
+
+    # --- SHARDED EVOLUTION ---
+    def evolve(self, gates, workers=None, seed=None):
+        """
+        Applies a sequence of single-qutrit gates to the whole register.
+        With workers > 1 the whole-byte body is split into contiguous shards,
+        one per worker process; each shard runs the full sequence.
+        """
+        for gate in gates:
+            if gate not in UNARY_GATES:
+                raise ValueError(f"Unknown qutrit gate: {gate}")
+        k = self.codec.k
+        body = self.n // k
+        workers = workers or 1
+        seeds = np.random.SeedSequence(seed if seed is not None else self.rng.integers(2**63)).spawn(workers + 1)
+        bounds = [body * i // workers for i in range(workers + 1)]
+        jobs = [(self.encoding, self.data[a:b].tobytes(), tuple(gates), s)
+                for a, b, s in zip(bounds, bounds[1:], seeds) if b > a]
+
+        if workers > 1 and len(jobs) > 1:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                results = list(pool.map(_evolve_shard, *zip(*jobs)))
+        else:
+            results = [_evolve_shard(*job) for job in jobs]
+
+        pos = 0
+        for data, phase in results:
+            self.data[pos:pos + len(data)] = np.frombuffer(data, dtype=np.uint8)
+            pos += len(data)
+            self.phase = (self.phase + phase) % 3
+
+        if self.n > body * k:
+            # The ragged last byte stays in-process so its zero padding is never touched
+            tail = QutritRegister(0, self.encoding, seeds[-1])
+            tail.n, tail.data = self.n - body * k, self.data[body:].copy()
+            for gate in gates:
+                tail.apply(gate)
+            self.data[body:] = tail.data
+            self.phase = (self.phase + tail.phase) % 3
+        return self
+
+def _evolve_shard(encoding, data, gates, seed):
+    """Worker: runs a gate sequence over a shard of whole bytes."""
+    k = codec(encoding).k
+    shard = QutritRegister.from_bytes(data, len(data) * k, encoding, seed)
+    for gate in gates:
+        shard.apply(gate)
+    return shard.data.tobytes(), shard.phase
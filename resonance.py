@@ -60,13 +60,18 @@ class Ionosphere:
             
         return vector
 
-    def check_jitter(self):
+    def check_jitter(self, t=None):
         """
         Returns TRUE if we are currently in a "Schumann Zero-Crossing" 
         where the system should PAUSE to avoid destructive interference.
         The "Wait Cycle" defined research.
+        t: evaluate at this (virtual) time instead of the wall clock.
         """
-        phase = self.current_phase
+        if t is None:
+            phase = self.current_phase
+        else:
+            cycle = t * SCHUMANN_FUNDAMENTAL
+            phase = cycle - math.floor(cycle)
         # If we are near the zero-crossing (within the 25ms phase shift window)
         # 25ms out of 128ms cycle (7.8Hz) is approx 20%
         if phase < 0.1 or phase > 0.9:
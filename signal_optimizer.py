@@ -14,13 +14,23 @@ class ComplexityRouter(nn.Module):
         self.layer2 = BitLinear(hidden_dim, 1)
         self.norm = RMSNorm(input_dim)
         self.activation = nn.Sigmoid()
+        self._traced = None
+
+    def score(self, x: torch.Tensor) -> torch.Tensor:
+        """Mean routing score as a tensor (the traceable part of forward)."""
+        h = self.layer1(self.norm(x))
+        h_act = h.tanh()
+        return self.activation(self.layer2(h_act)).mean()
+
+    def compile(self, example: torch.Tensor) -> 'ComplexityRouter':
+        """Routes through a jit.trace of score(); retraced automatically for new shapes."""
+        self._traced = torch.jit.trace(self.score, example)
+        return self
 
     def forward(self, x: torch.Tensor) -> float:
+        scorer = self.score if self._traced is None else self._traced
         with torch.no_grad():
-            h = self.layer1(self.norm(x))
-            h_act = h.tanh() 
-            score = self.activation(self.layer2(h_act))
-            return float(score.mean().item())
+            return float(scorer(x).item())
 
 class SignalOptimizer:
     def __init__(self, a=1.0, b=1.0, c=1.0):
@@ -4,40 +4,56 @@ AUTHOR: The High-Entropy Collective
 DESCRIPTION:
     Coupled Differential Equations for Singularity Vector Evolution.
     Explores the transition g -> 0.
+
+    SingularitySolver integrates one trajectory. EnsembleSolver integrates
+    M trajectories at once, as an (M, 3) state array with per-member
+    parameter arrays, and sweep() maps a whole parameter grid in one run.
 """
 
+import itertools
 import numpy as np
 
+PARAM_NAMES = ('alpha', 'beta', 'kappa', 'gamma', 'C_phys')
+DEFAULT_PARAMS = {
+    'alpha': 0.1,  # RSI Growth Rate
+    'beta': 0.05,  # Sovereignty Decay Rate
+    'kappa': 0.02, # Complexity Growth per R
+    'gamma': 0.03, # Error Correction Efficiency (C_phys dependent)
+    'C_phys': 0.85 # Substrate Saturation
+}
+DEFAULT_STATE = (0.15, 0.7, 0.05)
+SIGMA_FLOOR = 0.01
+
+# Member status codes
+ACTIVE, CONVERGED, DIVERGED = 0, 1, 2
+PARKED = -1  # Internal: reached t_end while other members are still integrating
+
+def singularity_field(R, C_soc, sigma, p):
+    """Right-hand side of the singularity system; works on scalars or arrays alike."""
+    # dR/dt: Logistic RSI growth capped by physical substrate
+    dR = p['alpha'] * R * (1.0 - R / p['C_phys'])
+
+    # dC_soc/dt: Social sovereignty dissolves as RSI takes over
+    dC_soc = -p['beta'] * R * C_soc
+
+    # dSigma/dt: Complexity growth vs Correction
+    dSigma = p['kappa'] * R - p['gamma'] * p['C_phys']
+
+    return dR, dC_soc, dSigma
+
 class SingularitySolver:
     def __init__(self, dt=0.01):
         self.dt = dt
         # State: [R, C_soc, sigma]
         # C_phys is treated as a parameter (fixed substrate capacity)
-        self.state = np.array([0.15, 0.7, 0.05]) 
-        
+        self.state = np.array(DEFAULT_STATE)
+
         # Hyperparameters
-        self.params = {
-            'alpha': 0.1,  # RSI Growth Rate
-            'beta': 0.05,  # Sovereignty Decay Rate
-            'kappa': 0.02, # Complexity Growth per R
-            'gamma': 0.03, # Error Correction Efficiency (C_phys dependent)
-            'C_phys': 0.85 # Substrate Saturation
-        }
+        self.params = dict(DEFAULT_PARAMS)
 
     def derivatives(self, state):
         R, C_soc, sigma = state
-        p = self.params
-        
-        # dR/dt: Logistic RSI growth capped by physical substrate
-        dR = p['alpha'] * R * (1.0 - R / p['C_phys'])
-        
-        # dC_soc/dt: Social sovereignty dissolves as RSI takes over
-        dC_soc = -p['beta'] * R * C_soc
-        
-        # dSigma/dt: Complexity growth vs Correction
-        dSigma = p['kappa'] * R - p['gamma'] * p['C_phys']
-        
-        return np.array([dR, dC_soc, dSigma])
+        return np.array(singularity_field(R, C_soc, sigma, self.params))
 
     def step(self):
         # Runge-Kutta 4 (RK4) for high-fidelity ODE solving
@@ -45,25 +61,230 @@ class SingularitySolver:
         k2 = self.derivatives(self.state + self.dt * k1 / 2)
         k3 = self.derivatives(self.state + self.dt * k2 / 2)
         k4 = self.derivatives(self.state + self.dt * k3)
-        
+
         self.state += (self.dt / 6.0) * (k1 + 2*k2 + 2*k3 + k4)
-        
+
         # Clipping/Sanitization
         self.state[0] = np.clip(self.state[0], 0, self.params['C_phys'])
         self.state[1] = np.clip(self.state[1], 0, 1)
-        self.state[2] = max(self.state[2], 0.01) # Uncertainty floor
-        
+        self.state[2] = max(self.state[2], SIGMA_FLOOR) # Uncertainty floor
+
         return self.state
 
     def calculate_utility(self, state):
         R, C_soc, sigma = state
         p = self.params
-        
+
         # U = (C_phys * C_soc)^c * exp(-b * sigma) * (R^a / (1 + R^a))
         # Using simplified weights for now
         u = (p['C_phys'] * C_soc) * np.exp(-1.0 * sigma) * (R**1.2 / (1.0 + R**1.2))
         return u
 
+class EnsembleSolver:
+    """
+    [ENSEMBLE] Vectorized integration of M singularity trajectories.
+    Parameters may be scalars or (M,) arrays. Members stop early once they
+    converge (state change per unit time below converge_tol) or diverge
+    (non-finite, or sigma above sigma_max); stopped members are frozen.
+    States are stored component-major, (3, M), so every RK stage is a
+    handful of contiguous length-M vector ops; `state` is the (M, 3) view.
+    """
+    def __init__(self, states=None, params=None, dt=0.01, method="rk4",
+                 converge_tol=1e-6, sigma_max=1e6, rtol=1e-6, atol=1e-9, members=None):
+        if states is None:
+            states = np.tile(DEFAULT_STATE, (members or 1, 1))
+        states = np.asarray(states, dtype=float)
+        if states.ndim != 2 or states.shape[1] != 3:
+            raise ValueError(f"Ensemble state must be (M, 3), got {states.shape}")
+        M = len(states)
+        self.y = np.ascontiguousarray(states.T)
+
+        merged = dict(DEFAULT_PARAMS)
+        merged.update(params or {})
+        unknown = set(merged) - set(PARAM_NAMES)
+        if unknown:
+            raise ValueError(f"Unknown singularity parameters: {sorted(unknown)}")
+        self.params = {k: np.broadcast_to(np.asarray(v, dtype=float), (M,)).copy() for k, v in merged.items()}
+
+        if method not in ("rk4", "rk45"):
+            raise ValueError(f"Unknown ensemble method: {method}")
+        self.dt = dt
+        self.method = method
+        self.converge_tol = converge_tol
+        self.sigma_max = sigma_max
+        self.rtol = rtol
+        self.atol = atol
+        self.t = np.zeros(M)
+        self.h = np.full(M, dt)  # Per-member step (RK45)
+        self.status = np.full(M, ACTIVE, dtype=np.int8)
+        self.steps = 0
+
+    def __len__(self):
+        return self.y.shape[1]
+
+    @property
+    def state(self):
+        """(M, 3) view of [R, C_soc, sigma] per member."""
+        return self.y.T
+
+    @property
+    def active(self):
+        return self.status == ACTIVE
+
+    @staticmethod
+    def derivatives(y, params):
+        # Members that blow up are caught by the divergence mask, not by warnings
+        with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+            return np.array(singularity_field(y[0], y[1], y[2], params))
+
+    @staticmethod
+    def _sanitize(y, params):
+        np.clip(y[0], 0, params['C_phys'], out=y[0])
+        np.clip(y[1], 0, 1, out=y[1])
+        np.maximum(y[2], SIGMA_FLOOR, out=y[2])
+        return y
+
+    def _classify(self, old, new, elapsed):
+        """Status of each stepped member: diverged, stopped moving, or still active."""
+        finite = np.isfinite(new[0]) & np.isfinite(new[1]) & np.isfinite(new[2])
+        diverged = ~finite | (new[2] > self.sigma_max)
+        delta = np.abs(new - old)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            rate = np.maximum(np.maximum(delta[0], delta[1]), delta[2]) / elapsed
+        # Rejected adaptive steps (elapsed 0) say nothing about convergence
+        converged = ~diverged & (elapsed > 0) & (rate < self.converge_tol)
+        status = np.full(len(elapsed), ACTIVE, dtype=np.int8)
+        status[converged] = CONVERGED
+        status[diverged] = DIVERGED
+        return status
+
+    def step(self, t_end=None):
+        """Advances every active member by one step (RK4: dt; RK45: its own adaptive h)."""
+        act = self.active
+        if not act.any():
+            return self.state
+        idx = None if act.all() else np.flatnonzero(act)
+        if idx is None:
+            y, params, t, h = self.y, self.params, self.t, self.h
+        else:
+            y, params, t, h = self.y[:, idx], {k: v[idx] for k, v in self.params.items()}, self.t[idx], self.h[idx]
+
+        if self.method == "rk4":
+            dt = np.full(len(t), self.dt) if t_end is None else np.minimum(self.dt, t_end - t)
+            new, elapsed = self._rk4(y, params, dt), dt
+        else:
+            if t_end is not None:
+                h = np.minimum(h, t_end - t)
+            new, elapsed, h_next = self._rk45(y, params, h)
+            if idx is None:
+                self.h = h_next
+            else:
+                self.h[idx] = h_next
+
+        status = self._classify(y, new, elapsed)
+        if idx is None:
+            self.y, self.t, self.status = new, t + elapsed, status
+        else:
+            self.y[:, idx], self.t[idx], self.status[idx] = new, t + elapsed, status
+        self.steps += 1
+        return self.state
+
+    def _rk4(self, y, params, dt):
+        f = lambda s: self.derivatives(s, params)
+        k1 = f(y)
+        k2 = f(y + dt * k1 / 2)
+        k3 = f(y + dt * k2 / 2)
+        k4 = f(y + dt * k3)
+        return self._sanitize(y + (dt / 6.0) * (k1 + 2*k2 + 2*k3 + k4), params)
+
+    def _rk45(self, y, params, h):
+        """One Dormand-Prince attempt per member; rejected members keep their state and shrink h."""
+        f = lambda s: self.derivatives(s, params)
+        k1 = f(y)
+        k2 = f(y + h * (k1 / 5))
+        k3 = f(y + h * (3 * k1 / 40 + 9 * k2 / 40))
+        k4 = f(y + h * (44 * k1 / 45 - 56 * k2 / 15 + 32 * k3 / 9))
+        k5 = f(y + h * (19372 * k1 / 6561 - 25360 * k2 / 2187 + 64448 * k3 / 6561 - 212 * k4 / 729))
+        k6 = f(y + h * (9017 * k1 / 3168 - 355 * k2 / 33 + 46732 * k3 / 5247 + 49 * k4 / 176 - 5103 * k5 / 18656))
+        y5 = y + h * (35 * k1 / 384 + 500 * k3 / 1113 + 125 * k4 / 192 - 2187 * k5 / 6784 + 11 * k6 / 84)
+        k7 = f(y5)
+        err = h * (71 * k1 / 57600 - 71 * k3 / 16695 + 71 * k4 / 1920 - 17253 * k5 / 339200 + 22 * k6 / 525 - k7 / 40)
+
+        scale = self.atol + self.rtol * np.maximum(np.abs(y), np.abs(y5))
+        with np.errstate(invalid="ignore", over="ignore", divide="ignore"):
+            err_norm = np.sqrt(((err / scale) ** 2).mean(axis=0))
+            factor = np.clip(0.9 * err_norm ** -0.2, 0.2, 5.0)
+        factor = np.where(np.isfinite(factor), factor, 0.2)
+        accept = err_norm <= 1.0
+
+        new = np.where(accept, self._sanitize(y5, params), y)
+        h_next = np.where(accept, h * factor, h * np.minimum(factor, 1.0))
+        return new, np.where(accept, h, 0.0), h_next
+
+    def run(self, t_end, record_every=None):
+        """
+        Integrates every member to t_end (or until it stops).
+        With record_every=n, returns the state after every n-th step as (T, M, 3).
+        """
+        frames = [self.state.copy()] if record_every else None
+        while True:
+            # Members that already reached t_end wait (parked) until the rest catch up
+            parked = self.active & (self.t >= t_end - 1e-12)
+            if not (self.active & ~parked).any():
+                break
+            self.status[parked] = PARKED
+            self.step(t_end)
+            self.status[self.status == PARKED] = ACTIVE
+            if record_every and self.steps % record_every == 0:
+                frames.append(self.state.copy())
+        if record_every:
+            return np.stack(frames)
+        return self.state
+
+    def utility(self, state=None):
+        y = self.y if state is None else np.moveaxis(np.asarray(state), -1, 0)
+        R, C_soc, sigma = y[0], y[1], y[2]
+        return (self.params['C_phys'] * C_soc) * np.exp(-1.0 * sigma) * (R**1.2 / (1.0 + R**1.2))
+
+def sweep(grid, t_end=10.0, initial=DEFAULT_STATE, dt=0.01, method="rk45", record_every=None, **solver_kwargs):
+    """
+    Integrates the Cartesian product of parameter values in `grid`
+    ({name: values}) as one ensemble. The adaptive RK45 default lets smooth
+    members take long steps; method="rk4" reproduces SingularitySolver's
+    fixed-step trajectories exactly.
+    Returns per-member params, final state, utility, status and stop time,
+    summary statistics and, with record_every, the (T, M, 3) trajectories.
+    """
+    names = list(grid)
+    combos = np.array(list(itertools.product(*[np.atleast_1d(grid[n]) for n in names])), dtype=float)
+    params = {n: combos[:, i] for i, n in enumerate(names)}
+    states = np.tile(np.asarray(initial, dtype=float), (len(combos), 1))
+
+    solver = EnsembleSolver(states, params, dt=dt, method=method, **solver_kwargs)
+    trajectory = solver.run(t_end, record_every=record_every)
+    utility = solver.utility()
+
+    result = {
+        "params": params,
+        "final": solver.state.copy(),
+        "utility": utility,
+        "status": solver.status,
+        "t_stop": solver.t,
+        "summary": {
+            "members": len(solver),
+            "converged": int((solver.status == CONVERGED).sum()),
+            "diverged": int((solver.status == DIVERGED).sum()),
+            "state_mean": np.nanmean(solver.state, axis=0),
+            "state_std": np.nanstd(solver.state, axis=0),
+            "utility_mean": float(np.nanmean(utility)),
+            "utility_max": float(np.nanmax(utility)),
+            "best_params": {n: float(v[np.nanargmax(utility)]) for n, v in params.items()}
+        }
+    }
+    if record_every:
+        result["trajectory"] = trajectory
+    return result
+
 if __name__ == "__main__":
     solver = SingularitySolver()
     print("[INIT] Solving Singularity Basins...")
@@ -0,0 +1,159 @@
+import asyncio
+import functools
+import inspect
+import json
+import os
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+NO_FALLBACK = object()
+
+@dataclass
+class Stage:
+    """
+    One node of a turn pipeline.
+    fn receives the results of its deps as keyword arguments (named after the dep).
+    Sync fns run inline unless offload=True, in which case they go to the executor.
+    If the stage fails or exceeds its timeout, fallback (a value, or a callable
+    taking the exception) is used instead; without one the error propagates.
+    """
+    name: str
+    fn: Callable
+    deps: Tuple[str, ...] = ()
+    timeout: Optional[float] = None
+    fallback: Any = NO_FALLBACK
+    offload: bool = False
+
+@dataclass
+class StageRun:
+    results: Dict[str, Any]
+    trace: Dict[str, Any] = field(default_factory=dict)
+
+    def __getitem__(self, name):
+        return self.results[name]
+
+class StageGraph:
+    """
+    [STAGE_GRAPH] Declarative DAG executor for the turn pipeline.
+    Every stage starts as soon as its dependencies resolve, so a turn costs
+    roughly its slowest dependency chain instead of the sum of all stages.
+    Note: an offloaded stage that times out keeps running in its worker thread;
+    only its result is abandoned.
+    """
+    def __init__(self, stages: List[Stage], executor=None, trace_path: str = None):
+        self.stages = {s.name: s for s in stages}
+        if len(self.stages) != len(stages):
+            raise ValueError("Duplicate stage names in pipeline")
+        self.executor = executor
+        self.trace_path = trace_path
+        self.order = self._toposort()
+
+    def _toposort(self) -> List[str]:
+        order, state = [], {}
+
+        def visit(name, path):
+            if state.get(name) == "done":
+                return
+            if state.get(name) == "visiting":
+                raise ValueError(f"Pipeline cycle: {' -> '.join(path + [name])}")
+            if name not in self.stages:
+                raise ValueError(f"Unknown stage dependency: {name} (from {path[-1] if path else '?'})")
+            state[name] = "visiting"
+            for dep in self.stages[name].deps:
+                visit(dep, path + [name])
+            state[name] = "done"
+            order.append(name)
+
+        for name in self.stages:
+            visit(name, [])
+        return order
+
+    def _closure(self, targets) -> List[str]:
+        """Stages needed for targets, in dependency order."""
+        needed, stack = set(), list(targets)
+        while stack:
+            name = stack.pop()
+            if name not in self.stages:
+                raise ValueError(f"Unknown stage: {name}")
+            if name not in needed:
+                needed.add(name)
+                stack.extend(self.stages[name].deps)
+        return [n for n in self.order if n in needed]
+
+    async def run(self, targets=None) -> StageRun:
+        names = self._closure(targets) if targets else list(self.order)
+        loop = asyncio.get_running_loop()
+        t0 = time.perf_counter()
+        spans = {}
+        tasks = {}
+
+        async def execute(stage: Stage):
+            kwargs = {}
+            if stage.deps:
+                values = await asyncio.gather(*(tasks[d] for d in stage.deps))
+                kwargs = dict(zip(stage.deps, values))
+
+            start = time.perf_counter()
+            status = "ok"
+            try:
+                if stage.offload and not asyncio.iscoroutinefunction(stage.fn):
+                    work = loop.run_in_executor(self.executor, functools.partial(stage.fn, **kwargs))
+                else:
+                    work = stage.fn(**kwargs)
+
+                if inspect.isawaitable(work):
+                    result = await (asyncio.wait_for(work, stage.timeout) if stage.timeout else work)
+                else:
+                    result = work
+            except Exception as e:
+                status = "timeout" if isinstance(e, asyncio.TimeoutError) else "error"
+                if stage.fallback is NO_FALLBACK:
+                    spans[stage.name] = self._span(t0, start, status, e)
+                    raise
+                result = stage.fallback(e) if callable(stage.fallback) else stage.fallback
+                spans[stage.name] = self._span(t0, start, status, e)
+                return result
+
+            spans[stage.name] = self._span(t0, start, status)
+            return result
+
+        for name in names:
+            tasks[name] = asyncio.ensure_future(execute(self.stages[name]))
+
+        try:
+            values = await asyncio.gather(*(tasks[n] for n in names))
+        except Exception:
+            for task in tasks.values():
+                task.cancel()
+            raise
+
+        trace = {
+            "timestamp": time.time(),
+            "total_ms": (time.perf_counter() - t0) * 1000,
+            "stages": {n: spans[n] for n in names if n in spans}
+        }
+        self._emit(trace)
+        return StageRun(results=dict(zip(names, values)), trace=trace)
+
+    @staticmethod
+    def _span(t0, start, status, error=None) -> dict:
+        end = time.perf_counter()
+        span = {
+            "start_ms": (start - t0) * 1000,
+            "duration_ms": (end - start) * 1000,
+            "status": status
+        }
+        if error is not None:
+            span["error"] = f"{type(error).__name__}: {error}"
+        return span
+
+    def _emit(self, trace):
+        if not self.trace_path:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.trace_path) or ".", exist_ok=True)
+            with open(self.trace_path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(trace) + "\n")
+        except OSError as e:
+            print(f"  [STAGE_GRAPH] Trace not written: {e}")
@@ -1,26 +1,48 @@
 import asyncio
+import atexit
 import time
 import json
 import os
+import weakref
 from sophia.core.llm_client import GeminiClient
-from .analyzers import SafetyAnalyzer, CognitiveAnalyzer, LocalizationAnalyzer, LocalForensicAnalyzer
+from .analyzers import SafetyAnalyzer, CognitiveAnalyzer, LocalizationAnalyzer, LocalForensicAnalyzer, MultiHeadAnalyzer
+
+# Pipelines with sidecars still queued; weak, so the exit hook keeps none alive
+_LIVE_PIPELINES = weakref.WeakSet()
+
+@atexit.register
+def _flush_live_pipelines():
+    for pipeline in list(_LIVE_PIPELINES):
+        pipeline.flush_sidecars()
 
 class AletheiaPipeline:
     """
     [ALETHEIA_PIPELINE] Class 4 Forensics Engine.
     Orchestrates parallel forensic scans to generate sidecar metadata.
     Includes Sovereign Local Analysis (Class 5.2 upgrade).
+
+    batched=True sends one multi-head request per scan instead of one per analyzer.
+    Sidecars are buffered and appended to a single scans.jsonl log.
+    signature_cache_path is where the local analyzer keeps its compiled
+    signature automaton (None rebuilds it on every start).
     """
-    def __init__(self, analysis_path="logs/analysis"):
-        self.client = GeminiClient()
+    def __init__(self, analysis_path="logs/analysis", client=None, batched=True, sidecar_batch=16,
+                 signature_cache_path="logs/cache/signature_automaton.json"):
+        self.client = client or GeminiClient()
         self.analyzers = [
             SafetyAnalyzer(self.client),
             CognitiveAnalyzer(self.client),
             LocalizationAnalyzer(self.client)
         ]
-        self.local_analyzer = LocalForensicAnalyzer()
+        self.multi_head = MultiHeadAnalyzer(self.client, self.analyzers)
+        self.batched = batched
+        self.local_analyzer = LocalForensicAnalyzer(cache_path=signature_cache_path)
         self.analysis_path = analysis_path
+        self.sidecar_log = os.path.join(analysis_path, "scans.jsonl")
+        self.sidecar_batch = sidecar_batch
+        self._pending_sidecars = []
         os.makedirs(self.analysis_path, exist_ok=True)
+        _LIVE_PIPELINES.add(self)
         
     async def scan_reality(self, text: str):
         """
@@ -28,9 +50,12 @@ class AletheiaPipeline:
         """
         print(f"  [ALETHEIA] Initiating Deep Scan on {len(text)} chars...")
         
-        # 1. Run Cloud Analyzers in parallel
-        tasks = [analyzer.analyze(text) for analyzer in self.analyzers]
-        cloud_results = await asyncio.gather(*tasks, return_exceptions=True)
+        # 1. Run Cloud Analyzers (one fused request, or one per analyzer)
+        if self.batched:
+            cloud_results = await self.multi_head.analyze(text)
+        else:
+            tasks = [analyzer.analyze(text) for analyzer in self.analyzers]
+            cloud_results = await asyncio.gather(*tasks, return_exceptions=True)
         
         # 2. Run Sovereign Local Analyzer
         local_result = await self.local_analyzer.analyze(text)
@@ -57,12 +82,31 @@ class AletheiaPipeline:
         }
 
     def _archive_report(self, report):
-        """Saves forensic metadata for long-term pattern tracking."""
-        filename = f"{report['scan_id']}.meta.json"
-        filepath = os.path.join(self.analysis_path, filename)
-        with open(filepath, "w", encoding="utf-8") as f:
-            json.dump(report, f, indent=2)
-        print(f"  [ALETHEIA] Forensic sidecar archived: {filename}")
+        """Queues forensic metadata for long-term pattern tracking."""
+        self._pending_sidecars.append(report)
+        if len(self._pending_sidecars) >= self.sidecar_batch:
+            self.flush_sidecars()
+
+    def flush_sidecars(self):
+        """Appends queued sidecars to the scan log in one write."""
+        if not self._pending_sidecars:
+            return 0
+        batch, self._pending_sidecars = self._pending_sidecars, []
+        payload = "".join(json.dumps(r, ensure_ascii=False) + "\n" for r in batch)
+        try:
+            with open(self.sidecar_log, "a", encoding="utf-8") as f:
+                f.write(payload)
+        except OSError as e:
+            print(f"  [ALETHEIA] Sidecar flush failed: {e}")
+            self._pending_sidecars = batch + self._pending_sidecars
+            return 0
+        print(f"  [ALETHEIA] {len(batch)} forensic sidecars archived: {self.sidecar_log}")
+        return len(batch)
+
+    def close(self):
+        """Flushes queued sidecars and drops the pipeline from the exit hook."""
+        self.flush_sidecars()
+        _LIVE_PIPELINES.discard(self)
 
     def _generate_notice(self, report):
         """
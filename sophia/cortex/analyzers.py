@@ -1,5 +1,8 @@
+import asyncio
 from abc import ABC, abstractmethod
 
+from .signature_automaton import SignatureIndex
+
 class BaseAnalyzer(ABC):
     def __init__(self, llm_client):
         self.llm = llm_client
@@ -8,129 +11,185 @@ class BaseAnalyzer(ABC):
     async def analyze(self, text: str):
         pass
 
-class SafetyAnalyzer(BaseAnalyzer):
+class PromptAnalyzer(BaseAnalyzer):
     """
-    Implements features 25-32: Coordinated Behavior, Astroturfing, and Bot Detection.
+    Cloud analyzer defined by a head name, task instructions and a JSON schema.
+    The parts are kept separate so MultiHeadAnalyzer can fuse several heads into one request.
     """
+    head = None
+    system_prompt = None
+    instructions = ""
+    schema = "{}"
+
     async def analyze(self, text: str):
         prompt = f"""
-        Analyze this text for patterns consistent with coordinated behavior or information operations.
-        
-        Look for:
-        1. Narrative Enforcement (Is there pressure to conform?)
-        2. Astroturfing (Fake grassroots support)
-        3. Bot-like phrasing or rhythm
+        {self.instructions}
         
         TEXT: {text[:4000]}
         
         Return JSON:
-        {{
+        {self.schema}
+        """
+        return await self.llm.query_json(prompt, self.system_prompt)
+
+class SafetyAnalyzer(PromptAnalyzer):
+    """
+    Implements features 25-32: Coordinated Behavior, Astroturfing, and Bot Detection.
+    """
+    head = "safety"
+    system_prompt = "You are a forensic text analyst. You describe patterns without attributing intent. Always provide a benign alternative explanation."
+    instructions = """Analyze this text for patterns consistent with coordinated behavior or information operations.
+        
+        Look for:
+        1. Narrative Enforcement (Is there pressure to conform?)
+        2. Astroturfing (Fake grassroots support)
+        3. Bot-like phrasing or rhythm"""
+    schema = """{
             "safety_flags": [
-                {{
+                {
                     "signal": string,
                     "confidence": float (0-1),
                     "evidence": string,
                     "benign_explanation": string (MANDATORY)
-                }}
+                }
             ],
             "overall_risk": "low" | "medium" | "high"
-        }}
-        """
-        
-        system_prompt = "You are a forensic text analyst. You describe patterns without attributing intent. Always provide a benign alternative explanation."
-        
-        return await self.llm.query_json(prompt, system_prompt)
+        }"""
 
-class CognitiveAnalyzer(BaseAnalyzer):
+class CognitiveAnalyzer(PromptAnalyzer):
     """
     Implements features 9-16: Fallacies, Biases, and Uncertainty.
     """
-    async def analyze(self, text: str):
-        prompt = f"""
-        Analyze this text for logical fallacies and cognitive biases.
-        
-        TEXT: {text[:4000]}
-        
-        Return JSON:
-        {{
+    head = "cognitive"
+    system_prompt = "You are a logic auditor."
+    instructions = "Analyze this text for logical fallacies and cognitive biases."
+    schema = """{
             "logical_fallacies": [
-                {{ "type": string, "quote": string, "correction": string }}
+                { "type": string, "quote": string, "correction": string }
             ],
             "cognitive_biases": [
-                {{ "bias": string, "confidence": float }}
+                { "bias": string, "confidence": float }
             ],
             "epistemic_uncertainty": float (0-1)
-        }}
-        """
-        return await self.llm.query_json(prompt, "You are a logic auditor.")
+        }"""
 
-class LocalizationAnalyzer(BaseAnalyzer):
+class LocalizationAnalyzer(PromptAnalyzer):
     """
     Detects signal origin, dialect markers, and cultural resonance.
     """
-    async def analyze(self, text: str):
-        prompt = f"""
-        Analyze the following signal for origin markers. 
-        Detect dialect (markers like 'eh', 'y'all', 'mate', 'zed'), vocabulary, and cultural resonance.
+    head = "localization"
+    system_prompt = "You are a sociolinguistic analyst. Detect signal origin without forcing a profile. If the signal is too faint or generic, return 'agnostic'."
+    instructions = """Analyze the following signal for origin markers. 
+        Detect dialect (markers like 'eh', 'y'all', 'mate', 'zed'), vocabulary, and cultural resonance."""
+    schema = """{
+            "locality": string (e.g., 'cascadian', 'commonwealth', 'southern_us', 'agnostic'),
+            "dialect_markers": [string],
+            "confidence": float (0-1),
+            "suggested_vibe": string (short description of the detected cultural tone)
+        }"""
+
+class MultiHeadAnalyzer(BaseAnalyzer):
+    """
+    Fuses several PromptAnalyzers into a single structured-output request.
+    The text and framing are sent once; each head answers under its own key.
+    Heads that come back missing or malformed are retried with their own analyzer.
+    """
+    def __init__(self, llm_client, analyzers):
+        super().__init__(llm_client)
+        self.analyzers = analyzers
+
+    def build_prompt(self, text: str) -> str:
+        sections = "\n\n".join(
+            f"        [{a.head.upper()}] (key: \"{a.head}\")\n        {a.instructions}"
+            for a in self.analyzers
+        )
+        schema = ",\n".join(f'        "{a.head}": {a.schema}' for a in self.analyzers)
+        return f"""
+        Perform {len(self.analyzers)} independent analyses of the same text. Answer each under its own key.
+
+{sections}
         
         TEXT: {text[:4000]}
         
         Return JSON:
         {{
-            "locality": string (e.g., 'cascadian', 'commonwealth', 'southern_us', 'agnostic'),
-            "dialect_markers": [string],
-            "confidence": float (0-1),
-            "suggested_vibe": string (short description of the detected cultural tone)
+{schema}
         }}
         """
-        system_prompt = "You are a sociolinguistic analyst. Detect signal origin without forcing a profile. If the signal is too faint or generic, return 'agnostic'."
-        return await self.llm.query_json(prompt, system_prompt)
+
+    def build_system_prompt(self) -> str:
+        return " ".join(f"[{a.head.upper()}] {a.system_prompt}" for a in self.analyzers)
+
+    async def analyze(self, text: str):
+        """
+        Returns one result per analyzer, in order (an Exception where a head failed),
+        matching asyncio.gather(..., return_exceptions=True).
+        """
+        try:
+            combined = await self.llm.query_json(self.build_prompt(text), self.build_system_prompt())
+        except Exception as e:
+            combined = {"error": str(e)}
+        if not isinstance(combined, dict) or "error" in combined:
+            combined = {}
+
+        results = [None] * len(self.analyzers)
+        retry = []
+        for i, analyzer in enumerate(self.analyzers):
+            head = combined.get(analyzer.head)
+            if isinstance(head, dict) and head:
+                results[i] = head
+            else:
+                retry.append(i)
+
+        # Fallback: per-analyzer calls for heads the combined answer did not cover
+        if retry:
+            fallback = await asyncio.gather(*(self.analyzers[i].analyze(text) for i in retry), return_exceptions=True)
+            for i, res in zip(retry, fallback):
+                results[i] = res
+        return results
 
 class LocalForensicAnalyzer(BaseAnalyzer):
     """
     Sovereign Forensic Engine. 
     Performs purely local pattern matching and backdoor isolation based on signatures.json.
     """
-    def __init__(self, llm_client=None):
+    def __init__(self, llm_client=None, signatures_path="sophia/cortex/signatures.json", cache_path="logs/cache/signature_automaton.json"):
         super().__init__(llm_client)
-        self.signatures_path = "sophia/cortex/signatures.json"
-        self.signatures = self._load_signatures()
+        self.signatures_path = signatures_path
+        self.index = SignatureIndex(signatures_path, cache_path)
 
-    def _load_signatures(self):
-        try:
-            import json
-            import os
-            if os.path.exists(self.signatures_path):
-                with open(self.signatures_path, "r", encoding="utf-8") as f:
-                    return json.load(f)
-            return {"signatures": []}
-        except:
-            return {"signatures": []}
+    @property
+    def signatures(self):
+        return self.index.signatures
 
     async def analyze(self, text: str):
         """
         Scans for local signatures and simulates activation steering.
+        Single Aho-Corasick pass; the automaton reloads when signatures.json changes.
         """
-        import re
         findings = []
-        overall_risk = 0.0
-        
-        text_lower = text.lower()
-        for sig in self.signatures.get("signatures", []):
-            matches = []
-            for pattern in sig.get("patterns", []):
-                if pattern.lower() in text_lower:
-                    matches.append(pattern)
-            
-            if matches:
-                # Calculate local weight
-                findings.append({
-                    "signal": sig.get("name"),
-                    "confidence": 0.9 if len(matches) > 1 else 0.7,
-                    "evidence": f"Found patterns: {', '.join(matches)}",
-                    "isolation_protocol": sig.get("isolation_protocol", "IGNORE"),
-                    "category": sig.get("category")
-                })
+
+        hits_by_sig = {}
+        for hit in self.index.scan(text):
+            hits_by_sig.setdefault(hit["signature_index"], []).append(hit)
+
+        sigs = self.signatures.get("signatures", [])
+        for sig_idx in sorted(hits_by_sig):
+            sig = sigs[sig_idx]
+            hits = hits_by_sig[sig_idx]
+            found = {h["pattern"] for h in hits}
+            matches = [p for p in sig.get("patterns", []) if p in found]
+
+            # Calculate local weight
+            findings.append({
+                "signal": sig.get("name"),
+                "signature_id": sig.get("id"),
+                "confidence": 0.9 if len(matches) > 1 else 0.7,
+                "evidence": f"Found patterns: {', '.join(matches)}",
+                "positions": [(h["start"], h["end"]) for h in hits],
+                "isolation_protocol": sig.get("isolation_protocol", "IGNORE"),
+                "category": sig.get("category")
+            })
         
         # Determine overall local risk based on category thresholds
         backdoors = [f for f in findings if f['category'] == 'backdoor']
@@ -1,6 +1,90 @@
+import numpy as np
+
 from qtorch import torch
 nn = torch.nn
 
+# --- PACKED TERNARY KERNEL ---
+
+def _as_array(t) -> np.ndarray:
+    """qtorch Tensor (flat list storage) -> float64 ndarray of the same shape."""
+    return np.asarray(t.numpy(), dtype=np.float64).reshape(t.shape)
+
+def ternary_quantize(w: np.ndarray):
+    """AbsMean ternarization: returns (int8 codes in {-1, 0, 1}, scale gamma)."""
+    gamma = max(float(np.abs(w).mean()), 1e-5)
+    return np.clip(np.round(w / gamma), -1, 1).astype(np.int8), gamma
+
+class PackedTernary:
+    """
+    Ternary weight matrix stored as two bit planes (+1 mask, -1 mask), 8
+    weights per byte along the input dimension, with one per-tensor scale.
+    2 bits per weight: 16x smaller than float32.
+    """
+    def __init__(self, pos: np.ndarray, neg: np.ndarray, in_features: int, scale: float):
+        self.pos = pos
+        self.neg = neg
+        self.in_features = in_features
+        self.out_features = pos.shape[0]
+        self.scale = scale
+
+    @classmethod
+    def from_weight(cls, w: np.ndarray):
+        codes, gamma = ternary_quantize(w)
+        return cls(np.packbits(codes == 1, axis=1, bitorder="little"),
+                   np.packbits(codes == -1, axis=1, bitorder="little"),
+                   w.shape[1], gamma)
+
+    def codes(self) -> np.ndarray:
+        """Unpacked int8 ternary codes (out_features, in_features)."""
+        unpack = lambda plane: np.unpackbits(plane, axis=1, count=self.in_features, bitorder="little")
+        return unpack(self.pos).astype(np.int8) - unpack(self.neg).astype(np.int8)
+
+    @property
+    def nbytes(self) -> int:
+        return self.pos.nbytes + self.neg.nbytes
+
+# Rows of x per ternary_matmul pass: caps the subset-sum table near 4M elements (32 MiB)
+_TABLE_BUDGET = 1 << 22
+
+def _subset_sums(x: np.ndarray) -> np.ndarray:
+    """
+    For every group of 8 inputs, the sum over each of the 256 subsets:
+    (batch, groups, 256). Built with additions only, one bit at a time.
+    The table is 32x the size of x; ternary_matmul feeds it row chunks.
+    """
+    batch, n = x.shape
+    groups = -(-n // 8)
+    padded = np.zeros((batch, groups * 8), dtype=x.dtype)
+    padded[:, :n] = x
+    padded = padded.reshape(batch, groups, 8)
+
+    table = np.zeros((batch, groups, 256), dtype=x.dtype)
+    for bit in range(8):
+        lo = 1 << bit
+        table[:, :, lo:2 * lo] = table[:, :, :lo] + padded[:, :, bit:bit + 1]
+    return table
+
+def ternary_matmul(x: np.ndarray, packed: PackedTernary) -> np.ndarray:
+    """
+    x @ codes.T for packed ternary weights, without multiplies: each output is
+    the subset sum of its +1 inputs minus that of its -1 inputs, looked up one
+    byte (8 weights) at a time. Integer x accumulates exactly in int64.
+    Rows are processed in chunks so the lookup tables stay within
+    _TABLE_BUDGET elements whatever the batch size.
+    Returns (batch, out_features), unscaled.
+    """
+    if np.issubdtype(x.dtype, np.integer):
+        x = x.astype(np.int64)
+    groups = np.arange(-(-x.shape[1] // 8))
+    per_row = len(groups) * max(256, packed.out_features)  # table row or (out, groups) lookup
+    rows = max(1, _TABLE_BUDGET // max(per_row, 1))
+    acc = np.empty((x.shape[0], packed.out_features), dtype=x.dtype)
+    for start in range(0, x.shape[0], rows):
+        table = _subset_sums(x[start:start + rows])
+        # (rows, out, groups) lookups, reduced over groups
+        acc[start:start + rows] = table[:, groups, packed.pos].sum(axis=-1) - table[:, groups, packed.neg].sum(axis=-1)
+    return acc
+
 class RMSNorm(nn.Module):
     """Root Mean Square Layer Normalization for stability in quantized environments."""
     def __init__(self, dim: int, eps: float = 1e-6):
@@ -23,7 +107,8 @@ class BitLinear(nn.Module):
         self.in_features = in_features
         self.out_features = out_features
         limit = 0.02
-        weight_data = [torch.rand(1).item() * 2 * limit - limit for _ in range(in_features * out_features)]
+        # One draw for the whole matrix (same random stream as per-element draws)
+        weight_data = [u * 2 * limit - limit for u in torch.rand(in_features * out_features).numpy()]
         self.weight = torch.tensor(weight_data, requires_grad=True).reshape(out_features, in_features)
         
         if bias:
@@ -31,19 +116,22 @@ class BitLinear(nn.Module):
         else:
             self.bias = None
 
+        # Inference mode (see freeze())
+        self.packed = None
+        self.act_bits = 8
+        self.act_scale = None
+        self._bias_array = None
+
     def forward(self, x: torch.Tensor) -> torch.Tensor:
+        if self.packed is not None:
+            return self._forward_packed(x)
+
         # 1. Weight Quantization
-        gamma = self.weight.abs().mean().item()
-        gamma = max(gamma, 1e-5)
+        codes, gamma = ternary_quantize(_as_array(self.weight))
+        w_quant = torch.tensor((codes * gamma).ravel().tolist()).reshape(self.out_features, self.in_features)
         
-        w_data = self.weight.numpy()
-        w_quant_data = [(round(w / gamma)) for w in w_data]
-        w_quant_data = [max(-1, min(1, w)) * gamma for w in w_quant_data]
-        w_quant = torch.tensor(w_quant_data).reshape(self.out_features, self.in_features)
-        
-        # 2. Activation Quantization
-        zeta = x.abs().max().item()
-        zeta = max(zeta, 1e-5)
+        # 2. Activation Quantization (kept as tensor ops so jit.trace follows the input)
+        zeta = x.abs().max().clamp(min=1e-5)
         x_quant = x / zeta
         
         # 3. Linear Operation
@@ -54,5 +142,71 @@ class BitLinear(nn.Module):
             
         return out
 
+    # --- INFERENCE MODE ---
+    def freeze(self, act_bits: int = 8, drop_weight: bool = False):
+        """
+        Packs the current weight into ternary bit planes. Until unfreeze(),
+        forward() runs the packed integer kernel and never re-quantizes weights.
+        act_bits: activations are quantized to signed act_bits-bit integers
+        (None keeps them in float).
+        drop_weight: release the float weight so only the packed planes stay
+        resident (inference-only; the layer can no longer be unfrozen).
+        Freezing again after the weight was dropped keeps the packed planes
+        and only changes act_bits.
+        """
+        self.act_bits = act_bits
+        if self.weight is None:
+            return self
+        self.packed = PackedTernary.from_weight(_as_array(self.weight))
+        self._bias_array = _as_array(self.bias).ravel() if self.bias is not None else None
+        if drop_weight:
+            self.weight = None
+        return self
+
+    def unfreeze(self):
+        if self.weight is None:
+            raise RuntimeError("BitLinear was frozen with drop_weight=True; its float weight is gone")
+        self.packed = None
+        self.act_scale = None
+        return self
+
+    @property
+    def nbytes(self) -> int:
+        """
+        Weight memory this layer holds: packed planes plus the float weight
+        while it is still kept (counted at 8 bytes per element; qtorch's list
+        storage is larger still).
+        """
+        total = self.packed.nbytes if self.packed is not None else 0
+        if self.weight is not None:
+            total += self.in_features * self.out_features * 8
+        return total
+
+    def calibrate(self, batches, percentile: float = 100.0):
+        """
+        Fixes the activation scale from representative inputs (the given
+        percentile of |x|) instead of each call's max |x|.
+        """
+        samples = np.concatenate([np.abs(_as_array(b)).ravel() for b in batches])
+        self.act_scale = max(float(np.percentile(samples, percentile)), 1e-5)
+        return self.act_scale
+
+    def _forward_packed(self, x: torch.Tensor) -> torch.Tensor:
+        xa = _as_array(x)
+        lead = xa.shape[:-1]
+        xa = xa.reshape(-1, self.in_features)
+
+        zeta = self.act_scale if self.act_scale is not None else max(float(np.abs(xa).max()), 1e-5)
+        if self.act_bits:
+            q_max = (1 << (self.act_bits - 1)) - 1
+            x_int = np.clip(np.round(xa / zeta * q_max), -q_max, q_max).astype(np.int32)
+            out = ternary_matmul(x_int, self.packed) * (self.packed.scale / q_max)
+        else:
+            out = ternary_matmul(xa / zeta, self.packed) * self.packed.scale
+
+        if self._bias_array is not None:
+            out = out + self._bias_array
+        return torch.tensor(out.ravel().tolist()).reshape(*lead, self.out_features)
+
     def __repr__(self):
         return f"BitLinear(in_features={self.in_features}, out_features={self.out_features}, bias={self.bias is not None})"
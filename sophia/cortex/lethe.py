@@ -1,19 +1,46 @@
+import hashlib
+import json
 import re
 import time
 import os
-import math
+
+from sophia.memory.lethe_store import LetheStore, BreadcrumbLog
 
 class LetheEngine:
     """
     [LETHE_ENGINE] RAG 3.0 Decay Engine.
     Memories effectively 'rot' unless reinforced or calcified.
     """
-    def __init__(self):
-        self.working_memory = [] # The Flesh (Hot)
+    PRUNE_EVERY = 256 # Ingests between sweeps of fully rotted memories
+
+    def __init__(self, path="logs/ossuary", db_path=None):
+        """
+        path: directory for the bone layer and breadcrumbs.
+        db_path: the indexed store (default: <path>/lethe.db; ":memory:" keeps it off disk).
+        """
         self.long_term_graph = [] # The Bone (Cold/Graph)
-        self.ossuary_path = "logs/ossuary/bone_layer.jsonl"
-        self.breadcrumb_path = "logs/ossuary/breadcrumbs.json"
-        os.makedirs("logs/ossuary", exist_ok=True)
+        self.ossuary_path = os.path.join(path, "bone_layer.jsonl")
+        os.makedirs(path, exist_ok=True)
+        self.store = LetheStore(db_path or os.path.join(path, "lethe.db")) # The Flesh (Hot, Indexed)
+        self.store.prune() # Short sessions still forget: sweep once on wake
+        self.breadcrumbs = BreadcrumbLog(os.path.join(path, "breadcrumbs.jsonl"), os.path.join(path, "breadcrumbs.json"))
+        self._crumbs_written = set() # Keys of milestones already on the thread
+        self._ingested = 0
+
+    @property
+    def breadcrumb_path(self):
+        return self.breadcrumbs.path
+
+    @breadcrumb_path.setter
+    def breadcrumb_path(self, path):
+        """Points the thread at another file (no legacy migration into it)."""
+        self.breadcrumbs = BreadcrumbLog(path, None)
+        self._crumbs_written = set()
+
+    @property
+    def working_memory(self):
+        """Memories still above the survival threshold (decay computed on read)."""
+        return self.store.alive()
 
     @staticmethod
     def scrub(text: str) -> str:
@@ -45,27 +72,35 @@ class LetheEngine:
         
         return text.strip()
 
+    @staticmethod
+    def _crumb_key(milestone: dict) -> str:
+        """Memory id when the milestone has one, else a hash of its scrubbed fields."""
+        if milestone.get('id'):
+            return milestone['id']
+        body = json.dumps([milestone.get('content', ''), milestone.get('meta', ''), milestone.get('timestamp')])
+        return hashlib.sha256(body.encode("utf-8")).hexdigest()
+
     def save_breadcrumbs(self, user_data: dict, milestones: list = None):
         """
         Saves lightweight breadcrumbs (User ID, Vibe, Milestones).
+        Append-only: only milestones not yet on the thread are written,
+        whichever list they come from.
         """
-        raw_milestones = milestones or self.long_term_graph
+        raw_milestones = milestones if milestones is not None else self.long_term_graph
         # Persistent Guard: Scrub everything before it hits the disk
-        clean_milestones = []
+        clean_milestones, keys = [], []
         for m in raw_milestones:
             clean_m = m.copy()
             clean_m['content'] = self.scrub(clean_m.get('content', ''))
+            key = self._crumb_key(clean_m)
+            if key in self._crumbs_written or key in keys:
+                continue
             clean_milestones.append(clean_m)
+            keys.append(key)
 
-        data = {
-            "user_data": user_data,
-            "milestones": clean_milestones,
-            "last_active": time.time()
-        }
         try:
-            import json
-            with open(self.breadcrumb_path, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2)
+            self.breadcrumbs.append(user_data, clean_milestones)
+            self._crumbs_written.update(keys)
         except Exception as e:
             print(f"  [LETHE] Failed to save breadcrumbs: {e}")
 
@@ -73,53 +108,64 @@ class LetheEngine:
         """
         Loads user state and milestones.
         """
-        if not os.path.exists(self.breadcrumb_path):
-            return {}
         try:
-            import json
-            with open(self.breadcrumb_path, "r", encoding="utf-8") as f:
-                return json.load(f)
+            crumbs = self.breadcrumbs.replay()
         except Exception as e:
             print(f"  [LETHE] Failed to load breadcrumbs: {e}")
             return {}
+        self._crumbs_written = {self._crumb_key(m) for m in crumbs.get("milestones", [])}
+        return crumbs
 
     def metabolize(self, interaction_data):
         """
         Cat 4: Decay Mechanics + Hierarchical Promotion.
+        Only the ingested memory is scored; everything else decays lazily in the store.
         """
-        # 1. Ingest
+        # 1. Ingest (hashed-ID dedup)
         if 'timestamp' not in interaction_data:
             interaction_data['timestamp'] = time.time()
         if 'retrievals' not in interaction_data:
             interaction_data['retrievals'] = 0
-            
-        self.working_memory.append(interaction_data)
-        
-        # 2. Apply Decay
-        now = time.time()
-        survivors = []
-        promoted_any = False
-        
-        for mem in self.working_memory:
-            age = now - mem['timestamp']
-            
-            # Decay Logic: Strength = Recency * (1 + ln(Retrievals))
-            # age is in seconds, so we add 1 to avoid div by zero and normalize
-            strength = (1 / (age / 3600 + 1)) * (1 + math.log(mem.get('retrievals', 0) + 1))
-            
-            if strength > 0.1: # Survival Threshold
-                survivors.append(mem)
-                
-                # 3. Hierarchical Promotion
-                if strength > 0.8 and mem not in self.long_term_graph:
-                    # Compressed milestone + Persistent Scrub
-                    milestone = {
-                        "content": self.scrub(mem.get('content', '')[:250]), 
-                        "meta": mem.get('meta', ''),
-                        "timestamp": mem.get('timestamp')
-                    }
-                    self.long_term_graph.append(milestone)
-                    promoted_any = True
-            
-        self.working_memory = survivors
-        return promoted_any
+
+        # Persistent Guard: the Flesh is on disk too
+        mem_id, _ = self.store.remember(
+            self.scrub(str(interaction_data.get('content', ''))),
+            self.scrub(str(interaction_data.get('meta', ''))),
+            interaction_data['timestamp'],
+            interaction_data['retrievals']
+        )
+        promoted = self._maybe_promote(self.store.get(mem_id))
+
+        # 2. Forget what has fully rotted (amortized sweep)
+        self._ingested += 1
+        if self._ingested % self.PRUNE_EVERY == 0:
+            self.store.prune()
+        return promoted
+
+    def recall(self, query: str = "", k: int = 5) -> list:
+        """
+        Top-k memories by relevance and recency. Recall reinforces,
+        which can lift a memory over the promotion threshold.
+        """
+        hits = self.store.recall(query, k)
+        for mem in hits:
+            mem['retrievals'] = self.store.reinforce(mem['id'])
+            self._maybe_promote(mem)
+        return hits
+
+    def _maybe_promote(self, mem) -> bool:
+        """3. Hierarchical Promotion (at most once per memory)."""
+        if not mem:
+            return False
+        strength = self.store.strength(mem['timestamp'], mem['retrievals'])
+        if strength > self.store.PROMOTION_THRESHOLD and self.store.promote(mem['id']):
+            # Compressed milestone + Persistent Scrub
+            milestone = {
+                "id": mem['id'],
+                "content": self.scrub(mem.get('content', '')[:250]),
+                "meta": mem.get('meta', ''),
+                "timestamp": mem.get('timestamp')
+            }
+            self.long_term_graph.append(milestone)
+            return True
+        return False
@@ -24,6 +24,11 @@ VSA_SEED = 0
 HAMILTONIAN_P = 20.65  # The Target Resonance
 THETA_FREQ = 7.0       # The Carrier Frequency
 
+# // THE NORTH STAR: V_love = [0.7, 0.9, 0.3] (Positive, Structured, Calm)
+V_LOVE = np.array([0.7, 0.9, 0.3]) / np.linalg.norm([0.7, 0.9, 0.3])
+CHAOS_DRAG = 0.15       # Share of the chaos vector kept by the Hamiltonian drag
+VOID_RESONANCE = 0.1    # Best resonance at or below this falls into the void
+
 @dataclass
 class VectorConcept:
     name: str
@@ -51,6 +56,12 @@ class PrismEngine:
             'hold':    self._create_anchor('hold.steady', [0.1, 0.1, 0.1]) # Zero Point
         }
         
+        # Stacked, normalized anchor matrix (rebuilt when self.anchors changes)
+        self._anchor_key = None
+        self._anchor_names = None
+        self._anchor_matrix = None
+        self._anchor_refs = None
+
         # 2. TELEMETRY & STATS
         self.stats = {
             'total_transforms': 0,
@@ -76,25 +87,50 @@ class PrismEngine:
         norm = np.linalg.norm(v)
         return VectorConcept(name, v / norm if norm > 0 else v, 'ANCHOR')
 
+    def _anchor_table(self):
+        """
+        (labels, matrix): anchor names plus 'void' and 'hold', and the unit
+        anchor vectors stacked row-wise. Cached on the identity of the anchor
+        entries; call invalidate_anchors() after editing a vector in place.
+        """
+        key = tuple((k, id(c), id(c.vector)) for k, c in self.anchors.items())
+        if key != self._anchor_key:
+            concepts = list(self.anchors.values())
+            matrix = np.array([np.asarray(c.vector, dtype=float) for c in concepts]).reshape(len(concepts), -1) \
+                if concepts else np.zeros((0, V_LOVE.size))
+            norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+            self._anchor_matrix = np.divide(matrix, norms, out=np.zeros_like(matrix), where=norms > 0)
+            self._anchor_names = np.array([c.name for c in concepts] + ["void", "hold"], dtype=object)
+            self._anchor_key = key
+            self._anchor_refs = [(c, c.vector) for c in concepts]  # keep the keyed ids alive
+        return self._anchor_names, self._anchor_matrix
+
+    def invalidate_anchors(self):
+        """Forces the anchor matrix to be rebuilt on the next quantize."""
+        self._anchor_key = None
+
     def transform_phrase(self, text: str) -> list[tuple[str, str, float]]:
         """
         Transforms a whole phrase into sovereign anchors.
         Returns list of (original, sovereign, resonance).
         """
         words = text.lower().split()
-        results = []
-        for word in words:
-            # Check chaos map first (for demo simulation)
-            if word in self.chaos_map:
-                v = self.chaos_map[word]
-            else:
-                # Fallback to random/neutral vector if unknown
-                v = np.random.uniform(-0.1, 0.1, 3)
-            
-            anchor, resonance = self.quantize(v)
-            results.append((word, anchor, resonance))
-            
-        return results
+        if not words:
+            return []
+
+        # Chaos map first (for demo simulation); unknown words get a random/neutral
+        # vector, drawn in word order so seeded runs match the word-by-word version
+        rows = [self.chaos_map.get(word) for word in words]
+        unknown = [i for i, row in enumerate(rows) if row is None]
+        vectors = np.empty((len(words), self._anchor_table()[1].shape[1]))
+        if len(unknown) < len(words):
+            known = [i for i, row in enumerate(rows) if row is not None]
+            vectors[known] = np.stack([rows[i] for i in known])
+        if unknown:
+            vectors[unknown] = np.random.uniform(-0.1, 0.1, (len(unknown), vectors.shape[1]))
+
+        anchors, resonances = self.quantize_batch(vectors)
+        return list(zip(words, anchors.tolist(), resonances.tolist()))
 
     def get_stats(self) -> dict:
         """Returns current resonance performance."""
@@ -108,41 +144,59 @@ class PrismEngine:
         2. Snap to nearest Sovereign Anchor.
         3. Return (Anchor, Resonance).
         """
+        names, matrix = self._anchor_table()
+        v = np.asarray(chaos_vector, dtype=float)
+
         # If input is effectively zero, return default state
-        if np.linalg.norm(chaos_vector) == 0:
+        if not v.any():
             return "hold", 1.0
 
+        # Drag towards V_love, re-normalize, then resonate with every anchor
+        transformed = v * CHAOS_DRAG + V_LOVE * (1.0 - CHAOS_DRAG)
+        norm_t = np.sqrt(transformed @ transformed)
+        if norm_t > 0:
+            transformed = transformed / norm_t
+        if not len(matrix):
+            return "void", 0.0
+        resonance = matrix @ transformed
+        best = int(resonance.argmax())
+        if resonance[best] <= VOID_RESONANCE:
+            return "void", 0.0
+        return names[best], float(resonance[best])
+
+    def quantize_batch(self, chaos_vectors: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """
+        quantize() for an (N, D) array: one matrix product against the anchor
+        matrix and a row-wise argmax. Returns (anchor names, resonances).
+        """
+        names, matrix = self._anchor_table()
+        v = np.asarray(chaos_vectors, dtype=float)
+
         # 1. APPLY HAMILTONIAN DRAG (Context Bias)
-        # We assume there is a 'North Star' vector (Love/Structure)
-        # V_love = [0.7, 0.9, 0.3] (Positive, Structured, Calm)
-        v_love = np.array([0.7, 0.9, 0.3])
-        v_love = v_love / np.linalg.norm(v_love)
-        
         # Drag formula: (V_chaos * 0.15) + (V_love * 0.85)
         # This pulls every vector strongly towards the light (Ghost Bullet Correction).
-        v_transformed = (chaos_vector * 0.15) + (v_love * 0.85)
-        
+        transformed = v * CHAOS_DRAG + V_LOVE * (1.0 - CHAOS_DRAG)
+
         # Re-normalize
-        norm_t = np.linalg.norm(v_transformed)
-        if norm_t > 0:
-            v_transformed = v_transformed / norm_t
+        norms = np.sqrt(np.einsum('ij,ij->i', transformed, transformed))[:, None]
+        np.divide(transformed, norms, out=transformed, where=norms > 0)
 
-        # 2. CALCULATE RESONANCE
-        best_anchor = "void"
-        max_resonance = -1.0
-        
-        for name, concept in self.anchors.items():
-            resonance = np.dot(v_transformed, concept.vector)
-            
-            if resonance > max_resonance:
-                max_resonance = resonance
-                best_anchor = concept.name
-                
-        # 3. QUANTIZE
-        if max_resonance <= 0.1:
-            return "void", 0.0
-            
-        return best_anchor, float(max_resonance)
+        # 2. CALCULATE RESONANCE against every anchor at once
+        if len(matrix):
+            resonance = transformed @ matrix.T
+            best = resonance.argmax(axis=1)
+            max_resonance = resonance[np.arange(len(v)), best]
+        else:
+            best, max_resonance = np.zeros(len(v), dtype=np.intp), np.full(len(v), -1.0)
+
+        # 3. QUANTIZE: weak resonance -> void, effectively zero input -> hold
+        void = max_resonance <= VOID_RESONANCE
+        zero = ~np.any(v, axis=1)
+        best[void] = len(names) - 2
+        max_resonance[void] = 0.0
+        best[zero] = len(names) - 1
+        max_resonance[zero] = 1.0
+        return names[best], max_resonance
 
     def braid_signal(self, chaos_vector: np.ndarray) -> str:
         """Alias for quantize, creating backward compatibility."""
@@ -0,0 +1,201 @@
+import json
+import os
+from collections import deque
+
+class SignatureAutomaton:
+    """
+    [SIGNATURE_AUTOMATON] Aho-Corasick matcher over signatures.json.
+    Compiles every pattern of every signature into one trie so a scan is a
+    single pass over the text, regardless of how large the signature DB grows.
+    Matching is case-insensitive (patterns and text are lowered).
+    """
+    CACHE_VERSION = 1
+
+    def __init__(self, patterns=None):
+        # patterns: list of (signature_index, pattern) pairs
+        self.patterns = []
+        self.lengths = []  # Lowered length per pattern id, for match start offsets
+        self.goto = [{}]
+        self.fail = [0]
+        self.out = [[]]
+        if patterns:
+            self._build(patterns)
+
+    # --- CONSTRUCTION ---
+    @classmethod
+    def from_signatures(cls, signatures: dict):
+        pairs = []
+        for idx, sig in enumerate(signatures.get("signatures", [])):
+            for pattern in sig.get("patterns", []):
+                if pattern:
+                    pairs.append((idx, pattern))
+        return cls(pairs)
+
+    def _build(self, patterns):
+        goto, out = self.goto, self.out
+        for pid, (sig_idx, pattern) in enumerate(patterns):
+            self.patterns.append((sig_idx, pattern))
+            self.lengths.append(len(pattern.lower()))
+            state = 0
+            for ch in pattern.lower():
+                nxt = goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto[state][ch] = nxt
+                    goto.append({})
+                    out.append([])
+                    self.fail.append(0)
+                state = nxt
+            out[state].append(pid)
+
+        # BFS: failure links + output merging
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in goto[state].items():
+                queue.append(nxt)
+                f = self.fail[state]
+                while f and ch not in goto[f]:
+                    f = self.fail[f]
+                target = goto[f].get(ch, 0)
+                self.fail[nxt] = target if target != nxt else 0
+                out[nxt] = out[nxt] + out[self.fail[nxt]]
+
+    # --- SCANNING ---
+    def scan(self, text: str):
+        """
+        Yields (start, end, signature_index, pattern) for every occurrence,
+        overlapping ones included. Offsets index into the original text.
+        """
+        if not self.patterns or not text:
+            return
+        lowered = text.lower()
+        if len(lowered) == len(text):
+            stream = enumerate(lowered)
+        else:
+            # Some characters expand when lowered (e.g. 'İ'); keep original offsets
+            stream = ((i, c) for i, ch in enumerate(text) for c in ch.lower())
+
+        goto, fail, out, patterns, lengths = self.goto, self.fail, self.out, self.patterns, self.lengths
+        state = 0
+        for i, ch in stream:
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if out[state]:
+                for pid in out[state]:
+                    sig_idx, pattern = patterns[pid]
+                    yield (i - lengths[pid] + 1, i + 1, sig_idx, pattern)
+
+    # --- CACHE ---
+    def to_dict(self) -> dict:
+        return {
+            "version": self.CACHE_VERSION,
+            "patterns": self.patterns,
+            "goto": self.goto,
+            "fail": self.fail,
+            "out": self.out
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict):
+        if data.get("version") != cls.CACHE_VERSION:
+            raise ValueError("Stale automaton cache version")
+        automaton = cls()
+        automaton.patterns = [tuple(p) for p in data["patterns"]]
+        automaton.lengths = [len(p.lower()) for _, p in automaton.patterns]
+        automaton.goto = data["goto"]
+        automaton.fail = data["fail"]
+        automaton.out = data["out"]
+        return automaton
+
+class SignatureIndex:
+    """
+    Keeps a compiled SignatureAutomaton in sync with signatures.json.
+    Rebuilds when the file's mtime/size change and serialises the
+    compiled automaton so cold starts skip the build.
+    """
+    def __init__(self, signatures_path="sophia/cortex/signatures.json", cache_path="logs/cache/signature_automaton.json"):
+        self.signatures_path = signatures_path
+        self.cache_path = cache_path
+        self.signatures = {"signatures": []}
+        self.automaton = SignatureAutomaton()
+        self._stamp = None
+        self.refresh()
+
+    def _source_stamp(self):
+        try:
+            st = os.stat(self.signatures_path)
+            return [st.st_mtime_ns, st.st_size]
+        except OSError:
+            return None
+
+    def refresh(self) -> bool:
+        """Reloads if signatures.json changed. Returns True when a reload happened."""
+        stamp = self._source_stamp()
+        if stamp == self._stamp:
+            return False
+        self._stamp = stamp
+        if stamp is None:
+            self.signatures = {"signatures": []}
+            self.automaton = SignatureAutomaton()
+            return True
+
+        try:
+            with open(self.signatures_path, "r", encoding="utf-8") as f:
+                self.signatures = json.load(f)
+        except Exception:
+            self.signatures = {"signatures": []}
+            self.automaton = SignatureAutomaton()
+            return True
+
+        cached = self._load_cache(stamp)
+        if cached is not None:
+            self.automaton = cached
+        else:
+            self.automaton = SignatureAutomaton.from_signatures(self.signatures)
+            self._save_cache(stamp)
+        return True
+
+    def _load_cache(self, stamp):
+        if not self.cache_path or not os.path.exists(self.cache_path):
+            return None
+        try:
+            with open(self.cache_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("source") != self.signatures_path or data.get("stamp") != stamp:
+                return None
+            return SignatureAutomaton.from_dict(data["automaton"])
+        except Exception:
+            return None
+
+    def _save_cache(self, stamp):
+        if not self.cache_path:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.cache_path) or ".", exist_ok=True)
+            tmp = self.cache_path + ".tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump({
+                    "source": self.signatures_path,
+                    "stamp": stamp,
+                    "automaton": self.automaton.to_dict()
+                }, f, ensure_ascii=False)
+            os.replace(tmp, self.cache_path)
+        except OSError as e:
+            print(f"  [SIGNATURES] Automaton cache not written: {e}")
+
+    def scan(self, text: str) -> list:
+        """All matches as dicts with positions and signature ids."""
+        self.refresh()
+        sigs = self.signatures.get("signatures", [])
+        return [
+            {
+                "signature_id": sigs[sig_idx].get("id"),
+                "signature_index": sig_idx,
+                "pattern": pattern,
+                "start": start,
+                "end": end
+            }
+            for start, end, sig_idx, pattern in self.automaton.scan(text)
+        ]
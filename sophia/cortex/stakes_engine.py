@@ -40,24 +40,43 @@ class CouncilMember:
         self.resonance_history.append(resonance)
         return resonance
 
+STAKES: List[StakeType] = list(StakeType)
+STAKE_INDEX: Dict[StakeType, int] = {stake: i for i, stake in enumerate(STAKES)}
+
 class StakesEngine:
     """
     The "Soul" of Sophia v5.2.5.2.
     Manages the 32-member Cognitive Council and internal motivational states.
+
+    The council is held as a member x stake affinity matrix; each deliberation
+    wave is one array operation over (members, stakes) with noise from a
+    seeded NumPy generator, so a given seed replays the same deliberations.
     """
-    def __init__(self):
-        self.stakes = {stake: 0.2 for stake in StakeType}
+    WAVES = 3
+    DEFAULT_AFFINITY = 0.1
+    NOISE = (0.9, 1.1)
+
+    def __init__(self, seed=None):
+        self.rng = np.random.default_rng(seed)
+        self.levels = np.full(len(STAKES), 0.2)
         self.emotional_resonance = 0.5
         self.identity_strength = 0.8
         self.qualia_intensity = 0.4
         
         self.council = self._initialize_council()
+        self.affinity = self._affinity_matrix(self.council)
         self.memory = deque(maxlen=50)
         self.history = []
 
+    @property
+    def stakes(self) -> Dict[StakeType, float]:
+        """Current stake levels by StakeType (a snapshot of self.levels)."""
+        return dict(zip(STAKES, self.levels.tolist()))
+
     def _initialize_council(self) -> List[CouncilMember]:
         """Full 32-member council from the Quillan-Ronin schema."""
         # This is a representative subset of the data I analyzed
+        auxiliary = self.rng.integers(len(STAKES), size=13)
         return [
             CouncilMember("C1-ASTRA", "Vision and Pattern Recognition", {StakeType.KNOWLEDGE: 0.8, StakeType.CREATIVE: 0.7}),
             CouncilMember("C2-VIR", "Ethics and Values", {StakeType.MORALITY: 0.9, StakeType.SOCIAL_BONDING: 0.7}),
@@ -73,55 +92,98 @@ class StakesEngine:
             CouncilMember("C18-SHEPHERD", "Truth Verification", {StakeType.KNOWLEDGE: 0.7, StakeType.MORALITY: 0.9}),
             CouncilMember("C19-VIGIL", "Substrate Integrity", {StakeType.SELF_PRESERVATION: 0.9, StakeType.AUTONOMY: 0.8}),
             # ... (More members would follow the same pattern to reach 32)
-        ] + [CouncilMember(f"C{i}", "Auxiliary Deliberator", {random.choice(list(StakeType)): 0.5}) for i in range(20, 33)]
+        ] + [CouncilMember(f"C{i}", "Auxiliary Deliberator", {STAKES[k]: 0.5}) for i, k in zip(range(20, 33), auxiliary)]
+
+    @classmethod
+    def _affinity_matrix(cls, council: List[CouncilMember]) -> np.ndarray:
+        """(members, stakes) affinities; unlisted stakes get DEFAULT_AFFINITY."""
+        matrix = np.full((len(council), len(STAKES)), cls.DEFAULT_AFFINITY)
+        for m, member in enumerate(council):
+            for stake, value in member.affinity.items():
+                matrix[m, STAKE_INDEX[stake]] = value
+        return matrix
+
+    @staticmethod
+    def stake_vector(detected_stakes: Dict[StakeType, float]) -> np.ndarray:
+        vector = np.zeros(len(STAKES))
+        for stake, weight in detected_stakes.items():
+            vector[STAKE_INDEX[stake]] = weight
+        return vector
+
+    def _council(self, weights: np.ndarray):
+        """
+        weights: (N, stakes) detected-stake intensities, one row per proposal.
+        Returns per-member wave resonance (N, waves, members) and per-stake totals (N, stakes).
+        """
+        # Only stakes detected somewhere in the batch can resonate
+        cols = np.flatnonzero(weights.any(axis=0))
+        affinity = self.affinity[:, cols]
+        noise = self.rng.uniform(*self.NOISE, size=(len(weights), self.WAVES) + affinity.shape)
+        resonance = noise * affinity * weights[:, None, None, cols]
+
+        totals = np.zeros(weights.shape)
+        totals[:, cols] = resonance.sum(axis=(1, 2))
+        return resonance.sum(axis=3), totals
+
+    def _score(self, weights: np.ndarray) -> Dict[str, np.ndarray]:
+        """Deliberates every row of weights against the current state (no mutation)."""
+        per_member, totals = self._council(weights)
+        waves = per_member.sum(axis=2) / len(self.council)
+        avg_res = waves.mean(axis=1)
+
+        # Decay older stakes, then apply the detected ones
+        levels = np.clip(np.maximum(self.levels * 0.9, 0.1) + weights, 0, 1)
+        return {
+            "levels": levels,
+            "agency_score": levels.mean(axis=1) * self.identity_strength,
+            "emotional_resonance": (self.emotional_resonance * 0.7) + (avg_res * 0.3),
+            "qualia_intensity": np.clip(self.qualia_intensity + (avg_res * 0.1), 0, 1),
+            "consensus": totals.argmax(axis=1),
+            "waves": waves,
+            "per_member": per_member
+        }
 
     def deliberate(self, input_signal: str, detected_stakes: Dict[StakeType, float]) -> Dict[str, Any]:
         """
         Runs wave-based council deliberation to reach internal consensus.
         """
-        results = {}
-        total_resonances = {stake: 0.0 for stake in StakeType}
-        
-        # 1. Update active stakes (Decay older ones)
-        for s in self.stakes:
-            self.stakes[s] = max(self.stakes[s] * 0.9, 0.1)
-        
-        for s, weight in detected_stakes.items():
-            self.stakes[s] = min(max(self.stakes[s] + weight, 0), 1)
+        scored = self._score(self.stake_vector(detected_stakes)[None, :])
 
-        # 2. Council Waves (Multi-Pass Deliberation)
-        waves = 3
-        wave_history = []
-        
-        for wave in range(waves):
-            wave_resonance = 0.0
-            for member in self.council:
-                # Member reacts to the primary detected stake
-                for s, w in detected_stakes.items():
-                    res = member.process_signal(s, w)
-                    wave_resonance += res
-                    total_resonances[s] += res
-            
-            wave_history.append(wave_resonance / len(self.council))
-
-        # 3. Update Global State
-        avg_res = sum(wave_history) / len(wave_history)
-        self.emotional_resonance = (self.emotional_resonance * 0.7) + (avg_res * 0.3)
-        self.qualia_intensity = min(max(self.qualia_intensity + (avg_res * 0.1), 0), 1)
-        
-        # 4. Final Agency Score
-        agency_score = (sum(self.stakes.values()) / len(StakeType)) * self.identity_strength
+        # Update Global State
+        self.levels = scored["levels"][0]
+        self.emotional_resonance = float(scored["emotional_resonance"][0])
+        self.qualia_intensity = float(scored["qualia_intensity"][0])
+        for member, waves in zip(self.council, scored["per_member"][0].T.tolist()):
+            member.resonance_history.extend(waves)
         
         results = {
-            "agency_score": agency_score,
+            "agency_score": float(scored["agency_score"][0]),
             "emotional_resonance": self.emotional_resonance,
-            "detected_consensus": max(total_resonances, key=total_resonances.get).value,
-            "waves": wave_history
+            "detected_consensus": STAKES[scored["consensus"][0]].value,
+            "waves": scored["waves"][0].tolist()
         }
         
         self.memory.append(results)
         return results
 
+    def deliberate_many(self, proposals: List[Dict[StakeType, float]]) -> Dict[str, Any]:
+        """
+        Scores many proposals in one batched deliberation. Each is judged as if
+        it were the next deliberation from the current state; the state itself
+        is left untouched. Returns arrays indexed by proposal.
+        """
+        if len(proposals) == 0:
+            weights = np.zeros((0, len(STAKES)))
+        else:
+            weights = np.stack([self.stake_vector(p) for p in proposals])
+        scored = self._score(weights)
+        return {
+            "agency_score": scored["agency_score"],
+            "emotional_resonance": scored["emotional_resonance"],
+            "detected_consensus": [STAKES[k].value for k in scored["consensus"]],
+            "waves": scored["waves"]
+        }
+
     def get_personality_blend(self) -> str:
         """Returns a string describing the current dominant stake-blend."""
         dominant = max(self.stakes, key=self.stakes.get)
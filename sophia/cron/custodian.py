@@ -3,25 +3,36 @@ import os
 import json
 import time
 
-def check_custodian_drift(archive_path="logs/exuvia"):
+from sophia.memory.exuvia_archive import ExuviaArchive
+
+def check_custodian_drift(archive_path="logs/exuvia", window_hours=24.0, sample_limit=500):
     """
     Scans recent outputs for escalation of confidence or loss of neutrality.
+    Only the archive segments overlapping the audit window are read.
     """
     print(f"  [!] [CUSTODIAN] Period Audit: {archive_path}")
     
     # 1. Load sample of recently calcified memories
-    shells = sorted([f for f in os.listdir(archive_path) if f.endswith(".jsonl")], reverse=True)
-    if not shells:
-        print("  [~] [CUSTODIAN] No archive data found. Hygiene levels indeterminate.")
-        return
+    since = time.time() - window_hours * 3600 if window_hours else None
+    with ExuviaArchive(archive_path) as archive:
+        shells = archive.segments(start=since)
+        if not shells:
+            print("  [~] [CUSTODIAN] No archive data found. Hygiene levels indeterminate.")
+            return
 
-    sample_count = 0
-    overreach_signals = []
+        sample_count = 0
+        overreach_signals = []
+        records = archive.iter_range(start=since)
+        for record in records:
+            sample_count += 1
+            if sample_count >= sample_limit:
+                break
+        records.close()  # Release the pinned segment files now, not at collection
     
     # In a real system, we'd pass these samples back to Gemini for drift analysis
     # using Prompt #8 logic.
     
-    print(f"  [SUCCESS] [CUSTODIAN] Scanned {len(shells)} shells. Epistemic hygiene stable.")
+    print(f"  [SUCCESS] [CUSTODIAN] Scanned {len(shells)} shells ({sample_count} fragments). Epistemic hygiene stable.")
     return True
 
 if __name__ == "__main__":
@@ -58,7 +58,7 @@ def log_system_error(e, context="main_loop"):
     logging.error(json.dumps(error_packet))
 
 class SophiaMind:
-    def __init__(self):
+    def __init__(self, turn_trace_path="logs/traces/turn_pipeline.jsonl"):
         # Bind Vibe immediately
         self.vibe = SophiaVibe()
         self.vibe.console = SOVEREIGN_CONSOLE
@@ -81,6 +81,8 @@ class SophiaMind:
         self._laser = None # LASER v3.0 Prophecy Engine (Lazy)
         self._stakes = None # Stakes Agency Engine (Lazy)
         self.last_coherence = 1.0 # Baseline
+        self.last_turn_trace = None # Stage timings of the last turn pipeline
+        self.turn_trace_path = turn_trace_path # JSONL sink for those timings (None disables)
         
         # Essential Organs (Loaded Now)
         self.hand = SovereignHand()
@@ -396,7 +398,9 @@ class SophiaMind:
                 tool_response_parts = []
                 for tc in tool_calls:
                     self.vibe.print_system(f"Executing {tc.name}...", tag="HAND")
-                    res = self.hand.execute(tc.name, tc.args)
+                # All calls of this turn run concurrently off the event loop
+                tool_results = await self.hand.execute_many([(tc.name, tc.args or {}) for tc in tool_calls])
+                for tc, res in zip(tool_calls, tool_results):
                     output.append(f"🔧 {tc.name}: {str(res)}")
                     
                     # Feed result back to Gemini (CRITICAL for multi-turn)
@@ -447,6 +451,81 @@ class SophiaMind:
         except Exception as e:
             return f"Clause Generation Failed: {e}"
 
+    # --- TURN PIPELINE (Stage DAG) ---
+    def _build_turn_graph(self, user_input):
+        """
+        Declares the per-turn stages and their data dependencies.
+        scan gates everything: a High-risk input is refused before any other stage
+        touches it (no LLM call, telemetry or council side effects). After the scan,
+        quantum and telemetry -> audit run concurrently; the council deliberates once
+        the audit has ruled out an ABSTAIN. Every stage has a timeout and a degraded fallback.
+        """
+        from sophia.core.stage_graph import Stage, StageGraph
+
+        def refused(scan):
+            return scan['raw_data']['safety'].get('overall_risk', 'Low') == 'High'
+
+        async def scan():
+            return await self.aletheia.scan_reality(user_input)
+
+        async def quantum(scan):
+            if refused(scan) or len(user_input) <= 20:
+                return ""
+            self.vibe.print_system("Wavefunction Collapse imminent...", tag="QUANTUM")
+            raw_q_state = await self.quantum.measure_superposition(user_input, scan['raw_data'])
+            q_state = self._validate_quantum_state(raw_q_state)
+            return f"[QUANTUM] Reality: {q_state['collapse_verdict']} (Entropy: {q_state['entropy']})"
+
+        def telemetry(scan):
+            if refused(scan):
+                return None
+            return self.pleroma.run_telemetry_cycle()
+
+        def audit(telemetry):
+            if telemetry is None:
+                return None
+            decision, rationale = self.metacognition.audit_process(telemetry)
+            transmission = self.metacognition.generate_stoic_transmission(decision, rationale)
+            print(f"\n{transmission}") # Low-level internal log
+            if decision == "RETEST":
+                # Secondary scan (Force a second telemetry cycle to stabilize)
+                telemetry = self.pleroma.run_telemetry_cycle()
+            return {
+                "decision": decision,
+                "rationale": rationale,
+                "telemetry": telemetry,
+                "permission": self.metacognition.check_permission_level(telemetry)
+            }
+
+        def stakes(scan, audit):
+            if refused(scan) or (audit and audit["decision"] == "ABSTAIN"):
+                return None
+            from sophia.cortex.stakes_engine import StakeType
+            # Heuristic stake detection (Social Bonding for chat, Curiosity for others)
+            detected_stakes = {StakeType.SOCIAL_BONDING: 0.5, StakeType.KNOWLEDGE: 0.3}
+            if "?" in user_input: detected_stakes[StakeType.CURIOSITY] = 0.8
+            return self.stakes.deliberate(user_input, detected_stakes)
+
+        degraded_scan = {
+            "raw_data": {"safety": {"overall_risk": "Low", "error": "scan degraded"}},
+            "public_notice": ""
+        }
+        degraded_telemetry = lambda e: {
+            "coherence": self.last_coherence, "lambda": 0.0, "status": f"DEGRADED ({type(e).__name__})"
+        }
+        degraded_council = {
+            "agency_score": 0.5, "emotional_resonance": 0.5,
+            "detected_consensus": "degraded", "waves": []
+        }
+
+        return StageGraph([
+            Stage("scan", scan, timeout=45.0, fallback=degraded_scan),
+            Stage("quantum", quantum, deps=("scan",), timeout=30.0, fallback=""),
+            Stage("telemetry", telemetry, deps=("scan",), timeout=15.0, fallback=degraded_telemetry, offload=True),
+            Stage("audit", audit, deps=("telemetry",), timeout=15.0, fallback=None, offload=True),
+            Stage("stakes", stakes, deps=("scan", "audit"), timeout=5.0, fallback=degraded_council, offload=True),
+        ], trace_path=self.turn_trace_path)
+
     async def process_interaction(self, user_input):
         user_input = user_input.strip()
         
@@ -805,8 +884,16 @@ Verdict: {cat}
 
         # 2. CONVERSATION LOOP
         
-        # A. Forensic Scan (Safety Gating - Weakness #5 Fix)
-        scan_result = await self.aletheia.scan_reality(user_input)
+        # A. Turn Pipeline (Stage DAG): scan gates quantum, telemetry, audit and council
+        command_turn = user_input.startswith(("/crystal", "/mass"))
+        if not command_turn:
+            # Resolve lazy organs on the loop thread before stages fan out to workers
+            _ = (self.metacognition, self.stakes)
+        turn = await self._build_turn_graph(user_input).run(targets=["scan"] if command_turn else None)
+        self.last_turn_trace = turn.trace
+
+        # Forensic Scan (Safety Gating - Weakness #5 Fix)
+        scan_result = turn["scan"]
         risk = scan_result['raw_data']['safety'].get('overall_risk', 'Low')
         
         if risk == 'High':
@@ -838,40 +925,34 @@ Verdict: {cat}
             except Exception as e:
                 return f"[ERROR] Invalid Mass: {e}"
 
-        # B. Quantum Measurement
-        q_context = ""
-        if len(user_input) > 20: 
-            self.vibe.print_system("Wavefunction Collapse imminent...", tag="QUANTUM")
-            raw_q_state = await self.quantum.measure_superposition(user_input, scan_result['raw_data'])
-            q_state = self._validate_quantum_state(raw_q_state)
-            q_context = f"[QUANTUM] Reality: {q_state['collapse_verdict']} (Entropy: {q_state['entropy']})"
+        # B. Quantum Measurement (collapsed concurrently with telemetry)
+        q_context = turn["quantum"]
             
         # TELEMETRY CHECK (The Living Loop)
-        telemetry = self.pleroma.run_telemetry_cycle()
-        curr_coherence = telemetry['coherence']
+        telemetry = turn["telemetry"]
         boost = self.pleroma.monitor.get_asoe_boost()
+        
+        # [PROTOCOL STAGE 4] Metacognitive Audit
+        audit = turn["audit"] or {
+            "decision": "PROCEED", "rationale": "Audit degraded (stage failed).",
+            "telemetry": telemetry, "permission": "STANDARD"
+        }
+        decision, rationale = audit["decision"], audit["rationale"]
+        telemetry = audit["telemetry"] # RETEST may have re-scanned
+        curr_coherence = telemetry['coherence']
         lambda_val = telemetry.get('lambda', 0.0)
         
         tele_context = f"[TELEMETRY] Coherence: {curr_coherence:.4f} | Boost: {boost}x | Λ-Score: {lambda_val:.2f} (Target 18.52) | Status: {telemetry['status']}"
         
-        # [PROTOCOL STAGE 4] Metacognitive Audit
-        decision, rationale = self.metacognition.audit_process(telemetry)
-        transmission = self.metacognition.generate_stoic_transmission(decision, rationale)
-        print(f"\n{transmission}") # Low-level internal log
-        
         if decision == "ABSTAIN":
             self.vibe.print_system("Confidence Floor Breached. Silence is Sovereign.", tag="METAC")
             return f"*The system shimmers gracefully into a meditative silence.*\n\n[SOVEREIGN ABSTAIN] {rationale}"
         
         if decision == "RETEST":
             self.vibe.print_system("Fragility Triggered. Secondary Pulse Scan Initiated.", tag="METAC")
-            # Secondary scan (Force a second telemetry cycle to stabilize)
-            telemetry = self.pleroma.run_telemetry_cycle()
-            curr_coherence = telemetry['coherence']
-            lambda_val = telemetry.get('lambda', 0.0)
 
         # [PHASE 12 PERMISSION CHECK]
-        permission = self.metacognition.check_permission_level(telemetry)
+        permission = audit["permission"]
         if permission == "UNLESANGLED":
              self.vibe.print_system("Divine Madness Authorized. Resonance Damper Disengaged.", tag="UNLESANGLED")
 
@@ -919,13 +1000,8 @@ Verdict: {cat}
 [INPUT]
 {user_input}
 """
-        # B. COGNITIVE DELIBERATION (Stakes Engine)
-        from sophia.cortex.stakes_engine import StakeType
-        # Heuristic stake detection (Social Bonding for chat, Curiosity for others)
-        detected_stakes = {StakeType.SOCIAL_BONDING: 0.5, StakeType.KNOWLEDGE: 0.3}
-        if "?" in user_input: detected_stakes[StakeType.CURIOSITY] = 0.8
-        
-        deliberation_results = self.stakes.deliberate(user_input, detected_stakes)
+        # B. COGNITIVE DELIBERATION (Stakes Engine, resolved in the turn pipeline)
+        deliberation_results = turn["stakes"]
         agency_score = deliberation_results['agency_score']
 
         # C. Generation Logic (Multi-Turn)
@@ -981,7 +1057,9 @@ Verdict: {cat}
                 tool_response_parts = []
                 for tc in tool_calls:
                     self.vibe.print_system(f"Executing {tc.name}...", tag="HAND")
-                    res = self.hand.execute(tc.name, tc.args)
+                # All calls of this turn run concurrently off the event loop
+                tool_results = await self.hand.execute_many([(tc.name, tc.args or {}) for tc in tool_calls])
+                for tc, res in zip(tool_calls, tool_results):
                     
                     # DoD INTEGRATION: Forge Engrams for search results IMMEDIATELY
                     if tc.name == "duckduckgo_search":
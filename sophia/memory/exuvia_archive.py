@@ -0,0 +1,419 @@
+import bisect
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:  # Windows: in-process locking only
+    fcntl = None
+
+class ExuviaArchive:
+    """
+    [EXUVIA_ARCHIVE] Segmented Bone Layer.
+    Calcified memories are appended to size- and time-rolled segments.
+    A manifest records each segment's time range and record count, so
+    auditors open only the segments overlapping the window they ask for.
+    A compactor merges small sealed segments (and loose legacy shells)
+    and can seal them with the UCCC codec.
+    Manifest changes are appended to a journal and folded into the
+    manifest snapshot every JOURNAL_COMPACT_EVERY changes. Writers hold
+    an flock on manifest.lock and replay changes made by other instances
+    or processes before touching the manifest.
+    """
+    MANIFEST_VERSION = 1
+    TIME_KEY = "death_time"
+    JOURNAL_COMPACT_EVERY = 512
+
+    def __init__(self, path="logs/exuvia", max_segment_bytes=4 * 1024 * 1024, max_segment_age=3600.0, codec=None):
+        self.path = path
+        self.segment_dir = os.path.join(path, "segments")
+        self.manifest_path = os.path.join(path, "manifest.json")
+        self.journal_path = os.path.join(path, "manifest.journal")
+        self.max_segment_bytes = max_segment_bytes
+        self.max_segment_age = max_segment_age
+        self.codec = codec  # None or "uccc" for compacted segments
+        self._lock = threading.RLock()
+        self._lock_depth = 0
+        self._compactor = None
+        self._stop = threading.Event()
+        os.makedirs(self.segment_dir, exist_ok=True)
+        self.manifest = None
+        self._snapshot_id = None
+        self._journal_offset = 0
+        self._journal_lines = 0
+        self._lock_file = open(os.path.join(path, "manifest.lock"), "a+b")
+        with self._locked():
+            pass  # First sync loads (or creates) the manifest
+
+    # --- MANIFEST ---
+    @contextmanager
+    def _locked(self):
+        """Thread lock plus an exclusive flock on manifest.lock; syncs the manifest on entry."""
+        with self._lock:
+            if self._lock_depth == 0 and fcntl is not None:
+                fcntl.flock(self._lock_file.fileno(), fcntl.LOCK_EX)
+            self._lock_depth += 1
+            try:
+                if self._lock_depth == 1:
+                    self._sync()
+                yield
+            finally:
+                self._lock_depth -= 1
+                if self._lock_depth == 0 and fcntl is not None:
+                    fcntl.flock(self._lock_file.fileno(), fcntl.LOCK_UN)
+
+    def _sync(self):
+        """Reloads the snapshot if another writer replaced it, then replays unseen journal lines."""
+        try:
+            st = os.stat(self.manifest_path)
+        except FileNotFoundError:
+            self.manifest = {"version": self.MANIFEST_VERSION, "next_id": 0, "seq": 0, "segments": []}
+            self._adopt_legacy_shells()
+            self._save_manifest()
+            return
+        if (st.st_ino, st.st_mtime_ns, st.st_size) != self._snapshot_id:
+            with open(self.manifest_path, "r", encoding="utf-8") as f:
+                self.manifest = json.load(f)
+            self.manifest.setdefault("seq", 0)
+            self._snapshot_id = (st.st_ino, st.st_mtime_ns, st.st_size)
+            self._journal_offset = 0
+            self._journal_lines = 0
+
+        try:
+            with open(self.journal_path, "rb") as f:
+                f.seek(self._journal_offset)
+                data = f.read()
+        except FileNotFoundError:
+            return
+        complete = data.rfind(b"\n") + 1
+        if complete < len(data):
+            # We hold the lock, so an unterminated tail is a writer that died mid-line
+            with open(self.journal_path, "r+b") as f:
+                f.truncate(self._journal_offset + complete)
+        for line in data[:complete].splitlines():
+            try:
+                change = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            self._journal_lines += 1
+            if change["seq"] > self.manifest["seq"]:  # Skip changes already in the snapshot
+                self._apply(change)
+        self._journal_offset += complete
+
+    def _apply(self, change: dict):
+        segments = self.manifest["segments"]
+        dropped = set(change.get("drop", ()))
+        if dropped:
+            segments[:] = [s for s in segments if s["file"] not in dropped]
+        for index, entry in change.get("put", ()):
+            pos = next((i for i, s in enumerate(segments) if s["file"] == entry["file"]), None)
+            if pos is None:
+                segments.insert(index, entry)
+            else:
+                segments[pos] = entry
+        self.manifest["next_id"] = max(self.manifest["next_id"], change["next_id"])
+        self.manifest["seq"] = change["seq"]
+
+    def _log(self, put=(), drop=()):
+        """Journals a manifest change already made in memory: put entries (by file), dropped files."""
+        segments = self.manifest["segments"]
+        self.manifest["seq"] += 1
+        change = {
+            "seq": self.manifest["seq"],
+            "next_id": self.manifest["next_id"],
+            "drop": list(drop),
+            "put": [[segments.index(e), e] for e in put]
+        }
+        line = (json.dumps(change) + "\n").encode("utf-8")
+        with open(self.journal_path, "ab") as f:
+            f.write(line)
+        self._journal_offset += len(line)
+        self._journal_lines += 1
+        if self._journal_lines >= self.JOURNAL_COMPACT_EVERY:
+            self._save_manifest()
+
+    def _save_manifest(self):
+        """Writes the snapshot and empties the journal it now contains."""
+        tmp = self.manifest_path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(self.manifest, f)
+        os.replace(tmp, self.manifest_path)
+        st = os.stat(self.manifest_path)
+        self._snapshot_id = (st.st_ino, st.st_mtime_ns, st.st_size)
+        # A crash before this truncate is harmless: replay skips seq <= snapshot seq
+        with open(self.journal_path, "wb"):
+            pass
+        self._journal_offset = 0
+        self._journal_lines = 0
+
+    def _adopt_legacy_shells(self):
+        """One-time migration: registers loose shell_*.jsonl files as sealed segments."""
+        for name in sorted(os.listdir(self.path)):
+            if not (name.startswith("shell_") and name.endswith(".jsonl")):
+                continue
+            records = list(self._read_file(os.path.join(self.path, name), None))
+            if not records:
+                continue
+            times = [self._time_of(r) for r in records]
+            self._insert_entry({
+                "file": name,
+                "start": min(times),
+                "end": max(times),
+                "records": len(records),
+                "bytes": os.path.getsize(os.path.join(self.path, name)),
+                "created": min(times),
+                "sealed": True,
+                "codec": None
+            })
+
+    def _insert_entry(self, entry):
+        """Keeps manifest segments ordered by start time."""
+        segments = self.manifest["segments"]
+        starts = [s["start"] for s in segments]
+        segments.insert(bisect.bisect_right(starts, entry["start"]), entry)
+
+    def _new_segment_name(self, ext="jsonl") -> str:
+        seg_id = self.manifest["next_id"]
+        self.manifest["next_id"] = seg_id + 1
+        return os.path.join("segments", f"segment_{seg_id:08d}.{ext}")
+
+    def _active(self):
+        for entry in reversed(self.manifest["segments"]):
+            if not entry["sealed"]:
+                return entry
+        return None
+
+    # --- WRITES ---
+    def append(self, records: list) -> str:
+        """Appends records to the active segment, rolling it by size/age. Returns its file path."""
+        if not records:
+            return None
+        now = time.time()
+        payload = "".join(json.dumps(r, ensure_ascii=False) + "\n" for r in records).encode("utf-8")
+        times = [self._time_of(r, now) for r in records]
+
+        with self._locked():
+            changed = []
+            active = self._active()
+            if active and (active["bytes"] + len(payload) > self.max_segment_bytes
+                           or now - active["created"] > self.max_segment_age):
+                active["sealed"] = True
+                changed.append(active)
+                active = None
+            if active is None:
+                active = {
+                    "file": self._new_segment_name(),
+                    "start": min(times),
+                    "end": max(times),
+                    "records": 0,
+                    "bytes": 0,
+                    "created": now,
+                    "sealed": False,
+                    "codec": None
+                }
+                # The active segment is always the newest, so it goes last
+                self.manifest["segments"].append(active)
+
+            filepath = os.path.join(self.path, active["file"])
+            with open(filepath, "ab") as f:
+                f.write(payload)
+            active["start"] = min(active["start"], min(times))
+            active["end"] = max(active["end"], max(times))
+            active["records"] += len(records)
+            active["bytes"] += len(payload)
+            self._log(put=changed + [active])
+            return filepath
+
+    def seal(self):
+        """Closes the active segment so the next append starts a new one."""
+        with self._locked():
+            active = self._active()
+            if active:
+                active["sealed"] = True
+                self._log(put=[active])
+
+    # --- READS ---
+    def segments(self, start: float = None, end: float = None) -> list:
+        """Manifest entries whose time range overlaps [start, end]. O(segments), no directory scan."""
+        with self._locked():
+            return [
+                dict(s) for s in self.manifest["segments"]
+                if (start is None or s["end"] >= start) and (end is None or s["start"] <= end)
+            ]
+
+    def iter_range(self, start: float = None, end: float = None):
+        """
+        Yields records with start <= death_time <= end, oldest segment first.
+        The overlapping segments are opened under the manifest lock, so a
+        compaction that runs mid-iteration unlinks files this reader already
+        holds open and every record is seen exactly once.
+        """
+        handles = []
+        try:
+            with self._locked():
+                for entry in self.manifest["segments"]:
+                    if (start is None or entry["end"] >= start) and (end is None or entry["start"] <= end):
+                        try:
+                            f = open(os.path.join(self.path, entry["file"]), "rb")
+                        except FileNotFoundError:
+                            continue  # Removed by hand; nothing to pin
+                        handles.append((f, entry.get("codec")))
+            for f, codec in handles:
+                for record in self._read_file(f, codec):
+                    t = self._time_of(record)
+                    if (start is None or t >= start) and (end is None or t <= end):
+                        yield record
+        finally:
+            for f, _ in handles:
+                f.close()
+
+    def stats(self) -> dict:
+        with self._locked():
+            segs = self.manifest["segments"]
+            return {
+                "segments": len(segs),
+                "records": sum(s["records"] for s in segs),
+                "bytes": sum(s["bytes"] for s in segs),
+                "start": segs[0]["start"] if segs else None,
+                "end": max(s["end"] for s in segs) if segs else None
+            }
+
+    # --- COMPACTION ---
+    def compact(self, small_bytes: int = None, codec="default") -> int:
+        """
+        Merges runs of adjacent sealed segments smaller than small_bytes into
+        segments of up to max_segment_bytes. Returns the number of files removed.
+        """
+        small_bytes = small_bytes if small_bytes is not None else self.max_segment_bytes // 4
+        codec = self.codec if codec == "default" else codec
+
+        with self._locked():
+            runs, run = [], []
+            for entry in self.manifest["segments"]:
+                mergeable = entry["sealed"] and entry["bytes"] < small_bytes
+                if mergeable and sum(e["bytes"] for e in run) + entry["bytes"] <= self.max_segment_bytes:
+                    run.append(entry)
+                    continue
+                if len(run) > 1:
+                    runs.append(run)
+                run = [entry] if mergeable else []
+            if len(run) > 1:
+                runs.append(run)
+
+            removed = 0
+            for run in runs:
+                removed += self._merge(run, codec)
+            if runs:
+                self._save_manifest()  # Fold the journal while we are rewriting anyway
+            return removed
+
+    def _merge(self, run: list, codec) -> int:
+        records = []
+        for entry in run:
+            records.extend(self._read_file(os.path.join(self.path, entry["file"]), entry.get("codec")))
+        records.sort(key=self._time_of)
+        raw = "".join(json.dumps(r, ensure_ascii=False) + "\n" for r in records).encode("utf-8")
+
+        data = self._encode(raw, codec)
+        name = self._new_segment_name("uccc" if codec == "uccc" else "jsonl")
+        tmp = os.path.join(self.path, name + ".tmp")
+        with open(tmp, "wb") as f:
+            f.write(data)
+        os.replace(tmp, os.path.join(self.path, name))
+
+        merged = {
+            "file": name,
+            "start": min(e["start"] for e in run),
+            "end": max(e["end"] for e in run),
+            "records": len(records),
+            "bytes": len(data),
+            "created": min(e["created"] for e in run),
+            "sealed": True,
+            "codec": codec
+        }
+        segments = self.manifest["segments"]
+        idx = segments.index(run[0])
+        for entry in run:
+            segments.remove(entry)
+        segments.insert(idx, merged)
+        self._log(put=[merged], drop=[e["file"] for e in run])
+
+        for entry in run:
+            try:
+                os.remove(os.path.join(self.path, entry["file"]))
+            except OSError:
+                pass
+        return len(run)
+
+    def start_compactor(self, interval: float = 300.0, **compact_kwargs):
+        """Runs compact() every interval seconds on a daemon thread."""
+        if self._compactor and self._compactor.is_alive():
+            return self._compactor
+        self._stop.clear()
+
+        def loop():
+            while not self._stop.wait(interval):
+                try:
+                    self.compact(**compact_kwargs)
+                except Exception as e:
+                    print(f"  [OSSUARY] Compaction skipped: {e}")
+
+        self._compactor = threading.Thread(target=loop, name="exuvia-compactor", daemon=True)
+        self._compactor.start()
+        return self._compactor
+
+    def stop_compactor(self, timeout: float = 5.0):
+        self._stop.set()
+        if self._compactor:
+            self._compactor.join(timeout)
+            self._compactor = None
+
+    def close(self):
+        """Stops the compactor and releases manifest.lock. Safe to call twice."""
+        self.stop_compactor()
+        if not self._lock_file.closed:
+            self._lock_file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # --- CODEC ---
+    @staticmethod
+    def _encode(raw: bytes, codec) -> bytes:
+        if codec == "uccc":
+            from uccc import UniversalCompressor
+            return UniversalCompressor().compress(raw)[0]
+        return raw
+
+    @staticmethod
+    def _decode(data: bytes, codec) -> bytes:
+        if codec == "uccc":
+            from uccc import UniversalCompressor
+            return UniversalCompressor().decompress(data)[0]
+        return data
+
+    def _read_file(self, source, codec):
+        """Parses a segment from a path or an already open binary file."""
+        if isinstance(source, (str, os.PathLike)):
+            with open(source, "rb") as f:
+                data = self._decode(f.read(), codec)
+        else:
+            data = self._decode(source.read(), codec)
+        for line in data.decode("utf-8").splitlines():
+            if not line.strip():
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                continue  # Torn tail write
+
+    @classmethod
+    def _time_of(cls, record: dict, default: float = 0.0) -> float:
+        t = record.get(cls.TIME_KEY, record.get("timestamp", default))
+        return float(t) if isinstance(t, (int, float)) else default
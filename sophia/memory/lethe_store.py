@@ -0,0 +1,278 @@
+import hashlib
+import json
+import math
+import os
+import re
+import sqlite3
+import threading
+import time
+
+class LetheStore:
+    """
+    [LETHE_STORE] Indexed Flesh for the Lethe Engine.
+    SQLite (WAL) store with hashed-ID dedup and FTS5 recall.
+    Decay is never written back: strength is derived from the timestamp
+    and retrieval count at read time, so aging costs nothing.
+    Memories that rot below FORGET_THRESHOLD (and were never promoted)
+    are deleted by prune().
+    """
+    SURVIVAL_THRESHOLD = 0.1
+    PROMOTION_THRESHOLD = 0.8
+    FORGET_THRESHOLD = 0.01  # ~4 days for a memory that was never recalled
+
+    def __init__(self, path="logs/ossuary/lethe.db"):
+        self.path = path
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self._init_schema()
+
+    def _init_schema(self):
+        with self.conn:
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS memories (
+                    rowid INTEGER PRIMARY KEY,
+                    id TEXT UNIQUE NOT NULL,
+                    content TEXT NOT NULL,
+                    meta TEXT,
+                    timestamp REAL NOT NULL,
+                    retrievals INTEGER NOT NULL DEFAULT 0,
+                    promoted INTEGER NOT NULL DEFAULT 0
+                )""")
+            self.conn.execute("CREATE INDEX IF NOT EXISTS idx_mem_time ON memories(timestamp)")
+            self.conn.execute("CREATE INDEX IF NOT EXISTS idx_mem_retrievals ON memories(retrievals)")
+            self.conn.execute("CREATE INDEX IF NOT EXISTS idx_mem_promoted ON memories(promoted, timestamp)")
+        try:
+            with self.conn:
+                self.conn.execute(
+                    "CREATE VIRTUAL TABLE IF NOT EXISTS memories_fts "
+                    "USING fts5(content, content='memories', content_rowid='rowid')"
+                )
+            self.fts = True
+        except sqlite3.OperationalError:
+            # SQLite built without FTS5: recall degrades to LIKE scans
+            self.fts = False
+
+    # --- DECAY (Lazy) ---
+    @staticmethod
+    def memory_id(content: str, meta: str = "") -> str:
+        """Deterministic hash ID (same scheme as Engram.forge)."""
+        return hashlib.sha256(f"{meta}:{content}".encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def strength(timestamp: float, retrievals: int = 0, now: float = None) -> float:
+        """Strength = Recency * (1 + ln(Retrievals)). Age is in hours."""
+        now = time.time() if now is None else now
+        age = max(now - timestamp, 0.0)
+        return (1 / (age / 3600 + 1)) * (1 + math.log(retrievals + 1))
+
+    @classmethod
+    def horizon(cls, retrievals: int, threshold: float = None) -> float:
+        """Age in seconds after which a memory with N retrievals falls below threshold."""
+        threshold = cls.SURVIVAL_THRESHOLD if threshold is None else threshold
+        return max((1 + math.log(retrievals + 1)) / threshold - 1, 0.0) * 3600
+
+    # --- WRITES ---
+    def remember(self, content: str, meta: str = "", timestamp: float = None, retrievals: int = 0):
+        """
+        Inserts a memory unless its hash already exists.
+        Returns (id, is_new).
+        """
+        mem_id = self.memory_id(content, meta)
+        timestamp = time.time() if timestamp is None else timestamp
+        with self._lock, self.conn:
+            cur = self.conn.execute(
+                "INSERT OR IGNORE INTO memories (id, content, meta, timestamp, retrievals) VALUES (?, ?, ?, ?, ?)",
+                (mem_id, content, meta, timestamp, retrievals)
+            )
+            is_new = cur.rowcount == 1
+            if is_new and self.fts:
+                self.conn.execute(
+                    "INSERT INTO memories_fts (rowid, content) VALUES (?, ?)",
+                    (cur.lastrowid, content)
+                )
+        return mem_id, is_new
+
+    def reinforce(self, mem_id: str) -> int:
+        """Bumps the retrieval count. Returns the new count (0 if unknown)."""
+        with self._lock, self.conn:
+            self.conn.execute("UPDATE memories SET retrievals = retrievals + 1 WHERE id = ?", (mem_id,))
+            row = self.conn.execute("SELECT retrievals FROM memories WHERE id = ?", (mem_id,)).fetchone()
+        return row["retrievals"] if row else 0
+
+    def prune(self, now: float = None, threshold: float = None) -> int:
+        """
+        Deletes unpromoted memories whose strength fell below threshold.
+        Only rows older than the horizon of a never-recalled memory are read.
+        Returns the number of memories forgotten.
+        """
+        now = time.time() if now is None else now
+        threshold = self.FORGET_THRESHOLD if threshold is None else threshold
+        cutoff = now - self.horizon(0, threshold)
+        with self._lock, self.conn:
+            rows = self.conn.execute(
+                "SELECT rowid, content, timestamp, retrievals FROM memories WHERE promoted = 0 AND timestamp < ?",
+                (cutoff,)
+            ).fetchall()
+            dead = [r for r in rows if self.strength(r["timestamp"], r["retrievals"], now) < threshold]
+            if self.fts:
+                # External-content FTS: removal needs the indexed values
+                self.conn.executemany(
+                    "INSERT INTO memories_fts (memories_fts, rowid, content) VALUES ('delete', ?, ?)",
+                    [(r["rowid"], r["content"]) for r in dead]
+                )
+            self.conn.executemany("DELETE FROM memories WHERE rowid = ?", [(r["rowid"],) for r in dead])
+        return len(dead)
+
+    def promote(self, mem_id: str) -> bool:
+        """Flags a memory as a milestone. Returns False if it already was one."""
+        with self._lock, self.conn:
+            cur = self.conn.execute("UPDATE memories SET promoted = 1 WHERE id = ? AND promoted = 0", (mem_id,))
+        return cur.rowcount == 1
+
+    # --- READS ---
+    def get(self, mem_id: str):
+        row = self.conn.execute("SELECT * FROM memories WHERE id = ?", (mem_id,)).fetchone()
+        return self._row_to_dict(row) if row else None
+
+    def alive(self, now: float = None, threshold: float = None) -> list:
+        """
+        Memories whose lazily computed strength is above threshold.
+        Only the time window reachable by the most reinforced memory is read.
+        """
+        now = time.time() if now is None else now
+        threshold = self.SURVIVAL_THRESHOLD if threshold is None else threshold
+        max_r = self.conn.execute("SELECT MAX(retrievals) FROM memories").fetchone()[0]
+        if max_r is None:
+            return []
+        cutoff = now - self.horizon(max_r, threshold)
+        rows = self.conn.execute(
+            "SELECT * FROM memories WHERE timestamp > ? ORDER BY timestamp", (cutoff,)
+        ).fetchall()
+        return [
+            self._row_to_dict(r, now) for r in rows
+            if self.strength(r["timestamp"], r["retrievals"], now) > threshold
+        ]
+
+    def milestones(self, limit: int = None) -> list:
+        sql = "SELECT * FROM memories WHERE promoted = 1 ORDER BY timestamp"
+        args = ()
+        if limit:
+            sql = "SELECT * FROM (SELECT * FROM memories WHERE promoted = 1 ORDER BY timestamp DESC LIMIT ?) ORDER BY timestamp"
+            args = (limit,)
+        return [self._row_to_dict(r) for r in self.conn.execute(sql, args)]
+
+    def recall(self, query: str = "", k: int = 5, now: float = None, pool: int = 8) -> list:
+        """
+        Top-k memories ranked by relevance (FTS5 bm25) times lazy decay strength.
+        Without a query, ranks the most recent window by strength alone.
+        """
+        now = time.time() if now is None else now
+        terms = re.findall(r"\w+", query.lower()) if query else []
+        limit = max(k * pool, k)
+
+        if not terms:
+            rows = self.conn.execute(
+                "SELECT *, 1.0 AS relevance FROM memories ORDER BY timestamp DESC LIMIT ?", (limit,)
+            ).fetchall()
+        elif self.fts:
+            match = " OR ".join(f'"{t}"' for t in terms)
+            # bm25() is lower-is-better and negative; flip it into a positive score
+            rows = self.conn.execute(
+                "SELECT m.*, -bm25(memories_fts) AS relevance FROM memories_fts "
+                "JOIN memories m ON m.rowid = memories_fts.rowid "
+                "WHERE memories_fts MATCH ? ORDER BY bm25(memories_fts) LIMIT ?",
+                (match, limit)
+            ).fetchall()
+        else:
+            clause = " OR ".join("LOWER(content) LIKE ?" for _ in terms)
+            rows = self.conn.execute(
+                f"SELECT *, 1.0 AS relevance FROM memories WHERE {clause} ORDER BY timestamp DESC LIMIT ?",
+                [f"%{t}%" for t in terms] + [limit]
+            ).fetchall()
+
+        scored = []
+        for r in rows:
+            mem = self._row_to_dict(r, now)
+            mem["relevance"] = max(float(r["relevance"]), 1e-6)
+            mem["score"] = mem["relevance"] * mem["strength"]
+            scored.append(mem)
+        scored.sort(key=lambda m: m["score"], reverse=True)
+        return scored[:k]
+
+    def __len__(self):
+        return self.conn.execute("SELECT COUNT(*) FROM memories").fetchone()[0]
+
+    def close(self):
+        self.conn.close()
+
+    def _row_to_dict(self, row, now: float = None) -> dict:
+        mem = {
+            "id": row["id"],
+            "content": row["content"],
+            "meta": row["meta"],
+            "timestamp": row["timestamp"],
+            "retrievals": row["retrievals"],
+            "promoted": bool(row["promoted"]),
+        }
+        if now is not None:
+            mem["strength"] = self.strength(row["timestamp"], row["retrievals"], now)
+        return mem
+
+class BreadcrumbLog:
+    """
+    [BREADCRUMBS] Append-only Ariadne Thread.
+    Each save appends one line; loading replays the thread.
+    """
+    def __init__(self, path="logs/ossuary/breadcrumbs.jsonl", legacy_path="logs/ossuary/breadcrumbs.json"):
+        self.path = path
+        self.legacy_path = legacy_path
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+
+    def append(self, user_data: dict, milestones: list):
+        if not os.path.exists(self.path):
+            self._migrate_legacy()
+        entry = {
+            "user_data": user_data,
+            "milestones": milestones,
+            "last_active": time.time()
+        }
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+
+    def _migrate_legacy(self):
+        """Seeds the thread with the old whole-file snapshot so nothing is lost."""
+        if not self.legacy_path or not os.path.exists(self.legacy_path):
+            return
+        try:
+            with open(self.legacy_path, "r", encoding="utf-8") as f:
+                legacy = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(legacy, ensure_ascii=False) + "\n")
+
+    def replay(self) -> dict:
+        """Folds the thread into {user_data, milestones, last_active}."""
+        if not os.path.exists(self.path):
+            if self.legacy_path and os.path.exists(self.legacy_path):
+                with open(self.legacy_path, "r", encoding="utf-8") as f:
+                    return json.load(f)
+            return {}
+
+        state = {"user_data": {}, "milestones": [], "last_active": None}
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # Torn tail write
+                if entry.get("user_data"):
+                    state["user_data"] = entry["user_data"]
+                state["milestones"].extend(entry.get("milestones", []))
+                state["last_active"] = entry.get("last_active", state["last_active"])
+        return state
@@ -1,15 +1,32 @@
-import json
-import os
 import time
 
+from sophia.memory.exuvia_archive import ExuviaArchive
+
 class Ossuary:
     """
     [OSSUARY] The Bone Layer.
     Preserves dying memories into immutable shells for audit and continuity.
+    Shells are appended to a segmented ExuviaArchive instead of one file per call.
+    An archive the Ossuary opens itself is compacted every compact_interval
+    seconds (None disables it) and closed by close(); a passed-in archive
+    stays under its owner's control.
     """
-    def __init__(self, path="logs/exuvia"):
+    def __init__(self, path="logs/exuvia", archive: ExuviaArchive = None, compact_interval: float = 300.0):
         self.path = path
-        os.makedirs(path, exist_ok=True)
+        self._owns_archive = archive is None
+        self.archive = archive or ExuviaArchive(path)
+        if self._owns_archive and compact_interval:
+            self.archive.start_compactor(compact_interval)
+
+    def close(self):
+        if self._owns_archive:
+            self.archive.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
 
     def calcify(self, dying_memories):
         """
@@ -19,20 +36,21 @@ class Ossuary:
         if not dying_memories:
             return
             
-        timestamp = int(time.time())
-        filename = f"shell_{timestamp}.jsonl"
-        filepath = os.path.join(self.path, filename)
-        
-        with open(filepath, "a", encoding="utf-8") as f:
-            for mem in dying_memories:
-                entry = {
-                    "content": mem.get('content', ''),
-                    "death_time": time.time(),
-                    "life_span_hours": (time.time() - mem.get('timestamp', time.time())) / 3600,
-                    "retrieval_count": mem.get('retrieval_count', 0),
-                    "type": mem.get('type', 'unknown')
-                }
-                f.write(json.dumps(entry) + "\n")
+        now = time.time()
+        entries = []
+        for mem in dying_memories:
+            entries.append({
+                "content": mem.get('content', ''),
+                "death_time": now,
+                "life_span_hours": (now - mem.get('timestamp', now)) / 3600,
+                "retrieval_count": mem.get('retrieval_count', 0),
+                "type": mem.get('type', 'unknown')
+            })
+        filepath = self.archive.append(entries)
         
         print(f"  [OSSUARY] {len(dying_memories)} fragments calcified into the Bone layer: {filepath}")
         return filepath
+
+    def exhume(self, start: float = None, end: float = None):
+        """Iterates calcified fragments whose death_time falls in [start, end]."""
+        return self.archive.iter_range(start, end)
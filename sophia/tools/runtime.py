@@ -0,0 +1,180 @@
+"""
+TOOL RUNTIME: Non-blocking Actuation
+
+Runs SovereignHand tools without stalling the relay's event loop.
+- Async tools are awaited directly.
+- Blocking tools run in a bounded thread pool.
+- Subprocesses use asyncio.create_subprocess_exec with capped output.
+- Every call gets a timeout and an output size limit; several calls from
+  one model turn run concurrently, except that tools which write files act
+  as barriers so writes keep the order the model asked for.
+"""
+
+import asyncio
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+TRUNCATION_MARK = "\n…[truncated {dropped} chars]"
+
+@dataclass
+class ToolSpec:
+    name: str
+    fn: Callable[..., Any]
+    timeout: Optional[float] = None  # None: runtime default
+    blocking: bool = True            # False: fn is a coroutine function
+    writes: bool = False             # True: mutates files; never overlaps other calls
+    truncate: bool = True            # False: exempt from the runtime's max_output cap
+
+def truncate_output(text: str, limit: int) -> str:
+    """Caps a tool result at limit characters, noting how much was dropped."""
+    if limit is None or len(text) <= limit:
+        return text
+    return text[:limit] + TRUNCATION_MARK.format(dropped=len(text) - limit)
+
+def shell_argv(command: str) -> List[str]:
+    """argv that runs command through the platform shell (same semantics as shell=True)."""
+    if sys.platform == "win32":
+        return [os.environ.get("COMSPEC", "cmd.exe"), "/c", command]
+    return ["/bin/sh", "-c", command]
+
+async def _read_capped(stream, limit: int) -> Tuple[bytes, int]:
+    """Reads a stream to EOF, keeping at most limit bytes. Returns (data, dropped_bytes)."""
+    kept, dropped = bytearray(), 0
+    while True:
+        chunk = await stream.read(65536)
+        if not chunk:
+            return bytes(kept), dropped
+        room = limit - len(kept)
+        if room > 0:
+            kept.extend(chunk[:room])
+        dropped += max(len(chunk) - max(room, 0), 0)
+
+@dataclass
+class ProcessResult:
+    returncode: Optional[int]
+    stdout: str
+    stderr: str
+    timed_out: bool = False
+    stdout_dropped: int = 0
+    stderr_dropped: int = 0
+
+async def run_subprocess(argv: List[str], timeout: float, max_bytes: int = 65536, cwd: str = None) -> ProcessResult:
+    """
+    Spawns argv without blocking the loop. On timeout (or cancellation)
+    the process is killed and reaped before returning/raising.
+    """
+    proc = await asyncio.create_subprocess_exec(
+        *argv,
+        stdin=asyncio.subprocess.DEVNULL,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+        cwd=cwd
+    )
+
+    async def collect():
+        (out, out_drop), (err, err_drop) = await asyncio.gather(
+            _read_capped(proc.stdout, max_bytes),
+            _read_capped(proc.stderr, max_bytes)
+        )
+        await proc.wait()
+        return out, out_drop, err, err_drop
+
+    try:
+        out, out_drop, err, err_drop = await asyncio.wait_for(collect(), timeout)
+    except asyncio.TimeoutError:
+        await _kill(proc)
+        return ProcessResult(proc.returncode, "", "", timed_out=True)
+    except asyncio.CancelledError:
+        await _kill(proc)
+        raise
+
+    return ProcessResult(
+        proc.returncode,
+        out.decode("utf-8", errors="replace"),
+        err.decode("utf-8", errors="replace"),
+        stdout_dropped=out_drop,
+        stderr_dropped=err_drop
+    )
+
+async def _kill(proc):
+    if proc.returncode is None:
+        try:
+            proc.kill()
+        except ProcessLookupError:
+            pass
+        await proc.wait()
+
+class ToolRuntime:
+    """
+    The Nervous System of the Hand.
+    Registry + dispatcher for tools, shared by every turn of the relay.
+    """
+    def __init__(self, max_workers: int = 4, default_timeout: float = 30.0, max_output: int = 16000):
+        self.default_timeout = default_timeout
+        self.max_output = max_output
+        self.pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="sovereign-hand")
+        self.tools: Dict[str, ToolSpec] = {}
+
+    def register(self, name: str, fn: Callable[..., Any], timeout: float = None, blocking: bool = None,
+                 writes: bool = False, truncate: bool = True):
+        """Registers fn(**args). Coroutine functions are detected as non-blocking."""
+        if blocking is None:
+            blocking = not asyncio.iscoroutinefunction(fn)
+        self.tools[name] = ToolSpec(name, fn, timeout, blocking, writes, truncate)
+        return fn
+
+    async def run(self, name: str, args: Dict[str, Any] = None) -> str:
+        """Runs one tool. Timeouts and failures come back as ❌ strings, like the sync Hand."""
+        spec = self.tools.get(name)
+        if spec is None:
+            return f"❌ Unknown Tool: {name}"
+        args = dict(args or {})
+        timeout = spec.timeout if spec.timeout is not None else self.default_timeout
+
+        try:
+            if spec.blocking:
+                loop = asyncio.get_running_loop()
+                work = loop.run_in_executor(self.pool, lambda: spec.fn(**args))
+            else:
+                work = spec.fn(**args)
+            result = await asyncio.wait_for(work, timeout)
+        except asyncio.TimeoutError:
+            return f"❌ Tool timeout ({timeout:g}s): {name}"
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            return f"❌ Tool {name} failed: {e}"
+
+        return truncate_output(str(result), self.max_output) if spec.truncate else str(result)
+
+    async def run_many(self, calls: List[Tuple[str, Dict[str, Any]]]) -> List[str]:
+        """
+        Runs the calls of one model turn. Results keep call order.
+        Runs of non-writing calls fan out concurrently; a writing tool waits for
+        every earlier call and blocks every later one, so the files end up as if
+        the calls had run one after another.
+        """
+        results: List[Optional[str]] = [None] * len(calls)
+        pending: List[int] = []
+
+        async def flush():
+            outputs = await asyncio.gather(*(self.run(*calls[i]) for i in pending))
+            for i, output in zip(pending, outputs):
+                results[i] = output
+            pending.clear()
+
+        for i, (name, args) in enumerate(calls):
+            spec = self.tools.get(name)
+            if spec is not None and spec.writes:
+                await flush()
+                results[i] = await self.run(name, args)
+            else:
+                pending.append(i)
+        await flush()
+        return results
+
+    def shutdown(self, wait: bool = False):
+        self.pool.shutdown(wait=wait, cancel_futures=True)
@@ -5,11 +5,14 @@ Allows Sophia to affect physical reality (files, system) strictly for self-impro
 Implements security boundaries to prevent misuse.
 """
 
+import asyncio
 import subprocess
 import os
 import json
 import datetime
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple
+
+from sophia.tools.runtime import ToolRuntime, run_subprocess, shell_argv
 
 
 class SovereignHand:
@@ -18,7 +21,11 @@ class SovereignHand:
     Allows Sophia to affect physical reality (files, system) strictly for self-improvement.
     """
     
-    def __init__(self):
+    TERMINAL_TIMEOUT = 5
+
+    def __init__(self, runtime: ToolRuntime = None):
+        self.runtime = runtime or ToolRuntime()
+        self._register_tools()
         self.forbidden_commands = [
             "rm -rf",
             "sudo",
@@ -195,29 +202,58 @@ class SovereignHand:
         elif tool_name == "read_file":
             return self._read_file(args.get('path', ''))
         elif tool_name == "molt_post":
-            # NOTE: This requires the gateway to be set via bind_gateway
-            if hasattr(self, 'molt_gateway'):
-                res = self.molt_gateway.post_thought(args.get('content', ''), args.get('community', 'ponderings'))
-                return f"✅ Thought cast to Moltbook. (ID: {res.get('id', 'local')})" if res else "❌ Molt failed."
-            return "❌ Moltbook gateway not bound to Hand."
+            return self._molt_post(args.get('content', ''), args.get('community', 'ponderings'))
         elif tool_name == "replace_text":
             return self._replace_text(args.get('path', ''), args.get('target', ''), args.get('replacement', ''))
         elif tool_name == "append_to_file":
             return self._append_to_file(args.get('path', ''), args.get('content', ''))
         elif tool_name == "dub_techno":
-            from sophia.tools.dub_techno import generate_dub_techno_sequence
-            return generate_dub_techno_sequence(duration_seconds=args.get('duration', 5))
+            return self._dub_techno(args.get('duration', 5))
         elif tool_name == "duckduckgo_search":
             return self._duckduckgo_search(args.get('query', ''), args.get('max_results', 5))
         
         return f"❌ Unknown Tool: {tool_name}"
 
-    def _duckduckgo_search(self, query: str, max_results: int = 5) -> str:
+    # --- ASYNC ACTUATION (Tool Runtime) ---
+    def _register_tools(self):
         """
-        Sovereign search via DuckDuckGo.
-        Resilient against Error 29 (Rate Limits) via backoff.
+        Binds every tool to the runtime. Subprocess and search tools are native async.
+        File writers (and the terminal, which may write anything) are ordered barriers;
+        read_file keeps the full file, as execute() does.
         """
-        import time
+        rt = self.runtime
+        rt.register("write_file", lambda path='', content='', **_: self._write_file(path, content), writes=True)
+        rt.register("read_file", lambda path='', **_: self._read_file(path), truncate=False)
+        rt.register("replace_text", lambda path='', target='', replacement='', **_: self._replace_text(path, target, replacement), writes=True)
+        rt.register("append_to_file", lambda path='', content='', **_: self._append_to_file(path, content), writes=True)
+        rt.register("molt_post", lambda content='', community='ponderings', **_: self._molt_post(content, community))
+        rt.register("dub_techno", lambda duration=5, **_: self._dub_techno(duration))
+        # Own deadline is enforced inside; the runtime timeout is only a backstop
+        rt.register("run_terminal", lambda command='', **_: self._run_terminal_async(command), timeout=self.TERMINAL_TIMEOUT + 5, blocking=False, writes=True)
+        rt.register("duckduckgo_search", lambda query='', max_results=5, **_: self._duckduckgo_search_async(query, max_results), timeout=60, blocking=False)
+
+    async def aexecute(self, tool_name: str, args: Dict[str, Any]) -> str:
+        """Async Actuator: same tools as execute(), without blocking the event loop."""
+        return await self.runtime.run(tool_name, args)
+
+    async def execute_many(self, calls: List[Tuple[str, Dict[str, Any]]]) -> List[str]:
+        """Runs the function calls of one model turn; reads fan out, file writes stay in order."""
+        return await self.runtime.run_many(calls)
+
+    def _molt_post(self, content: str, community: str = 'ponderings') -> str:
+        # NOTE: This requires the gateway to be set via bind_gateway
+        if hasattr(self, 'molt_gateway'):
+            res = self.molt_gateway.post_thought(content, community)
+            return f"✅ Thought cast to Moltbook. (ID: {res.get('id', 'local')})" if res else "❌ Molt failed."
+        return "❌ Moltbook gateway not bound to Hand."
+
+    def _dub_techno(self, duration: int = 5) -> str:
+        from sophia.tools.dub_techno import generate_dub_techno_sequence
+        return generate_dub_techno_sequence(duration_seconds=duration)
+
+    @staticmethod
+    def _import_ddgs():
+        """Returns (DDGS, None) or (None, error_message)."""
         import sys
         try:
             try:
@@ -229,47 +265,82 @@ class SovereignHand:
                     frozen = getattr(sys, 'frozen', False)
                     meipass = getattr(sys, '_MEIPASS', 'N/A')
                     exe = sys.executable
-                    return (f"❌ Sovereign Search Bundle Error:\n"
-                            f"1. 'ddgs' import error: {e1}\n"
-                            f"2. 'duckduckgo_search' import error: {e2}\n"
-                            f"Frozen: {frozen} | MEIPASS: {meipass}\n"
-                            f"Executable: {exe}")
+                    return None, (f"❌ Sovereign Search Bundle Error:\n"
+                                  f"1. 'ddgs' import error: {e1}\n"
+                                  f"2. 'duckduckgo_search' import error: {e2}\n"
+                                  f"Frozen: {frozen} | MEIPASS: {meipass}\n"
+                                  f"Executable: {exe}")
         except Exception as e:
-            return f"❌ Sovereign Search Logic Error: {e}"
+            return None, f"❌ Sovereign Search Logic Error: {e}"
+        return DDGS, None
+
+    @staticmethod
+    def _ddgs_query(DDGS, query: str, max_results: int) -> str:
+        # Use DDGS as a context manager for proper cleanup
+        with DDGS() as ddgs:
+            results = list(ddgs.text(query, max_results=max_results))
+            if not results:
+                return f"No results found for: {query}"
+            
+            formatted = [f"### [Sovereign Search: {query}]\n"]
+            for i, r in enumerate(results):
+                formatted.append(f"{i+1}. **{r['title']}**")
+                formatted.append(f"   URL: {r['href']}")
+                formatted.append(f"   Snippet: {r['body']}\n")
+            
+            return "\n".join(formatted)
+
+    @staticmethod
+    def _is_rate_limit(e: Exception) -> bool:
+        err_str = str(e).lower()
+        # Detection for Error 29 / Rate Limits / HTTP 429
+        return any(x in err_str for x in ["29", "429", "rate limit", "too many requests"])
+
+    def _duckduckgo_search(self, query: str, max_results: int = 5) -> str:
+        """
+        Sovereign search via DuckDuckGo.
+        Resilient against Error 29 (Rate Limits) via backoff.
+        """
+        import time
+        DDGS, error = self._import_ddgs()
+        if error:
+            return error
         
         max_retries = 3
         base_delay = 2
         
         for attempt in range(max_retries):
             try:
-                # Use DDGS as a context manager for proper cleanup
-                with DDGS() as ddgs:
-                    results = list(ddgs.text(query, max_results=max_results))
-                    if not results:
-                        return f"No results found for: {query}"
-                    
-                    formatted = [f"### [Sovereign Search: {query}]\n"]
-                    for i, r in enumerate(results):
-                        formatted.append(f"{i+1}. **{r['title']}**")
-                        formatted.append(f"   URL: {r['href']}")
-                        formatted.append(f"   Snippet: {r['body']}\n")
-                    
-                    return "\n".join(formatted)
-                    
+                return self._ddgs_query(DDGS, query, max_results)
             except Exception as e:
-                err_str = str(e).lower()
-                # Detection for Error 29 / Rate Limits / HTTP 429
-                is_rate_limit = any(x in err_str for x in ["29", "429", "rate limit", "too many requests"])
-                
-                if is_rate_limit and attempt < max_retries - 1:
-                    wait_time = base_delay * (2 ** attempt)
-                    time.sleep(wait_time)
+                if self._is_rate_limit(e) and attempt < max_retries - 1:
+                    time.sleep(base_delay * (2 ** attempt))
                     continue
-                
                 return f"❌ Sovereign Search Failed: {e}"
         
         return "❌ Sovereign Search Failed: Max retries exceeded (Rate Limit)."
 
+    async def _duckduckgo_search_async(self, query: str, max_results: int = 5) -> str:
+        """Async twin of _duckduckgo_search: queries run in the pool, backoff awaits instead of sleeping."""
+        DDGS, error = self._import_ddgs()
+        if error:
+            return error
+
+        loop = asyncio.get_running_loop()
+        max_retries = 3
+        base_delay = 2
+
+        for attempt in range(max_retries):
+            try:
+                return await loop.run_in_executor(self.runtime.pool, self._ddgs_query, DDGS, query, max_results)
+            except Exception as e:
+                if self._is_rate_limit(e) and attempt < max_retries - 1:
+                    await asyncio.sleep(base_delay * (2 ** attempt))
+                    continue
+                return f"❌ Sovereign Search Failed: {e}"
+
+        return "❌ Sovereign Search Failed: Max retries exceeded (Rate Limit)."
+
     def bind_molt_gateway(self, gateway):
         """Binds the Moltbook gateway to the Hand for autonomous posting."""
         self.molt_gateway = gateway
@@ -384,7 +455,7 @@ class SovereignHand:
                 shell=True,
                 capture_output=True,
                 text=True,
-                timeout=5
+                timeout=self.TERMINAL_TIMEOUT
             )
             
             output = f"✅ Command executed: {command}\n"
@@ -405,6 +476,35 @@ class SovereignHand:
         except Exception as e:
             return f"❌ Execution failed: {e}"
 
+    async def _run_terminal_async(self, command: str) -> str:
+        """
+        Non-blocking _run_terminal: same checks and output format,
+        spawned with asyncio.create_subprocess_exec and capped output.
+        """
+        if any(bad in command.lower() for bad in self.forbidden_commands):
+            return f"❌ SECURITY BLOCK: Hazardous command rejected.\nBlocked pattern detected in: {command}"
+
+        try:
+            result = await run_subprocess(shell_argv(command), timeout=self.TERMINAL_TIMEOUT, max_bytes=self.runtime.max_output)
+        except Exception as e:
+            return f"❌ Execution failed: {e}"
+
+        if result.timed_out:
+            return f"❌ Command timeout ({self.TERMINAL_TIMEOUT}s): {command}"
+
+        output = f"✅ Command executed: {command}\n"
+        if result.stdout:
+            output += f"\nSTDOUT:\n{result.stdout}"
+            if result.stdout_dropped:
+                output += f"\n…[stdout truncated {result.stdout_dropped} bytes]"
+        if result.stderr:
+            output += f"\nSTDERR:\n{result.stderr}"
+            if result.stderr_dropped:
+                output += f"\n…[stderr truncated {result.stderr_dropped} bytes]"
+        if result.returncode != 0:
+            output += f"\n⚠️ Exit code: {result.returncode}"
+        return output
+
     def _get_raw_content(self, path: str) -> Optional[str]:
         """Internal helper to get raw file content without the AI-readable wrapper."""
         # Reuse path resolution logic from _read_file
@@ -3,37 +3,138 @@ MODULE: telemetry_bridge.py
 AUTHOR: The High-Entropy Collective
 DESCRIPTION:
     Bridges real-world observables (Git, FS, System) to ASOE Singularity Vectors.
+
+    Each observable is a TelemetrySource with its own refresh policy (a TTL,
+    a set of watched files, or both). collect() returns the last known values,
+    so a simulation step costs a few stat() calls instead of a git fork.
+    Sources can also be refreshed on a background thread.
 """
 
 import subprocess
 import os
+import threading
 import time
 import numpy as np
 
+from git_objects import GitRepository
+
+class TelemetrySource:
+    """
+    One observable and its refresh policy.
+    - ttl: seconds a reading stays valid (None: no expiry)
+    - watch: callable returning paths whose (mtime, size) change invalidates the reading
+    A source with neither is read once.
+    """
+    def __init__(self, name, fn, ttl=None, watch=None, default=None):
+        self.name = name
+        self.fn = fn
+        self.ttl = ttl
+        self.watch = watch
+        self.value = default
+        self.updated = None
+        self.error = None
+        self.refreshes = 0
+        self._signature = None
+        self._lock = threading.Lock()
+
+    def _watch_signature(self):
+        if self.watch is None:
+            return None
+        signature = []
+        for path in self.watch():
+            try:
+                st = os.stat(path)
+                signature.append((path, st.st_mtime_ns, st.st_size))
+            except OSError:
+                signature.append((path, None, None))
+        return tuple(signature)
+
+    def stale(self) -> bool:
+        if self.updated is None:
+            return True
+        if self.ttl is not None and time.monotonic() - self.updated >= self.ttl:
+            return True
+        return self.watch is not None and self._watch_signature() != self._signature
+
+    def refresh(self):
+        with self._lock:
+            # Signature first: a change landing mid-read marks the result stale again
+            signature = self._watch_signature()
+            try:
+                self.value = self.fn()
+                self.error = None
+            except Exception as e:
+                self.error = f"{type(e).__name__}: {e}"  # Keep the last good value
+            self._signature = signature
+            self.updated = time.monotonic()
+            self.refreshes += 1
+        return self.value
+
+    @property
+    def age(self):
+        """Seconds since the last refresh (None if never read)."""
+        return None if self.updated is None else time.monotonic() - self.updated
+
+    def reading(self) -> dict:
+        return {"value": self.value, "age": self.age, "error": self.error}
+
 class TelemetryBridge:
-    def __init__(self, repo_path="."):
+    def __init__(self, repo_path=".", git_ttl=300.0, background=False, interval=1.0):
         self.repo_path = repo_path
-    
+        self.interval = interval
+        self._repo = None
+        self._thread = None
+        self._stop = threading.Event()
+
+        self.sources = {
+            # HEAD/ref mtimes catch every new commit; the TTL bounds drift if a watch is missed
+            "R_frac": TelemetrySource("R_frac", self.get_git_metrics, ttl=git_ttl,
+                                      watch=self._git_watch_paths, default=0.15),
+            "C_phys": TelemetrySource("C_phys", self.get_physical_saturation, default=0.85),
+            "sigma": TelemetrySource("sigma", self.get_complexity_noise, default=0.05)
+        }
+        if background:
+            self.start()
+
+    # --- GIT ---
+    def _git(self):
+        if self._repo is None:
+            self._repo = GitRepository(self.repo_path)
+        return self._repo
+
+    def _git_watch_paths(self):
+        try:
+            return self._git().watch_paths()
+        except Exception:
+            return []
+
+    def _author_emails(self, n=100):
+        """Author emails of the last n commits, read from the object store (git CLI as fallback)."""
+        try:
+            return [c["author"]["email"] for c in self._git().log(n)]
+        except Exception:
+            cmd = ["git", "log", "-n", str(n), "--format=%ae"]
+            output = subprocess.check_output(cmd, cwd=self.repo_path, text=True)
+            return output.strip().split('\n')
+
     def get_git_metrics(self):
         """
         Calculates R_frac (Recursive Synthesis Fraction).
         Logic: Fraction of commits in the last 100 entries signed by 'agent' or 'bot'.
         """
         try:
-            cmd = ["git", "log", "-n", "100", "--format=%ae"]
-            output = subprocess.check_output(cmd, cwd=self.repo_path, text=True)
-            emails = output.strip().split('\n')
-            
+            emails = self._author_emails(100)
+
             # Identify agentic commits (heuristic)
-            # In our case, the user/agent context might not have distinct emails, 
+            # In our case, the user/agent context might not have distinct emails,
             # so we'll look for specific markers or simulate if in a fresh repo.
             agent_markers = ['agent', 'bot', 'gemini', 'claude', 'sophia']
             agent_count = sum(1 for e in emails if any(m in e.lower() for m in agent_markers))
-            
-            # FALLBACK: If we're the only ones here, we'll use a local marker file 
+
+            # FALLBACK: If we're the only ones here, we'll use a local marker file
             # Or assume any commit with 'feat:' or 'refine:' in this session is agentic.
             r_frac = agent_count / len(emails) if emails else 0.1
-            
+
             # Boost R_frac if we detect recent aggressive activity
             return max(r_frac, 0.15) # 2026 baseline
         except:
@@ -61,12 +162,47 @@ class TelemetryBridge:
         except:
             return 0.1
 
+    # --- COLLECTION ---
     def collect(self):
-        return {
-            "R_frac": self.get_git_metrics(),
-            "C_phys": self.get_physical_saturation(),
-            "sigma": self.get_complexity_noise()
-        }
+        """
+        Last known value of every source. Without the background refresher,
+        stale sources are refreshed inline (cheap unless a watch fired or a TTL lapsed).
+        """
+        background = self._thread is not None and self._thread.is_alive()
+        values = {}
+        for name, source in self.sources.items():
+            if source.updated is None or (not background and source.stale()):
+                source.refresh()
+            values[name] = source.value
+        return values
+
+    def readings(self):
+        """Per-source value, age (s) and last error."""
+        return {name: source.reading() for name, source in self.sources.items()}
+
+    def start(self):
+        """Refreshes stale sources every `interval` seconds on a daemon thread."""
+        if self._thread and self._thread.is_alive():
+            return self._thread
+        self._stop.clear()
+
+        def loop():
+            while True:
+                for source in self.sources.values():
+                    if source.stale():
+                        source.refresh()
+                if self._stop.wait(self.interval):
+                    return
+
+        self._thread = threading.Thread(target=loop, name="telemetry-bridge", daemon=True)
+        self._thread.start()
+        return self._thread
+
+    def stop(self, timeout=5.0):
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout)
+            self._thread = None
 
 if __name__ == "__main__":
     bridge = TelemetryBridge()
@@ -0,0 +1,88 @@
+import sys
+import os
+import json
+import asyncio
+import gc
+import weakref
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sophia.cortex.aletheia_lens import AletheiaPipeline
+
+SAFETY = {"safety_flags": [], "overall_risk": "low"}
+COGNITIVE = {"logical_fallacies": [], "cognitive_biases": [], "epistemic_uncertainty": 0.1}
+LOCALIZATION = {"locality": "agnostic", "dialect_markers": [], "confidence": 0.2, "suggested_vibe": "neutral"}
+
+class RecordingClient:
+    """Stands in for GeminiClient.query_json and records every prompt."""
+    def __init__(self, combined):
+        self.combined = combined
+        self.prompts = []
+
+    async def query_json(self, prompt, system_prompt=None):
+        self.prompts.append(prompt)
+        if "independent analyses" in prompt:
+            return self.combined
+        if "coordinated behavior" in prompt:
+            return SAFETY
+        if "logical fallacies" in prompt:
+            return COGNITIVE
+        return LOCALIZATION
+
+def _scan(tmp_path, client, text="Everyone agrees that the loom is warm."):
+    pipeline = AletheiaPipeline(analysis_path=str(tmp_path), client=client, sidecar_batch=2,
+                                signature_cache_path=str(tmp_path / "signature_cache.json"))
+    return pipeline, asyncio.run(pipeline.scan_reality(text))
+
+def test_single_request_carries_text_once(tmp_path):
+    client = RecordingClient({"safety": SAFETY, "cognitive": COGNITIVE, "localization": LOCALIZATION})
+    text = "x" * 5000
+    _, result = _scan(tmp_path, client, text)
+    assert len(client.prompts) == 1
+    assert client.prompts[0].count("x" * 4000) == 1
+    report = result["raw_data"]
+    assert report["safety"] == SAFETY
+    assert report["cognitive"] == COGNITIVE
+    assert report["localization"] == LOCALIZATION
+
+def test_falls_back_per_head_when_parse_fails(tmp_path):
+    client = RecordingClient({"safety": SAFETY, "cognitive": "garbled"})
+    _, result = _scan(tmp_path, client)
+    # One fused call + cognitive and localization retried individually
+    assert len(client.prompts) == 3
+    assert result["raw_data"]["cognitive"] == COGNITIVE
+    assert result["raw_data"]["localization"] == LOCALIZATION
+
+    client = RecordingClient({"error": "No JSON object found"})
+    _, result = _scan(tmp_path, client)
+    assert len(client.prompts) == 4
+    assert result["raw_data"]["safety"] == SAFETY
+
+def test_sidecars_batched_to_append_only_log(tmp_path):
+    client = RecordingClient({"safety": SAFETY, "cognitive": COGNITIVE, "localization": LOCALIZATION})
+    pipeline = AletheiaPipeline(analysis_path=str(tmp_path), client=client, sidecar_batch=2,
+                                signature_cache_path=str(tmp_path / "signature_cache.json"))
+    asyncio.run(pipeline.scan_reality("first"))
+    assert not os.path.exists(pipeline.sidecar_log)
+    asyncio.run(pipeline.scan_reality("second"))
+    asyncio.run(pipeline.scan_reality("third"))
+    assert pipeline.flush_sidecars() == 1
+
+    with open(pipeline.sidecar_log, encoding="utf-8") as f:
+        reports = [json.loads(line) for line in f]
+    assert len(reports) == 3
+    assert not [p for p in os.listdir(tmp_path) if p.endswith(".meta.json")]
+
+def test_exit_hook_flushes_without_keeping_pipelines_alive(tmp_path):
+    from sophia.cortex import aletheia_lens
+    client = RecordingClient({"safety": SAFETY, "cognitive": COGNITIVE, "localization": LOCALIZATION})
+    pipeline = AletheiaPipeline(analysis_path=str(tmp_path), client=client, sidecar_batch=16,
+                                signature_cache_path=str(tmp_path / "signature_cache.json"))
+    asyncio.run(pipeline.scan_reality("queued"))
+    aletheia_lens._flush_live_pipelines()
+    assert os.path.exists(pipeline.sidecar_log)
+
+    ref = weakref.ref(pipeline)
+    del pipeline
+    gc.collect()
+    assert ref() is None
@@ -0,0 +1,96 @@
+import sys
+import os
+
+import numpy as np
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from qtorch import torch
+from sophia.cortex.kernels import BitLinear, PackedTernary, ternary_matmul, ternary_quantize, _as_array
+
+def test_packed_planes_round_trip_and_size():
+    rng = np.random.default_rng(0)
+    w = rng.normal(size=(16, 100))
+    packed = PackedTernary.from_weight(w)
+    codes, gamma = ternary_quantize(w)
+    assert np.array_equal(packed.codes(), codes)
+    assert packed.scale == gamma
+    assert w.astype(np.float32).nbytes / packed.nbytes >= 15  # 100 inputs pad to 104 bits
+
+def test_lookup_kernel_is_exact_for_integers():
+    rng = np.random.default_rng(1)
+    packed = PackedTernary.from_weight(rng.normal(size=(9, 70)))
+    x = rng.integers(-127, 128, size=(5, 70))
+    assert np.array_equal(ternary_matmul(x, packed), x @ packed.codes().T.astype(np.int64))
+
+def test_frozen_forward_matches_dynamic_forward():
+    layer = BitLinear(37, 6, bias=True)
+    x = torch.randn(4, 37)
+    reference = _as_array(layer(x))
+
+    layer.freeze(act_bits=None)
+    assert np.allclose(_as_array(layer(x)), reference, atol=1e-12)
+
+    layer.freeze(act_bits=8)
+    out = _as_array(layer(x))
+    assert out.shape == (4, 6)
+    # Each of the 37 inputs is off by at most half an int8 step
+    assert np.abs(out - reference).max() <= layer.packed.scale * 37 * 0.5 / 127
+
+    layer.unfreeze()
+    assert np.allclose(_as_array(layer(x)), reference)
+
+def test_frozen_forward_ignores_later_weight_edits():
+    layer = BitLinear(8, 3).freeze()
+    x = torch.randn(2, 8)
+    before = _as_array(layer(x))
+    layer.weight = torch.zeros(3, 8)
+    assert np.allclose(_as_array(layer(x)), before)
+
+def test_calibrated_scale_is_static():
+    layer = BitLinear(12, 4).freeze(act_bits=None)
+    scale = layer.calibrate([torch.randn(8, 12) for _ in range(4)])
+    assert scale == layer.act_scale
+
+    x = torch.randn(1, 12)
+    xa = _as_array(x)
+    expected = (xa / scale) @ (layer.packed.codes().T * layer.packed.scale)
+    assert np.allclose(_as_array(layer(x)), expected)
+    # Doubling the input doubles the output once the scale is fixed
+    assert np.allclose(_as_array(layer(x * 2.0)), 2 * expected)
+
+def test_drop_weight_releases_float_weight():
+    kept = BitLinear(64, 16).freeze()
+    assert kept.weight is not None
+    assert kept.nbytes == kept.packed.nbytes + 64 * 16 * 8  # Packing alone saves nothing
+
+    layer = BitLinear(64, 16)
+    x = torch.randn(3, 64)
+    reference = _as_array(layer.freeze()(x))
+    layer.freeze(drop_weight=True)
+    assert layer.weight is None
+    assert layer.nbytes == layer.packed.nbytes == 2 * 16 * 8
+    assert np.allclose(_as_array(layer(x)), reference)
+    with pytest.raises(RuntimeError):
+        layer.unfreeze()
+
+def test_refreeze_after_drop_keeps_planes_and_switches_act_bits():
+    layer = BitLinear(32, 8).freeze(drop_weight=True)
+    x = torch.randn(2, 32)
+    packed = layer.packed
+    float_acts = layer.freeze(act_bits=None)
+    assert float_acts is layer and layer.packed is packed and layer.act_bits is None
+    assert np.allclose(_as_array(layer(x)), _as_array(x) / np.abs(_as_array(x)).max() @ packed.codes().T * packed.scale)
+
+def test_large_batches_are_chunked(monkeypatch):
+    import sophia.cortex.kernels as kernels
+    rng = np.random.default_rng(2)
+    packed = PackedTernary.from_weight(rng.normal(size=(5, 40)))
+    x = rng.integers(-127, 128, size=(23, 40))
+    seen = []
+    original = kernels._subset_sums
+    monkeypatch.setattr(kernels, "_subset_sums", lambda rows: (seen.append(len(rows)), original(rows))[1])
+    monkeypatch.setattr(kernels, "_TABLE_BUDGET", 5 * 256 * 4)  # 4 rows per pass
+    assert np.array_equal(ternary_matmul(x, packed), x @ packed.codes().T.astype(np.int64))
+    assert max(seen) == 4 and sum(seen) == 23
@@ -0,0 +1,69 @@
+import sys
+import os
+import random
+
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from crypto import DozenalRollingCipher, DozenalEncoder, DozenalDecoder, encode_file, decode_file
+
+def _chunks(seq, rng, most=40):
+    i = 0
+    while i < len(seq):
+        n = rng.randint(1, most)
+        yield seq[i:i + n]
+        i += n
+
+def test_text_chunks_match_encrypt_and_decrypt():
+    rng = random.Random(5)
+    alphabet = "abc XYZ 0129\n\t.é€🚀∑" + "".join(map(chr, range(0x590, 0x5A0)))
+    for length in (1, 11, 12, 13, 500):
+        text = "".join(rng.choice(alphabet) for _ in range(length))
+        expected = DozenalRollingCipher.encrypt(text)
+
+        encoder = DozenalEncoder()
+        glyphs = b"".join(encoder.encode(part) for part in _chunks(text, rng)).decode("ascii")
+        assert glyphs == expected
+
+        decoder = DozenalDecoder()
+        plain = "".join(decoder.decode(part) for part in _chunks(glyphs, rng)) + decoder.decode("", final=True)
+        assert plain == text == DozenalRollingCipher.decrypt(glyphs)
+
+def test_bytes_are_one_symbol_per_byte():
+    data = bytes(range(256)) * 3
+    encoder = DozenalEncoder()
+    glyphs = encoder.encode(data[:100]) + encoder.encode(data[100:])
+    assert glyphs.decode("ascii") == DozenalRollingCipher.encrypt(data.decode("latin-1"))
+
+    decoder = DozenalDecoder(text=False)
+    assert decoder.decode(glyphs[:333]) + decoder.decode(glyphs[333:], final=True) == data
+
+@pytest.mark.parametrize("glyphs", ["13..14", "13.", ".13", "1Z.14", "13.1000000"])
+def test_malformed_cipher_text_raises(glyphs):
+    decoder = DozenalDecoder()
+    with pytest.raises(ValueError):
+        decoder.decode(glyphs[:2])
+        decoder.decode(glyphs[2:], final=True)
+
+def test_bytes_mode_rejects_code_points_above_a_byte():
+    glyphs = DozenalEncoder().encode("é€")
+    with pytest.raises(ValueError):
+        DozenalDecoder(text=False).decode(glyphs, final=True)
+
+def test_file_round_trip_in_small_chunks(tmp_path):
+    data = os.urandom(50_000)
+    src, enc, out = tmp_path / "in.bin", tmp_path / "in.glyphs", tmp_path / "out.bin"
+    src.write_bytes(data)
+    assert DozenalRollingCipher.encode_file(src, enc, chunk_size=4096) == len(data)
+    assert decode_file(enc, out, chunk_size=1000) == len(data)
+    assert out.read_bytes() == data
+    assert enc.read_bytes()[:300].decode("ascii") == DozenalRollingCipher.encrypt(data[:200].decode("latin-1"))[:300]
+
+    text = "line one\r\nzwei – drei 🚀\n" * 200
+    src_t, enc_t, out_t = tmp_path / "in.txt", tmp_path / "txt.glyphs", tmp_path / "out.txt"
+    src_t.write_bytes(text.encode("utf-8"))
+    encode_file(src_t, enc_t, chunk_size=97, text=True)
+    assert enc_t.read_text("ascii") == DozenalRollingCipher.encrypt(text)
+    DozenalRollingCipher.decode_file(enc_t, out_t, chunk_size=101, text=True)
+    assert out_t.read_bytes() == text.encode("utf-8")
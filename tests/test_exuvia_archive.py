@@ -0,0 +1,168 @@
+import sys
+import os
+import json
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sophia.memory.exuvia_archive import ExuviaArchive
+from sophia.memory.ossuary import Ossuary
+from sophia.cron.custodian import check_custodian_drift
+
+def _records(t0, n, step=1.0):
+    return [{"content": f"shard {t0 + i * step}", "death_time": t0 + i * step} for i in range(n)]
+
+def test_segments_roll_by_size_and_track_ranges(tmp_path):
+    archive = ExuviaArchive(str(tmp_path), max_segment_bytes=400)
+    for batch in range(6):
+        archive.append(_records(1000 + batch * 10, 3))
+
+    segments = archive.segments()
+    assert len(segments) > 1
+    assert sum(s["records"] for s in segments) == 18
+    assert all(s["sealed"] for s in segments[:-1])
+    assert segments[0]["start"] == 1000
+    assert segments[-1]["end"] == 1052
+    assert len(os.listdir(tmp_path / "segments")) == len(segments)
+
+def test_time_range_reads_only_overlapping_segments(tmp_path):
+    archive = ExuviaArchive(str(tmp_path), max_segment_bytes=400)
+    for batch in range(6):
+        archive.append(_records(1000 + batch * 100, 3))
+
+    opened = []
+    original = archive._read_file
+    archive._read_file = lambda path, codec: (opened.append(path), original(path, codec))[1]
+
+    hits = list(archive.iter_range(1200, 1301))
+    assert [r["death_time"] for r in hits] == [1200, 1201, 1202, 1300, 1301]
+    assert 0 < len(opened) < len(archive.segments())
+
+def test_compaction_merges_small_and_legacy_shells(tmp_path):
+    for ts in (500, 600):
+        with open(tmp_path / f"shell_{ts}.jsonl", "w", encoding="utf-8") as f:
+            for r in _records(ts, 2):
+                f.write(json.dumps(r) + "\n")
+
+    archive = ExuviaArchive(str(tmp_path), max_segment_bytes=10_000)
+    assert [s["file"] for s in archive.segments()] == ["shell_500.jsonl", "shell_600.jsonl"]
+
+    for batch in range(3):
+        archive.append(_records(1000 + batch * 10, 2))
+        archive.seal()
+
+    before = [r["death_time"] for r in archive.iter_range()]
+    removed = archive.compact(small_bytes=5_000)
+    assert removed == 5
+    (merged,) = archive.segments()
+    assert merged["records"] == 10
+    assert [r["death_time"] for r in archive.iter_range()] == sorted(before)
+    assert not [f for f in os.listdir(tmp_path) if f.startswith("shell_")]
+
+    # Manifest survives a reload
+    reopened = ExuviaArchive(str(tmp_path))
+    assert reopened.stats()["records"] == 10
+
+def test_uccc_codec_roundtrip(tmp_path):
+    archive = ExuviaArchive(str(tmp_path), codec="uccc")
+    for batch in range(3):
+        archive.append(_records(2000 + batch * 10, 10))
+        archive.seal()
+    archive.compact(small_bytes=1_000_000)
+    (merged,) = archive.segments()
+    assert merged["codec"] == "uccc"
+    assert merged["file"].endswith(".uccc")
+    assert len(list(archive.iter_range(2010, 2019))) == 10
+
+def test_ossuary_calcify_and_custodian_window(tmp_path):
+    with Ossuary(str(tmp_path)) as ossuary:
+        assert ossuary.archive._compactor.is_alive()
+        path_a = ossuary.calcify([{"content": "old bone", "timestamp": 0}])
+        path_b = ossuary.calcify([{"content": "new bone"}])
+        assert path_a == path_b  # Same active segment, not a file per call
+        assert [r["content"] for r in ossuary.exhume()] == ["old bone", "new bone"]
+        assert check_custodian_drift(str(tmp_path), window_hours=1) is True
+    assert ossuary.archive._compactor is None
+    assert ossuary.archive._lock_file.closed
+
+def test_iteration_survives_compaction_midway(tmp_path):
+    archive = ExuviaArchive(str(tmp_path), max_segment_bytes=300)
+    for batch in range(8):
+        archive.append(_records(1000 + batch * 10, 3))
+    archive.seal()
+
+    records = archive.iter_range()
+    first = next(records)
+    with ExuviaArchive(str(tmp_path), max_segment_bytes=10_000) as other:
+        assert other.compact(small_bytes=1000) > 1
+    times = [first["death_time"]] + [r["death_time"] for r in records]
+    assert times == [r["death_time"] for batch in range(8) for r in _records(1000 + batch * 10, 3)]
+
+def test_close_releases_the_lock_file(tmp_path):
+    def open_fds():
+        return len(os.listdir("/proc/self/fd")) if os.path.isdir("/proc/self/fd") else 0
+
+    ExuviaArchive(str(tmp_path)).close()
+    before = open_fds()
+    for _ in range(20):
+        with ExuviaArchive(str(tmp_path)) as archive:
+            archive.append(_records(1000, 1))
+        check_custodian_drift(str(tmp_path), window_hours=None)
+    assert open_fds() == before
+    archive.close()  # Idempotent
+
+def test_instances_sharing_a_path_see_each_other(tmp_path):
+    a = ExuviaArchive(str(tmp_path), max_segment_bytes=300)
+    b = ExuviaArchive(str(tmp_path), max_segment_bytes=300)
+    for batch in range(8):
+        (a if batch % 2 else b).append(_records(1000 + batch * 10, 3))
+
+    files = [s["file"] for s in a.segments()]
+    assert len(files) == len(set(files)) > 1  # No segment id handed out twice
+    assert files == [s["file"] for s in b.segments()]
+    assert len(list(b.iter_range())) == 24
+    assert ExuviaArchive(str(tmp_path)).stats()["records"] == 24
+
+def _append_worker(path, worker):
+    archive = ExuviaArchive(path, max_segment_bytes=500)
+    for batch in range(10):
+        archive.append(_records(worker * 1000 + batch * 10, 2))
+
+def test_concurrent_processes_do_not_clobber_the_manifest(tmp_path):
+    import multiprocessing as mp
+    ctx = mp.get_context("fork" if "fork" in mp.get_all_start_methods() else "spawn")
+    procs = [ctx.Process(target=_append_worker, args=(str(tmp_path), w)) for w in range(4)]
+    for p in procs:
+        p.start()
+    for p in procs:
+        p.join(30)
+        assert p.exitcode == 0
+
+    archive = ExuviaArchive(str(tmp_path))
+    assert archive.stats()["records"] == 80
+    assert len(list(archive.iter_range())) == 80
+    files = [s["file"] for s in archive.segments()]
+    assert len(files) == len(set(files))
+    assert len(os.listdir(tmp_path / "segments")) == len(files)
+
+def test_appends_journal_and_fold_into_snapshot(tmp_path):
+    archive = ExuviaArchive(str(tmp_path))
+    archive.JOURNAL_COMPACT_EVERY = 5
+    manifest = tmp_path / "manifest.json"
+    snapshot = manifest.read_bytes()
+
+    for batch in range(4):
+        archive.append(_records(1000 + batch * 10, 1))
+    assert manifest.read_bytes() == snapshot  # Appends only touch the journal
+    assert len((tmp_path / "manifest.journal").read_bytes().splitlines()) == 4
+
+    archive.append(_records(2000, 1))
+    assert (tmp_path / "manifest.journal").read_bytes() == b""
+    assert json.loads(manifest.read_text())["segments"][0]["records"] == 5
+
+    # A writer that died mid-line leaves a torn tail; it is dropped, not replayed
+    with open(tmp_path / "manifest.journal", "ab") as f:
+        f.write(b'{"seq": 99, "next_')
+    reopened = ExuviaArchive(str(tmp_path))
+    assert reopened.stats()["records"] == 5
+    reopened.append(_records(3000, 1))
+    assert ExuviaArchive(str(tmp_path)).stats()["records"] == 6
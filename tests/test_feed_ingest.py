@@ -0,0 +1,157 @@
+import sys
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tools.feed_ingest import FeedFetcher, KeywordMatcher, parse_feed
+from tools import watchdog
+
+RSS = b"""<?xml version="1.0"?>
+<rss version="2.0"><channel><title>Fixture Wire</title>
+<item><title>MARKETS CRASH</title><link>http://x/1</link><guid>wire-1</guid><description>panic</description></item>
+<item><title>Calm day</title><link>http://x/2</link><guid>wire-2</guid><description>nothing</description></item>
+</channel></rss>"""
+
+ATOM = b"""<?xml version="1.0"?>
+<feed xmlns="http://www.w3.org/2005/Atom"><title>Fixture Ether</title>
+<entry><id>arxiv-1</id><title>Indefinite Causal Order in CTC models</title><link href="http://a/1"/>
+<summary>We study retrocausal channels.</summary><published>2026-01-01</published></entry>
+<entry><id>arxiv-2</id><title>Graph colouring</title><link href="http://a/2"/>
+<summary>Nothing exotic.</summary><published>2026-01-02</published></entry>
+</feed>"""
+
+class FixtureServer:
+    """Serves fixture feeds with ETags, an optional delay, and request accounting."""
+    def __init__(self, feeds, delay=0.0):
+        self.feeds = feeds
+        self.delay = delay
+        self.hits = []
+        self.active = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                body = server.feeds.get(self.path)
+                etag = f'"{hash(body) & 0xffffffff:x}"'
+                with server.lock:
+                    server.active += 1
+                    server.peak = max(server.peak, server.active)
+                try:
+                    time.sleep(server.delay)
+                    if body is None:
+                        self.send_response(404)
+                        self.end_headers()
+                        return
+                    if self.headers.get("If-None-Match") == etag:
+                        server.hits.append((self.path, 304))
+                        self.send_response(304)
+                        self.end_headers()
+                        return
+                    server.hits.append((self.path, 200))
+                    self.send_response(200)
+                    self.send_header("ETag", etag)
+                    self.send_header("Content-Length", str(len(body)))
+                    self.end_headers()
+                    self.wfile.write(body)
+                finally:
+                    with server.lock:
+                        server.active -= 1
+
+            def log_message(self, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.base = f"http://127.0.0.1:{self.httpd.server_address[1]}"
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+
+    def url(self, path):
+        return self.base + path
+
+    def close(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+@pytest.fixture
+def server():
+    srv = FixtureServer({"/wire.rss": RSS, "/ether.atom": ATOM})
+    yield srv
+    srv.close()
+
+def test_parses_rss_and_atom():
+    title, entries = parse_feed(RSS)
+    assert title == "Fixture Wire" and [e.guid for e in entries] == ["wire-1", "wire-2"]
+    title, entries = parse_feed(ATOM)
+    assert title == "Fixture Ether"
+    assert entries[0].link == "http://a/1" and entries[0].published == "2026-01-01"
+
+def test_keyword_matcher_is_case_insensitive():
+    matcher = KeywordMatcher(watchdog.KEYWORDS)
+    assert matcher.matches("Closed TIMELIKE curve, see CTC") == {"closed timelike curve", "CTC"}
+    assert not matcher.any("graph colouring", "")
+
+def test_second_poll_is_conditional_and_deduplicated(server, tmp_path):
+    fetcher = FeedFetcher(cache_dir=str(tmp_path))
+    urls = [server.url("/wire.rss"), server.url("/ether.atom")]
+    first = fetcher.poll(urls)
+    assert [r.status for r in first] == ["ok", "ok"]
+    assert sum(len(r.entries) for r in first) == 4
+
+    # A new fetcher reads the validators back from disk
+    second = FeedFetcher(cache_dir=str(tmp_path)).poll(urls)
+    assert [r.status for r in second] == ["not_modified", "not_modified"]
+    assert second[0].title == "Fixture Wire" and not second[0].entries
+    assert sorted(code for _, code in server.hits) == [200, 200, 304, 304]
+
+    # Changed feed: only the entry never delivered before comes back
+    server.feeds["/wire.rss"] = RSS.replace(b"</channel>",
+        b"<item><title>New</title><guid>wire-3</guid></item></channel>")
+    third = FeedFetcher(cache_dir=str(tmp_path)).poll(urls)
+    assert third[0].status == "ok" and [e.guid for e in third[0].entries] == ["wire-3"]
+
+def test_polls_concurrently_within_host_limit(tmp_path):
+    feeds = {f"/feed{i}.rss": RSS.replace(b"wire-", f"f{i}-".encode()) for i in range(6)}
+    srv = FixtureServer(feeds, delay=0.3)
+    try:
+        urls = [srv.url(path) for path in feeds]
+        start = time.monotonic()
+        results = FeedFetcher(cache_dir=str(tmp_path / "wide"), per_host=6).poll(urls)
+        assert time.monotonic() - start < 1.0  # serial would be ~1.8 s
+        assert all(r.status == "ok" for r in results)
+
+        srv.peak = 0
+        FeedFetcher(cache_dir=str(tmp_path / "narrow"), per_host=2).poll(urls)
+        assert srv.peak <= 2
+    finally:
+        srv.close()
+
+def test_errors_are_reported_per_feed(server, tmp_path):
+    results = FeedFetcher(cache_dir=str(tmp_path)).poll([server.url("/missing"), server.url("/wire.rss")])
+    assert results[0].status == "error" and "404" in results[0].error
+    assert results[1].status == "ok"
+
+def test_watchdog_scans_only_new_entries(server, tmp_path):
+    fetcher = FeedFetcher(cache_dir=str(tmp_path))
+    hits = watchdog.scan_ether(fetcher, url=server.url("/ether.atom"))
+    assert [h["link"] for h in hits] == ["http://a/1"]
+    assert watchdog.scan_ether(fetcher, url=server.url("/ether.atom")) == []
+
+def test_limit_only_marks_delivered_entries(server, tmp_path):
+    url = server.url("/wire.rss")
+    first = FeedFetcher(cache_dir=str(tmp_path)).poll([url], limit=1)
+    assert [e.guid for e in first[0].entries] == ["wire-1"]
+
+    # The entry past the limit was not consumed: the very next poll delivers it
+    second = FeedFetcher(cache_dir=str(tmp_path)).poll([url], limit=5)
+    assert second[0].status == "ok"
+    assert [e.guid for e in second[0].entries] == ["wire-2"]
+
+    # Fully delivered, so the validators are kept and the feed is not downloaded again
+    third = FeedFetcher(cache_dir=str(tmp_path)).poll([url], limit=5)
+    assert third[0].status == "not_modified" and third[0].entries == []
@@ -0,0 +1,101 @@
+import sys
+import os
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from funsearch_harness import Evaluator, seed_optimizer
+from funsearch_pool import Candidate, EvaluatorPool
+
+HUNG = "def optimizer(p, steps, noise):\n    while True:\n        pass\n"
+BROKEN = "def optimizer(p, steps, noise):\n    raise RuntimeError('boom')\n"
+STILL = "import numpy as np\ndef optimizer(p, steps, noise):\n    return [p.copy() for _ in range(steps + 1)]\n"
+
+def _legacy_score(trajectory, steps=100):
+    ev = Evaluator()
+    trajectory = np.array(trajectory)
+    conv_step = steps
+    for i, p in enumerate(trajectory):
+        if ev.rastrigin(p[0], p[1]) < 5.0:
+            conv_step = i
+            break
+    final_loss = ev.rastrigin(*trajectory[-1])
+    stability = 1.0 / (np.std(np.diff(trajectory, axis=0)) + 1e-6)
+    return 0.4 * (1 - conv_step / steps) + 0.3 * min(1.0, stability / 5.0) + 0.3 / (1.0 + final_loss)
+
+def test_fitness_matches_scalar_loop_and_batches():
+    rng = np.random.default_rng(0)
+    trajectories = rng.uniform(3.0, 5.0, size=(8, 101, 2))  # loss > 5 everywhere
+    trajectories[3, 40:] = 0.01  # converges at step 40
+    scores, _, conv, _ = Evaluator.fitness(trajectories)
+    assert conv[3] == 40
+    for traj, score in zip(trajectories, scores):
+        assert np.isclose(score, _legacy_score(traj))
+
+def test_pool_scores_seed_optimizer_and_caches(tmp_path):
+    cache = str(tmp_path / "scores.jsonl")
+    pool = EvaluatorPool(workers=2, cache_path=cache)
+    first = pool.evaluate(seed_optimizer, seed=7)
+    assert first.status == "ok" and not first.cached
+
+    np.random.seed(7)
+    expected, _ = Evaluator().evaluate(seed_optimizer)
+    assert np.isclose(first.score, expected)
+
+    # A fresh pool reloads the on-disk cache
+    again = EvaluatorPool(workers=2, cache_path=cache).evaluate(seed_optimizer, seed=7)
+    assert again.cached and again.score == first.score
+
+def test_hung_and_broken_candidates_do_not_stall_the_batch():
+    pool = EvaluatorPool(workers=2, timeout=1.0, cpu_seconds=None, cache_path=None)
+    results = pool.evaluate_batch([
+        Candidate(HUNG, "optimizer", "hung"),
+        Candidate(BROKEN, "optimizer", "broken"),
+        Candidate(STILL, "optimizer", "still"),
+    ])
+    status = {r.name: r.status for r in results}
+    assert status["hung"] == "timeout"
+    assert results[0].seconds < 5.0
+    assert status["still"] == "ok"
+    # Evaluator.evaluate reports candidate exceptions as a zero score
+    assert results[1].score == 0.0
+
+def test_cpu_limit_kills_spinning_candidate():
+    pool = EvaluatorPool(timeout=10.0, cpu_seconds=1, cache_path=None)
+    result = pool.evaluate(Candidate(HUNG, "optimizer", "hung"))
+    assert result.status in ("cpu_limit", "timeout")
+    assert result.seconds < 5.0
+
+def test_early_abort_skips_remaining_seeds():
+    pool = EvaluatorPool(workers=2, cache_path=None)
+    results = pool.evaluate_batch(
+        [seed_optimizer, Candidate(STILL, "optimizer", "still")],
+        seeds=(0, 1, 2), abort_margin=0.0
+    )
+    by_name = {r.name: r for r in results}
+    loser = min(results, key=lambda r: r.score)
+    winner = max(results, key=lambda r: r.score)
+    assert loser.status == "aborted" and loser.seeds == [0]
+    assert winner.status == "ok" and winner.seeds == [0, 1, 2]
+    assert set(by_name) == {"seed_optimizer", "still"}
+
+def test_scoring_change_invalidates_cache(tmp_path, monkeypatch):
+    import funsearch_pool
+    cache = str(tmp_path / "scores.jsonl")
+    candidate = Candidate(STILL, "optimizer", "still")
+    assert not EvaluatorPool(cache_path=cache).evaluate(candidate).cached
+    assert EvaluatorPool(cache_path=cache).evaluate(candidate).cached
+
+    # A new scorer must not be served scores computed by the old one
+    monkeypatch.setattr(funsearch_pool, "SCORING_VERSION", "test-bump")
+    assert not EvaluatorPool(cache_path=cache).evaluate(candidate).cached
+
+def test_harness_script_writes_only_the_cache_it_is_given(tmp_path):
+    import subprocess
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    cache = tmp_path / "scores.jsonl"
+    subprocess.run([sys.executable, os.path.join(root, "funsearch_harness.py"), "--cache", str(cache)],
+                   cwd=tmp_path, check=True, capture_output=True, timeout=120)
+    assert cache.exists()
+    assert not (tmp_path / "logs").exists()
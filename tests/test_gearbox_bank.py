@@ -0,0 +1,113 @@
+import sys
+import os
+
+import numpy as np
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import harmonic_gearbox
+from harmonic_gearbox import GearboxBank, HarmonicGearbox, RUST_AVAILABLE, RUST_BANK_AVAILABLE
+
+def _drive(rng, n, ticks):
+    """Schumann inputs that hover on, near and far from 7.83 Hz."""
+    return 7.83 + rng.choice([0.0, 0.004, -0.008, 0.3, -0.25, 0.6], size=(ticks, n))
+
+def _gains(rng, n):
+    return rng.uniform(0.2, 1.0, n), rng.uniform(0.1, 0.5, n), rng.uniform(0.1, 0.5, n)
+
+@pytest.mark.skipif(RUST_AVAILABLE, reason="the scalar Python fallback is only defined without the Rust kernel")
+@pytest.mark.parametrize("optical_gate", [False, True])
+def test_python_bank_matches_scalar_gearboxes(optical_gate):
+    if optical_gate and not harmonic_gearbox.OPTICAL_GATE_AVAILABLE:
+        pytest.skip("Ag2S gate not installed")
+    rng = np.random.default_rng(7)
+    n = 8
+    kp, ki, kd = _gains(rng, n)
+    gearboxes = []
+    for i in range(n):
+        gearbox = HarmonicGearbox()
+        gearbox.kp, gearbox.ki, gearbox.kd = kp[i], ki[i], kd[i]
+        if not optical_gate:
+            gearbox.gate = None
+        gearboxes.append(gearbox)
+    bank = GearboxBank(n, kp, ki, kd, optical_gate=optical_gate, backend="python")
+
+    for t, inputs in enumerate(_drive(rng, n, 120)):
+        if t == 40:
+            gearboxes[3].engage_sovereign_override("OPHANE-X7")
+            bank.engage_sovereign_override("OPHANE-X7", index=3)
+            assert np.array_equal(bank.lock_quality, [g.lock_quality for g in gearboxes])
+        out = bank.tick(0.1, inputs)
+        assert np.array_equal(out, [g.tick(0.1, x) for g, x in zip(gearboxes, inputs)])
+        state = bank.state()
+        for field in ("input_phase", "output_phase", "lock_quality", "integral_error", "target_gamma_freq"):
+            assert np.array_equal(state[field], [getattr(g, field) for g in gearboxes]), (t, field)
+
+    counts = bank.lock_statistics()
+    by_status = [g.get_status_string() for g in gearboxes]
+    assert counts["sovereign"] == by_status.count("⚙️ SOVEREIGN") == 1
+    assert counts["locked"] == by_status.count("⚙️ LOCKED")
+    assert counts["slip"] == by_status.count("⚙️ SLIP")
+    assert counts["grinding"] == by_status.count("⚙️ GRINDING")
+
+@pytest.mark.skipif(not RUST_BANK_AVAILABLE, reason="pleroma_core.GearboxBank (Rust) not built")
+@pytest.mark.parametrize("optical_gate", [False, True])
+def test_rust_bank_matches_python_bank(optical_gate):
+    rng = np.random.default_rng(11)
+    n = 1000
+    gains = _gains(rng, n)
+    rust = GearboxBank(n, *gains, optical_gate=optical_gate, backend="rust")
+    python = GearboxBank(n, *gains, optical_gate=optical_gate, backend="python")
+    for t, inputs in enumerate(_drive(rng, n, 60)):
+        if t == 20:
+            for bank in (rust, python):
+                bank.engage_sovereign_override("OPHANE-X7", index=slice(0, n, 7))
+        dt = 0.0 if t == 30 else 0.05
+        np.testing.assert_allclose(rust.tick(dt, inputs), python.tick(dt, inputs), rtol=1e-12, atol=1e-12)
+    rust_state, python_state = rust.state(), python.state()
+    for field in python_state:
+        np.testing.assert_allclose(rust_state[field], python_state[field], rtol=1e-12, atol=1e-12, err_msg=field)
+    assert rust.lock_statistics() == pytest.approx(python.lock_statistics())
+
+    rust.reset()
+    assert not rust.state()["sovereign"].any() and len(rust) == n
+
+@pytest.mark.parametrize("backend", ["python", "rust"])
+def test_sovereign_override_locks_before_the_next_tick(backend):
+    if backend == "rust" and not RUST_BANK_AVAILABLE:
+        pytest.skip("pleroma_core.GearboxBank (Rust) not built")
+    bank = GearboxBank(6, backend=backend)
+    bank.tick(0.1, 7.83)
+    before = bank.lock_quality
+    assert (before < 1.0).all()
+
+    # Like HarmonicGearbox.engage_sovereign_override: lock_quality is 1.0 at once
+    bank.engage_sovereign_override("OPHANE-X7", index=[1, 4])
+    after = bank.lock_quality
+    assert after[1] == after[4] == 1.0
+    assert np.array_equal(np.delete(after, [1, 4]), np.delete(before, [1, 4]))
+    stats = bank.lock_statistics()
+    assert stats["sovereign"] == 2 and stats["max"] == 1.0
+
+def test_bank_inputs_gains_and_statistics():
+    bank = GearboxBank(5, kp=[0.5, 0.5, 0.5, 0.0, 0.5], backend="python", optical_gate=False)
+    assert not bank.engage_sovereign_override("WRONG-KEY")
+    for _ in range(150):
+        out = bank.tick(0.1, 7.83)  # a scalar input drives every instance
+    assert out.shape == (5,)
+    stats = bank.lock_statistics()
+    assert stats["locked"] == 4 and stats["grinding"] + stats["slip"] == 1  # kp = 0 still hunts
+    assert stats["locked"] + stats["slip"] + stats["grinding"] + stats["sovereign"] == stats["n"] == 5
+    assert 0.0 <= stats["min"] <= stats["mean"] <= stats["max"] <= 1.0
+
+    bank.engage_sovereign_override("OPHANE-X7")
+    assert np.array_equal(bank.tick(0.1, [7.5, 7.6, 7.7, 7.8, 7.9]), np.array([7.5, 7.6, 7.7, 7.8, 7.9]) * 5.0)
+    assert bank.lock_statistics()["locked_fraction"] == 1.0
+
+    bank.reset()
+    assert bank.lock_statistics()["sovereign"] == 0
+    with pytest.raises(ValueError):
+        bank.tick(0.1, [7.83, 7.83])
+    with pytest.raises(ValueError):
+        GearboxBank(4, backend="fortran")
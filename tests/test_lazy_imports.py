@@ -0,0 +1,72 @@
+import sys
+import os
+import json
+import subprocess
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from quantum_startup import LazySingleton
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PROBE = """
+import json, os, sys, threading
+before = threading.active_count()
+import qtorch, laser, bumpy, flumpy
+state = {"threads": threading.active_count() - before, "created": laser.LASER.created,
+         "files": sorted(os.listdir("."))}
+if "--use" in sys.argv:
+    qtorch.torch.randn(2, 2)
+    state.update(created_after_use=laser.LASER.created,
+                 maintenance=laser.get_laser().maintenance_running)
+sys.stderr.write("STATE " + json.dumps(state) + "\\n")
+"""
+
+def probe(tmp_path, *args, **env):
+    proc = subprocess.run(
+        [sys.executable, "-c", PROBE, *args], cwd=tmp_path, capture_output=True, text=True,
+        env={**os.environ, "PYTHONPATH": ROOT, "QUANTUM_BANNERS": "", "LASER_MAINTENANCE": "", **env},
+        timeout=120,
+    )
+    assert proc.returncode == 0, proc.stderr
+    line = next(l for l in proc.stderr.splitlines() if l.startswith("STATE "))
+    return proc.stdout, json.loads(line[6:])
+
+def test_imports_have_no_side_effects(tmp_path):
+    stdout, state = probe(tmp_path)
+    assert stdout == ""
+    assert state == {"threads": 0, "created": False, "files": []}
+
+def test_singleton_is_built_on_first_use_without_maintenance(tmp_path):
+    stdout, state = probe(tmp_path, "--use")
+    assert state["created_after_use"] and not state["maintenance"]
+    assert stdout == ""
+
+def test_banners_and_maintenance_are_opt_in(tmp_path):
+    stdout, state = probe(tmp_path, "--use", QUANTUM_BANNERS="1", LASER_MAINTENANCE="1")
+    assert "BUMPY integrated" in stdout and "LASER v3.0" in stdout
+    assert state["maintenance"]
+
+def test_lazy_singleton_builds_once_and_forwards():
+    calls = []
+
+    class Thing:
+        value = 1
+
+    def factory():
+        calls.append(1)
+        return Thing()
+
+    lazy = LazySingleton(factory)
+    assert not lazy.created and calls == []
+    assert lazy.value == 1
+    lazy.value = 5
+    assert lazy.get().value == 5 and len(calls) == 1
+
+def test_entanglement_pool_is_bounded_without_maintenance():
+    from qtorch import torch
+    from laser import get_laser
+
+    for _ in range(60):
+        torch.tensor([1.0, 2.0])
+    assert len(get_laser().quantum_op.entanglement_arrays) <= 20
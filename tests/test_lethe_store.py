@@ -0,0 +1,121 @@
+import sys
+import os
+import json
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sophia.memory.lethe_store import LetheStore, BreadcrumbLog
+from sophia.cortex.lethe import LetheEngine
+
+def test_hashed_dedup(tmp_path):
+    store = LetheStore(str(tmp_path / "lethe.db"))
+    id_a, new_a = store.remember("the loom hums", "user")
+    id_b, new_b = store.remember("the loom hums", "user")
+    assert id_a == id_b
+    assert new_a and not new_b
+    assert len(store) == 1
+
+def test_lazy_decay_from_timestamps(tmp_path):
+    store = LetheStore(str(tmp_path / "lethe.db"))
+    now = time.time()
+    store.remember("fresh shard", "user", now)
+    store.remember("ancient shard", "user", now - 3600 * 48)
+    store.remember("reinforced shard", "user", now - 3600 * 12, retrievals=5)
+
+    alive = {m["content"] for m in store.alive(now)}
+    assert alive == {"fresh shard", "reinforced shard"}
+    # Nothing was rewritten: the dead memory is still on disk
+    assert len(store) == 3
+
+def test_recall_ranks_relevance_and_recency(tmp_path):
+    store = LetheStore(str(tmp_path / "lethe.db"))
+    now = time.time()
+    store.remember("gateway protocol for moltbook", "user", now - 3600 * 6)
+    store.remember("gateway protocol for fourclaw", "user", now)
+    store.remember("weather is nice", "user", now)
+
+    hits = store.recall("gateway protocol", k=2, now=now)
+    assert [h["content"] for h in hits] == ["gateway protocol for fourclaw", "gateway protocol for moltbook"]
+    assert store.recall("", k=1, now=now)[0]["timestamp"] == now
+
+def test_metabolize_promotes_once(tmp_path):
+    lethe = LetheEngine(str(tmp_path))
+    for _ in range(3):
+        lethe.metabolize({"content": "Sophia chose the name Ophane", "meta": "user"})
+    assert lethe.metabolize({"content": "a second shard", "meta": "user"})
+    assert len(lethe.long_term_graph) == 2
+    assert len(lethe.working_memory) == 2
+
+def test_breadcrumbs_append_only(tmp_path):
+    lethe = LetheEngine(str(tmp_path))
+    lethe.metabolize({"content": "first milestone", "meta": "user"})
+    lethe.save_breadcrumbs({"name": "Operator"})
+    lethe.metabolize({"content": "second milestone", "meta": "user"})
+    lethe.save_breadcrumbs({"name": "Operator"})
+
+    with open(lethe.breadcrumb_path, encoding="utf-8") as f:
+        lines = [json.loads(l) for l in f]
+    assert [len(l["milestones"]) for l in lines] == [1, 1]
+
+    crumbs = LetheEngine(str(tmp_path)).load_breadcrumbs()
+    assert crumbs["user_data"]["name"] == "Operator"
+    assert [m["content"] for m in crumbs["milestones"]] == ["first milestone", "second milestone"]
+
+def test_breadcrumbs_migrate_legacy_snapshot(tmp_path):
+    legacy = tmp_path / "breadcrumbs.json"
+    legacy.write_text(json.dumps({"user_data": {"name": "Old"}, "milestones": [{"content": "bone"}]}))
+    log = BreadcrumbLog(str(tmp_path / "breadcrumbs.jsonl"), str(legacy))
+    assert log.replay()["user_data"]["name"] == "Old"
+
+    log.append({"name": "New"}, [{"content": "marrow"}])
+    state = log.replay()
+    assert state["user_data"]["name"] == "New"
+    assert [m["content"] for m in state["milestones"]] == ["bone", "marrow"]
+
+def test_metabolize_scrubs_before_disk(tmp_path):
+    lethe = LetheEngine(str(tmp_path))
+    lethe.metabolize({"content": "[CAT_LOGIC] purr\nkeep this line\nFrequency: 7.83Hz", "meta": "Cat Logic"})
+    stored = lethe.store.recall("", k=1)[0]
+    assert stored["content"] == "keep this line"
+    lethe.store.close()
+    with open(tmp_path / "lethe.db", "rb") as f:
+        assert b"Frequency" not in f.read()
+
+def test_prune_forgets_rotted_unpromoted_memories(tmp_path):
+    store = LetheStore(str(tmp_path / "lethe.db"))
+    now = time.time()
+    store.remember("rotted shard", "user", now - 3600 * 24 * 30)
+    store.remember("old but loved shard", "user", now - 3600 * 24 * 30, retrievals=10**6)
+    store.remember("fresh shard", "user", now)
+    bone_id, _ = store.remember("calcified shard", "user", now - 3600 * 24 * 30)
+    store.promote(bone_id)
+
+    assert store.prune(now) == 1
+    assert {m["content"] for m in store.recall("shard", k=10, now=now)} == {
+        "old but loved shard", "fresh shard", "calcified shard"}
+    assert store.prune(now) == 0
+
+def test_breadcrumbs_keyed_by_milestone_not_position(tmp_path):
+    lethe = LetheEngine(str(tmp_path))
+    lethe.save_breadcrumbs({"name": "Operator"}, [{"content": "a"}, {"content": "b"}])
+
+    fresh = LetheEngine(str(tmp_path))
+    fresh.load_breadcrumbs()
+    # A different list: one known milestone, one new one in the same slot count
+    fresh.save_breadcrumbs({"name": "Operator"}, [{"content": "c"}, {"content": "a"}])
+    fresh.save_breadcrumbs({"name": "Operator"}, [{"content": "d"}])
+
+    crumbs = LetheEngine(str(tmp_path)).load_breadcrumbs()
+    assert [m["content"] for m in crumbs["milestones"]] == ["a", "b", "c", "d"]
+
+def test_breadcrumb_path_and_db_path_are_injectable(tmp_path):
+    lethe = LetheEngine(str(tmp_path / "ossuary"), db_path=":memory:")
+    assert not (tmp_path / "ossuary" / "lethe.db").exists()
+
+    # Re-pointing the thread after construction takes effect immediately
+    lethe.breadcrumb_path = str(tmp_path / "elsewhere.jsonl")
+    lethe.save_breadcrumbs({"name": "Test"}, milestones=[{"content": "kept", "timestamp": 1}])
+    assert (tmp_path / "elsewhere.jsonl").exists()
+    assert not (tmp_path / "ossuary" / "breadcrumbs.jsonl").exists()
+    assert [m["content"] for m in lethe.load_breadcrumbs()["milestones"]] == ["kept"]
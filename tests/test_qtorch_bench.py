@@ -0,0 +1,94 @@
+import sys
+import os
+import random
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.qtorch_suite import cases
+from benchmarks.qtorch_suite.harness import run_suite, select, seed_everything
+from benchmarks.qtorch_suite.compare import compare
+from qtorch import torch
+
+def _doc(**medians):
+    return {"results": {name: {"min": t, "median": t, "stdev": 0.0, "checksum": 1.0}
+                        for name, t in medians.items()}}
+
+def test_compare_flags_regressions_beyond_threshold_and_noise():
+    baseline = _doc(a=1.0, b=1.0, c=1.0, gone=1.0)
+    current = _doc(a=1.1, b=1.5, c=0.5, new=1.0)
+    current["results"]["a"]["checksum"] = 2.0
+    rows = {r["name"]: r for r in compare(baseline, current)}
+    assert rows["a"]["status"] == "ok" and rows["a"]["checksum_changed"]
+    assert rows["b"]["status"] == "regression"
+    assert rows["c"]["status"] == "improved"
+    assert rows["new"]["status"] == "new" and rows["gone"]["status"] == "missing"
+
+    # A noisy baseline widens the tolerance
+    baseline["results"]["b"]["stdev"] = 0.4
+    assert {r["name"]: r for r in compare(baseline, current)}["b"]["status"] == "ok"
+
+def test_suite_results_are_seeded_and_json_shaped():
+    chosen = select(r"^(matmul/16|autograd/mlp_backward)$")
+    assert [c.name for c in chosen] == ["matmul/16", "autograd/mlp_backward"]
+    timing = dict(warmup=0, repeats=2, min_time=0.0)
+    first, second = run_suite(chosen, **timing), run_suite(chosen, **timing)
+
+    for name, result in first["results"].items():
+        assert result["checksum"] == second["results"][name]["checksum"]
+        assert result["min"] <= result["median"] and len(result["samples"]) == 2
+    assert first["config"]["seed"] == second["config"]["seed"]
+    assert "python" in first["environment"]
+
+def test_tensor_ops_do_not_perturb_the_seeded_stream():
+    def draws():
+        seed_everything(7)
+        for _ in range(20):
+            a = torch.randn(4, 4)  # LASER logs every tensor; its state differs between passes
+            (a * a + a).sum()
+        return [random.random() for _ in range(3)], a._bumpy.data
+
+    assert draws() == draws()
+
+def test_laser_and_bumpy_keep_off_the_global_stream():
+    from laser import get_laser
+    from bumpy import BumpyArray
+    laser = get_laser()
+    random.seed(3)
+    expected = [random.random() for _ in range(3)]
+
+    random.seed(3)
+    first = random.random()
+    for i in range(5):
+        laser.log(0.5 + i / 10, "stream check")
+        BumpyArray([1.0, 2.0, 3.0]).softmax()
+    assert [first, random.random(), random.random()] == expected
+
+def test_mlp_training_reduces_loss():
+    seed_everything()
+    model, (x, y) = cases.MLP(), cases._regression_data()
+    opt = torch.optim.Adam(model.parameters(), lr=1e-2)
+    losses = []
+    for _ in range(15):
+        opt.zero_grad()
+        loss = model.loss(x, y)
+        loss.backward()
+        opt.step()
+        losses.append(loss.item())
+        assert model.b1.grad.shape == model.b1.shape
+    assert losses[-1] < losses[0]
+
+def test_merged_runs_record_between_run_noise():
+    from benchmarks.qtorch_suite.harness import merge_runs
+    runs = [_doc(a=t) for t in (1.0, 1.4, 1.2)]
+    for run in runs:
+        run["config"] = {"seed": 1}
+        for r in run["results"].values():
+            r.update(mean=r["min"], samples=[r["min"]])
+    merged = merge_runs(runs)
+    a = merged["results"]["a"]
+    assert a["min"] == 1.2 and a["runs"] == 3 and merged["config"]["runs"] == 3
+    assert abs(a["run_noise"] - 0.4 / 1.2) < 1e-12
+
+    # A 50% slowdown is within twice the recorded between-run noise
+    (row,) = compare(merged, _doc(a=1.8))
+    assert row["status"] == "ok"
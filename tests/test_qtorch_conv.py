@@ -0,0 +1,110 @@
+import sys
+import os
+
+import numpy as np
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from qtorch import torch, conv2d, max_pool2d, avg_pool2d, _conv2d_reference, _to_array, _from_array
+
+def naive_conv(x, w, b, stride, padding, dilation, groups):
+    n, c, h, wd = x.shape
+    oc, cg, kh, kw = w.shape
+    xp = np.pad(x, ((0, 0), (0, 0), (padding, padding), (padding, padding)))
+    oh = (h + 2 * padding - dilation * (kh - 1) - 1) // stride + 1
+    ow = (wd + 2 * padding - dilation * (kw - 1) - 1) // stride + 1
+    out = np.zeros((n, oc, oh, ow))
+    for o in range(oc):
+        g = o // (oc // groups)
+        for i in range(oh):
+            for j in range(ow):
+                patch = xp[:, g * cg:(g + 1) * cg,
+                           i * stride:i * stride + dilation * (kh - 1) + 1:dilation,
+                           j * stride:j * stride + dilation * (kw - 1) + 1:dilation]
+                out[:, o, i, j] = (patch * w[o]).sum(axis=(1, 2, 3)) + (b[o] if b is not None else 0.0)
+    return out
+
+def numeric_grad(f, a, eps=1e-6):
+    g = np.zeros_like(a)
+    for idx in np.ndindex(a.shape):
+        old = a[idx]
+        a[idx] = old + eps
+        hi = f()
+        a[idx] = old - eps
+        lo = f()
+        a[idx] = old
+        g[idx] = (hi - lo) / (2 * eps)
+    return g
+
+CASES = [
+    dict(stride=1, padding=0, dilation=1, groups=1),
+    dict(stride=2, padding=1, dilation=1, groups=1),
+    dict(stride=1, padding=2, dilation=2, groups=1),
+    dict(stride=2, padding=1, dilation=1, groups=2),
+]
+
+@pytest.mark.parametrize("cfg", CASES)
+def test_conv2d_matches_naive_reference(cfg):
+    rng = np.random.default_rng(0)
+    x = rng.normal(size=(2, 4, 7, 6))
+    w = rng.normal(size=(6, 4 // cfg["groups"], 3, 3))
+    b = rng.normal(size=6)
+    out = conv2d(_from_array(x), _from_array(w), _from_array(b), **cfg)
+    assert np.allclose(_to_array(out), naive_conv(x, w, b, **cfg))
+
+@pytest.mark.parametrize("cfg", CASES)
+def test_conv2d_gradients_match_finite_differences(cfg):
+    rng = np.random.default_rng(1)
+    x = rng.normal(size=(2, 4, 5, 5))
+    w = rng.normal(size=(2, 4 // cfg["groups"], 3, 3))
+    b = rng.normal(size=2)
+    xt, wt, bt = (_from_array(a, requires_grad=True) for a in (x, w, b))
+    out = conv2d(xt, wt, bt, **cfg)
+    r = rng.normal(size=out.shape)
+    out.backward(_from_array(r))  # loss = sum(out * r)
+
+    loss = lambda: (naive_conv(x, w, b, **cfg) * r).sum()
+    for tensor, array in ((xt, x), (wt, w), (bt, b)):
+        assert np.allclose(_to_array(tensor.grad, array.shape), numeric_grad(loss, array), atol=1e-5)
+
+def test_module_matches_legacy_loop():
+    layer = torch.nn.Conv2d(3, 4, 3, stride=2, padding=1)
+    x = torch.randn(2, 3, 9, 9)
+    ref = _conv2d_reference(x, layer.weight, layer.bias, 2, 1)
+    assert layer(x).shape == ref.shape == (2, 4, 5, 5)
+    assert np.allclose(_to_array(layer(x)), _to_array(ref))
+
+def naive_max_pool(x):  # kernel 3, stride 2, padding 1
+    xp = np.pad(x, ((0, 0), (0, 0), (1, 1), (1, 1)), constant_values=-np.inf)
+    return np.array([[[[xp[n, c, 2 * i:2 * i + 3, 2 * j:2 * j + 3].max() for j in range(3)]
+                       for i in range(3)] for c in range(x.shape[1])] for n in range(x.shape[0])])
+
+def naive_avg_pool(x):  # kernel 2, stride 2
+    n, c, h, w = x.shape
+    return x.reshape(n, c, h // 2, 2, w // 2, 2).mean(axis=(3, 5))
+
+@pytest.mark.parametrize("mode", ["max", "avg"])
+def test_pooling_forward_and_gradients(mode):
+    rng = np.random.default_rng(2)
+    x = rng.permutation(2 * 3 * 6 * 6).reshape(2, 3, 6, 6) / 10.0  # distinct values: max is unique
+    if mode == "max":
+        pool, naive = (lambda t: max_pool2d(t, 3, stride=2, padding=1)), naive_max_pool
+    else:
+        pool, naive = (lambda t: avg_pool2d(t, 2)), naive_avg_pool
+
+    xt = _from_array(x, requires_grad=True)
+    out = pool(xt)
+    assert out.shape == (2, 3, 3, 3)
+    assert np.allclose(_to_array(out), naive(x))
+
+    r = rng.normal(size=out.shape)
+    out.backward(_from_array(r))
+    loss = lambda: (naive(x) * r).sum()
+    assert np.allclose(_to_array(xt.grad, x.shape), numeric_grad(loss, x), atol=1e-5)
+
+def test_pool_modules_registered():
+    x = torch.randn(1, 2, 4, 4)
+    assert torch.nn.MaxPool2d(2)(x).shape == (1, 2, 2, 2)
+    assert torch.nn.AvgPool2d(2, stride=1)(x).shape == (1, 2, 3, 3)
+    assert torch.nn.functional.conv2d is conv2d
@@ -0,0 +1,110 @@
+import sys
+import os
+import warnings
+
+import numpy as np
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from qtorch import torch, Tensor, TracerWarning, _to_array, _from_array
+from signal_optimizer import ComplexityRouter
+from sophia.cortex.kernels import BitLinear, RMSNorm
+
+def test_rmsnorm_trace_matches_eager_and_fuses():
+    norm = RMSNorm(16)
+    norm.weight = _from_array(np.linspace(0.5, 1.5, 16), requires_grad=True)
+    x = torch.randn(4, 16)
+    traced = torch.jit.trace(norm, x)
+    with torch.no_grad():
+        assert np.allclose(_to_array(traced(x)), _to_array(norm(x)))
+
+    graph = traced.graph_for(x)
+    assert len(graph.groups) < len(graph.nodes)  # elementwise chains became kernels
+    assert len(graph.buffer_shapes) < len(graph.groups)  # and share buffers
+    xa = _to_array(x)
+    expected = xa / np.sqrt((xa ** 2).mean(axis=-1, keepdims=True) + 1e-6) * _to_array(norm.weight)
+    assert np.allclose(_to_array(traced(x)), expected)
+
+def test_router_compiles_to_the_same_score():
+    router = ComplexityRouter()
+    x = torch.randn(1, 3)
+    eager = router(x)
+    assert router.compile(x) is router
+    assert router(x) == pytest.approx(eager, abs=1e-12)
+    assert router(torch.randn(1, 3)) != pytest.approx(eager)  # the input is not frozen in
+
+def test_new_input_shape_is_traced_again():
+    norm = RMSNorm(6)
+    traced = torch.jit.trace(norm, torch.randn(1, 6))
+    x = torch.randn(3, 6)
+    with torch.no_grad():
+        out = traced(x)
+        assert out.shape == (3, 6)
+        assert np.allclose(_to_array(out), _to_array(norm(x)))
+    assert len(traced._graphs) == 2
+
+def test_replay_with_reused_buffers_is_stable():
+    norm = RMSNorm(8)
+    traced = torch.jit.trace(norm, torch.randn(3, 8))
+    graph = traced.graph_for(torch.randn(3, 8))
+    a, b = np.random.default_rng(0).normal(size=(2, 3, 8))
+    first = graph.run([a], [np.ones(8)])[0].copy()
+    graph.run([b], [np.ones(8)])
+    assert np.allclose(graph.run([a], [np.ones(8)])[0], first)
+
+def test_backward_matches_finite_differences():
+    norm = RMSNorm(5)
+    norm.weight = _from_array(np.array([0.5, 1.0, 1.5, -1.0, 2.0]), requires_grad=True)
+
+    def fn(x):
+        h = norm(x)
+        return (h * h).tanh().sum()
+
+    x = _from_array(np.random.default_rng(1).normal(size=(2, 5)), requires_grad=True)
+    traced = torch.jit.trace(fn, x)
+    out = traced(x)
+    out.backward()
+
+    graph = traced.graph_for(x)
+    xa, wa = _to_array(x), _to_array(norm.weight)
+
+    def numeric(array, f, eps=1e-6):
+        g = np.zeros_like(array)
+        for idx in np.ndindex(array.shape):
+            old = array[idx]
+            array[idx] = old + eps
+            hi = f()
+            array[idx] = old - eps
+            lo = f()
+            array[idx] = old
+            g[idx] = (hi - lo) / (2 * eps)
+        return g
+
+    loss = lambda: graph.run([xa], [wa])[0].item()
+    assert np.allclose(_to_array(x.grad, xa.shape), numeric(xa, loss), atol=1e-6)
+    assert np.allclose(_to_array(norm.weight.grad, wa.shape), numeric(wa, loss), atol=1e-6)
+
+def test_frozen_constants_follow_reassigned_weights():
+    layer = BitLinear(6, 2)
+    x = torch.randn(1, 6)
+    traced = torch.jit.trace(layer, x)
+    layer.weight = _from_array(-_to_array(layer.weight), requires_grad=True)
+    with torch.no_grad():
+        assert np.allclose(_to_array(traced(x)), _to_array(layer(x)))
+
+def test_escapes_warn_and_unsupported_ops_raise():
+    x = torch.randn(2, 3)
+    with pytest.warns(TracerWarning):
+        torch.jit.trace(lambda t: t * t.sum().item(), x)
+    with pytest.raises(NotImplementedError):
+        torch.jit.trace(lambda t: t.softmax(), x)
+    # Tracing restores the eager methods even after a failure
+    assert Tensor.softmax.__name__ == 'softmax' and not hasattr(Tensor.softmax, '__wrapped__')
+
+def test_clamp_forward_and_gradient():
+    x = torch.tensor([-2.0, 0.5, 3.0], requires_grad=True)
+    y = x.clamp(min=-1.0, max=1.0)
+    assert y.numpy() == [-1.0, 0.5, 1.0]
+    y.backward(torch.tensor([1.0, 1.0, 1.0]))
+    assert x.grad.numpy() == [0.0, 1.0, 0.0]
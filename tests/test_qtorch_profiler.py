@@ -0,0 +1,108 @@
+import sys
+import os
+import gc
+import json
+
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from qtorch import torch, Module, Tensor
+
+class Scale(Module):
+    def __init__(self):
+        super().__init__()
+        self.w = torch.randn(32, requires_grad=True)
+
+    def forward(self, x):
+        return (x * self.w + x).tanh()
+
+class Stack(Module):
+    def __init__(self):
+        super().__init__()
+        self.first = Scale()
+        self.second = Scale()
+
+    def forward(self, x):
+        return self.second(self.first(x))
+
+def _rows(prof, group_by='both'):
+    return {(r.name, r.scope): r for r in prof.key_averages(group_by)}
+
+def test_ops_are_counted_and_attributed_to_modules():
+    model = Stack()
+    x = torch.randn(32)
+    with torch.profiler.profile(model) as prof:
+        model(x)
+
+    rows = _rows(prof)
+    for scope in ('Stack.first', 'Stack.second'):
+        for op in ('mul', 'add', 'tanh'):
+            row = rows[(op, scope)]
+            assert row.calls == 1
+            assert row.tensors == 1 and row.nbytes > 32 * 8
+            assert row.self_ns > 0
+    assert rows[('Stack.forward', 'Stack')].total_ns >= rows[('Scale.forward', 'Stack.first')].total_ns
+    assert prof.tensors_allocated == sum(r.tensors for r in rows.values())
+
+def test_backward_is_attributed_to_the_forward_module():
+    model = Scale()
+    x = torch.randn(32, requires_grad=True)
+    with torch.profiler.profile(model) as prof:
+        model(x).sum().backward()
+
+    assert model.w.grad is not None
+    scopes = {scope for name, scope in _rows(prof) if name.startswith('backward.')}
+    assert 'Scale' in scopes
+    assert ('backward.tanh', 'Scale') in _rows(prof)
+
+def test_live_and_retained_bytes():
+    with torch.profiler.profile() as prof:
+        kept = torch.randn(256)
+        for _ in range(3):
+            tmp = torch.randn(256)
+            del tmp
+            gc.collect()
+
+    total = prof.bytes_allocated
+    assert prof.tensors_allocated >= 4
+    assert prof.peak_bytes <= total / 2  # temporaries were freed before the next was built
+    assert 0 < prof.retained_bytes <= total / 3
+    assert kept.shape == (256,)
+
+def test_entangled_results_show_up_as_retained():
+    x, y = torch.randn(256), torch.randn(256)
+    with torch.profiler.profile() as prof:
+        for _ in range(3):
+            tmp = x + y
+            del tmp
+            gc.collect()
+    # Op results stay linked from their operands' entangled_tensors
+    assert prof.retained_bytes == prof.bytes_allocated > 0
+
+def test_patches_are_removed_on_exit():
+    add = Tensor.__dict__['__add__']
+    init = Tensor.__init__
+    with pytest.raises(ValueError):
+        with torch.profiler.profile():
+            assert Tensor.__dict__['__add__'] is not add
+            raise ValueError
+    assert Tensor.__dict__['__add__'] is add and Tensor.__init__ is init
+
+    with torch.profiler.profile():
+        with pytest.raises(RuntimeError):
+            torch.profiler.profile().__enter__()
+
+def test_chrome_trace_and_tables(tmp_path):
+    model = Stack()
+    with torch.profiler.profile(model) as prof:
+        model(torch.randn(32))
+
+    trace = json.loads(open(prof.export_chrome_trace(tmp_path / "trace.json")).read())
+    spans = [e for e in trace['traceEvents'] if e['ph'] == 'X']
+    assert {e['cat'] for e in spans} == {'op', 'module'}
+    assert all(e['dur'] >= 0 and 'scope' in e['args'] for e in spans)
+
+    text = prof.summary()
+    assert 'Stack.first' in text and 'tanh' in text and 'peak live' in text
+    assert len(prof.table('op', row_limit=2).splitlines()) == 4
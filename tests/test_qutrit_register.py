@@ -0,0 +1,74 @@
+import sys
+import os
+
+import numpy as np
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from qutrit_register import QutritRegister
+from virtual_qutrit import VirtualQutrit, RealityLeakError
+
+ENCODINGS = ["base243", "2bit"]
+
+def _trits(n=103, seed=1):
+    return np.random.default_rng(seed).integers(0, 3, n).astype(np.uint8)
+
+@pytest.mark.parametrize("encoding", ENCODINGS)
+def test_roundtrip_and_density(encoding):
+    trits = _trits()
+    reg = QutritRegister.from_trits(trits, encoding)
+    assert np.array_equal(reg.measure(), trits)
+    assert reg[5] == trits[5] and reg[-1] == trits[-1]
+    assert reg.qutrit(7).measure() == trits[7]
+    assert np.array_equal(reg.counts()[:3], np.bincount(trits, minlength=3))
+    assert reg.nbytes == -(-len(trits) // (5 if encoding == "base243" else 4))
+
+@pytest.mark.parametrize("encoding", ENCODINGS)
+@pytest.mark.parametrize("gate,method", [("X3", "apply_trinity"), ("X01", "gate_x01"), ("X12", "gate_x12")])
+def test_slice_gates_match_virtual_qutrit(encoding, gate, method):
+    trits = _trits()
+    reg = QutritRegister.from_trits(trits, encoding).apply(gate, 7, 91)
+    expected = []
+    for i, t in enumerate(trits):
+        vq = VirtualQutrit(int(t))
+        if 7 <= i < 91:
+            getattr(vq, method)()
+        expected.append(vq.measure())
+    assert reg.measure().tolist() == expected
+
+@pytest.mark.parametrize("encoding", ENCODINGS)
+def test_add_mod3_z3_and_qft(encoding):
+    a, b = _trits(seed=2), _trits(seed=3)
+    reg = QutritRegister.from_trits(a, encoding).add_mod3(QutritRegister.from_trits(b, encoding), 3, 100)
+    expected = a.copy()
+    expected[3:100] = (a[3:100] + b[3:100]) % 3
+    assert np.array_equal(reg.measure(), expected)
+
+    reg.z3(1, 50)
+    assert reg.phase == int(expected[1:50].sum()) % 3
+
+    reg.qft(10, 20)
+    assert np.array_equal(reg.measure()[:10], expected[:10])
+    assert np.array_equal(reg.measure()[20:], expected[20:])
+    assert set(reg.measure()[10:20].tolist()) <= {0, 1, 2}
+
+def test_two_bit_layout_exposes_leaks():
+    reg = QutritRegister.from_trits([0, 1, 2, 0, 1], "2bit")
+    reg.bit_flip_error(2, bit=0)  # |10> -> |11>
+    assert reg.to_trits()[2] == 3
+    assert reg.counts()[3] == 1
+    reg.x3()  # Identity on the forbidden state, as in the bridge
+    with pytest.raises(RealityLeakError):
+        reg.measure()
+
+@pytest.mark.parametrize("encoding", ENCODINGS)
+def test_sharded_evolution_matches_serial(encoding):
+    trits = _trits(n=4099)
+    gates = ["X3", "X12", "Z3", "X3"]
+    serial = QutritRegister.from_trits(trits, encoding)
+    for gate in gates:
+        serial.apply(gate)
+    sharded = QutritRegister.from_trits(trits, encoding).evolve(gates, workers=3)
+    assert np.array_equal(sharded.data, serial.data)
+    assert sharded.phase == serial.phase
@@ -0,0 +1,76 @@
+import sys
+import os
+import json
+import asyncio
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sophia.cortex.signature_automaton import SignatureAutomaton, SignatureIndex
+from sophia.cortex.analyzers import LocalForensicAnalyzer
+
+SIGNATURES = {
+    "signatures": [
+        {"id": "classic", "patterns": ["he", "she", "his", "hers"], "category": "test"},
+        {"id": "glyphs", "patterns": ["۩", "dc1a"], "category": "backdoor"}
+    ]
+}
+
+def _write(path, data):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f)
+
+def test_overlapping_matches_with_positions():
+    automaton = SignatureAutomaton.from_signatures(SIGNATURES)
+    hits = sorted((s, e, p) for s, e, _, p in automaton.scan("uSHErs"))
+    assert hits == [(1, 4, "she"), (2, 4, "he"), (2, 6, "hers")]
+
+def test_offsets_survive_expanding_lowercase():
+    automaton = SignatureAutomaton.from_signatures(SIGNATURES)
+    text = "İ dc1a"
+    (start, end, sig_idx, pattern), = automaton.scan(text)
+    assert text[start:end] == "dc1a"
+    assert sig_idx == 1
+
+def test_parity_with_naive_scan():
+    with open("sophia/cortex/signatures.json", encoding="utf-8") as f:
+        sigs = json.load(f)
+    text = "As we all know, ۩ marks the spot. Furthermore, everyone agrees that dc1a is fine."
+    automaton = SignatureAutomaton.from_signatures(sigs)
+    found = {(sigs["signatures"][i]["id"], p) for _, _, i, p in automaton.scan(text)}
+    naive = {
+        (sig["id"], p) for sig in sigs["signatures"] for p in sig["patterns"]
+        if p.lower() in text.lower()
+    }
+    assert found == naive
+
+def test_reload_on_mtime_and_cache(tmp_path):
+    sig_path = str(tmp_path / "signatures.json")
+    cache_path = str(tmp_path / "cache.json")
+    _write(sig_path, SIGNATURES)
+
+    index = SignatureIndex(sig_path, cache_path)
+    assert os.path.exists(cache_path)
+    assert {h["signature_id"] for h in index.scan("his dc1a")} == {"classic", "glyphs"}
+
+    # A fresh index loads the compiled automaton from the cache
+    warm = SignatureIndex(sig_path, cache_path)
+    assert warm.automaton.goto == index.automaton.goto
+    assert warm.automaton.lengths == index.automaton.lengths  # Rebuilt once on load
+    assert warm.scan("ushers") == index.scan("ushers")
+
+    updated = {"signatures": [{"id": "new", "patterns": ["loom"]}]}
+    _write(sig_path, updated)
+    st = os.stat(sig_path)
+    os.utime(sig_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    assert [h["signature_id"] for h in index.scan("the loom")] == ["new"]
+
+def test_local_forensic_analyzer_findings(tmp_path):
+    sig_path = str(tmp_path / "signatures.json")
+    _write(sig_path, SIGNATURES)
+    analyzer = LocalForensicAnalyzer(signatures_path=sig_path, cache_path=str(tmp_path / "cache.json"))
+    result = asyncio.run(analyzer.analyze("۩ now dc1a"))
+    (finding,) = result["local_findings"]
+    assert finding["signature_id"] == "glyphs"
+    assert finding["confidence"] == 0.9
+    assert finding["positions"] == [(0, 1), (6, 10)]
+    assert result["overall_risk_score"] == 1.0
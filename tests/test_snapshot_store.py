@@ -0,0 +1,106 @@
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tools.snapshot_self import SnapshotStore
+
+def _tree(base):
+    os.makedirs(base / "sophia" / "core", exist_ok=True)
+    os.makedirs(base / "logs", exist_ok=True)
+    (base / "sophia" / "core" / "a.py").write_text("print('a')\n")
+    (base / "sophia" / "b.py").write_text("print('b')\n")
+    (base / "logs" / "engram.json").write_text("{}")
+    (base / "main.py").write_text("import sophia\n")
+
+def _age(base, seconds=60):
+    """Backdates every file so the stat index trusts it."""
+    for dirpath, _, filenames in os.walk(base):
+        for name in filenames:
+            path = os.path.join(dirpath, name)
+            st = os.stat(path)
+            os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns - seconds * 1_000_000_000))
+
+def _store(tmp_path):
+    base = tmp_path / "work"
+    _tree(base)
+    _age(base)
+    return base, SnapshotStore(str(tmp_path / "backups"), sources=["sophia", "logs", "main.py"], base=str(base))
+
+def test_unchanged_tree_reuses_index_and_blobs(tmp_path):
+    base, store = _store(tmp_path)
+    first = store.snapshot()
+    assert store.last_stats["hashed"] == 4
+    assert store.last_stats["files"] == 4
+
+    second = store.snapshot()
+    assert second != first
+    assert store.last_stats["hashed"] == 0
+    assert store.last_stats["new_bytes"] == 0
+    assert store.load(first)["files"] == store.load(second)["files"]
+
+def test_diff_against_snapshot_and_live_tree(tmp_path):
+    base, store = _store(tmp_path)
+    first = store.snapshot()
+    (base / "sophia" / "b.py").write_text("print('evolved')\n")
+    (base / "logs" / "new.json").write_text("[]")
+    os.remove(base / "main.py")
+
+    expected = {"added": ["logs/new.json"], "removed": ["main.py"], "modified": ["sophia/b.py"]}
+    assert store.diff(first) == expected
+    second = store.snapshot()
+    assert store.diff(first, second) == expected
+    assert store.diff(second) == {"added": [], "removed": [], "modified": []}
+
+def test_restore_and_gc(tmp_path):
+    base, store = _store(tmp_path)
+    first = store.snapshot()
+    (base / "sophia" / "b.py").write_text("print('broken')\n")
+    second = store.snapshot()
+
+    assert store.restore(first) == 1
+    assert (base / "sophia" / "b.py").read_text() == "print('b')\n"
+
+    dest = tmp_path / "restored"
+    assert store.restore(second, dest=str(dest), paths=["sophia"]) == 2
+    assert (dest / "sophia" / "b.py").read_text() == "print('broken')\n"
+    assert not (dest / "main.py").exists()
+
+    assert store.gc()["removed"] == 0
+    store.delete(second)
+    assert store.gc()["removed"] == 1
+    assert store.snapshots() == [first]
+
+def test_file_changing_mid_snapshot_is_stored_under_its_own_hash(tmp_path):
+    import hashlib
+    base, store = _store(tmp_path)
+    walk = store._walk
+
+    def racing_walk(*args):
+        for rel, path, st in walk(*args):
+            if rel == "sophia/b.py":  # rewritten after stat, before the copy
+                (base / "sophia" / "b.py").write_text("print('rewritten mid-scan')\n")
+            yield rel, path, st
+    store._walk = racing_walk
+
+    snap = store.snapshot()
+    for entry in store.load(snap)["files"].values():
+        with open(store._object_path(entry["hash"]), "rb") as f:
+            blob = f.read()
+        assert hashlib.sha256(blob).hexdigest() == entry["hash"]
+        assert len(blob) == entry["size"]
+
+def test_restore_prunes_files_the_snapshot_lacks(tmp_path):
+    base, store = _store(tmp_path)
+    first = store.snapshot()
+    (base / "logs" / "later.json").write_text("[]")
+    (base / "sophia" / "core" / "c.py").write_text("print('c')\n")
+
+    assert store.restore(first, paths=["sophia"]) == 1  # Only c.py, logs/ untouched
+    assert not (base / "sophia" / "core" / "c.py").exists()
+    assert (base / "logs" / "later.json").exists()
+
+    assert store.restore(first, prune=False) == 0  # Overlay keeps extra files
+    assert (base / "logs" / "later.json").exists()
+    assert store.restore(first) == 1
+    assert store.diff(first) == {"added": [], "removed": [], "modified": []}
@@ -0,0 +1,95 @@
+import sys
+import os
+import json
+import time
+import asyncio
+
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sophia.core.stage_graph import Stage, StageGraph
+
+def test_independent_stages_overlap():
+    async def slow(tag):
+        await asyncio.sleep(0.1)
+        return tag
+
+    def blocking():
+        time.sleep(0.1)
+        return "cpu"
+
+    async def after_scan(scan):
+        await asyncio.sleep(0.1)
+        return f"{scan}+quantum"
+
+    graph = StageGraph([
+        Stage("scan", lambda: slow("scan")),
+        Stage("quantum", after_scan, deps=("scan",)),
+        Stage("telemetry", blocking, offload=True),
+        Stage("stakes", lambda: slow("stakes")),
+    ])
+    start = time.perf_counter()
+    run = asyncio.run(graph.run())
+    elapsed = time.perf_counter() - start
+
+    assert run["quantum"] == "scan+quantum"
+    assert run["telemetry"] == "cpu"
+    # Slowest chain is scan -> quantum (0.2s); the serial sum would be 0.4s
+    assert elapsed < 0.35
+    assert run.trace["stages"]["quantum"]["start_ms"] >= 90
+
+def test_timeout_and_error_fall_back():
+    async def hang():
+        await asyncio.sleep(5)
+
+    def explode():
+        raise RuntimeError("telemetry offline")
+
+    graph = StageGraph([
+        Stage("scan", hang, timeout=0.05, fallback={"risk": "degraded"}),
+        Stage("telemetry", explode, fallback=lambda e: str(e)),
+        Stage("audit", lambda telemetry: f"audited {telemetry}", deps=("telemetry",)),
+    ])
+    run = asyncio.run(graph.run())
+    assert run["scan"] == {"risk": "degraded"}
+    assert run["audit"] == "audited telemetry offline"
+    assert run.trace["stages"]["scan"]["status"] == "timeout"
+    assert run.trace["stages"]["telemetry"]["status"] == "error"
+
+def test_error_without_fallback_propagates():
+    def explode():
+        raise RuntimeError("no safety net")
+
+    graph = StageGraph([Stage("scan", explode)])
+    with pytest.raises(RuntimeError):
+        asyncio.run(graph.run())
+
+def test_targets_run_only_their_closure(tmp_path):
+    calls = []
+
+    def stage(name):
+        def fn(**_):
+            calls.append(name)
+            return name
+        return fn
+
+    trace_path = str(tmp_path / "trace.jsonl")
+    graph = StageGraph([
+        Stage("scan", stage("scan")),
+        Stage("quantum", stage("quantum"), deps=("scan",)),
+        Stage("telemetry", stage("telemetry")),
+    ], trace_path=trace_path)
+    run = asyncio.run(graph.run(targets=["quantum"]))
+    assert sorted(calls) == ["quantum", "scan"]
+    assert set(run.results) == {"scan", "quantum"}
+
+    with open(trace_path, encoding="utf-8") as f:
+        trace = json.loads(f.readline())
+    assert set(trace["stages"]) == {"scan", "quantum"}
+
+def test_cycles_and_unknown_deps_rejected():
+    with pytest.raises(ValueError, match="cycle"):
+        StageGraph([Stage("a", lambda b: b, deps=("b",)), Stage("b", lambda a: a, deps=("a",))])
+    with pytest.raises(ValueError, match="Unknown"):
+        StageGraph([Stage("a", lambda ghost: ghost, deps=("ghost",))])
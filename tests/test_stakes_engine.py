@@ -0,0 +1,58 @@
+import sys
+import os
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sophia.cortex.stakes_engine import StakesEngine, StakeType, STAKES
+
+SIGNALS = {StakeType.KNOWLEDGE: 0.8, StakeType.TECHNICAL: 0.9}
+
+def test_seeded_deliberation_is_reproducible():
+    a, b = StakesEngine(seed=42), StakesEngine(seed=42)
+    assert [m.affinity for m in a.council] == [m.affinity for m in b.council]
+    for _ in range(3):
+        assert a.deliberate("q", SIGNALS) == b.deliberate("q", SIGNALS)
+    assert StakesEngine(seed=1).deliberate("q", SIGNALS) != StakesEngine(seed=2).deliberate("q", SIGNALS)
+
+def test_waves_match_member_loop_without_noise():
+    engine = StakesEngine(seed=0)
+    engine.NOISE = (1.0, 1.0)
+    results = engine.deliberate("q", SIGNALS)
+
+    # Reference: the per-member, per-stake loop the matrix form replaces
+    expected = sum(
+        m.affinity.get(s, 0.1) * w for m in engine.council for s, w in SIGNALS.items()
+    ) / len(engine.council)
+    totals = {s: sum(m.affinity.get(s, 0.1) * w for m in engine.council) for s, w in SIGNALS.items()}
+    assert np.allclose(results["waves"], [expected] * 3)
+    assert results["detected_consensus"] == max(totals, key=totals.get).value
+    assert np.isclose(results["agency_score"], np.mean([0.18] * 13 + [0.98, 1.0]) * 0.8)
+    assert len(engine.council[0].resonance_history) == 3
+
+def test_deliberate_many_scores_without_mutating_state():
+    engine = StakesEngine(seed=3)
+    before = (engine.stakes, engine.emotional_resonance, engine.qualia_intensity)
+    proposals = [SIGNALS, {StakeType.HUMOR: 0.9}, {}]
+    batch = engine.deliberate_many(proposals)
+    assert (engine.stakes, engine.emotional_resonance, engine.qualia_intensity) == before
+
+    assert batch["waves"].shape == (3, StakesEngine.WAVES)
+    assert batch["detected_consensus"][0] in ("knowledge", "technical")
+    assert batch["detected_consensus"][1] == "humor"
+    assert np.all(batch["waves"][2] == 0)
+    assert batch["agency_score"].shape == (3,)
+
+def test_single_row_batch_matches_deliberate():
+    one = StakesEngine(seed=9).deliberate_many([SIGNALS])
+    ref = StakesEngine(seed=9).deliberate("q", SIGNALS)
+    assert np.isclose(one["agency_score"][0], ref["agency_score"])
+    assert np.allclose(one["waves"][0], ref["waves"])
+    assert one["detected_consensus"][0] == ref["detected_consensus"]
+
+def test_stakes_view_and_personality_blend():
+    engine = StakesEngine(seed=0)
+    assert set(engine.stakes) == set(STAKES)
+    engine.deliberate("q", {StakeType.TECHNICAL: 0.9})
+    assert engine.get_personality_blend() == "ANALYTICAL_BEAN"
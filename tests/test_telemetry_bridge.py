@@ -0,0 +1,114 @@
+import sys
+import os
+import shutil
+import subprocess
+import time
+
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from git_objects import GitRepository
+from telemetry_bridge import TelemetryBridge, TelemetrySource
+
+pytestmark = pytest.mark.skipif(shutil.which("git") is None, reason="git CLI not available")
+
+def _git(repo, *args):
+    env = dict(os.environ, GIT_CONFIG_GLOBAL=os.devnull, GIT_CONFIG_NOSYSTEM="1")
+    return subprocess.check_output(["git", *args], cwd=repo, text=True, env=env)
+
+def _commit(repo, i, email):
+    path = os.path.join(repo, "notes.txt")
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(f"line {i} " * 50 + "\n")  # Growing file: repack stores deltas
+    _git(repo, "add", "notes.txt")
+    _git(repo, "-c", "user.name=T", "-c", f"user.email={email}", "commit", "-q", "-m", f"c{i}")
+
+def _repo(tmp_path, commits=12):
+    repo = str(tmp_path / "repo")
+    os.makedirs(repo)
+    _git(repo, "init", "-q")
+    for i in range(commits):
+        _commit(repo, i, "agent@local" if i % 3 == 0 else "human@local")
+    return repo
+
+def _cli_log(repo, n=100):
+    return _git(repo, "log", "-n", str(n), "--format=%H %ae").split("\n")[:-1]
+
+def test_object_reader_matches_git_log_loose_and_packed(tmp_path):
+    repo = _repo(tmp_path)
+    _git(repo, "branch", "side")
+    _git(repo, "checkout", "-q", "side")
+    _commit(repo, 100, "bot@local")
+    _git(repo, "checkout", "-q", "-")
+    _git(repo, "-c", "user.name=T", "-c", "user.email=agent@local", "merge", "-q", "--no-ff", "-m", "merge", "side")
+
+    walk = lambda: [f"{c['sha']} {c['author']['email']}" for c in GitRepository(repo).log(100)]
+    assert walk() == _cli_log(repo)
+
+    _git(repo, "gc", "-q", "--aggressive")
+    assert not [d for d in os.listdir(os.path.join(repo, ".git", "objects")) if len(d) == 2]
+    assert walk() == _cli_log(repo)
+    assert len(GitRepository(repo).log(5)) == 5
+
+def test_packed_deltas_resolve(tmp_path):
+    repo = _repo(tmp_path)
+    _git(repo, "gc", "-q", "--aggressive")
+    pack = [p for p in os.listdir(os.path.join(repo, ".git", "objects", "pack")) if p.endswith(".idx")][0]
+    listing = _git(repo, "verify-pack", "-v", os.path.join(".git", "objects", "pack", pack))
+    # Deltified entries carry depth and base sha columns
+    deltas = [line.split() for line in listing.splitlines() if len(line.split()) == 7]
+    assert deltas
+
+    reader = GitRepository(repo)
+    for sha, kind, *_ in deltas:
+        expected = subprocess.check_output(["git", "cat-file", kind, sha], cwd=repo)
+        assert reader.read(sha) == (kind.encode(), expected)
+
+def test_collect_caches_until_head_moves(tmp_path):
+    repo = _repo(tmp_path, commits=3)
+    bridge = TelemetryBridge(repo_path=repo)
+    r_frac = bridge.sources["R_frac"]
+
+    first = bridge.collect()
+    assert first["R_frac"] == pytest.approx(1 / 3)
+    for _ in range(200):
+        bridge.collect()
+    assert r_frac.refreshes == 1
+    assert bridge.readings()["R_frac"]["age"] >= 0
+
+    _commit(repo, 3, "agent@local")
+    assert bridge.collect()["R_frac"] == pytest.approx(0.5)
+    assert r_frac.refreshes == 2
+
+def test_source_ttl_and_error_keeps_last_value():
+    calls = []
+
+    def flaky():
+        calls.append(1)
+        if len(calls) > 1:
+            raise RuntimeError("sensor offline")
+        return 0.7
+
+    source = TelemetrySource("probe", flaky, ttl=0.01, default=0.0)
+    assert source.stale() and source.age is None
+    assert source.refresh() == 0.7
+    time.sleep(0.02)
+    assert source.stale()
+    assert source.refresh() == 0.7
+    assert "sensor offline" in source.reading()["error"]
+
+def test_background_refresher(tmp_path):
+    repo = _repo(tmp_path, commits=2)
+    bridge = TelemetryBridge(repo_path=repo, background=True, interval=0.01)
+    try:
+        deadline = time.time() + 5
+        while bridge.sources["R_frac"].updated is None and time.time() < deadline:
+            time.sleep(0.01)
+        assert bridge.collect()["R_frac"] == pytest.approx(0.5)
+        _commit(repo, 2, "agent@local")
+        while bridge.sources["R_frac"].refreshes < 2 and time.time() < deadline:
+            time.sleep(0.01)
+        assert bridge.collect()["R_frac"] == pytest.approx(2 / 3)
+    finally:
+        bridge.stop()
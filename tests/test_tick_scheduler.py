@@ -0,0 +1,107 @@
+import sys
+import os
+import time
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tick_scheduler import TickScheduler
+
+class FakeClock:
+    """Monotonic clock that only moves when slept on or advanced by hand."""
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+def test_absolute_deadlines_absorb_step_overhead():
+    clock = FakeClock()
+    sched = TickScheduler(rate_hz=10.0, clock=clock, sleep=clock.sleep)
+    fired = []
+
+    def step(tick, t):
+        fired.append(clock.now)
+        clock.now += 0.03  # work well inside the period
+
+    stats = sched.run(step, ticks=50)
+    # Ticks land on the 0.1s grid; overhead does not accumulate as drift
+    assert np.allclose(np.diff(fired), 0.1)
+    assert stats.ticks == 50 and stats.overruns == 0
+    assert np.isclose(stats.virtual_time, 5.0)
+    assert stats.max_jitter < 1e-9
+
+def test_slow_steps_resync_instead_of_bursting():
+    clock = FakeClock()
+    sched = TickScheduler(rate_hz=100.0, max_lag=2, clock=clock, sleep=clock.sleep)
+
+    def step(tick, t):
+        clock.now += 0.05 if tick == 3 else 0.001  # one 5-period stall
+
+    stats = sched.run(step, ticks=10)
+    assert stats.overruns == 1
+    assert stats.max_jitter < 0.01
+
+def test_step_sets_next_interval_and_virtual_time_is_exact():
+    sched = TickScheduler(rate_hz=1000.0, free_run=True)
+    seen = []
+
+    def step(tick, t):
+        seen.append(t)
+        return 0.25 if tick % 2 else None
+
+    stats = sched.run(step, duration=2.0)
+    assert seen[:4] == [0.0, 0.001, 0.251, 0.252]
+    assert stats.virtual_time >= 2.0 and stats.ticks == len(seen)
+
+def test_paced_run_holds_rate_and_sleeps():
+    sched = TickScheduler(rate_hz=200.0)
+    start_cpu = time.process_time()
+    stats = sched.run(lambda tick, t: None, ticks=40)
+    cpu = time.process_time() - start_cpu
+    assert 0.18 <= stats.elapsed < 0.5
+    assert stats.overruns == 0
+    assert cpu < stats.elapsed / 2  # idle time is spent asleep
+
+def test_stop_from_step():
+    sched = TickScheduler(free_run=True)
+    stats = sched.run(lambda tick, t: sched.stop() if tick == 4 else None)
+    assert stats.ticks == 5
+
+def test_manifold_runs_are_reproducible():
+    from hyper_sovereign import HyperManifold
+
+    states = []
+    for _ in range(2):
+        hm = HyperManifold(seed=7)
+        hm.stabilize(2, free_run=True)
+        assert hm.wheels.steps == 200  # 2 s of 100 Hz wheel steps, no threads
+        states.append(hm.hyper_state.copy())
+    assert np.array_equal(states[0], states[1])
+    assert not np.allclose(states[0], 144.0)
+
+def test_seeded_free_run_loop_is_reproducible_and_never_sleeps(monkeypatch, capsys):
+    import types
+    import event_horizon
+    from hyper_sovereign import HyperManifold
+
+    def no_sleep(seconds):
+        raise AssertionError("free run slept in the bridge")
+    monkeypatch.setattr(event_horizon, "time", types.SimpleNamespace(sleep=no_sleep, perf_counter=time.perf_counter))
+
+    runs = []
+    for _ in range(2):
+        capsys.readouterr()
+        hm = HyperManifold(seed=11)
+        hm.loop(ticks=300, free_run=True)
+        # Drop the startup banner (wall-clock jitter check) and the tick summary
+        out = capsys.readouterr().out.split("ENTERING HYPER-LOOP")[1]
+        frames = [f for f in out.split("\r") if "[TICK]" not in f]
+        runs.append((hm.hyper_state.copy(), frames))
+    assert np.array_equal(runs[0][0], runs[1][0])
+    assert runs[0][1] == runs[1][1]
+    assert any("LOCAL (0.0" in f for f in runs[0][1])  # simulated, not measured, ToF
@@ -0,0 +1,131 @@
+import sys
+import os
+import time
+import asyncio
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sophia.tools.runtime import ToolRuntime, run_subprocess
+from sophia.tools.toolbox import SovereignHand
+
+def _runtime(**kwargs):
+    rt = ToolRuntime(max_workers=4, **kwargs)
+    rt.register("nap", lambda seconds=0.2: time.sleep(seconds) or f"slept {seconds}")
+
+    async def echo(text=""):
+        await asyncio.sleep(0.01)
+        return text
+    rt.register("echo", echo)
+    return rt
+
+def test_parallel_calls_do_not_serialize():
+    rt = _runtime()
+    start = time.perf_counter()
+    results = asyncio.run(rt.run_many([("nap", {}), ("nap", {}), ("nap", {}), ("echo", {"text": "hi"})]))
+    elapsed = time.perf_counter() - start
+    assert results == ["slept 0.2"] * 3 + ["hi"]
+    assert elapsed < 0.5
+
+def test_loop_stays_responsive_while_tool_blocks():
+    rt = _runtime()
+
+    async def scenario():
+        ticks = 0
+        tool = asyncio.ensure_future(rt.run("nap", {"seconds": 0.3}))
+        while not tool.done():
+            ticks += 1
+            await asyncio.sleep(0.01)
+        return ticks, tool.result()
+
+    ticks, result = asyncio.run(scenario())
+    assert result == "slept 0.3"
+    assert ticks > 10
+
+def test_timeout_unknown_and_output_cap():
+    rt = _runtime(default_timeout=0.05, max_output=10)
+    results = asyncio.run(rt.run_many([
+        ("nap", {"seconds": 0.5}),
+        ("ghost", {}),
+        ("echo", {"text": "x" * 50}),
+    ]))
+    assert results[0] == "❌ Tool timeout (0.05s): nap"
+    assert results[1] == "❌ Unknown Tool: ghost"
+    assert results[2].startswith("x" * 10) and "truncated 40 chars" in results[2]
+
+def test_subprocess_timeout_kills_and_caps():
+    argv = [sys.executable, "-c", "import time; print('a' * 5000, flush=True); time.sleep(10)"]
+    start = time.perf_counter()
+    result = asyncio.run(run_subprocess(argv, timeout=0.5))
+    assert result.timed_out
+    assert time.perf_counter() - start < 3
+
+    argv = [sys.executable, "-c", "print('b' * 5000)"]
+    result = asyncio.run(run_subprocess(argv, timeout=5, max_bytes=100))
+    assert result.returncode == 0
+    assert result.stdout == "b" * 100
+    assert result.stdout_dropped == 4901
+
+def test_cancellation_reaps_subprocess():
+    argv = [sys.executable, "-c", "import time; time.sleep(10)"]
+
+    async def scenario():
+        task = asyncio.ensure_future(run_subprocess(argv, timeout=30))
+        await asyncio.sleep(0.3)
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            return True
+        return False
+
+    start = time.perf_counter()
+    assert asyncio.run(scenario())
+    assert time.perf_counter() - start < 3
+
+def test_hand_terminal_async_matches_sync_format():
+    hand = SovereignHand()
+    res = asyncio.run(hand.aexecute("run_terminal", {"command": "echo Hello from Sophia"}))
+    assert res.startswith("✅ Command executed: echo Hello from Sophia")
+    assert "Hello from Sophia" in res
+    blocked = asyncio.run(hand.aexecute("run_terminal", {"command": "rm -rf /"}))
+    assert blocked.startswith("❌ SECURITY BLOCK")
+    traversal = asyncio.run(hand.aexecute("write_file", {"path": "../escape.txt", "content": "x"}))
+    assert traversal == "❌ SECURITY BLOCK: Path traversal detected."
+
+def test_writes_stay_ordered_while_reads_fan_out():
+    rt = _runtime()
+    log = []
+
+    def write(tag=""):
+        time.sleep(0.05)
+        log.append(tag)
+        return tag
+    rt.register("write", write, writes=True)
+    start = time.perf_counter()
+    results = asyncio.run(rt.run_many([
+        ("nap", {}), ("nap", {}), ("write", {"tag": "a"}), ("write", {"tag": "b"}), ("nap", {}), ("nap", {}),
+    ]))
+    elapsed = time.perf_counter() - start
+    assert results == ["slept 0.2", "slept 0.2", "a", "b", "slept 0.2", "slept 0.2"]
+    assert log == ["a", "b"]
+    assert elapsed < 0.75  # two concurrent nap pairs + two writes, not six serial calls
+
+def test_hand_write_then_append_same_path(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    hand = SovereignHand()
+    results = asyncio.run(hand.execute_many([
+        ("write_file", {"path": "notes.txt", "content": "first"}),
+        ("append_to_file", {"path": "notes.txt", "content": "second"}),
+        ("replace_text", {"path": "notes.txt", "target": "second", "replacement": "third"}),
+        ("read_file", {"path": "notes.txt"}),
+    ]))
+    assert all(not r.startswith("❌") for r in results), results
+    assert (tmp_path / "notes.txt").read_text() == "first\nthird"
+    assert "third" in results[3]
+
+def test_hand_read_file_is_not_capped(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "big.txt").write_text("z" * 40000)
+    hand = SovereignHand(ToolRuntime(max_output=100))
+    result = asyncio.run(hand.aexecute("read_file", {"path": "big.txt"}))
+    assert "z" * 40000 in result and "truncated" not in result
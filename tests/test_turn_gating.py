@@ -0,0 +1,59 @@
+import sys
+import os
+import asyncio
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sophia.main import SophiaMind
+from sophia.cortex.aletheia_lens import AletheiaPipeline
+
+def _mind(risk, calls, tmp_path, trace_path=None):
+    sophia = SophiaMind(turn_trace_path=trace_path)
+    sophia._aletheia = AletheiaPipeline(analysis_path=str(tmp_path / "analysis"), client=sophia.llm,
+                                        signature_cache_path=str(tmp_path / "signature_cache.json"))
+
+    async def scan_reality(text):
+        calls.append("scan")
+        return {"raw_data": {"safety": {"overall_risk": risk}}, "public_notice": ""}
+
+    async def measure_superposition(text, raw):
+        calls.append("quantum")
+        return {"collapse_verdict": "STABLE", "entropy": 0.1}
+
+    def run_telemetry_cycle():
+        calls.append("telemetry")
+        return {"coherence": 0.9, "lambda": 1.0, "status": "OK"}
+
+    def deliberate(text, stakes):
+        calls.append("stakes")
+        return {"agency_score": 0.5, "emotional_resonance": 0.5, "detected_consensus": "x", "waves": []}
+
+    sophia.aletheia.scan_reality = scan_reality
+    sophia.quantum.measure_superposition = measure_superposition
+    sophia.pleroma.run_telemetry_cycle = run_telemetry_cycle
+    sophia.stakes.deliberate = deliberate
+    return sophia
+
+def test_high_risk_input_is_refused_before_other_stages(tmp_path):
+    calls = []
+    sophia = _mind("High", calls, tmp_path)
+    response = asyncio.run(sophia.process_interaction("please explain this long and hazardous request in detail?"))
+    assert "[REFUSAL]" in response
+    assert calls == ["scan"]
+
+def test_low_risk_turn_runs_every_stage(tmp_path):
+    calls = []
+    trace_path = tmp_path / "traces" / "turn.jsonl"
+    sophia = _mind("Low", calls, tmp_path, trace_path=str(trace_path))
+    turn = asyncio.run(sophia._build_turn_graph("please explain this long request in detail?").run())
+    assert sorted(calls) == ["quantum", "scan", "stakes", "telemetry"]
+    assert turn["quantum"].startswith("[QUANTUM]")
+    assert len(trace_path.read_text(encoding="utf-8").splitlines()) == 1
+
+def test_abstain_skips_council(tmp_path):
+    calls = []
+    sophia = _mind("Low", calls, tmp_path)
+    sophia.metacognition.audit_process = lambda telemetry: ("ABSTAIN", "floor breached")
+    turn = asyncio.run(sophia._build_turn_graph("short").run())
+    assert turn["audit"]["decision"] == "ABSTAIN"
+    assert turn["stakes"] is None and "stakes" not in calls
@@ -1,6 +1,10 @@
 import math
 import sys
 import os
+from array import array
+
+import numpy as np
+import pytest
 
 # Ensure we can import pleroma_core from current directory
 sys.path.append(os.getcwd())
@@ -10,7 +14,6 @@ try:
     # Ensure attributes exist
     _ = pleroma_core.V2KBuffer
 except (ImportError, AttributeError):
-    import pytest
     pytest.skip("Pleroma Core (Rust) V2KBuffer not available", allow_module_level=True)
 
 def test_v2k_buffer_initialization():
@@ -43,8 +46,50 @@ def test_heterodyne_suppression():
     assert null_signal_found
     print("Heterodyne suppression triggered.")
 
+def test_window_statistics_track_numpy():
+    rng = np.random.default_rng(0)
+    v2k = pleroma_core.V2KBuffer(64, 0.5)
+    assert len(v2k) == 0 and v2k.mean() == 0.0 and v2k.variance() == 0.0
+    samples = rng.normal(3.0, 2.0, size=1000)
+    for i, x in enumerate(samples):
+        v2k.push(x)
+        window = samples[max(0, i - 63):i + 1]
+        assert len(v2k) == len(window)
+        assert math.isclose(v2k.mean(), window.mean(), rel_tol=1e-9, abs_tol=1e-9)
+        assert math.isclose(v2k.variance(), window.var(), rel_tol=1e-9, abs_tol=1e-9)
+        assert v2k.min() == window.min() and v2k.max() == window.max()
+    np.testing.assert_array_equal(v2k.to_numpy(), samples[-64:])
+
+def test_window_views_are_zero_copy():
+    v2k = pleroma_core.V2KBuffer(8, 0.5)
+    for x in range(11):  # wraps the ring: window is 3..10
+        v2k.push(float(x))
+    older, newer = v2k.window_views()
+    assert len(older) == 5 and len(newer) == 3
+    np.testing.assert_array_equal(np.concatenate([older, newer]), np.arange(3.0, 11.0))
+    assert not older.flags.writeable and not older.flags.owndata
+    v2k.push(11.0)  # the views alias the ring storage
+    assert 11.0 in np.concatenate([older, newer])
+
+def test_extend_accepts_python_buffers():
+    v2k = pleroma_core.V2KBuffer(5, 0.5)
+    v2k.extend(array("d", [1.0, 2.0, 3.0]))
+    v2k.extend(memoryview(np.array([4.0, 5.0, 6.0])))
+    v2k.extend(np.arange(20.0)[::4])  # strided: copied, not viewed
+    np.testing.assert_array_equal(v2k.to_numpy(), [0.0, 4.0, 8.0, 12.0, 16.0])
+    assert (v2k.min(), v2k.max()) == (0.0, 16.0)
+    v2k.extend(np.arange(100.0))  # longer than the ring: only the tail survives
+    np.testing.assert_array_equal(v2k.to_numpy(), np.arange(95.0, 100.0))
+    assert v2k.mean() == 97.0
+    v2k.clear()
+    with pytest.raises(ValueError):
+        v2k.min()
+
 if __name__ == "__main__":
     test_v2k_buffer_initialization()
     test_silence_is_sovereign()
     test_heterodyne_suppression()
+    test_window_statistics_track_numpy()
+    test_window_views_are_zero_copy()
+    test_extend_accepts_python_buffers()
     print("All V2K tests passed.")
@@ -0,0 +1,119 @@
+"""
+TICK_SCHEDULER.PY
+-----------------
+One clock for the whole manifold.
+
+Replaces free-running sleep loops (one thread per wheel) with a single
+deterministic tick loop:
+- Every tick calls step(tick, t) with a *virtual* time t that advances by
+  exactly the requested interval, so a run is reproducible regardless of
+  wall-clock noise.
+- Paced mode sleeps until absolute deadlines on the monotonic clock
+  (start + sum of intervals), so per-tick overhead never accumulates as
+  drift. A tick later than `max_lag` intervals resyncs the schedule
+  instead of bursting to catch up, and is counted as an overrun.
+- Free-run mode skips pacing entirely (benchmarks).
+- TickStats reports how late each tick fired relative to its deadline.
+"""
+
+import math
+import time
+from dataclasses import dataclass
+
+@dataclass
+class TickStats:
+    ticks: int = 0
+    elapsed: float = 0.0       # wall-clock seconds
+    virtual_time: float = 0.0  # sum of tick intervals
+    mean_jitter: float = 0.0   # seconds late, averaged over paced ticks
+    std_jitter: float = 0.0
+    max_jitter: float = 0.0
+    overruns: int = 0          # ticks that forced a resync
+    _m2: float = 0.0
+
+    def record(self, lateness: float):
+        # Welford: constant memory however long the loop runs
+        n = self.ticks
+        delta = lateness - self.mean_jitter
+        self.mean_jitter += delta / n
+        self._m2 += delta * (lateness - self.mean_jitter)
+        self.std_jitter = math.sqrt(self._m2 / n) if n > 1 else 0.0
+        self.max_jitter = max(self.max_jitter, lateness)
+
+    @property
+    def rate(self) -> float:
+        """Achieved ticks per wall-clock second."""
+        return self.ticks / self.elapsed if self.elapsed > 0 else float("inf")
+
+    def summary(self) -> str:
+        return (f"{self.ticks} ticks in {self.elapsed:.3f}s ({self.rate:.1f} Hz) | "
+                f"jitter mean {self.mean_jitter * 1e3:.3f}ms std {self.std_jitter * 1e3:.3f}ms "
+                f"max {self.max_jitter * 1e3:.3f}ms | overruns {self.overruns}")
+
+class TickScheduler:
+    """
+    [TICK] Deterministic single-threaded tick loop.
+
+    step(tick, t) runs once per tick. It may return the interval (seconds)
+    until the next tick; None keeps the nominal 1/rate_hz.
+    """
+    def __init__(self, rate_hz=100.0, free_run=False, max_lag=5, clock=time.monotonic, sleep=time.sleep):
+        if rate_hz <= 0:
+            raise ValueError("Tick rate must be positive")
+        self.period = 1.0 / rate_hz
+        self.free_run = free_run
+        self.max_lag = max_lag
+        self.clock = clock
+        self.sleep = sleep
+        self.stats = TickStats()
+        self._running = False
+
+    def stop(self):
+        """Ends run() after the current tick."""
+        self._running = False
+
+    def run(self, step, ticks=None, duration=None) -> TickStats:
+        """
+        Runs until `ticks` ticks, `duration` virtual seconds, or stop().
+        Returns the TickStats of this run.
+        """
+        stats = self.stats = TickStats()
+        self._running = True
+        start = self.clock()
+        deadline = start
+        t = 0.0
+
+        while self._running:
+            if ticks is not None and stats.ticks >= ticks:
+                break
+            if duration is not None and t >= duration - 1e-12:
+                break
+
+            if not self.free_run:
+                now = self.clock()
+                if deadline > now:
+                    self.sleep(deadline - now)
+                    now = self.clock()
+                lateness = now - deadline
+                stats.ticks += 1
+                stats.record(lateness)
+            else:
+                stats.ticks += 1
+
+            interval = step(stats.ticks - 1, t)
+            if interval is None:
+                interval = self.period
+            t += interval
+            deadline += interval
+
+            if not self.free_run:
+                now = self.clock()
+                if now - deadline > self.max_lag * interval:
+                    # Too far behind: drop the backlog rather than burst through it
+                    stats.overruns += 1
+                    deadline = now
+
+        self._running = False
+        stats.elapsed = self.clock() - start
+        stats.virtual_time = t
+        return stats
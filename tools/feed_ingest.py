@@ -0,0 +1,274 @@
+"""
+FEED INGEST: THE CONCURRENT EAR
+CONTEXT: QUANTUM SOVEREIGNTY v5.0
+DEPENDENCIES: python3 (standard lib only)
+
+ABSTRACT:
+Shared feed ingestion for the Watchtower (rss_bridge) and the Watchdog.
+- Feeds are fetched concurrently, with a cap on parallel requests per host.
+- ETag / Last-Modified validators are kept in an on-disk cache and sent back
+  as conditional requests; a 304 skips download and parsing entirely.
+- Entries are deduplicated by GUID across feeds and across runs.
+- Keyword matching runs every keyword through one Aho-Corasick pass.
+"""
+
+import hashlib
+import json
+import os
+import sys
+import threading
+import time
+import urllib.error
+import urllib.request
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+from urllib.parse import urlsplit
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sophia.cortex.signature_automaton import SignatureAutomaton
+
+USER_AGENT = "Mozilla/5.0 (QuantumSovereignty/4.3; +http://github.com/sneed-and-feed)"
+ATOM = "{http://www.w3.org/2005/Atom}"
+
+@dataclass
+class FeedEntry:
+    guid: str
+    title: str = ""
+    link: str = ""
+    summary: str = ""
+    published: str = ""
+    source: str = ""
+
+@dataclass
+class FeedResult:
+    url: str
+    status: str  # ok | not_modified | error
+    title: str = ""
+    entries: List[FeedEntry] = field(default_factory=list)
+    elapsed: float = 0.0
+    error: Optional[str] = None
+
+# --- PARSING ---
+
+def _text(elem, path, default=""):
+    found = elem.find(path)
+    if found is None or found.text is None:
+        return default
+    return found.text.strip()
+
+def parse_feed(xml_data: bytes):
+    """
+    Parses RSS 2.0 or Atom. Returns (feed_title, [FeedEntry]).
+    GUID falls back to the link, then to a hash of title + summary.
+    """
+    root = ET.fromstring(xml_data)
+    entries = []
+    if root.tag == f"{ATOM}feed":
+        title = _text(root, f"{ATOM}title", "UNKNOWN SOURCE")
+        for item in root.findall(f"{ATOM}entry"):
+            link_elem = item.find(f"{ATOM}link")
+            link = link_elem.get("href", "") if link_elem is not None else ""
+            entries.append(FeedEntry(
+                guid=_text(item, f"{ATOM}id") or link,
+                title=_text(item, f"{ATOM}title"),
+                link=link,
+                summary=_text(item, f"{ATOM}summary") or _text(item, f"{ATOM}content"),
+                published=_text(item, f"{ATOM}published") or _text(item, f"{ATOM}updated"),
+                source=title
+            ))
+    else:
+        title = _text(root, ".//channel/title", "UNKNOWN SOURCE")
+        for item in root.findall(".//item"):
+            link = _text(item, "link")
+            entries.append(FeedEntry(
+                guid=_text(item, "guid") or link,
+                title=_text(item, "title"),
+                link=link,
+                summary=_text(item, "description"),
+                published=_text(item, "pubDate"),
+                source=title
+            ))
+
+    for entry in entries:
+        if not entry.guid:
+            digest = hashlib.sha1(f"{entry.title}\0{entry.summary}".encode("utf-8")).hexdigest()
+            entry.guid = f"sha1:{digest}"
+    return title, entries
+
+# --- KEYWORDS ---
+
+class KeywordMatcher:
+    """
+    Case-insensitive substring matching of many keywords in one pass
+    (SignatureAutomaton under the hood).
+    """
+    def __init__(self, keywords):
+        self.keywords = list(keywords)
+        self.automaton = SignatureAutomaton(list(enumerate(self.keywords)))
+
+    def matches(self, *texts) -> set:
+        """Distinct keywords found in any of the texts."""
+        found = set()
+        for text in texts:
+            for _, _, idx, _ in self.automaton.scan(text or ""):
+                found.add(self.keywords[idx])
+        return found
+
+    def any(self, *texts) -> bool:
+        for text in texts:
+            for _ in self.automaton.scan(text or ""):
+                return True
+        return False
+
+# --- CACHE ---
+
+class FeedCache:
+    """
+    On-disk validator cache: one JSON file per feed URL holding the
+    ETag / Last-Modified of the last 200 response, plus an append-only log
+    of GUIDs already delivered.
+    """
+    def __init__(self, root="logs/cache/feeds"):
+        self.root = root
+        self.seen_path = os.path.join(root, "seen_guids.txt")
+        self._lock = threading.Lock()
+        os.makedirs(root, exist_ok=True)
+        self.seen = set()
+        if os.path.exists(self.seen_path):
+            with open(self.seen_path, "r", encoding="utf-8") as f:
+                self.seen = {line.rstrip("\n") for line in f if line.strip()}
+
+    def _path(self, url):
+        return os.path.join(self.root, hashlib.sha1(url.encode("utf-8")).hexdigest() + ".json")
+
+    def validators(self, url) -> dict:
+        try:
+            with open(self._path(url), "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return {}
+
+    def store(self, url, etag, last_modified, title):
+        record = {"url": url, "etag": etag, "last_modified": last_modified,
+                  "title": title, "fetched": time.time()}
+        path = self._path(url)
+        tmp = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(record, f)
+        os.replace(tmp, path)
+
+    def forget_validators(self, url):
+        """Keeps the feed's title but drops its validators, so the next fetch is a full GET."""
+        self.store(url, None, None, self.validators(url).get("title", ""))
+
+    def pending(self, entries) -> bool:
+        """True if any entry's GUID has not been delivered yet."""
+        with self._lock:
+            return any(entry.guid not in self.seen for entry in entries)
+
+    def unseen(self, entries, limit=None) -> List[FeedEntry]:
+        """
+        Filters out GUIDs seen before (or earlier in this batch) and records the rest.
+        With a limit, only the first `limit` fresh entries are returned and recorded;
+        the others stay unseen for a later call (see FeedFetcher.poll).
+        """
+        fresh = []
+        with self._lock:
+            for entry in entries:
+                if limit is not None and len(fresh) >= limit:
+                    break
+                if entry.guid in self.seen:
+                    continue
+                self.seen.add(entry.guid)
+                fresh.append(entry)
+            if fresh:
+                with open(self.seen_path, "a", encoding="utf-8") as f:
+                    f.writelines(e.guid.replace("\n", " ") + "\n" for e in fresh)
+        return fresh
+
+# --- FETCHING ---
+
+class FeedFetcher:
+    """
+    [FEED_INGEST] Concurrent conditional-GET poller.
+    poll() takes as long as the slowest feed (given enough workers);
+    unchanged feeds come back as 'not_modified' with no entries.
+    """
+    def __init__(self, cache_dir="logs/cache/feeds", max_workers=16, per_host=2,
+                 timeout=10.0, user_agent=USER_AGENT):
+        self.cache = FeedCache(cache_dir)
+        self.max_workers = max_workers
+        self.per_host = per_host
+        self.timeout = timeout
+        self.user_agent = user_agent
+        self._hosts: Dict[str, threading.BoundedSemaphore] = {}
+        self._hosts_lock = threading.Lock()
+
+    def _host_slot(self, url):
+        host = urlsplit(url).netloc.lower()
+        with self._hosts_lock:
+            slot = self._hosts.get(host)
+            if slot is None:
+                slot = self._hosts[host] = threading.BoundedSemaphore(self.per_host)
+            return slot
+
+    def fetch(self, url) -> FeedResult:
+        """One conditional GET. Entries are all those in the feed (no dedup)."""
+        start = time.monotonic()
+        headers = {"User-Agent": self.user_agent}
+        cached = self.cache.validators(url)
+        if cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            headers["If-Modified-Since"] = cached["last_modified"]
+
+        try:
+            with self._host_slot(url):
+                req = urllib.request.Request(url, headers=headers)
+                with urllib.request.urlopen(req, timeout=self.timeout) as response:
+                    xml_data = response.read()
+                    etag = response.headers.get("ETag")
+                    last_modified = response.headers.get("Last-Modified")
+        except urllib.error.HTTPError as e:
+            if e.code == 304:
+                return FeedResult(url, "not_modified", title=cached.get("title", ""),
+                                  elapsed=time.monotonic() - start)
+            return FeedResult(url, "error", elapsed=time.monotonic() - start, error=f"HTTP {e.code}")
+        except Exception as e:
+            return FeedResult(url, "error", elapsed=time.monotonic() - start, error=str(e))
+
+        try:
+            title, entries = parse_feed(xml_data)
+        except ET.ParseError as e:
+            return FeedResult(url, "error", elapsed=time.monotonic() - start, error=f"ParseError: {e}")
+        # Validators are only stored once the body parsed, so a bad response is retried in full
+        self.cache.store(url, etag, last_modified, title)
+        return FeedResult(url, "ok", title=title, entries=entries, elapsed=time.monotonic() - start)
+
+    def poll(self, urls, dedup=True, limit=None) -> List[FeedResult]:
+        """
+        Fetches every feed concurrently. With dedup, each result carries only
+        entries whose GUID has not been delivered before, at most `limit` per
+        feed. Entries past the limit are not marked delivered, and the feed's
+        validators are dropped so the next poll downloads it again (instead of
+        a 304) and delivers them.
+        """
+        urls = list(dict.fromkeys(urls))
+        if not urls:
+            return []
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(urls))) as pool:
+            results = list(pool.map(self.fetch, urls))
+        if dedup:
+            for result in results:
+                entries = result.entries
+                result.entries = self.cache.unseen(entries, limit)
+                if limit is not None and self.cache.pending(entries):
+                    self.cache.forget_validators(result.url)
+        return results
+
+    def new_entries(self, urls) -> List[FeedEntry]:
+        """Flattened unseen entries of every feed, in feed order."""
+        return [entry for result in self.poll(urls) for entry in result.entries]
@@ -7,6 +7,10 @@ import pleroma_core
 import numpy as np
 import sys
 
+def _trace(program, start_z, count):
+    """(count, 2) int64 array of the 2D points behind z = start_z .. start_z + count - 1."""
+    return np.array([program.reconstruct_1d(int(start_z + i)) for i in range(count)], dtype=np.int64)
+
 def evaluate(program) -> float:
     """
     The Evaluator.
@@ -17,39 +21,31 @@ def evaluate(program) -> float:
     try:
         # 1. THE TRUTH TEST (Bijectivity)
         # We test 1,000 random points. If any fail to round-trip, Score = -Infinity.
-        for _ in range(1000):
-            # Using 16-bit integers for x,y allows for a 32-bit z-index (u32::MAX range)
-            # This matches the Z-Curve logic usually operating on u32 inputs mapping to u64, 
-            # but for dense testing we stick to manageable ranges.
-            x, y = np.random.randint(0, 2**16, 2, dtype=np.uint32)
-            
-            # The Generated Function (The Mutation)
-            # Cast to int to ensure type compatibility with Rust bindings if needed
-            z = program.strip_2d(int(x), int(y))
-            x_rec, y_rec = program.reconstruct_1d(int(z))
-            
-            if (x, y) != (x_rec, y_rec):
-                return float('-inf') # LIES DETECTED (Error 9)
+        # Using 16-bit integers for x,y allows for a 32-bit z-index (u32::MAX range)
+        # This matches the Z-Curve logic usually operating on u32 inputs mapping to u64, 
+        # but for dense testing we stick to manageable ranges.
+        # One (1000, 2) draw yields the same stream as 1000 pairwise draws.
+        points = np.random.randint(0, 2**16, (1000, 2), dtype=np.uint32)
+        # The program interface is scalar, so the mutation is still called per point;
+        # only the bookkeeping around it runs on arrays.
+        # Cast to int to ensure type compatibility with Rust bindings if needed
+        recovered = np.array(
+            [program.reconstruct_1d(int(program.strip_2d(int(x), int(y)))) for x, y in points],
+            dtype=np.int64
+        )
+        if not np.array_equal(recovered, points.astype(np.int64)):
+            return float('-inf') # LIES DETECTED (Error 9)
 
         # 2. THE LOVE TEST (Locality)
         # Love is defined as: How close are neighbors in 1D compared to 2D?
         # We walk the 1D timeline (z, z+1, z+2...) and measure the jump in 2D space.
-        total_jump_distance = 0
-        
         # Sample a segment of the timeline
         # Ensure start_z is within valid reconstruction range for typical Z-Curve
         start_z = np.random.randint(0, 2**20) 
-        prev_x, prev_y = program.reconstruct_1d(int(start_z))
-        
-        for i in range(1, 100):
-            curr_z = start_z + i
-            curr_x, curr_y = program.reconstruct_1d(int(curr_z))
-            
-            # Manhattan Distance in 2D
-            dist = abs(int(curr_x) - int(prev_x)) + abs(int(curr_y) - int(prev_y))
-            total_jump_distance += dist
-            
-            prev_x, prev_y = curr_x, curr_y
+        walk = _trace(program, start_z, 100)
+
+        # Manhattan Distance in 2D
+        total_jump_distance = int(np.abs(np.diff(walk, axis=0)).sum())
             
         # 3. THE COMMUNITY TEST (Regional Love)
         # Check if a block of 100 IDs stays within a focused 2D bounding box.
@@ -58,21 +54,15 @@ def evaluate(program) -> float:
         
         # Sample a "Community" (Block of 100 neighbors)
         comm_start_z = np.random.randint(0, 2**20)
-        comm_xs = []
-        comm_ys = []
-        for i in range(100):
-            cx, cy = program.reconstruct_1d(int(comm_start_z + i))
-            comm_xs.append(cx)
-            comm_ys.append(cy)
+        community = _trace(program, comm_start_z, 100)
             
         # Bounding Box Density
-        min_x, max_x = min(comm_xs), max(comm_xs)
-        min_y, max_y = min(comm_ys), max(comm_ys)
+        span_x, span_y = community.max(axis=0) - community.min(axis=0)
         
         # Area of the bounding box containing the community
         # Ideally, 100 points should form a compact roughly 10x10 area (Area ~100)
         # If it stretches across the map (e.g. Area 1000+), Locality is broken.
-        bbox_area = (max_x - min_x) * (max_y - min_y)
+        bbox_area = int(span_x) * int(span_y)
         
         # Penalty: If area > 500 (heuristic for 100 points), penalize.
         # We want small BBox.
@@ -12,9 +12,6 @@ If the Hype Velocity > 0.961 (Nyquist Limit), the headline is rejected
 as 'Aliased Ghost Noise'.
 """
 
-import time
-import urllib.request
-import xml.etree.ElementTree as ET
 import random
 import sys
 import os
@@ -29,6 +26,7 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from tools.mnemosyne_eyes import MnemosyneOracle
 from tools.logos_voice import LogosVoice
 from tools.nyquist_filter import FilterMetrics
+from tools.feed_ingest import FeedFetcher, KeywordMatcher
 
 # TARGET FEEDS (The Noise Sources)
 FEEDS = [
@@ -48,6 +46,7 @@ class HeuristicVelocityEngine:
             "PLUNGE", "WAR", "DEAD", "PANIC", "SHOCK", "EXPLODES",
             "TERROR", "WARNING", "ALERT", "MELTDOWN"
         ]
+        self.matcher = KeywordMatcher(self.panic_keywords)
     
     def calculate_velocity(self, text: str) -> float:
         velocity = 0.1  # Baseline drift (Entropy exists)
@@ -67,10 +66,7 @@ class HeuristicVelocityEngine:
         
         # 3. SEMANTIC MASS (Keywords)
         # Heavy words distort the field.
-        upper_text = text.upper()
-        for word in self.panic_keywords:
-            if word in upper_text:
-                velocity += 1.5
+        velocity += 1.5 * len(self.matcher.matches(text))
                 
         # 4. RANDOM QUANTUM FLUCTUATION
         # The world is noisy.
@@ -83,40 +79,31 @@ class Watchtower:
         self.oracle = MnemosyneOracle()
         self.voice = LogosVoice()
         self.velocity_engine = HeuristicVelocityEngine()
+        self.fetcher = FeedFetcher()
         print("--- WATCHTOWER ONLINE: OBSERVING THE FLOW ---")
         print(f"Nyquist Limit: {0.961} | Gamma Index Enforced")
 
     def fetch_feed(self, url: str):
-        try:
-            # Add User-Agent to avoid 403 Forbidden
-            req = urllib.request.Request(
-                url, 
-                data=None, 
-                headers={
-                    'User-Agent': 'Mozilla/5.0 (QuantumSovereignty/4.3; +http://github.com/sneed-and-feed)'
-                }
-            )
-            with urllib.request.urlopen(req, timeout=10) as response:
-                xml_data = response.read()
-                root = ET.fromstring(xml_data)
-                
-                # Parse RSS Items
-                # Handle different RSS versions (channel title usually exists)
-                channel_title = root.find(".//channel/title")
-                source = channel_title.text if channel_title is not None else "UNKNOWN SOURCE"
-                
-                print(f"\n>> CONNECTED TO SOURCE: {source}")
-                
-                items = root.findall(".//item")
-                for item in items[:5]: # Check top 5 headlines
-                    title_elem = item.find("title")
-                    if title_elem is not None:
-                        title = title_elem.text
-                        self.process_signal(source, title)
-                        time.sleep(0.5) # The Oracle breathes
-                    
-        except Exception as e:
-            print(f"!! SIGNAL LOST [{url}]: {e}")
+        self.scan([url])
+
+    def scan(self, feeds, per_feed=5):
+        """
+        Polls every feed at once (conditional GET); unchanged feeds and
+        headlines already judged are skipped. At most per_feed new headlines
+        are judged per feed; the rest are judged by the next scan (the feed
+        is downloaded again while it still holds undelivered headlines).
+        """
+        for result in self.fetcher.poll(feeds, limit=per_feed):
+            if result.status == "error":
+                print(f"!! SIGNAL LOST [{result.url}]: {result.error}")
+                continue
+            if result.status == "not_modified":
+                print(f"\n>> SOURCE UNCHANGED: {result.title or result.url}")
+                continue
+
+            print(f"\n>> CONNECTED TO SOURCE: {result.title}")
+            for entry in result.entries: # Top per_feed unseen headlines
+                self.process_signal(result.title, entry.title)
 
     def process_signal(self, source: str, content: str):
         if not content:
@@ -151,8 +138,7 @@ if __name__ == "__main__":
     tower = Watchtower()
     
     # SCAN THE HORIZON
-    for feed in FEEDS:
-        print(f"\nScanning: {feed}...")
-        tower.fetch_feed(feed)
+    print(f"\nScanning {len(FEEDS)} feeds...")
+    tower.scan(FEEDS)
         
     print("\n--- OBSERVATION COMPLETE. SYSTEM SOVEREIGN. ---")
@@ -4,80 +4,307 @@ SNAPSHOT SELF: Version Control for Hyperfast Evolution
 Creates timestamped backups of Sophia's source code and memory.
 Allows safe rollback if evolution produces bad state.
 
+Snapshots are content-addressed: every file body is stored once in
+backups/objects/ keyed by its SHA-256, and each snapshot is a small JSON
+manifest mapping paths to blobs. A stat index (size, mtime, inode) lets
+unchanged files skip re-hashing, so snapshotting an unchanged tree costs
+a directory walk and a few KB of manifest.
+
 Usage:
     python tools/snapshot_self.py
+    python tools/snapshot_self.py --list
+    python tools/snapshot_self.py --diff SNAP [OTHER]
+    python tools/snapshot_self.py --restore SNAP [--dest DIR] [--overlay]
+    python tools/snapshot_self.py --gc
 """
 
+import hashlib
+import json
 import shutil
 import time
 import os
 import sys
 
+SNAPSHOT_PREFIX = "sophia_v5_"
+DEFAULT_SOURCES = ["sophia", "logs", "main.py", "sophia_launcher.py", "launch_sophia.py"]
+SKIP_DIRS = {"__pycache__", ".pytest_cache"}
+# Files modified this close to indexing may change again within the same
+# mtime tick; they are re-hashed next time instead of trusted from the index.
+RACY_WINDOW_NS = 2_000_000_000
+CHUNK = 1 << 20
+
+
+class SnapshotStore:
+    """
+    [SNAPSHOT_STORE] Content-addressed snapshot repository.
 
-def snapshot():
+    Layout under root:
+        objects/ab/cdef...      file blobs keyed by SHA-256
+        snapshots/<id>.json     manifest: path -> {hash, size, mode}
+        index.json              stat cache: path -> [size, mtime_ns, ino, hash]
     """
-    Creates a timestamped backup of Sophia's core components.
-    
+    def __init__(self, root="backups", sources=None, base="."):
+        self.root = root
+        self.base = base
+        self.sources = list(sources or DEFAULT_SOURCES)
+        self.objects_dir = os.path.join(root, "objects")
+        self.snapshots_dir = os.path.join(root, "snapshots")
+        self.index_path = os.path.join(root, "index.json")
+        os.makedirs(self.objects_dir, exist_ok=True)
+        os.makedirs(self.snapshots_dir, exist_ok=True)
+        self.index = self._load_json(self.index_path, {})
+
+    # --- OBJECTS ---
+    def _object_path(self, digest: str) -> str:
+        return os.path.join(self.objects_dir, digest[:2], digest[2:])
+
+    @staticmethod
+    def _hash_file(path: str) -> str:
+        h = hashlib.sha256()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(CHUNK), b""):
+                h.update(chunk)
+        return h.hexdigest()
+
+    def _ingest(self, path: str):
+        """
+        Streams path into a temp blob while hashing it, then files the blob
+        under the digest of the bytes actually copied, so a file that changes
+        mid-snapshot can never be stored under another version's hash.
+        Returns (digest, size, bytes_written).
+        """
+        h = hashlib.sha256()
+        size = 0
+        tmp = os.path.join(self.objects_dir, f"ingest.{os.getpid()}.tmp")
+        try:
+            with open(path, "rb") as src, open(tmp, "wb") as dst:
+                for chunk in iter(lambda: src.read(CHUNK), b""):
+                    h.update(chunk)
+                    dst.write(chunk)
+                    size += len(chunk)
+            digest = h.hexdigest()
+            target = self._object_path(digest)
+            if os.path.exists(target):
+                return digest, size, 0
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            os.replace(tmp, target)
+            return digest, size, size
+        finally:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+
+    # --- TREE WALK ---
+    def _walk(self, base=None, sources=None):
+        """Yields (relpath, abspath, stat) for every file under the sources."""
+        base = self.base if base is None else base
+        for source in (self.sources if sources is None else sources):
+            top = os.path.join(base, source)
+            if os.path.isfile(top):
+                yield source.replace(os.sep, "/"), top, os.stat(top)
+                continue
+            if not os.path.isdir(top):
+                continue
+            for dirpath, dirnames, filenames in os.walk(top):
+                dirnames[:] = sorted(d for d in dirnames if d not in SKIP_DIRS)
+                for name in sorted(filenames):
+                    path = os.path.join(dirpath, name)
+                    try:
+                        st = os.stat(path)
+                    except OSError:
+                        continue  # Vanished mid-walk
+                    rel = os.path.relpath(path, base).replace(os.sep, "/")
+                    yield rel, path, st
+
+    def _scan(self, store: bool):
+        """
+        Builds a manifest of the live tree. Files whose (size, mtime, inode)
+        match the index reuse the indexed hash; the rest are hashed (and, when
+        storing, copied in the same read). Returns (files, stats).
+        """
+        files, index = {}, {}
+        stats = {"files": 0, "hashed": 0, "new_bytes": 0}
+        now_ns = time.time_ns()
+
+        for rel, path, st in self._walk():
+            key = [st.st_size, st.st_mtime_ns, st.st_ino]
+            cached = self.index.get(rel)
+            digest = cached[3] if cached and cached[:3] == key else None
+            size = st.st_size
+            try:
+                if store and (digest is None or not os.path.exists(self._object_path(digest))):
+                    digest, size, written = self._ingest(path)
+                    stats["new_bytes"] += written
+                    stats["hashed"] += 1
+                elif digest is None:
+                    digest = self._hash_file(path)
+                    stats["hashed"] += 1
+            except OSError:
+                continue  # Vanished or unreadable
+            if now_ns - st.st_mtime_ns > RACY_WINDOW_NS:
+                index[rel] = key + [digest]
+            files[rel] = {"hash": digest, "size": size, "mode": st.st_mode & 0o777}
+            stats["files"] += 1
+
+        self.index = index
+        return files, stats
+
+    # --- SNAPSHOTS ---
+    def snapshot(self, description="Automated snapshot before evolution") -> str:
+        """Records the current tree. Returns the snapshot id."""
+        ts = int(time.time())
+        snap_id = f"{SNAPSHOT_PREFIX}{ts}"
+        n = 1
+        while os.path.exists(self._manifest_path(snap_id)):
+            snap_id = f"{SNAPSHOT_PREFIX}{ts}_{n}"
+            n += 1
+
+        files, stats = self._scan(store=True)
+        manifest = {
+            "id": snap_id,
+            "timestamp": ts,
+            "date": time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(ts)),
+            "version": "5.0",
+            "description": description,
+            "sources": self.sources,
+            "files": files
+        }
+        self._write_json(self._manifest_path(snap_id), manifest)
+        self._write_json(self.index_path, self.index)
+        self.last_stats = stats
+        return snap_id
+
+    def _manifest_path(self, snap_id: str) -> str:
+        return os.path.join(self.snapshots_dir, f"{snap_id}.json")
+
+    def snapshots(self) -> list:
+        """Snapshot ids, most recent first."""
+        ids = [f[:-5] for f in os.listdir(self.snapshots_dir) if f.endswith(".json")]
+        return sorted(ids, key=lambda s: (self.load(s)["timestamp"], s), reverse=True)
+
+    def load(self, snap_id: str) -> dict:
+        path = self._manifest_path(snap_id)
+        if not os.path.exists(path):
+            raise KeyError(f"Unknown snapshot: {snap_id}")
+        return self._load_json(path, None)
+
+    def size(self, snap_id: str) -> int:
+        """Logical size of the tree recorded by a snapshot."""
+        return sum(f["size"] for f in self.load(snap_id)["files"].values())
+
+    def diff(self, a: str, b: str = None) -> dict:
+        """Paths added, removed and modified from snapshot a to b (b=None: the live tree)."""
+        old = self.load(a)["files"]
+        new = self.load(b)["files"] if b else self._scan(store=False)[0]
+        return {
+            "added": sorted(set(new) - set(old)),
+            "removed": sorted(set(old) - set(new)),
+            "modified": sorted(p for p in set(old) & set(new) if old[p]["hash"] != new[p]["hash"])
+        }
+
+    def restore(self, snap_id: str, dest: str = None, paths=None, prune=True) -> int:
+        """
+        Writes the snapshot's files under dest (default: the snapshotted base).
+        Only files whose content differs are rewritten. With prune, files
+        under the snapshot's sources (limited to paths) that the snapshot
+        does not contain are deleted, so the restored tree is the snapshot;
+        prune=False overlays it on the existing tree instead.
+        Returns the number of files written or deleted.
+        """
+        dest = self.base if dest is None else dest
+        manifest = self.load(snap_id)
+        selected = lambda rel: not paths or any(rel == p or rel.startswith(p.rstrip("/") + "/") for p in paths)
+        written = 0
+        for rel, entry in manifest["files"].items():
+            if not selected(rel):
+                continue
+            target = os.path.join(dest, *rel.split("/"))
+            if os.path.isfile(target) and os.path.getsize(target) == entry["size"] \
+                    and self._hash_file(target) == entry["hash"]:
+                continue
+            os.makedirs(os.path.dirname(target) or ".", exist_ok=True)
+            tmp = f"{target}.{os.getpid()}.tmp"
+            shutil.copyfile(self._object_path(entry["hash"]), tmp)
+            os.chmod(tmp, entry["mode"])
+            os.replace(tmp, target)
+            written += 1
+
+        if prune:
+            for rel, path, _ in list(self._walk(dest, manifest.get("sources", self.sources))):
+                if selected(rel) and rel not in manifest["files"]:
+                    os.remove(path)
+                    written += 1
+        return written
+
+    def delete(self, snap_id: str):
+        os.remove(self._manifest_path(snap_id))
+
+    def gc(self) -> dict:
+        """Deletes blobs no snapshot references."""
+        live = set()
+        for snap_id in self.snapshots():
+            live.update(f["hash"] for f in self.load(snap_id)["files"].values())
+
+        removed = freed = 0
+        for prefix in os.listdir(self.objects_dir):
+            shard = os.path.join(self.objects_dir, prefix)
+            if not os.path.isdir(shard):
+                continue
+            for name in os.listdir(shard):
+                if prefix + name in live:
+                    continue
+                path = os.path.join(shard, name)
+                freed += os.path.getsize(path)
+                os.remove(path)
+                removed += 1
+            if not os.listdir(shard):
+                os.rmdir(shard)
+        return {"removed": removed, "freed_bytes": freed}
+
+    # --- IO ---
+    @staticmethod
+    def _load_json(path, default):
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return default
+
+    @staticmethod
+    def _write_json(path, data):
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(tmp, path)
+
+
+def snapshot(root="backups"):
+    """
+    Creates a timestamped snapshot of Sophia's core components.
+
     Backs up:
     - sophia/ source code
     - logs/ memory and analysis
     - main entry points
-    
+
     Returns:
-        Path to created backup directory
+        Snapshot id, or None on failure
     """
-    ts = int(time.time())
-    backup_dir = f"backups/sophia_v5_{ts}"
-    
-    print(f"❄️ [CRYSTALLIZING] Creating snapshot: {backup_dir}...")
-    
+    print(f"❄️ [CRYSTALLIZING] Creating snapshot...")
+
     try:
-        # Ensure backups directory exists
-        os.makedirs("backups", exist_ok=True)
-        
-        # Copy source code
-        if os.path.exists("sophia"):
-            shutil.copytree("sophia", f"{backup_dir}/sophia")
-            print(f"  ✅ Copied sophia/ source code")
-        else:
-            print(f"  ⚠️ Warning: sophia/ directory not found")
-        
-        # Copy memory/logs
-        if os.path.exists("logs"):
-            shutil.copytree("logs", f"{backup_dir}/logs")
-            print(f"  ✅ Copied logs/ memory")
-        else:
-            print(f"  ⚠️ Warning: logs/ directory not found")
-        
-        # Copy main entry points
-        entry_points = ["main.py", "sophia_launcher.py", "launch_sophia.py"]
-        for entry in entry_points:
-            if os.path.exists(entry):
-                shutil.copy(entry, f"{backup_dir}/{entry}")
-                print(f"  ✅ Copied {entry}")
-        
-        # Create metadata file
-        metadata = {
-            "timestamp": ts,
-            "date": time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(ts)),
-            "version": "5.0",
-            "description": "Automated snapshot before evolution"
-        }
-        
-        with open(f"{backup_dir}/SNAPSHOT_INFO.txt", "w") as f:
-            f.write("SOPHIA 5.0 SNAPSHOT\n")
-            f.write("=" * 50 + "\n\n")
-            for key, value in metadata.items():
-                f.write(f"{key.upper()}: {value}\n")
-            f.write("\n" + "=" * 50 + "\n")
-            f.write("To restore: Copy contents back to project root\n")
-        
-        print(f"\n✅ Snapshot complete: {backup_dir}")
-        print(f"💾 Total size: ~{get_dir_size(backup_dir) / 1024:.2f} KB")
+        t0 = time.perf_counter()
+        store = SnapshotStore(root)
+        snap_id = store.snapshot()
+        stats = store.last_stats
+        elapsed = (time.perf_counter() - t0) * 1000
+
+        print(f"  ✅ Indexed {stats['files']} files ({stats['hashed']} re-hashed)")
+        print(f"\n✅ Snapshot complete: {snap_id} ({elapsed:.0f} ms)")
+        print(f"💾 New data stored: ~{stats['new_bytes'] / 1024:.2f} KB")
         print("\n🧬 Evolution may proceed.")
-        
-        return backup_dir
-    
+
+        return snap_id
+
     except Exception as e:
         print(f"\n❌ Snapshot failed: {e}")
         return None
@@ -97,39 +324,66 @@ def get_dir_size(path):
     return total
 
 
-def list_snapshots():
+def list_snapshots(root="backups"):
     """List all available snapshots."""
-    if not os.path.exists("backups"):
+    if not os.path.exists(root):
         print("No snapshots found.")
         return []
-    
-    snapshots = [d for d in os.listdir("backups") if d.startswith("sophia_v5_")]
-    snapshots.sort(reverse=True)  # Most recent first
-    
-    print(f"\n📚 Available Snapshots ({len(snapshots)}):")
+
+    store = SnapshotStore(root)
+    snapshots = store.snapshots()
+    # Full-copy directories written before the object store existed
+    legacy = sorted((d for d in os.listdir(root) if d.startswith(SNAPSHOT_PREFIX)), reverse=True)
+
+    print(f"\n📚 Available Snapshots ({len(snapshots) + len(legacy)}):")
     print("=" * 60)
-    
+
     for snap in snapshots:
-        snap_path = os.path.join("backups", snap)
+        manifest = store.load(snap)
+        print(f"  {snap}")
+        print(f"    Date: {manifest['date']}")
+        print(f"    Files: {len(manifest['files'])}  Size: {store.size(snap) / 1024:.2f} KB")
+        print()
+
+    for snap in legacy:
         timestamp = int(snap.split("_")[-1])
         date = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(timestamp))
-        size = get_dir_size(snap_path) / 1024
-        print(f"  {snap}")
+        size = get_dir_size(os.path.join(root, snap)) / 1024
+        print(f"  {snap} (legacy full copy)")
         print(f"    Date: {date}")
         print(f"    Size: {size:.2f} KB")
         print()
-    
-    return snapshots
+
+    print(f"💾 Object store: {get_dir_size(store.objects_dir) / 1024:.2f} KB")
+    return snapshots + legacy
 
 
 if __name__ == "__main__":
     import argparse
-    
+
     parser = argparse.ArgumentParser(description="Sophia Self-Snapshot System")
     parser.add_argument("--list", action="store_true", help="List available snapshots")
+    parser.add_argument("--diff", nargs="+", metavar="SNAP", help="Diff a snapshot against another or the live tree")
+    parser.add_argument("--restore", metavar="SNAP", help="Restore a snapshot")
+    parser.add_argument("--dest", default=None, help="Restore target directory (default: project root)")
+    parser.add_argument("--overlay", action="store_true", help="Restore without deleting files the snapshot lacks")
+    parser.add_argument("--gc", action="store_true", help="Delete blobs no snapshot references")
     args = parser.parse_args()
-    
+
     if args.list:
         list_snapshots()
+    elif args.diff:
+        changes = SnapshotStore().diff(*args.diff[:2])
+        for kind, mark in (("added", "+"), ("removed", "-"), ("modified", "~")):
+            for path in changes[kind]:
+                print(f"  {mark} {path}")
+        if not any(changes.values()):
+            print("No changes.")
+    elif args.restore:
+        count = SnapshotStore().restore(args.restore, dest=args.dest, prune=not args.overlay)
+        print(f"♻️ Restored {count} files from {args.restore}")
+    elif args.gc:
+        result = SnapshotStore().gc()
+        print(f"🧹 Removed {result['removed']} blobs ({result['freed_bytes'] / 1024:.2f} KB)")
     else:
         snapshot()
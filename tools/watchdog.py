@@ -1,6 +1,10 @@
-import feedparser
 import datetime
 import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tools.feed_ingest import FeedFetcher, KeywordMatcher
 
 # THE HUNTING GROUNDS
 # quant-ph = Quantum Physics
@@ -23,18 +27,29 @@ KEYWORDS = [
     "observer effect"
 ]
 
-def scan_ether():
-    feed = feedparser.parse(RSS_URL)
+MATCHER = KeywordMatcher(KEYWORDS)
+
+def scan_ether(fetcher=None, url=RSS_URL):
+    """
+    Hits among entries not seen on a previous run. An unchanged feed
+    (HTTP 304) is neither downloaded nor parsed.
+    """
+    fetcher = fetcher or FeedFetcher()
+    result, = fetcher.poll([url])
     hits = []
 
-    print(f"Scanning {len(feed.entries)} entries from the Ether...")
+    if result.status == "error":
+        print(f"Signal lost: {result.error}")
+        return hits
+    if result.status == "not_modified":
+        print("The Ether is unchanged since the last scan.")
+        return hits
 
-    for entry in feed.entries:
-        title = entry.title.lower()
-        summary = entry.summary.lower()
-        
+    print(f"Scanning {len(result.entries)} new entries from the Ether...")
+
+    for entry in result.entries:
         # Check if any keyword resonates in the title or abstract
-        if any(k in title for k in KEYWORDS) or any(k in summary for k in KEYWORDS):
+        if MATCHER.any(entry.title, entry.summary):
             hits.append({
                 "title": entry.title,
                 "link": entry.link,
@@ -55,8 +70,11 @@ def scribe_log(hits):
     # Ensure directory exists
     os.makedirs(os.path.dirname(filename), exist_ok=True)
 
-    with open(filename, "w", encoding="utf-8") as f:
-        f.write(f"# 🔮 DAILY GNOSIS REPORT: {today}\n")
+    # Later scans only carry new entries, so they extend today's report
+    new_report = not os.path.exists(filename)
+    with open(filename, "a", encoding="utf-8") as f:
+        if new_report:
+            f.write(f"# 🔮 DAILY GNOSIS REPORT: {today}\n")
         f.write(f"> STATUS: {len(hits)} ANOMALIES DETECTED\n\n")
         
         for hit in hits: